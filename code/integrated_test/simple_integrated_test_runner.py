@@ -411,7 +411,7 @@ class SimpleIntegratedTestRunner:
                     self.logger.info("TranslateWorkflow initialized")
                     
                     self.logger.info("Starting enhanced-translate workflow")
-                    translate_result = translate_workflow.process_items(str(workspace_path), target_papers)
+                    translate_result = translate_workflow.process_items(str(workspace_path / "Clippings"), target_papers)
                     self.logger.info(f"Enhanced-translate processing completed: {translate_result}")
                     modules_executed.append('enhanced-translate')
                     
@@ -85,6 +85,21 @@ def validate_workspace_path(ctx, param, value):
     is_flag=True,
     help='ochiai-format機能を無効化（開発用）'
 )
+@click.option(
+    '--migrate-layout',
+    is_flag=True,
+    help='Clippingsディレクトリを設定のレイアウト（clippings_layout.scheme）へ移行して終了'
+)
+@click.option(
+    '--sync-report',
+    type=click.Path(dir_okay=False),
+    help='sync結果の不足・孤立論文をDOIレポート（.json / .csv）に出力して終了'
+)
+@click.option(
+    '--release-quarantine',
+    metavar='STEP[:CITATION_KEY]',
+    help='隔離（quarantined）されたAIジョブを解除して終了（STEPに"all"で全ステップ）'
+)
 @click.option(
     '--verbose', '-v',
     is_flag=True,
@@ -93,7 +108,8 @@ def validate_workspace_path(ctx, param, value):
 def cli(workspace_path: Optional[str], dry_run: bool, force: bool, show_plan: bool,
         disable_ai: bool, enable_only_tagger: bool, enable_only_translate: bool,
         enable_only_ochiai: bool, disable_tagger: bool, disable_translate: bool,
-        disable_ochiai: bool, verbose: bool):
+        disable_ochiai: bool, migrate_layout: bool, sync_report: Optional[str],
+        release_quarantine: Optional[str], verbose: bool):
     """
     ObsClippingsManager - 学術研究における文献管理とMarkdownファイル整理を自動化
     
@@ -135,6 +151,21 @@ def cli(workspace_path: Optional[str], dry_run: bool, force: bool, show_plan: bo
         click.echo(f"ワークスペース: {workspace_path}")
         click.echo()
         
+        # Clippingsレイアウトの移行
+        if migrate_layout:
+            migrate_clippings_layout(config_manager, logger, workspace_path, dry_run)
+            return
+        
+        # 不足・孤立論文のDOIレポート
+        if sync_report:
+            write_sync_report(config_manager, logger, workspace_path, sync_report)
+            return
+        
+        # 隔離AIジョブの解除
+        if release_quarantine:
+            release_quarantined_jobs(config_manager, logger, workspace_path, release_quarantine)
+            return
+        
         # 実行計画の表示
         if show_plan:
             display_execution_plan(workspace_path, dry_run, force, 
@@ -234,6 +265,82 @@ def cli(workspace_path: Optional[str], dry_run: bool, force: bool, show_plan: bo
         sys.exit(3)
 
 
+def migrate_clippings_layout(config_manager: ConfigManager, logger: IntegratedLogger,
+                             workspace_path: Path, dry_run: bool):
+    """Clippingsディレクトリを設定のレイアウトへ移行"""
+    from code.py.modules.shared_modules.clippings_layout import ClippingsLayout
+    from code.py.modules.shared_modules.bibtex_parser import BibTeXParser
+    from code.py.modules.file_organizer.file_organizer import FileOrganizer
+    
+    clippings_dir = workspace_path / "Clippings"
+    bibtex_file = workspace_path / "CurrentManuscript.bib"
+    layout = ClippingsLayout(config_manager, logger)
+    
+    click.echo(f"Clippingsレイアウト移行: {layout.scheme}")
+    if dry_run:
+        click.echo("※ DRY RUN モード: 実際の変更は行われません")
+    
+    # 中断したorganizeの移動を先に完了させる（ジャーナルは移行前のパスを記録しているため）
+    if not dry_run:
+        FileOrganizer(config_manager, logger).recover_organize_transaction(str(clippings_dir))
+    
+    # year方式ではBibTeXの出版年でシャードを決定
+    years = {}
+    if layout.scheme == 'year' and bibtex_file.exists():
+        entries = BibTeXParser(logger.get_logger('BibTeXParser')).parse_file(str(bibtex_file))
+        years = {citation_key: entry.get('year') for citation_key, entry in entries.items()}
+    
+    result = layout.migrate(clippings_dir, years, dry_run=dry_run)
+    
+    click.echo(f"移動{'予定' if dry_run else '済み'}: {len(result['moves']) if dry_run else result['moved']} 件")
+    click.echo(f"配置済み: {result['in_place']} 件")
+    for conflict in result['conflicts']:
+        click.echo(f"  ⚠️  移動先が既に存在: {conflict['source']} -> {conflict['target']}", err=True)
+    for failure in result['failed']:
+        click.echo(f"  ❌ 移動失敗: {failure['source']} ({failure['error']})", err=True)
+    
+    if result['conflicts'] or result['failed']:
+        sys.exit(1)
+
+
+def release_quarantined_jobs(config_manager: ConfigManager, logger: IntegratedLogger,
+                             workspace_path: Path, target: str):
+    """隔離されたAIジョブを解除（target: STEP、STEP:CITATION_KEY、またはall）"""
+    from code.py.modules.ai_tagging_translation.ai_job_queue import AIJobQueue
+    
+    step, _, citation_key = target.partition(':')
+    job_queue = AIJobQueue(config_manager, logger, str(workspace_path / "Clippings"))
+    released = job_queue.release_quarantined(
+        None if step in ('', 'all') else step,
+        [citation_key] if citation_key else None
+    )
+    
+    click.echo(f"隔離ジョブ解除: {len(released)} 件")
+    for job_step, job_citation_key in released:
+        click.echo(f"  - {job_step}: {job_citation_key}")
+    for job in job_queue.get_quarantined_jobs():
+        click.echo(f"  隔離中: {job['step']}: {job['citation_key']} ({job.get('last_error')})")
+
+
+def write_sync_report(config_manager: ConfigManager, logger: IntegratedLogger,
+                      workspace_path: Path, output_path: str):
+    """sync結果の不足・孤立論文をDOIレポートとして出力（ワークスペースのファイルは変更しない）"""
+    from code.py.modules.sync_checker.sync_checker import SyncChecker
+    
+    sync_checker = SyncChecker(config_manager, logger)
+    check_result = sync_checker.check_workspace_consistency(
+        str(workspace_path), str(workspace_path / "CurrentManuscript.bib"), str(workspace_path / "Clippings"),
+        update_yaml_headers=False
+    )
+    report = sync_checker.build_doi_report(check_result)
+    report_file = sync_checker.write_doi_report(report, output_path)
+    
+    summary = report['summary']
+    click.echo(f"DOIレポート: {report_file}")
+    click.echo(f"不足Markdown: {summary['missing_markdown']} 件 / 孤立Markdown: {summary['orphaned_markdown']} 件")
+    click.echo(f"DOIなし: {summary['without_doi']} 件 / キャッシュから補完: {summary['enriched_from_api_cache']} 件")
+
+
 def display_execution_plan(workspace_path: Path, dry_run: bool, force: bool,
                           disable_ai: bool, enable_only_tagger: bool, 
                           enable_only_translate: bool, enable_only_ochiai: bool,
@@ -8,16 +8,24 @@ Classes:
     TranslateWorkflow: 論文要約翻訳専用ワークフロー
     OchiaiFormatWorkflow: 落合フォーマット6項目要約生成専用ワークフロー
     ClaudeAPIClient: Claude API通信クライアント
+    ClaudeClientRegistry: プロセス全体で共有するClaude APIクライアントレジストリ
+    ContentPacker: トークン予算付きコンテンツパッカー
+    AIJobQueue: 再開可能なAIステップ用永続ジョブキュー
 """
 
 from .tagger_workflow import TaggerWorkflow
 from .translate_workflow import TranslateWorkflow
 from .ochiai_format_workflow import OchiaiFormatWorkflow
-from .claude_api_client import ClaudeAPIClient
+from .claude_api_client import ClaudeAPIClient, ClaudeClientRegistry
+from .content_packer import ContentPacker
+from .ai_job_queue import AIJobQueue
 
 __all__ = [
     'TaggerWorkflow',
     'TranslateWorkflow',
     'OchiaiFormatWorkflow',
-    'ClaudeAPIClient'
+    'ClaudeAPIClient',
+    'ClaudeClientRegistry',
+    'ContentPacker',
+    'AIJobQueue'
 ] 
\ No newline at end of file
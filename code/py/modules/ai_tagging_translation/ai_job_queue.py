@@ -0,0 +1,429 @@
+"""
+AI Job Queue
+
+AIステップ用の再開可能な永続ジョブキュー
+"""
+
+import hashlib
+import json
+import os
+import re
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import yaml
+
+from ..shared_modules.config_manager import ConfigManager
+from ..shared_modules.integrated_logger import IntegratedLogger
+
+
+class AIJobQueue:
+    """
+    AIステップ用の永続ジョブキュー
+
+    (step, citation_key) 単位のジョブ状態を追記専用のJSON Linesジャーナルに記録します。
+    プロセスが途中で停止しても、次回実行時は未完了（queued/running）のジョブから
+    即座に再開し、max_attempts回失敗したジョブは隔離（quarantined）して再試行しません。
+    隔離ジョブは論文本文または処理状態が隔離時から変わった場合に自動で解除されます。
+    """
+
+    JOURNAL_FILE_NAME = '.ai_job_queue.jsonl'
+
+    STATUS_QUEUED = 'queued'
+    STATUS_RUNNING = 'running'
+    STATUS_COMPLETED = 'completed'
+    STATUS_FAILED = 'failed'
+    STATUS_QUARANTINED = 'quarantined'
+
+    def __init__(self, config_manager: ConfigManager, logger: IntegratedLogger, queue_dir: str):
+        """
+        AIJobQueue初期化
+
+        Args:
+            config_manager: 設定管理インスタンス
+            logger: ログ管理インスタンス
+            queue_dir: ジャーナルファイルを配置するディレクトリ
+        """
+        self.config_manager = config_manager
+        self.logger = logger.get_logger('AIJobQueue')
+
+        # 設定値取得
+        self.enabled = bool(config_manager.get_ai_setting('job_queue', 'enabled', default=True))
+        self.max_attempts = int(config_manager.get_ai_setting('job_queue', 'max_attempts', default=3))
+        self.fsync = bool(config_manager.get_ai_setting('job_queue', 'fsync', default=True))
+        self.compact_threshold = int(config_manager.get_ai_setting('job_queue', 'compact_threshold', default=5000))
+        self.scan_on_resume = bool(config_manager.get_ai_setting('job_queue', 'scan_on_resume', default=False))
+
+        self.journal_path = Path(queue_dir) / self.JOURNAL_FILE_NAME
+        self._jobs: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._journal_records = 0
+        # 無効時はジャーナルを使わずメモリ上でのみ状態を管理
+        self._persistent = self.enabled
+
+        # 直近のcollect_jobs実行統計
+        self.last_run_stats = self._empty_run_stats()
+
+        self._load()
+        self._compact_if_needed()
+
+    def collect_jobs(self, step: str, scan: Callable[[], List[str]],
+                     target_items: Optional[List[str]] = None) -> List[str]:
+        """
+        処理対象の論文パスリストを取得
+
+        前回実行で未完了（queued/running）だったジョブを先頭に並べ、続いてscanで
+        得た論文のうち隔離されていないものをキューに登録して返します。
+        再開ジョブがある場合、scan_on_resumeが無効ならscan（全論文の走査）は
+        次回実行に持ち越し、再開ジョブのみを返します。
+
+        Args:
+            step: 処理ステップ名
+            scan: 処理が必要な論文パスリストを返す関数
+            target_items: 処理対象citation_keyリスト（Noneの場合は制限なし）
+
+        Returns:
+            List[str]: 論文ファイルパスのリスト（再開ジョブ優先）
+        """
+        self.last_run_stats = self._empty_run_stats()
+
+        # 1. 未完了ジョブの再開
+        jobs = [
+            job['paper_path'] for (job_step, citation_key), job in self._jobs.items()
+            if job_step == step
+            and job['status'] in (self.STATUS_QUEUED, self.STATUS_RUNNING)
+            and (target_items is None or citation_key in target_items)
+            and os.path.exists(job['paper_path'])
+        ]
+        self.last_run_stats['resumed'] = len(jobs)
+        if jobs:
+            self.logger.info(f"Resuming {len(jobs)} unfinished '{step}' jobs from {self.journal_path}")
+            if not self.scan_on_resume:
+                self.last_run_stats['scan_deferred'] = True
+                self.logger.info(f"Deferring scan for new '{step}' jobs until the resumed jobs are finished")
+                return jobs
+
+        # 2. 新規ジョブの登録
+        new_jobs = []
+        for paper_path in scan():
+            if paper_path in jobs or paper_path in new_jobs:
+                continue
+            citation_key = self.citation_key_for(paper_path)
+            if self.is_quarantined(step, citation_key) and self._input_changed(step, paper_path):
+                self.release(step, citation_key)
+                self.last_run_stats['released'] += 1
+            if self.is_quarantined(step, citation_key):
+                self.last_run_stats['quarantined_skipped'] += 1
+                self.logger.warning(f"Skipping quarantined '{step}' job for {citation_key}: "
+                                    f"{self._jobs[(step, citation_key)].get('last_error')}")
+                continue
+            new_jobs.append(paper_path)
+
+        self._append_records([
+            self._update_job(step, paper_path, self.STATUS_QUEUED) for paper_path in new_jobs
+        ])
+        self.last_run_stats['scanned'] = len(new_jobs)
+
+        return jobs + new_jobs
+
+    def mark_started(self, step: str, paper_path: str):
+        """
+        ジョブ開始を記録
+
+        Args:
+            step: 処理ステップ名
+            paper_path: 論文ファイルパス
+        """
+        self._append_records([self._update_job(step, paper_path, self.STATUS_RUNNING)])
+
+    def mark_completed(self, step: str, paper_path: str):
+        """
+        ジョブ完了を記録
+
+        Args:
+            step: 処理ステップ名
+            paper_path: 論文ファイルパス
+        """
+        self._append_records([
+            self._update_job(step, paper_path, self.STATUS_COMPLETED, attempts=0, last_error=None)
+        ])
+
+    def mark_failed(self, step: str, paper_path: str, error: str):
+        """
+        ジョブ失敗を記録（max_attempts回に達した場合は隔離）
+
+        自動解除の判定用に、失敗時点の本文ハッシュと処理状態（fingerprint）を記録します。
+
+        Args:
+            step: 処理ステップ名
+            paper_path: 論文ファイルパス
+            error: エラー内容
+        """
+        citation_key = self.citation_key_for(paper_path)
+        attempts = self._jobs.get((step, citation_key), {}).get('attempts', 0) + 1
+
+        if attempts >= self.max_attempts:
+            status = self.STATUS_QUARANTINED
+            self.logger.warning(f"Quarantining '{step}' job for {citation_key} after {attempts} failures: {error}")
+        else:
+            status = self.STATUS_FAILED
+
+        self._append_records([
+            self._update_job(step, paper_path, status, attempts=attempts, last_error=str(error),
+                             fingerprint=self.input_fingerprint(step, paper_path))
+        ])
+
+    def release(self, step: str, citation_key: str) -> bool:
+        """
+        隔離ジョブを解除し再試行可能にする
+
+        Args:
+            step: 処理ステップ名
+            citation_key: 論文の識別キー
+
+        Returns:
+            bool: 解除した場合True
+        """
+        job = self._jobs.get((step, citation_key))
+        if not job or job['status'] != self.STATUS_QUARANTINED:
+            return False
+
+        self._append_records([
+            self._update_job(step, job['paper_path'], self.STATUS_FAILED, attempts=0)
+        ])
+        self.logger.info(f"Released quarantined '{step}' job for {citation_key}")
+        return True
+
+    def release_quarantined(self, step: Optional[str] = None,
+                            citation_keys: Optional[List[str]] = None) -> List[Tuple[str, str]]:
+        """
+        条件に一致する隔離ジョブをまとめて解除
+
+        Args:
+            step: 処理ステップ名（Noneの場合は全ステップ）
+            citation_keys: 対象citation_keyリスト（Noneの場合は制限なし）
+
+        Returns:
+            List[Tuple[str, str]]: 解除した(step, citation_key)のリスト
+        """
+        targets = [
+            (job_step, citation_key) for (job_step, citation_key), job in self._jobs.items()
+            if job['status'] == self.STATUS_QUARANTINED
+            and (step is None or job_step == step)
+            and (citation_keys is None or citation_key in citation_keys)
+        ]
+        return [target for target in targets if self.release(*target)]
+
+    def is_quarantined(self, step: str, citation_key: str) -> bool:
+        """
+        ジョブが隔離されているかを判定
+
+        Args:
+            step: 処理ステップ名
+            citation_key: 論文の識別キー
+
+        Returns:
+            bool: 隔離されている場合True
+        """
+        job = self._jobs.get((step, citation_key))
+        return bool(job) and job['status'] == self.STATUS_QUARANTINED
+
+    def get_job(self, step: str, citation_key: str) -> Optional[Dict[str, Any]]:
+        """
+        ジョブ状態の取得
+
+        Args:
+            step: 処理ステップ名
+            citation_key: 論文の識別キー
+
+        Returns:
+            Optional[Dict[str, Any]]: ジョブ状態（未登録の場合はNone）
+        """
+        job = self._jobs.get((step, citation_key))
+        return dict(job) if job else None
+
+    def get_quarantined_jobs(self, step: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        隔離ジョブ一覧の取得
+
+        Args:
+            step: 処理ステップ名（Noneの場合は全ステップ）
+
+        Returns:
+            List[Dict[str, Any]]: 隔離ジョブのリスト
+        """
+        return [
+            dict(job) for (job_step, _), job in self._jobs.items()
+            if job['status'] == self.STATUS_QUARANTINED and (step is None or job_step == step)
+        ]
+
+    @staticmethod
+    def citation_key_for(paper_path: str) -> str:
+        """
+        論文パスからcitation_keyを取得（{citation_key}/{citation_key}.md 構成）
+
+        Args:
+            paper_path: 論文ファイルパス
+
+        Returns:
+            str: citation_key
+        """
+        return Path(paper_path).parent.name
+
+    @staticmethod
+    def input_fingerprint(step: str, paper_path: str) -> Optional[str]:
+        """
+        ジョブ入力のfingerprint（論文本文のSHA-256とYAMLヘッダーのprocessing_status[step]）
+
+        Args:
+            step: 処理ステップ名
+            paper_path: 論文ファイルパス
+
+        Returns:
+            Optional[str]: fingerprint（ファイルを読めない場合None）
+        """
+        try:
+            with open(paper_path, 'rb') as f:
+                data = f.read()
+        except OSError:
+            return None
+
+        header, body = '', data.decode('utf-8', errors='replace')
+        match = re.match(r'---\r?\n(.*?)^---[ \t]*(?:\r?\n|$)', body, re.DOTALL | re.MULTILINE)
+        if match:
+            header, body = match.group(1), body[match.end():]
+
+        status = None
+        try:
+            header_data = yaml.safe_load(header) if header else None
+        except yaml.YAMLError:
+            header_data = None
+        if isinstance(header_data, dict) and isinstance(header_data.get('processing_status'), dict):
+            status = header_data['processing_status'].get(step)
+
+        return f"{hashlib.sha256(body.encode('utf-8')).hexdigest()}:{status}"
+
+    def _input_changed(self, step: str, paper_path: str) -> bool:
+        """
+        隔離時から論文本文または処理状態が変わったかを判定
+
+        Args:
+            step: 処理ステップ名
+            paper_path: 論文ファイルパス
+
+        Returns:
+            bool: 変わっている場合True（隔離時のfingerprintがない場合False）
+        """
+        recorded = self._jobs.get((step, self.citation_key_for(paper_path)), {}).get('fingerprint')
+        if recorded is None:
+            return False
+        current = self.input_fingerprint(step, paper_path)
+        return current is not None and current != recorded
+
+    @staticmethod
+    def _empty_run_stats() -> Dict[str, Any]:
+        """collect_jobs実行統計の初期値"""
+        return {'resumed': 0, 'scanned': 0, 'quarantined_skipped': 0, 'released': 0, 'scan_deferred': False}
+
+    def _update_job(self, step: str, paper_path: str, status: str,
+                    attempts: Optional[int] = None, last_error: Any = ...,
+                    fingerprint: Any = ...) -> Dict[str, Any]:
+        """
+        メモリ上のジョブ状態を更新し、ジャーナル用レコードを返す
+
+        Args:
+            step: 処理ステップ名
+            paper_path: 論文ファイルパス
+            status: 新しい状態
+            attempts: 失敗回数（Noneの場合は現在値を維持）
+            last_error: 最終エラー（省略時は現在値を維持）
+            fingerprint: 失敗時の入力fingerprint（省略時は現在値を維持）
+
+        Returns:
+            Dict[str, Any]: ジョブ状態レコード
+        """
+        citation_key = self.citation_key_for(paper_path)
+        previous = self._jobs.get((step, citation_key), {})
+
+        # 完了済みジョブの再登録は新しいジョブとして失敗回数をリセット
+        if status == self.STATUS_QUEUED and previous.get('status') == self.STATUS_COMPLETED:
+            previous = {}
+
+        record = {
+            'step': step,
+            'citation_key': citation_key,
+            'paper_path': str(paper_path),
+            'status': status,
+            'attempts': previous.get('attempts', 0) if attempts is None else attempts,
+            'last_error': previous.get('last_error') if last_error is ... else last_error,
+            'fingerprint': previous.get('fingerprint') if fingerprint is ... else fingerprint,
+            'updated_at': datetime.now().isoformat()
+        }
+        self._jobs[(step, citation_key)] = record
+        return record
+
+    def _append_records(self, records: List[Dict[str, Any]]):
+        """
+        ジャーナルへのレコード追記（1回の書き込み・fsyncでまとめて永続化）
+
+        Args:
+            records: 追記するレコード
+        """
+        if not records or not self._persistent:
+            return
+
+        data = ''.join(json.dumps(record, ensure_ascii=False) + '\n' for record in records)
+
+        try:
+            with open(self.journal_path, 'a', encoding='utf-8') as f:
+                f.write(data)
+                f.flush()
+                if self.fsync:
+                    os.fsync(f.fileno())
+            self._journal_records += len(records)
+        except OSError as e:
+            self._persistent = False
+            self.logger.warning(f"Job queue journal unavailable ({self.journal_path}): {e}. "
+                                f"Continuing without crash-safe checkpoints")
+
+    def _load(self):
+        """ジャーナルの読み込みとジョブ状態の復元（途中で切れた最終行は無視）"""
+        if not self._persistent or not self.journal_path.exists():
+            return
+
+        try:
+            with open(self.journal_path, 'r', encoding='utf-8') as f:
+                for line_number, line in enumerate(f, 1):
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        record = json.loads(line)
+                        self._jobs[(record['step'], record['citation_key'])] = record
+                        self._journal_records += 1
+                    except (ValueError, KeyError):
+                        self.logger.warning(f"Ignoring corrupted job queue record at "
+                                            f"{self.journal_path}:{line_number}")
+        except OSError as e:
+            self.logger.warning(f"Failed to load job queue journal {self.journal_path}: {e}")
+            return
+
+        self.logger.debug(f"Loaded {len(self._jobs)} jobs from {self._journal_records} journal records")
+
+    def _compact_if_needed(self):
+        """ジャーナルが肥大化した場合、最新状態のみのスナップショットに置き換え"""
+        if not self._persistent or self._journal_records <= max(self.compact_threshold, len(self._jobs) * 2):
+            return
+
+        temp_path = self.journal_path.with_name(self.journal_path.name + '.tmp')
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                for record in self._jobs.values():
+                    f.write(json.dumps(record, ensure_ascii=False) + '\n')
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self.journal_path)
+            self.logger.info(f"Compacted job queue journal: {self._journal_records} -> {len(self._jobs)} records")
+            self._journal_records = len(self._jobs)
+        except OSError as e:
+            self.logger.warning(f"Failed to compact job queue journal {self.journal_path}: {e}")
@@ -7,7 +7,8 @@ Claude 3.5 Haiku との統合通信を行うクライアントクラス
 import os
 import time
 import json
-from typing import List, Optional, Any
+import threading
+from typing import Callable, Dict, List, Optional, Any, Tuple
 from pathlib import Path
 
 try:
@@ -15,6 +16,11 @@ try:
 except ImportError:
     anthropic = None
 
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
 from ..shared_modules.exceptions import APIError
 from ..shared_modules.config_manager import ConfigManager
 from ..shared_modules.integrated_logger import IntegratedLogger
@@ -37,6 +43,172 @@ except ImportError:
                     os.environ[key] = value
 
 
+class SharedRateLimiter:
+    """
+    プロセス全体で共有するClaude APIレート制限
+    
+    複数のAIステップ・スレッドからのリクエスト間隔を一元的に制御します。
+    """
+    
+    def __init__(self):
+        """SharedRateLimiter初期化"""
+        self._lock = threading.Lock()
+        self._last_request_time = 0.0
+        self.wait_count = 0
+        self.total_wait_seconds = 0.0
+    
+    def acquire(self, min_interval: float) -> float:
+        """
+        前回リクエストから最小間隔が経過するまで待機
+        
+        Args:
+            min_interval: リクエスト間の最小間隔（秒）
+            
+        Returns:
+            float: 実際に待機した秒数
+        """
+        with self._lock:
+            wait_time = min_interval - (time.time() - self._last_request_time)
+            if wait_time > 0:
+                time.sleep(wait_time)
+                self.wait_count += 1
+                self.total_wait_seconds += wait_time
+            else:
+                wait_time = 0.0
+            
+            self._last_request_time = time.time()
+            return wait_time
+    
+    def reset(self):
+        """待機状態と統計をリセット"""
+        with self._lock:
+            self._last_request_time = 0.0
+            self.wait_count = 0
+            self.total_wait_seconds = 0.0
+
+
+class ClaudeClientRegistry:
+    """
+    プロセス全体のClaude APIクライアントレジストリ
+    
+    Tagger・Translate・OchiaiFormatの各ワークフローが同一のClaudeAPIClient
+    （= 同一のHTTP接続プール）と共有レート制限を利用するための登録所です。
+    """
+    
+    _lock = threading.Lock()
+    _clients: Dict[Tuple[Any, Any], Any] = {}
+    rate_limiter = SharedRateLimiter()
+    _metrics = {
+        'clients_created': 0,
+        'client_reuses': 0,
+        'requests': 0,
+        'new_connections': 0,
+        'reused_connections': 0,
+        'routed_requests': 0,
+        'escalations': 0
+    }
+    _routing_by_task: Dict[str, Dict[str, int]] = {}
+    
+    @classmethod
+    def get_client(cls, config_manager: ConfigManager, logger: IntegratedLogger, client_class=None):
+        """
+        共有クライアントの取得（未登録の場合は作成して登録）
+        
+        同一の設定管理インスタンスを使うワークフロー間で1つのクライアントを共有します。
+        
+        Args:
+            config_manager: 設定管理インスタンス
+            logger: ログ管理インスタンス
+            client_class: 生成するクライアントクラス（Noneの場合はClaudeAPIClient）
+            
+        Returns:
+            ClaudeAPIClient: 共有クライアント
+        """
+        if client_class is None:
+            client_class = ClaudeAPIClient
+        
+        key = (client_class, config_manager)
+        
+        with cls._lock:
+            if key in cls._clients:
+                cls._metrics['client_reuses'] += 1
+                return cls._clients[key]
+            
+            client = client_class(config_manager, logger)
+            cls._clients[key] = client
+            cls._metrics['clients_created'] += 1
+            return client
+    
+    @classmethod
+    def record_request(cls, new_connections: Optional[int]):
+        """
+        リクエスト実行と接続再利用状況の記録
+        
+        Args:
+            new_connections: リクエスト中に新規作成された接続数（不明な場合はNone）
+        """
+        with cls._lock:
+            cls._metrics['requests'] += 1
+            if new_connections is None:
+                return
+            if new_connections > 0:
+                cls._metrics['new_connections'] += new_connections
+            else:
+                cls._metrics['reused_connections'] += 1
+    
+    @classmethod
+    def record_routing(cls, task: str, escalated: bool):
+        """
+        モデルルーティング結果の記録
+        
+        Args:
+            task: タスク名（tagger, translate_abstract等）
+            escalated: 上位モデルへエスカレーションしたか
+        """
+        with cls._lock:
+            cls._metrics['routed_requests'] += 1
+            task_stats = cls._routing_by_task.setdefault(task, {'requests': 0, 'escalations': 0})
+            task_stats['requests'] += 1
+            if escalated:
+                cls._metrics['escalations'] += 1
+                task_stats['escalations'] += 1
+    
+    @classmethod
+    def get_metrics(cls) -> Dict[str, Any]:
+        """
+        クライアント・接続再利用メトリクスの取得
+        
+        Returns:
+            Dict[str, Any]: メトリクス（connection_reuse_rateは接続状況が計測できた
+                リクエストのうち既存接続を再利用した割合）
+        """
+        with cls._lock:
+            metrics = dict(cls._metrics)
+            routing_by_task = {task: dict(stats) for task, stats in cls._routing_by_task.items()}
+        
+        measured = metrics['new_connections'] + metrics['reused_connections']
+        metrics['connection_reuse_rate'] = metrics['reused_connections'] / measured if measured else 0.0
+        metrics['rate_limit_waits'] = cls.rate_limiter.wait_count
+        metrics['rate_limit_wait_seconds'] = cls.rate_limiter.total_wait_seconds
+        metrics['escalation_rate'] = (
+            metrics['escalations'] / metrics['routed_requests'] if metrics['routed_requests'] else 0.0
+        )
+        for stats in routing_by_task.values():
+            stats['escalation_rate'] = stats['escalations'] / stats['requests'] if stats['requests'] else 0.0
+        metrics['routing_by_task'] = routing_by_task
+        return metrics
+    
+    @classmethod
+    def reset(cls):
+        """登録済みクライアントとメトリクスのリセット"""
+        with cls._lock:
+            cls._clients.clear()
+            for key in cls._metrics:
+                cls._metrics[key] = 0
+            cls._routing_by_task.clear()
+        cls.rate_limiter.reset()
+
+
 class ClaudeAPIClient:
     """
     Claude API通信クライアント
@@ -65,9 +237,32 @@ class ClaudeAPIClient:
         self.max_retries = config_manager.get_api_setting('max_retries', default=3)
         self.request_delay = config_manager.get_api_setting('request_delay', default=0.5)
         
+        # ストリーミング設定
+        self.default_max_tokens = config_manager.get_ai_setting('max_tokens', default=4096)
+        self.streaming_enabled = config_manager.get_ai_setting('streaming', 'enabled', default=True)
+        
+        # 接続プール設定（keep-aliveでTLSハンドシェイクの繰り返しを回避）
+        self.max_keepalive_connections = config_manager.get_ai_setting(
+            'connection_pool', 'max_keepalive_connections', default=10
+        )
+        self.keepalive_expiry = config_manager.get_ai_setting('connection_pool', 'keepalive_expiry', default=120)
+        
+        # モデルルーティング設定（初回は高速モデル、低品質時のみ上位モデルへ）
+        self.routing_enabled = config_manager.get_ai_setting('model_routing', 'enabled', default=True)
+        self.escalation_model = config_manager.get_ai_setting(
+            'model_routing', 'escalation_model', default='claude-3-5-sonnet-20241022'
+        )
+        self.quality_threshold = config_manager.get_ai_setting('model_routing', 'quality_threshold', default=0.6)
+        
         # クライアント初期化（遅延初期化）
         self._client = None
-        self._last_request_time = 0
+        
+        # 新規接続数の計測（スレッドごと、httpxのevent hookを設定できた場合のみ）
+        self._connection_counts = threading.local()
+        self._connection_tracking = False
+        
+        # レート制限はプロセス全体で共有
+        self.rate_limiter = ClaudeClientRegistry.rate_limiter
         
         # API Key検証
         if not self.api_key:
@@ -88,20 +283,143 @@ class ClaudeAPIClient:
                     error_code="MISSING_DEPENDENCY"
                 )
             
+            client_options = {}
+            if httpx is not None and hasattr(anthropic, 'DefaultHttpxClient'):
+                client_options['http_client'] = anthropic.DefaultHttpxClient(
+                    limits=httpx.Limits(
+                        max_connections=self.max_keepalive_connections * 2,
+                        max_keepalive_connections=self.max_keepalive_connections,
+                        keepalive_expiry=self.keepalive_expiry
+                    ),
+                    event_hooks={'request': [self._trace_connections]}
+                )
+                self._connection_tracking = True
+            
             self._client = anthropic.Anthropic(
                 api_key=self.api_key,
-                timeout=self.timeout
+                timeout=self.timeout,
+                **client_options
             )
         
         return self._client
     
-    def send_request(self, prompt: str, max_retries: Optional[int] = None) -> str:
+    def _trace_connections(self, request):
+        """
+        httpxのrequest event hook: httpcoreのtrace拡張で新規接続の確立を数える
+        
+        接続確立イベントはリクエストを送信したスレッドで通知されるため、
+        スレッドごとのカウンタに加算します（既存のtraceがあれば併せて呼び出し）。
+        
+        Args:
+            request: 送信するhttpx.Request
+        """
+        previous_trace = request.extensions.get('trace')
+        
+        def trace(event_name: str, info: Dict[str, Any]):
+            if event_name.startswith('connection.connect_') and event_name.endswith('.complete'):
+                self._connection_counts.new = getattr(self._connection_counts, 'new', 0) + 1
+            if previous_trace is not None:
+                previous_trace(event_name, info)
+        
+        request.extensions['trace'] = trace
+    
+    def _count_new_connections(self) -> Optional[int]:
+        """
+        現在のスレッドで確立した新規接続数の累計を取得
+        
+        Returns:
+            Optional[int]: 新規接続数（計測できない場合はNone）
+        """
+        if not self._connection_tracking:
+            return None
+        return getattr(self._connection_counts, 'new', 0)
+    
+    def send_request(self, prompt: str, max_retries: Optional[int] = None,
+                     max_tokens: Optional[int] = None,
+                     completion_detector: Optional[Callable[[str], Optional[int]]] = None,
+                     quality_evaluator: Optional[Callable[[str], float]] = None,
+                     task: str = 'default') -> str:
         """
         Claude APIにリクエストを送信
         
+        completion_detectorが指定され、ストリーミングが有効な場合はレスポンスを
+        逐次受信し、期待する構造が揃った時点で受信を打ち切ります。
+        quality_evaluatorが指定され、モデルルーティングが有効な場合は初回を
+        高速モデル（default_model）で送信し、品質スコアがquality_threshold未満の
+        場合のみescalation_modelで再送信します。
+        
+        Args:
+            prompt: 送信するプロンプト
+            max_retries: 最大リトライ回数（Noneの場合は設定値を使用）
+            max_tokens: 最大出力トークン数（Noneの場合は設定値を使用）
+            completion_detector: 受信済みテキストを受け取り、構造が完成していれば
+                その終端位置を、未完成ならNoneを返す関数
+            quality_evaluator: レスポンスを受け取り品質スコア（0.0-1.0）を返す関数
+            task: ルーティング統計用のタスク名
+            
+        Returns:
+            str: APIレスポンス
+            
+        Raises:
+            APIError: API通信エラーが発生した場合
+        """
+        response_text = self._send_with_retries(prompt, self.model, max_retries, max_tokens, completion_detector)
+        
+        if (quality_evaluator is None or not self.routing_enabled
+                or not self.escalation_model or self.escalation_model == self.model):
+            return response_text
+        
+        quality_score = self._evaluate_response(quality_evaluator, response_text)
+        if quality_score >= self.quality_threshold:
+            ClaudeClientRegistry.record_routing(task, escalated=False)
+            return response_text
+        
+        self.logger.info(f"Escalating {task} request to {self.escalation_model} "
+                         f"(quality: {quality_score:.3f} < {self.quality_threshold})")
+        ClaudeClientRegistry.record_routing(task, escalated=True)
+        
+        try:
+            escalated_text = self._send_with_retries(
+                prompt, self.escalation_model, max_retries, max_tokens, completion_detector
+            )
+        except APIError as e:
+            self.logger.warning(f"Escalation request failed, using {self.model} response: {e}")
+            return response_text
+        
+        escalated_score = self._evaluate_response(quality_evaluator, escalated_text)
+        self.logger.debug(f"Escalated response quality: {escalated_score:.3f} (initial: {quality_score:.3f})")
+        
+        return escalated_text if escalated_score >= quality_score else response_text
+    
+    def _evaluate_response(self, quality_evaluator: Callable[[str], float], response_text: str) -> float:
+        """
+        レスポンス品質の評価（評価関数の例外は最低スコアとして扱う）
+        
+        Args:
+            quality_evaluator: 品質評価関数
+            response_text: 評価対象レスポンス
+            
+        Returns:
+            float: 品質スコア（0.0-1.0）
+        """
+        try:
+            return float(quality_evaluator(response_text))
+        except Exception as e:
+            self.logger.debug(f"Quality evaluation failed: {e}")
+            return 0.0
+    
+    def _send_with_retries(self, prompt: str, model: str, max_retries: Optional[int],
+                           max_tokens: Optional[int],
+                           completion_detector: Optional[Callable[[str], Optional[int]]]) -> str:
+        """
+        指定モデルへのリクエスト送信（リトライ・レート制限付き）
+        
         Args:
             prompt: 送信するプロンプト
+            model: 使用するモデル
             max_retries: 最大リトライ回数（Noneの場合は設定値を使用）
+            max_tokens: 最大出力トークン数（Noneの場合は設定値を使用）
+            completion_detector: 構造完成判定関数
             
         Returns:
             str: APIレスポンス
@@ -111,27 +429,46 @@ class ClaudeAPIClient:
         """
         if max_retries is None:
             max_retries = self.max_retries
+        if max_tokens is None:
+            max_tokens = self.default_max_tokens
         
-        self.logger.debug(f"Sending request to Claude API (max_retries: {max_retries})")
+        use_streaming = self.streaming_enabled and completion_detector is not None
+        
+        self.logger.debug(f"Sending request to Claude API (model: {model}, max_retries: {max_retries}, "
+                          f"max_tokens: {max_tokens}, streaming: {use_streaming})")
         
         for attempt in range(max_retries + 1):
             try:
                 # レート制限適用
                 self._apply_rate_limit()
                 
-                # APIリクエスト実行
-                response = self.client.messages.create(
-                    model=self.model,
-                    max_tokens=4096,
-                    messages=[{
-                        "role": "user",
-                        "content": prompt
-                    }]
-                )
+                client = self.client
+                connections_before = self._count_new_connections()
+                
+                if use_streaming:
+                    response_text = self._send_streaming_request(prompt, model, max_tokens, completion_detector)
+                else:
+                    # APIリクエスト実行
+                    response = client.messages.create(
+                        model=model,
+                        max_tokens=max_tokens,
+                        messages=[{
+                            "role": "user",
+                            "content": prompt
+                        }]
+                    )
+                    
+                    # レスポンス解析
+                    response_text = response.content[0].text
+                    self.logger.debug(f"Received response from Claude API (length: {len(response_text)})")
+                
+                # 接続再利用状況の記録（ストリームを途中で閉じた場合も確立した接続数で判定）
+                connections_after = self._count_new_connections()
+                if connections_before is None or connections_after is None:
+                    ClaudeClientRegistry.record_request(None)
+                else:
+                    ClaudeClientRegistry.record_request(connections_after - connections_before)
                 
-                # レスポンス解析
-                response_text = response.content[0].text
-                self.logger.debug(f"Received response from Claude API (length: {len(response_text)})")
                 return response_text
                 
             except Exception as e:
@@ -150,6 +487,43 @@ class ClaudeAPIClient:
                 self.logger.debug(f"Waiting {wait_time} seconds before retry...")
                 time.sleep(wait_time)
     
+    def _send_streaming_request(self, prompt: str, model: str, max_tokens: int,
+                                completion_detector: Callable[[str], Optional[int]]) -> str:
+        """
+        ストリーミングでリクエストを送信し、構造完成時点で早期終了
+        
+        ストリームを閉じることで残りの生成はキャンセルされます。
+        
+        Args:
+            prompt: 送信するプロンプト
+            model: 使用するモデル
+            max_tokens: 最大出力トークン数
+            completion_detector: 構造完成判定関数
+            
+        Returns:
+            str: 受信したレスポンス（構造完成時は終端位置までに切り詰め）
+        """
+        response_text = ""
+        
+        with self.client.messages.stream(
+            model=model,
+            max_tokens=max_tokens,
+            messages=[{
+                "role": "user",
+                "content": prompt
+            }]
+        ) as stream:
+            for text in stream.text_stream:
+                response_text += text
+                end_pos = completion_detector(response_text)
+                if end_pos is not None:
+                    self.logger.debug(f"Streaming response complete at {end_pos} chars, "
+                                      f"cancelling remaining generation")
+                    return response_text[:end_pos]
+        
+        self.logger.debug(f"Received streamed response from Claude API (length: {len(response_text)})")
+        return response_text
+    
     def send_batch_requests(self, prompts: List[str]) -> List[str]:
         """
         複数のプロンプトをバッチ処理で送信
@@ -187,14 +561,8 @@ class ClaudeAPIClient:
         """
         レート制限を適用
         
-        リクエスト間隔が設定値を下回る場合は待機します。
+        全AIステップで共有するリクエスト間隔が設定値を下回る場合は待機します。
         """
-        current_time = time.time()
-        time_since_last_request = current_time - self._last_request_time
-        
-        if time_since_last_request < self.request_delay:
-            wait_time = self.request_delay - time_since_last_request
-            self.logger.debug(f"Rate limiting: waiting {wait_time:.2f} seconds")
-            time.sleep(wait_time)
-        
-        self._last_request_time = time.time() 
\ No newline at end of file
+        wait_time = self.rate_limiter.acquire(self.request_delay)
+        if wait_time > 0:
+            self.logger.debug(f"Rate limiting: waited {wait_time:.2f} seconds") 
\ No newline at end of file
@@ -0,0 +1,222 @@
+"""
+Content Packer
+
+トークン予算に基づく論文コンテンツ抽出クラス
+"""
+
+import re
+from typing import Any, Dict, List, Optional
+
+from ..shared_modules.config_manager import ConfigManager
+from ..shared_modules.integrated_logger import IntegratedLogger
+
+
+# ローカルトークン推定用パターン（英単語・数字列・CJK文字・その他記号）
+_TOKEN_PATTERN = re.compile(
+    r"[A-Za-z]+|\d+|[\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff\uac00-\ud7af]|[^\sA-Za-z\d]"
+)
+
+# 英文の平均的な文字数/トークン（estimate_tokensの英単語の換算と同じ）
+ASCII_CHARS_PER_TOKEN = 4
+
+# 文末境界（英文・和文）
+_SENTENCE_BOUNDARY_PATTERN = re.compile(r'(?<=[.!?。！？])\s+|(?<=[。！？])')
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    テキストのトークン数をローカルで推定
+
+    Claudeのトークナイザーに近い粒度（英単語は約4文字/トークン、
+    数字は約3桁/トークン、CJK文字と記号は1文字/トークン）で見積もります。
+    予算超過を避けるため、やや多めに推定する方向に寄せています。
+
+    Args:
+        text: 対象テキスト
+
+    Returns:
+        int: 推定トークン数
+    """
+    if not text:
+        return 0
+
+    tokens = 0
+    for match in _TOKEN_PATTERN.finditer(text):
+        piece = match.group()
+        first_char = piece[0]
+        if first_char.isascii() and first_char.isalpha():
+            tokens += (len(piece) + 3) // 4
+        elif first_char.isdigit():
+            tokens += (len(piece) + 2) // 3
+        else:
+            tokens += 1
+
+    return tokens
+
+
+class ContentPacker:
+    """
+    トークン予算付きコンテンツパッカー
+
+    paper_structureのセクションを優先度順にトークン予算内へ詰め込み、
+    文書順で連結したコンテンツとトークン数レポートを返します。
+    """
+
+    def __init__(self, config_manager: ConfigManager, logger: IntegratedLogger):
+        """
+        ContentPacker初期化
+
+        Args:
+            config_manager: 設定管理インスタンス
+            logger: ログ管理インスタンス
+        """
+        self.config_manager = config_manager
+        self.logger = logger.get_logger('ContentPacker')
+
+        # 予算残りがこれ未満の場合はセクションを切り詰めずに省略
+        self.min_section_tokens = 64
+
+    def estimate_tokens(self, text: str) -> int:
+        """
+        テキストのトークン数を推定
+
+        Args:
+            text: 対象テキスト
+
+        Returns:
+            int: 推定トークン数
+        """
+        return estimate_tokens(text)
+
+    def tokens_for_length(self, max_chars: int) -> int:
+        """
+        文字数による上限を推定トークン数の上限に換算（文字数で指定する旧設定の移行用）
+
+        英文を想定し、estimate_tokensの英単語の換算（約4文字/トークン）で換算します。
+
+        Args:
+            max_chars: 文字数の上限
+
+        Returns:
+            int: 推定トークン数の上限
+        """
+        return max(1, max_chars // ASCII_CHARS_PER_TOKEN)
+
+    def pack_sections(self, blocks: List[Dict[str, str]], section_priority: List[str],
+                      token_budget: int, header: str = "") -> Dict[str, Any]:
+        """
+        セクションブロックをトークン予算内に詰め込み
+
+        Args:
+            blocks: 文書順のセクションブロック（section_type, text）
+            section_priority: 優先度順のセクションタイプ（先頭ほど優先）
+            token_budget: トークン予算
+            header: 常に先頭に含めるテキスト（タイトル等）
+
+        Returns:
+            Dict[str, Any]: content, tokens, token_budget, included/truncated/omitted_sections
+        """
+        header_tokens = estimate_tokens(header)
+        remaining = max(0, token_budget - header_tokens)
+
+        priority_rank = {section_type: rank for rank, section_type in enumerate(section_priority)}
+        packing_order = sorted(
+            range(len(blocks)),
+            key=lambda i: (priority_rank.get(blocks[i].get('section_type'), len(section_priority)), i)
+        )
+
+        packed_texts: Dict[int, str] = {}
+        included_sections = []
+        truncated_sections = []
+        omitted_sections = []
+
+        for index in packing_order:
+            block = blocks[index]
+            section_type = block.get('section_type', 'unknown')
+            text = block.get('text', '')
+            block_tokens = estimate_tokens(text)
+
+            if block_tokens <= remaining:
+                packed_texts[index] = text
+                remaining -= block_tokens
+                included_sections.append(section_type)
+            elif remaining >= self.min_section_tokens:
+                truncated_text = self.truncate_to_budget(text, remaining)
+                packed_texts[index] = truncated_text
+                remaining -= estimate_tokens(truncated_text)
+                truncated_sections.append(section_type)
+            else:
+                omitted_sections.append(section_type)
+
+        parts = [header] if header else []
+        parts.extend(packed_texts[i] for i in sorted(packed_texts))
+        content = '\n\n'.join(parts)
+
+        report = {
+            'content': content,
+            'tokens': estimate_tokens(content),
+            'token_budget': token_budget,
+            'included_sections': included_sections,
+            'truncated_sections': truncated_sections,
+            'omitted_sections': omitted_sections
+        }
+
+        self.logger.debug(f"Packed {len(packed_texts)}/{len(blocks)} sections "
+                          f"({report['tokens']}/{token_budget} tokens, "
+                          f"truncated: {truncated_sections}, omitted: {omitted_sections})")
+
+        return report
+
+    def truncate_to_budget(self, text: str, token_budget: int) -> str:
+        """
+        テキストを文境界でトークン予算内に切り詰め
+
+        Args:
+            text: 対象テキスト
+            token_budget: トークン予算
+
+        Returns:
+            str: 切り詰めたテキスト（予算内ならそのまま）
+        """
+        if estimate_tokens(text) <= token_budget:
+            return text
+
+        end_pos = self._find_cut_position(text, token_budget)
+        return text[:end_pos].rstrip() + " ..."
+
+    def _find_cut_position(self, text: str, token_budget: int) -> int:
+        """
+        予算内に収まる最後の文末位置を取得（文単位で収まらない場合は語単位）
+
+        Args:
+            text: 対象テキスト
+            token_budget: トークン予算
+
+        Returns:
+            int: 切り詰め位置
+        """
+        used = 0
+        cut_pos: Optional[int] = None
+        sentence_start = 0
+
+        for boundary in _SENTENCE_BOUNDARY_PATTERN.finditer(text):
+            sentence_tokens = estimate_tokens(text[sentence_start:boundary.start()])
+            if used + sentence_tokens > token_budget:
+                break
+            used += sentence_tokens
+            cut_pos = boundary.start()
+            sentence_start = boundary.end()
+
+        if cut_pos is not None:
+            return cut_pos
+
+        # 先頭の文だけで予算超過の場合は語単位で切り詰め
+        used = 0
+        cut_pos = 0
+        for word in re.finditer(r'\S+', text):
+            used += estimate_tokens(word.group())
+            if used > token_budget:
+                break
+            cut_pos = word.end()
+
+        return cut_pos
@@ -21,7 +21,10 @@ from typing import Dict, List, Any, Optional, Union
 from ..shared_modules.exceptions import ProcessingError, APIError
 from ..status_management_yaml.status_manager import StatusManager
 from ..status_management_yaml.yaml_header_processor import YAMLHeaderProcessor
-from .claude_api_client import ClaudeAPIClient
+from ..section_parsing.section_reader import SectionReader
+from .ai_job_queue import AIJobQueue
+from .claude_api_client import ClaudeAPIClient, ClaudeClientRegistry
+from .content_packer import ContentPacker
 
 
 class OchiaiFormatWorkflow:
@@ -37,16 +40,48 @@ class OchiaiFormatWorkflow:
         """
         self.config_manager = config_manager
         self.logger = logger.get_logger('OchiaiFormatWorkflow')
-        self.claude_client = ClaudeAPIClient(config_manager, logger)
+        self.claude_client = ClaudeClientRegistry.get_client(config_manager, logger, client_class=ClaudeAPIClient)
+        self.content_packer = ContentPacker(config_manager, logger)
         
         # 設定値の取得
         ochiai_config = config_manager.config.get('ochiai_format', {})
         self.batch_size = ochiai_config.get('batch_size', 3)
         self.request_delay = ochiai_config.get('request_delay', 1.0)
-        self.max_content_length = ochiai_config.get('max_content_length', 10000)
+        self.max_content_tokens = self._load_max_content_tokens(ochiai_config)
+        self.section_priority = ochiai_config.get('section_priority', [
+            'abstract', 'conclusion', 'results', 'discussion', 'methods', 'introduction'
+        ])
+        self.max_tokens = ochiai_config.get('max_tokens', 4096)
         
         self.logger.info(f"OchiaiFormatWorkflow initialized with batch_size={self.batch_size}")
     
+    def _load_max_content_tokens(self, ochiai_config: Dict[str, Any]) -> int:
+        """
+        入力上限（推定トークン数）を取得
+        
+        旧設定max_content_length（文字数）のみが指定されている場合は、
+        ContentPackerの推定に基づいてトークン数に換算し、非推奨の警告を出力する。
+        
+        Args:
+            ochiai_config: ochiai_format設定
+            
+        Returns:
+            int: 入力上限（推定トークン数）
+        """
+        max_content_tokens = ochiai_config.get('max_content_tokens')
+        max_content_length = ochiai_config.get('max_content_length')
+        
+        if max_content_length is not None:
+            if max_content_tokens is not None:
+                self.logger.warning("ochiai_format.max_content_length is deprecated and ignored "
+                                    "because max_content_tokens is set")
+            elif isinstance(max_content_length, int) and not isinstance(max_content_length, bool):
+                max_content_tokens = self.content_packer.tokens_for_length(max_content_length)
+                self.logger.warning(f"ochiai_format.max_content_length is deprecated; converted "
+                                    f"{max_content_length} characters to max_content_tokens={max_content_tokens}")
+        
+        return max_content_tokens if max_content_tokens is not None else 6000
+    
     def process_items(self, input_dir: str, target_items: Optional[List[str]] = None) -> Dict[str, int]:
         """
         論文の一括落合フォーマット要約処理
@@ -69,17 +104,20 @@ class OchiaiFormatWorkflow:
             integrated_logger = IntegratedLogger(self.config_manager)
         
         status_manager = StatusManager(self.config_manager, integrated_logger)
-        papers_needing_processing = status_manager.get_papers_needing_processing(
-            input_dir, 'ochiai_format', target_items
+        job_queue = AIJobQueue(self.config_manager, integrated_logger, input_dir)
+        papers_needing_processing = job_queue.collect_jobs(
+            'ochiai_format',
+            lambda: status_manager.get_papers_needing_processing(input_dir, 'ochiai_format', target_items),
+            target_items
         )
         
         processed = 0
-        skipped = 0
+        skipped = job_queue.last_run_stats['quarantined_skipped']
         failed = 0
         
         if not papers_needing_processing:
             self.logger.info("No papers need Ochiai format processing")
-            return {'processed': 0, 'skipped': 0, 'failed': 0}
+            return {'processed': 0, 'skipped': skipped, 'failed': 0}
         
         self.logger.info(f"Found {len(papers_needing_processing)} papers needing Ochiai format processing")
         
@@ -91,10 +129,12 @@ class OchiaiFormatWorkflow:
             for paper_path in batch:
                 try:
                     self.logger.info(f"Generating Ochiai format for: {paper_path}")
+                    job_queue.mark_started('ochiai_format', paper_path)
                     ochiai_summary = self.generate_ochiai_summary_single(paper_path)
                     self.update_yaml_with_ochiai(paper_path, ochiai_summary)
                     
                     processed += 1
+                    job_queue.mark_completed('ochiai_format', paper_path)
                     self.logger.info(f"Successfully generated Ochiai format for: {paper_path}")
                     
                     # ステータス更新をtry-catchで分離
@@ -106,6 +146,7 @@ class OchiaiFormatWorkflow:
                 except Exception as e:
                     self.logger.error(f"Failed to generate Ochiai format for {paper_path}: {e}")
                     failed += 1
+                    job_queue.mark_failed('ochiai_format', paper_path, str(e))
                     
                     # ステータス更新をtry-catchで分離
                     try:
@@ -134,17 +175,26 @@ class OchiaiFormatWorkflow:
             # 論文内容の抽出
             paper_content = self.extract_paper_content(paper_path)
             
-            # コンテンツサイズチェック
+            # コンテンツサイズチェック（トークン予算）
             content_str = '\n'.join(paper_content) if isinstance(paper_content, list) else str(paper_content)
-            if len(content_str) > self.max_content_length:
-                content_str = content_str[:self.max_content_length] + "..."
-                self.logger.warning(f"Content truncated to {self.max_content_length} characters for {paper_path}")
+            content_tokens = self.content_packer.estimate_tokens(content_str)
+            if content_tokens > self.max_content_tokens:
+                content_str = self.content_packer.truncate_to_budget(content_str, self.max_content_tokens)
+                self.logger.warning(f"Content truncated from {content_tokens} to {self.max_content_tokens} "
+                                    f"tokens for {paper_path}")
+                content_tokens = self.content_packer.estimate_tokens(content_str)
+            
+            self.logger.info(f"Ochiai content for {paper_path}: {content_tokens}/{self.max_content_tokens} tokens")
             
             # プロンプト構築
             prompt = self._build_ochiai_prompt(content_str)
             
-            # Claude API呼び出し
-            response = self.claude_client.send_request(prompt)
+            # Claude API呼び出し（JSONオブジェクトが閉じた時点で受信終了）
+            response = self.claude_client.send_request(
+                prompt,
+                max_tokens=self.max_tokens,
+                completion_detector=self._detect_ochiai_response_end
+            )
             
             # 応答解析
             ochiai_data = self._parse_ochiai_response(response)
@@ -165,6 +215,11 @@ class OchiaiFormatWorkflow:
         Returns:
             Union[List[str], str]: 抽出された論文内容
         """
+        # バイトオフセットが有効なら重要セクションのみを直接読み込み
+        indexed_content = self._extract_important_sections_by_offset(paper_path)
+        if indexed_content is not None:
+            return indexed_content
+        
         yaml_header, content = self._load_paper_with_yaml(paper_path)
         
         # paper_structure が存在する場合は重要セクションを抽出
@@ -217,10 +272,47 @@ class OchiaiFormatWorkflow:
             self.logger.error(f"Error loading paper {paper_path}: {e}")
             raise ProcessingError(f"Failed to load paper: {e}") from e
     
+    def _extract_important_sections_by_offset(self, paper_path: str) -> Optional[str]:
+        """
+        paper_structureのバイトオフセットを使って重要セクションのみを読み込み
+        
+        Args:
+            paper_path: 論文ファイルパス
+            
+        Returns:
+            Optional[str]: 抽出された重要セクション（インデックスが無効・対象セクションなしの場合None）
+        """
+        try:
+            reader = SectionReader(paper_path)
+        except OSError:
+            return None
+        
+        if not reader.is_current():
+            return None
+        
+        important_blocks = []
+        for section in reader.sections:
+            section_type = section.get('section_type', '').lower()
+            if section_type in self.section_priority:
+                text = reader.read_section(section)
+                if text is None:
+                    return None
+                important_blocks.append({
+                    'section_type': section_type,
+                    'text': '\n'.join(line.rstrip() for line in text.splitlines())
+                })
+        
+        if not important_blocks:
+            return None
+        
+        return self._pack_important_blocks(reader.yaml_header, important_blocks)
+    
     def _extract_important_sections(self, yaml_header: Dict, content: List[str]) -> str:
         """
         重要セクションの抽出（paper_structure活用）
         
+        セクションは section_priority の順にトークン予算（max_content_tokens）内へ詰め込まれます。
+        
         Args:
             yaml_header: YAMLヘッダー情報
             content: 論文本文
@@ -231,30 +323,54 @@ class OchiaiFormatWorkflow:
         paper_structure = yaml_header.get('paper_structure', {})
         sections = paper_structure.get('sections', [])
         
-        important_sections = []
-        
-        # タイトル追加
-        title = yaml_header.get('title', '')
-        if title:
-            if isinstance(title, list):
-                title = ' - '.join(title)
-            important_sections.append(f"# {title}")
-        
-        # 重要セクションの種類
-        important_types = ['abstract', 'introduction', 'methods', 'results', 'discussion', 'conclusion']
+        important_blocks = []
         
         for section in sections:
             section_type = section.get('section_type', '').lower()
-            if section_type in important_types:
+            if section_type in self.section_priority:
                 start_line = section.get('start_line', 0)
                 end_line = section.get('end_line', len(content))
                 
                 # 相対行数から実際の行数に変換（1ベース）
                 if start_line > 0 and end_line > start_line and end_line <= len(content):
-                    section_content = content[start_line-1:end_line]
-                    important_sections.extend(section_content)
+                    important_blocks.append({
+                        'section_type': section_type,
+                        'text': '\n'.join(content[start_line-1:end_line])
+                    })
+        
+        if not important_blocks and not yaml_header.get('title', ''):
+            return '\n'.join(content)
+        
+        return self._pack_important_blocks(yaml_header, important_blocks)
+    
+    def _pack_important_blocks(self, yaml_header: Dict, important_blocks: List[Dict[str, str]]) -> str:
+        """
+        タイトルと重要セクションをトークン予算内に詰め込み
+        
+        Args:
+            yaml_header: YAMLヘッダー情報
+            important_blocks: section_typeとtextを持つセクションのリスト
+            
+        Returns:
+            str: 詰め込まれたコンテンツ
+        """
+        # タイトル
+        title_section = ''
+        title = yaml_header.get('title', '')
+        if title:
+            if isinstance(title, list):
+                title = ' - '.join(title)
+            title_section = f"# {title}"
+        
+        packed = self.content_packer.pack_sections(
+            important_blocks, self.section_priority, self.max_content_tokens, header=title_section
+        )
         
-        return '\n'.join(important_sections) if important_sections else '\n'.join(content)
+        if packed['truncated_sections'] or packed['omitted_sections']:
+            self.logger.warning(f"Token budget exceeded: truncated {packed['truncated_sections']}, "
+                                f"omitted {packed['omitted_sections']}")
+        
+        return packed['content']
     
     def _build_ochiai_prompt(self, paper_content: str) -> str:
         """
@@ -306,6 +422,9 @@ class OchiaiFormatWorkflow:
                 end_idx = response_clean.find('```', start_idx)
                 if end_idx != -1:
                     response_clean = response_clean[start_idx:end_idx].strip()
+                else:
+                    # ストリーミング早期終了時は閉じフェンスが存在しない
+                    response_clean = response_clean[start_idx:].strip()
             elif '{' in response_clean and '}' in response_clean:
                 start_idx = response_clean.find('{')
                 end_idx = response_clean.rfind('}') + 1
@@ -336,6 +455,27 @@ class OchiaiFormatWorkflow:
             self.logger.error(f"Error parsing Ochiai response: {e}")
             return self._create_fallback_ochiai_data(response)
     
+    def _detect_ochiai_response_end(self, partial_response: str) -> Optional[int]:
+        """
+        ストリーミング受信中のレスポンスで落合フォーマットJSONが完成したかを判定
+        
+        Args:
+            partial_response: 受信済みのレスポンス
+            
+        Returns:
+            Optional[int]: JSONオブジェクトが完成していれば終端位置、未完成ならNone
+        """
+        start_idx = partial_response.find('{')
+        if start_idx == -1 or '}' not in partial_response[start_idx:]:
+            return None
+        
+        try:
+            parsed_data, end_idx = json.JSONDecoder().raw_decode(partial_response, start_idx)
+        except ValueError:
+            return None
+        
+        return end_idx if isinstance(parsed_data, dict) else None
+    
     def _create_fallback_ochiai_data(self, response: str) -> Dict[str, Any]:
         """
         フォールバック用の落合フォーマットデータ作成（仕様書順序）
@@ -10,12 +10,15 @@ from pathlib import Path
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 
-from .claude_api_client import ClaudeAPIClient
+from .ai_job_queue import AIJobQueue
+from .claude_api_client import ClaudeAPIClient, ClaudeClientRegistry
+from .content_packer import ContentPacker
 from ..shared_modules.config_manager import ConfigManager
 from ..shared_modules.integrated_logger import IntegratedLogger
 from ..shared_modules.exceptions import APIError, ProcessingError
 from ..status_management_yaml.status_manager import StatusManager
 from ..status_management_yaml.yaml_header_processor import YAMLHeaderProcessor
+from ..section_parsing.section_reader import SectionReader
 
 
 class TaggerWorkflow:
@@ -41,19 +44,34 @@ class TaggerWorkflow:
         self.enabled = config_manager.get_ai_setting('tagger', 'enabled', default=True)
         self.batch_size = config_manager.get_ai_setting('tagger', 'batch_size', default=8)
         self.tag_count_range = config_manager.get_ai_setting('tagger', 'tag_count_range', default=[10, 20])
+        self.max_tokens = config_manager.get_ai_setting('tagger', 'max_tokens', default=1024)
+        self.token_budget = config_manager.get_ai_setting('tagger', 'token_budget', default=8000)
+        self.section_priority = config_manager.get_ai_setting(
+            'tagger', 'section_priority', default=['introduction', 'results', 'discussion']
+        )
         
-        # Claude APIクライアント（遅延初期化）
+        # Claude APIクライアント・コンテンツパッカー（遅延初期化）
         self._claude_client = None
+        self._content_packer = None
         
         self.logger.info(f"TaggerWorkflow initialized (enabled: {self.enabled}, batch_size: {self.batch_size})")
     
     @property
     def claude_client(self) -> ClaudeAPIClient:
-        """Claude APIクライアントの遅延初期化"""
+        """Claude APIクライアントの遅延初期化（プロセス全体で共有）"""
         if self._claude_client is None:
-            self._claude_client = ClaudeAPIClient(self.config_manager, self.integrated_logger)
+            self._claude_client = ClaudeClientRegistry.get_client(
+                self.config_manager, self.integrated_logger, client_class=ClaudeAPIClient
+            )
         return self._claude_client
     
+    @property
+    def content_packer(self) -> ContentPacker:
+        """コンテンツパッカーの遅延初期化"""
+        if self._content_packer is None:
+            self._content_packer = ContentPacker(self.config_manager, self.integrated_logger)
+        return self._content_packer
+    
     def process_items(self, input_dir: str, target_items: Optional[List[str]] = None) -> Dict[str, Any]:
         """
         論文の一括タグ生成処理
@@ -73,8 +91,11 @@ class TaggerWorkflow:
         
         # 処理対象論文の取得
         status_manager = StatusManager(self.config_manager, self.integrated_logger)
-        papers_needing_processing = status_manager.get_papers_needing_processing(
-            input_dir, 'tagger', target_items
+        job_queue = AIJobQueue(self.config_manager, self.integrated_logger, input_dir)
+        papers_needing_processing = job_queue.collect_jobs(
+            'tagger',
+            lambda: status_manager.get_papers_needing_processing(input_dir, 'tagger', target_items),
+            target_items
         )
         
         processed_count = 0
@@ -83,6 +104,7 @@ class TaggerWorkflow:
         for paper_path in papers_needing_processing:
             try:
                 self.logger.debug(f"Processing tags for: {paper_path}")
+                job_queue.mark_started('tagger', paper_path)
                 
                 # タグ生成
                 tags = self.generate_tags_single(paper_path)
@@ -109,11 +131,13 @@ class TaggerWorkflow:
                     # citation_keyを抽出してから状態更新
                     citation_key = Path(paper_path).parent.name
                     status_manager.update_status(input_dir, citation_key, 'tagger', 'completed')
+                    job_queue.mark_completed('tagger', paper_path)
                     processed_count += 1
                 else:
                     # タグ生成失敗
                     citation_key = Path(paper_path).parent.name
                     status_manager.update_status(input_dir, citation_key, 'tagger', 'failed')
+                    job_queue.mark_failed('tagger', paper_path, "No tags generated")
                     failed_count += 1
                     self.logger.warning(f"No tags generated for {Path(paper_path).name}")
                     
@@ -121,6 +145,7 @@ class TaggerWorkflow:
                 self.logger.error(f"Failed to generate tags for {paper_path}: {e}")
                 citation_key = Path(paper_path).parent.name
                 status_manager.update_status(input_dir, citation_key, 'tagger', 'failed')
+                job_queue.mark_failed('tagger', paper_path, str(e))
                 failed_count += 1
         
         result = {
@@ -131,6 +156,10 @@ class TaggerWorkflow:
             'total_papers': len(papers_needing_processing)
         }
         
+        if job_queue.last_run_stats['resumed'] or job_queue.last_run_stats['quarantined_skipped']:
+            self.logger.info(f"Job queue: {job_queue.last_run_stats['resumed']} resumed, "
+                             f"{job_queue.last_run_stats['quarantined_skipped']} quarantined")
+        
         self.logger.info(f"Tagger processing completed: {result}")
         return result
     
@@ -151,8 +180,16 @@ class TaggerWorkflow:
             # プロンプト構築
             prompt = self._build_tagging_prompt(paper_content)
             
-            # Claude API呼び出し
-            response = self.claude_client.send_request(prompt)
+            # Claude API呼び出し（JSON配列が閉じた時点で受信終了、低品質時は上位モデルで再生成）
+            response = self.claude_client.send_request(
+                prompt,
+                max_tokens=self.max_tokens,
+                completion_detector=self._detect_tags_response_end,
+                quality_evaluator=lambda text: self.evaluate_tag_quality(
+                    self._parse_tags_response(text), paper_content
+                ),
+                task='tagger'
+            )
             
             # レスポンス解析
             tags = self._parse_tags_response(response)
@@ -171,16 +208,25 @@ class TaggerWorkflow:
         """
         YAMLヘッダーのtitleと paper_structure を使用してintroduction, results, discussionセクションを抽出
         
+        セクションは section_priority の順にトークン予算（token_budget）内へ詰め込まれ、
+        予算を超える場合は低優先度のセクションから文境界で切り詰め・省略されます。
+        
         Args:
             paper_path: 論文ファイルパス
             
         Returns:
-            str: タイトル + 抽出されたセクションコンテンツ（全文）
+            str: タイトル + 抽出されたセクションコンテンツ（トークン予算内）
         """
         try:
-            # YAMLヘッダー解析
-            processor = YAMLHeaderProcessor(self.config_manager, self.integrated_logger)
-            yaml_data, markdown_content = processor.parse_yaml_header(Path(paper_path))
+            # バイトオフセットが有効なら対象セクションのみを直接読み込み
+            reader = SectionReader(paper_path)
+            if reader.is_current():
+                yaml_data = reader.yaml_header
+                markdown_content = None
+            else:
+                # YAMLヘッダー解析
+                processor = YAMLHeaderProcessor(self.config_manager, self.integrated_logger)
+                yaml_data, markdown_content = processor.parse_yaml_header(Path(paper_path))
             
             # title取得・処理
             title_section = self._extract_title_section(yaml_data)
@@ -191,47 +237,54 @@ class TaggerWorkflow:
             
             if not sections:
                 self.logger.warning(f"No paper_structure found in {paper_path}, falling back to full content")
-                # titleがある場合は先頭に追加してから全文を返す
-                if title_section:
-                    return f"{title_section}\n\n{markdown_content}"
-                return markdown_content
+                return self._pack_full_content(title_section, self._read_markdown_body(paper_path, markdown_content))
             
             # 対象セクション（introduction, results, discussion）の抽出
-            target_section_types = ['introduction', 'results', 'discussion']
-            extracted_sections = []
+            extracted_blocks = []
             
-            markdown_lines = markdown_content.split('\n')
+            markdown_lines = None
             
             for section in sections:
                 section_type = section.get('section_type')
-                if section_type in target_section_types:
+                if section_type in self.section_priority:
                     start_line = section.get('start_line', 0)
-                    end_line = section.get('end_line', len(markdown_lines))
+                    end_line = section.get('end_line', 0)
                     
-                    # セクション内容抽出（行範囲ベース、1-indexedから0-indexedに変換）
-                    section_content = '\n'.join(markdown_lines[start_line-1:end_line])
+                    section_content = reader.read_section(section, include_heading=False)
+                    if section_content is None:
+                        # セクション内容抽出（行範囲ベース、1-indexedから0-indexedに変換）
+                        if markdown_lines is None:
+                            markdown_content = self._read_markdown_body(paper_path, markdown_content)
+                            markdown_lines = markdown_content.split('\n')
+                        end_line = section.get('end_line', len(markdown_lines))
+                        section_content = '\n'.join(markdown_lines[start_line-1:end_line])
                     section_title = section.get('title', section_type.title())
-                    extracted_sections.append(f"## {section_title}\n{section_content}")
+                    extracted_blocks.append({
+                        'section_type': section_type,
+                        'text': f"## {section_title}\n{section_content}"
+                    })
                     
                     self.logger.debug(f"Extracted {section_type} section: lines {start_line}-{end_line}")
             
-            if not extracted_sections:
+            if not extracted_blocks:
                 self.logger.warning(f"No target sections found in {paper_path}, falling back to full content")
-                # titleがある場合は先頭に追加してから全文を返す
-                if title_section:
-                    return f"{title_section}\n\n{markdown_content}"
-                return markdown_content
-            
-            # titleセクションがある場合は先頭に追加
-            if title_section:
-                all_sections = [title_section] + extracted_sections
-                result = '\n\n'.join(all_sections)
-                self.logger.info(f"Extracted title + {len(extracted_sections)} sections for tagging from {Path(paper_path).name}")
-            else:
-                result = '\n\n'.join(extracted_sections)
-                self.logger.info(f"Extracted {len(extracted_sections)} sections for tagging from {Path(paper_path).name}")
+                return self._pack_full_content(title_section, self._read_markdown_body(paper_path, markdown_content))
+            
+            # トークン予算内へ優先度順に詰め込み（titleセクションは常に先頭）
+            packed = self.content_packer.pack_sections(
+                extracted_blocks, self.section_priority, self.token_budget, header=title_section
+            )
+            
+            self.logger.info(f"Extracted {'title + ' if title_section else ''}{len(extracted_blocks)} sections "
+                             f"for tagging from {Path(paper_path).name} "
+                             f"({packed['tokens']}/{self.token_budget} tokens)")
             
-            return result
+            if packed['truncated_sections'] or packed['omitted_sections']:
+                self.logger.warning(f"Token budget exceeded for {Path(paper_path).name}: "
+                                    f"truncated {packed['truncated_sections']}, "
+                                    f"omitted {packed['omitted_sections']}")
+            
+            return packed['content']
             
         except Exception as e:
             self.logger.error(f"Failed to extract content from {paper_path}: {e}")
@@ -241,6 +294,43 @@ class TaggerWorkflow:
                 context={"paper_path": paper_path}
             ) from e
     
+    def _read_markdown_body(self, paper_path: str, markdown_content: Optional[str]) -> str:
+        """
+        本文を取得（セクション単位読み込み時は未読込のため全体を読み込む）
+        
+        Args:
+            paper_path: 論文ファイルパス
+            markdown_content: 読み込み済みの本文（未読込の場合None）
+            
+        Returns:
+            str: Markdown本文
+        """
+        if markdown_content is not None:
+            return markdown_content
+        
+        processor = YAMLHeaderProcessor(self.config_manager, self.integrated_logger)
+        _, markdown_content = processor.parse_yaml_header(Path(paper_path))
+        return markdown_content
+    
+    def _pack_full_content(self, title_section: str, markdown_content: str) -> str:
+        """
+        全文フォールバック時のコンテンツをトークン予算内に切り詰め
+        
+        Args:
+            title_section: titleセクション（空文字列の場合はtitleなし）
+            markdown_content: Markdown本文
+            
+        Returns:
+            str: title + 本文（トークン予算内）
+        """
+        body_budget = self.token_budget - self.content_packer.estimate_tokens(title_section)
+        body = self.content_packer.truncate_to_budget(markdown_content, max(0, body_budget))
+        
+        # titleがある場合は先頭に追加してから全文を返す
+        if title_section:
+            return f"{title_section}\n\n{body}"
+        return body
+    
     def _extract_title_section(self, yaml_data: dict) -> str:
         """
         YAMLヘッダーからtitleを抽出してMarkdownセクションとして作成
@@ -407,6 +497,27 @@ class TaggerWorkflow:
         self.logger.error(f"Could not parse any tags from response: {response[:200]}...")
         return []
     
+    def _detect_tags_response_end(self, partial_response: str) -> Optional[int]:
+        """
+        ストリーミング受信中のレスポンスでタグJSON配列が完成したかを判定
+        
+        Args:
+            partial_response: 受信済みのレスポンス
+            
+        Returns:
+            Optional[int]: 配列が完成していれば終端位置、未完成ならNone
+        """
+        start_idx = partial_response.find('[')
+        if start_idx == -1 or ']' not in partial_response[start_idx:]:
+            return None
+        
+        try:
+            tags, end_idx = json.JSONDecoder().raw_decode(partial_response, start_idx)
+        except ValueError:
+            return None
+        
+        return end_idx if isinstance(tags, list) else None
+    
     def _validate_tag_format(self, tag: str) -> bool:
         """
         タグ形式のバリデーション
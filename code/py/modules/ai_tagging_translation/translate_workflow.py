@@ -10,12 +10,14 @@ from pathlib import Path
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 
-from .claude_api_client import ClaudeAPIClient
+from .ai_job_queue import AIJobQueue
+from .claude_api_client import ClaudeAPIClient, ClaudeClientRegistry
 from ..shared_modules.config_manager import ConfigManager
 from ..shared_modules.integrated_logger import IntegratedLogger
 from ..shared_modules.exceptions import APIError, ProcessingError
 from ..status_management_yaml.status_manager import StatusManager
 from ..status_management_yaml.yaml_header_processor import YAMLHeaderProcessor
+from ..section_parsing.section_reader import SectionReader
 
 
 class TranslateWorkflow:
@@ -40,6 +42,7 @@ class TranslateWorkflow:
         # 設定値取得
         self.enabled = config_manager.get_ai_setting('translate_abstract', 'enabled', default=True)
         self.batch_size = config_manager.get_ai_setting('translate_abstract', 'batch_size', default=5)
+        self.max_tokens = config_manager.get_ai_setting('translate_abstract', 'max_tokens', default=2048)
         
         # Claude APIクライアント（遅延初期化）
         self._claude_client = None
@@ -48,9 +51,11 @@ class TranslateWorkflow:
     
     @property
     def claude_client(self) -> ClaudeAPIClient:
-        """Claude APIクライアントの遅延初期化"""
+        """Claude APIクライアントの遅延初期化（プロセス全体で共有）"""
         if self._claude_client is None:
-            self._claude_client = ClaudeAPIClient(self.config_manager, self.integrated_logger)
+            self._claude_client = ClaudeClientRegistry.get_client(
+                self.config_manager, self.integrated_logger, client_class=ClaudeAPIClient
+            )
         return self._claude_client
     
     def process_items(self, input_dir: str, target_items: Optional[List[str]] = None) -> Dict[str, Any]:
@@ -72,8 +77,11 @@ class TranslateWorkflow:
         
         # 処理対象論文の取得
         status_manager = StatusManager(self.config_manager, self.integrated_logger)
-        papers_needing_processing = status_manager.get_papers_needing_processing(
-            input_dir, 'translate_abstract', target_items
+        job_queue = AIJobQueue(self.config_manager, self.integrated_logger, input_dir)
+        papers_needing_processing = job_queue.collect_jobs(
+            'translate_abstract',
+            lambda: status_manager.get_papers_needing_processing(input_dir, 'translate_abstract', target_items),
+            target_items
         )
         
         processed_count = 0
@@ -82,6 +90,7 @@ class TranslateWorkflow:
         for paper_path in papers_needing_processing:
             try:
                 self.logger.debug(f"Processing translation for: {paper_path}")
+                job_queue.mark_started('translate_abstract', paper_path)
                 
                 # Abstract翻訳
                 translation = self.translate_abstract_single(paper_path)
@@ -108,11 +117,13 @@ class TranslateWorkflow:
                     # citation_keyを抽出してから状態更新
                     citation_key = Path(paper_path).parent.name
                     status_manager.update_status(input_dir, citation_key, 'translate_abstract', 'completed')
+                    job_queue.mark_completed('translate_abstract', paper_path)
                     processed_count += 1
                 else:
                     # 翻訳失敗
                     citation_key = Path(paper_path).parent.name
                     status_manager.update_status(input_dir, citation_key, 'translate_abstract', 'failed')
+                    job_queue.mark_failed('translate_abstract', paper_path, "No translation generated")
                     failed_count += 1
                     self.logger.warning(f"No translation generated for {Path(paper_path).name}")
                     
@@ -120,6 +131,7 @@ class TranslateWorkflow:
                 self.logger.error(f"Failed to translate abstract for {paper_path}: {e}")
                 citation_key = Path(paper_path).parent.name
                 status_manager.update_status(input_dir, citation_key, 'translate_abstract', 'failed')
+                job_queue.mark_failed('translate_abstract', paper_path, str(e))
                 failed_count += 1
         
         result = {
@@ -130,6 +142,10 @@ class TranslateWorkflow:
             'total_papers': len(papers_needing_processing)
         }
         
+        if job_queue.last_run_stats['resumed'] or job_queue.last_run_stats['quarantined_skipped']:
+            self.logger.info(f"Job queue: {job_queue.last_run_stats['resumed']} resumed, "
+                             f"{job_queue.last_run_stats['quarantined_skipped']} quarantined")
+        
         self.logger.info(f"Translate processing completed: {result}")
         return result
     
@@ -154,8 +170,16 @@ class TranslateWorkflow:
             # プロンプト構築
             prompt = self._build_translation_prompt(abstract_content)
             
-            # Claude API呼び出し
-            response = self.claude_client.send_request(prompt)
+            # Claude API呼び出し（翻訳本文の終了を検出した時点で受信終了、低品質時は上位モデルで再翻訳）
+            response = self.claude_client.send_request(
+                prompt,
+                max_tokens=self.max_tokens,
+                completion_detector=self._detect_translation_response_end,
+                quality_evaluator=lambda text: self.evaluate_translation_quality(
+                    self._parse_translation_response(text), abstract_content
+                ),
+                task='translate_abstract'
+            )
             
             # レスポンス解析
             translation = self._parse_translation_response(response)
@@ -181,6 +205,15 @@ class TranslateWorkflow:
             str: abstractコンテンツ
         """
         try:
+            # バイトオフセットが有効ならabstractセクションのみを直接読み込み
+            reader = SectionReader(paper_path)
+            abstract_content = reader.read_section_by_type('abstract', include_heading=True,
+                                                           include_subsections=True)
+            if abstract_content is not None:
+                abstract_content = re.sub(r'^#+\s*', '', abstract_content, flags=re.MULTILINE).strip()
+                self.logger.debug(f"Read abstract section by byte offset ({len(abstract_content)} chars)")
+                return abstract_content
+            
             # YAMLヘッダー解析
             processor = YAMLHeaderProcessor(self.config_manager, self.integrated_logger)
             yaml_data, markdown_content = processor.parse_yaml_header(Path(paper_path))
@@ -194,7 +227,8 @@ class TranslateWorkflow:
                 return ""
             
             # abstractセクションを探す
-            markdown_lines = markdown_content.split('\n')
+            # parse_yaml_headerは本文先頭の空行を除去するため、行番号に合わせて補う
+            markdown_lines = [''] * reader.count_leading_blank_lines() + markdown_content.split('\n')
             
             for section in sections:
                 section_type = section.get('section_type')
@@ -332,6 +366,26 @@ class TranslateWorkflow:
             self.logger.debug(f"Response content: '{response[:200]}...'")
             return ""
     
+    def _detect_translation_response_end(self, partial_response: str) -> Optional[int]:
+        """
+        ストリーミング受信中のレスポンスで翻訳本文が終了したかを判定
+        
+        翻訳本文の後に区切り線（---）が出力された場合、以降は注釈等の
+        付随テキストとみなして本文の終端とします。
+        
+        Args:
+            partial_response: 受信済みのレスポンス
+            
+        Returns:
+            Optional[int]: 本文が終了していれば終端位置、未終了ならNone
+        """
+        for match in re.finditer(r'^-{3,}[ \t]*\n', partial_response, flags=re.MULTILINE):
+            body = partial_response[:match.start()]
+            if len(body.strip()) >= 50 and re.search(r'[\u3040-\u30ff\u4e00-\u9fff]', body):
+                return match.start()
+        
+        return None
+    
     def evaluate_translation_quality(self, translation: str, original: str) -> float:
         """
         翻訳品質の評価
@@ -9,6 +9,7 @@ from .api_clients import CrossRefAPIClient, SemanticScholarAPIClient, OpenCitati
 from .data_quality_evaluator import DataQualityEvaluator
 from .rate_limiter import RateLimiter
 from .citation_statistics import CitationStatistics
+from .response_cache import APIResponseCache
 
 __all__ = [
     'CitationFetcherWorkflow',
@@ -17,7 +18,8 @@ __all__ = [
     'OpenCitationsAPIClient',
     'DataQualityEvaluator',
     'RateLimiter',
-    'CitationStatistics'
+    'CitationStatistics',
+    'APIResponseCache'
 ]
 
 __version__ = '3.2.0' 
\ No newline at end of file
@@ -16,7 +16,8 @@ class BaseAPIClient(ABC):
     """
     APIクライアントベースクラス
     
-    共通のAPIアクセス機能とエラーハンドリングを提供
+    共通のAPIアクセス機能とエラーハンドリングを提供。
+    response_cacheを設定した場合、DOI単位のレスポンスをキャッシュから返し、取得結果を保存する。
     """
     
     def __init__(self, config_manager, logger, api_name: str):
@@ -35,6 +36,9 @@ class BaseAPIClient(ABC):
         # API設定取得
         self.config = self._get_api_config()
         
+        # レスポンスキャッシュ（CitationFetcherWorkflowがワークスペースのキャッシュを設定）
+        self.response_cache = None
+        
         # HTTPセッション
         self.session = requests.Session()
         self.session.timeout = self.config.get('timeout', 30)
@@ -72,7 +76,7 @@ class BaseAPIClient(ABC):
             return {}
     
     def _make_request(self, url: str, params: Optional[Dict] = None, 
-                     headers: Optional[Dict] = None) -> Dict[str, Any]:
+                     headers: Optional[Dict] = None, cache_key: Optional[str] = None) -> Dict[str, Any]:
         """
         HTTP請求を実行
         
@@ -80,6 +84,7 @@ class BaseAPIClient(ABC):
             url (str): 請求URL
             params (Optional[Dict]): クエリパラメータ
             headers (Optional[Dict]): 追加ヘッダー
+            cache_key (Optional[str]): レスポンスキャッシュのキー（論文のDOI）
             
         Returns:
             Dict[str, Any]: レスポンスデータ
@@ -87,6 +92,12 @@ class BaseAPIClient(ABC):
         Raises:
             APIError: API請求エラー時
         """
+        if cache_key is not None and self.response_cache is not None:
+            cached = self.response_cache.get(self.api_name, cache_key)
+            if cached is not None:
+                self.logger.debug(f"Using cached {self.api_name} response for {cache_key}")
+                return cached
+        
         try:
             if headers:
                 request_headers = {**self.session.headers, **headers}
@@ -116,13 +127,17 @@ class BaseAPIClient(ABC):
             
             # JSON解析
             try:
-                return response.json()
+                response_data = response.json()
             except ValueError as e:
                 raise APIError(
                     f"Invalid JSON response from {self.api_name}: {str(e)}",
                     error_code="API_INVALID_JSON",
                     context={"api_name": self.api_name, "response_text": response.text[:200]}
                 )
+            
+            if cache_key is not None and self.response_cache is not None and response_data:
+                self.response_cache.put(self.api_name, cache_key, response_data)
+            return response_data
                 
         except requests.exceptions.Timeout:
             raise APIError(
@@ -174,7 +189,7 @@ class CrossRefAPIClient(BaseAPIClient):
             url = self._build_api_url(doi)
             
             # API呼び出し
-            response_data = self._make_request(url)
+            response_data = self._make_request(url, cache_key=doi)
             
             # レスポンス解析
             citations = self._parse_crossref_response(response_data)
@@ -313,7 +328,7 @@ class SemanticScholarAPIClient(BaseAPIClient):
             url = self._build_api_url(doi)
             
             # API呼び出し
-            response_data = self._make_request(url)
+            response_data = self._make_request(url, cache_key=doi)
             
             # レスポンス解析
             citations = self._parse_semantic_scholar_response(response_data)
@@ -463,7 +478,7 @@ class OpenCitationsAPIClient(BaseAPIClient):
             url = self._build_api_url(normalized_doi)
             
             # API呼び出し
-            response_data = self._make_request(url)
+            response_data = self._make_request(url, cache_key=doi)
             
             # レスポンス解析
             citations = self._parse_opencitations_response(response_data)
@@ -15,6 +15,7 @@ from ..shared_modules.bibtex_parser import BibTeXParser
 from ..shared_modules.exceptions import BibTeXError, APIError, ProcessingError
 from ..status_management_yaml.yaml_header_processor import YAMLHeaderProcessor
 from ..status_management_yaml.status_manager import StatusManager
+from .response_cache import APIResponseCache
 
 
 class CitationFetcherWorkflow:
@@ -46,6 +47,9 @@ class CitationFetcherWorkflow:
         self._semantic_scholar_client = None
         self._opencitations_client = None
         
+        # APIレスポンスキャッシュ（process_itemsでワークスペースごとに設定）
+        self.response_cache = None
+        
         # サポートクラス（遅延初期化）
         self._rate_limiter = None
         self._quality_evaluator = None
@@ -112,6 +116,9 @@ class CitationFetcherWorkflow:
         try:
             self.logger.info(f"Starting citation fetcher workflow for directory: {input_dir}")
             
+            # APIレスポンスキャッシュ（{workspace}/.citation_api_cache、sync DOIレポートでも参照）
+            self.response_cache = APIResponseCache.for_workspace(self.config_manager, Path(input_dir).parent)
+            
             # 処理対象論文の取得
             status_manager = StatusManager(self.config_manager, self.logger)
             papers_needing_processing = status_manager.get_papers_needing_processing(
@@ -227,7 +234,8 @@ class CitationFetcherWorkflow:
                     # レート制限チェック
                     self.rate_limiter.wait_if_needed(api_name, rate_limit)
                     
-                    # API呼び出し
+                    # API呼び出し（キャッシュ済みレスポンスがあれば再利用）
+                    client.response_cache = self.response_cache
                     data = client.fetch_citations(doi)
                     
                     if data:
@@ -0,0 +1,171 @@
+"""
+API Response Cache Module
+
+引用文献APIレスポンスのディスクキャッシュ - API名・DOIごとにレスポンスJSONを保存し、
+再取得時やsyncレポート作成時（オフライン）に再利用する
+"""
+
+import os
+import json
+import time
+import hashlib
+import tempfile
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Union
+
+
+class APIResponseCache:
+    """
+    APIレスポンスキャッシュ
+
+    キャッシュ構成:
+        {workspace}/.citation_api_cache/{api_name}/{sha1先頭2文字}/{sha1(正規化DOI)}.json
+    各ファイルはapi、key、fetched_at、dataを持つ。読み書きのエラーはキャッシュなしとして扱う。
+    """
+
+    DIR_NAME = '.citation_api_cache'
+
+    def __init__(self, cache_dir: Union[str, Path], ttl_days: Optional[float] = 30):
+        """
+        APIResponseCache初期化
+
+        Args:
+            cache_dir: キャッシュディレクトリ
+            ttl_days: レスポンスの有効日数（None・0以下は無期限）
+        """
+        self.cache_dir = Path(cache_dir)
+        self.ttl_seconds = ttl_days * 86400 if ttl_days and ttl_days > 0 else None
+
+    @classmethod
+    def for_workspace(cls, config_manager, workspace_dir: Union[str, Path]) -> Optional['APIResponseCache']:
+        """
+        ワークスペースのキャッシュを設定から作成
+
+        Args:
+            config_manager: 設定管理インスタンス（citation_fetcher.response_cacheを使用）
+            workspace_dir: ワークスペースディレクトリ（Clippingsの親ディレクトリ）
+
+        Returns:
+            Optional[APIResponseCache]: キャッシュ（無効化されている場合None）
+        """
+        full_config = config_manager.get_config()
+        citation_config = full_config.get('citation_fetcher', {}) if isinstance(full_config, dict) else {}
+        cache_config = citation_config.get('response_cache', {}) if isinstance(citation_config, dict) else {}
+        if not isinstance(cache_config, dict):
+            cache_config = {}
+        if not cache_config.get('enabled', True):
+            return None
+        ttl_days = cache_config.get('ttl_days', 30)
+        if not isinstance(ttl_days, (int, float)) or isinstance(ttl_days, bool):
+            ttl_days = None
+        return cls(Path(workspace_dir) / cls.DIR_NAME, ttl_days)
+
+    @staticmethod
+    def normalize_key(doi: str) -> str:
+        """DOIをキャッシュキーに正規化（大文字小文字・前後空白・doi.orgプレフィックスを無視）"""
+        key = str(doi).strip().lower()
+        for prefix in ('https://doi.org/', 'http://doi.org/', 'https://dx.doi.org/', 'http://dx.doi.org/', 'doi:'):
+            if key.startswith(prefix):
+                key = key[len(prefix):].strip()
+        return key
+
+    def get(self, api_name: str, doi: str, allow_stale: bool = False) -> Optional[Any]:
+        """
+        キャッシュ済みレスポンスを取得
+
+        Args:
+            api_name: API名（crossref等）
+            doi: 論文のDOI
+            allow_stale: Trueの場合は有効期限切れのレスポンスも返す
+
+        Returns:
+            Optional[Any]: レスポンスデータ（ない・期限切れ・読み込み失敗の場合None）
+        """
+        try:
+            with open(self._path(api_name, doi), 'r', encoding='utf-8') as f:
+                record = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not allow_stale and self.ttl_seconds is not None \
+                and time.time() - record.get('fetched_at', 0) > self.ttl_seconds:
+            return None
+        return record.get('data')
+
+    def put(self, api_name: str, doi: str, data: Any) -> bool:
+        """
+        レスポンスを保存（一時ファイル経由で置き換え）
+
+        Args:
+            api_name: API名
+            doi: 論文のDOI
+            data: レスポンスデータ（JSON化可能な値）
+
+        Returns:
+            bool: 保存できた場合True
+        """
+        path = self._path(api_name, doi)
+        record = {'api': api_name, 'key': self.normalize_key(doi), 'fetched_at': time.time(), 'data': data}
+        temp_path = None
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=str(path.parent), prefix=f".{path.name}.", suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(record, f, ensure_ascii=False, separators=(',', ':'))
+            os.replace(temp_path, path)
+            return True
+        except (OSError, TypeError, ValueError):
+            if temp_path is not None and os.path.exists(temp_path):
+                os.unlink(temp_path)
+            return False
+
+    def work_metadata(self, doi: str) -> Optional[Dict[str, Any]]:
+        """
+        キャッシュ済みCrossRefレスポンス（/works/{doi}）から論文自体の書誌情報を取得
+
+        ネットワークアクセスは行わず、有効期限切れのレスポンスも使用する。
+
+        Args:
+            doi: 論文のDOI
+
+        Returns:
+            Optional[Dict[str, Any]]: title、authors、year、journal、publisher（キャッシュがない場合None）
+        """
+        response = self.get('crossref', doi, allow_stale=True)
+        message = response.get('message') if isinstance(response, dict) else None
+        if not isinstance(message, dict):
+            return None
+
+        authors: List[str] = []
+        for author in message.get('author') or []:
+            if not isinstance(author, dict):
+                continue
+            name = ', '.join(part for part in (author.get('family'), author.get('given')) if part)
+            if name or author.get('name'):
+                authors.append(name or author['name'])
+
+        year = None
+        for date_field in ('published-print', 'published-online', 'issued', 'created'):
+            date_parts = (message.get(date_field) or {}).get('date-parts') or []
+            if date_parts and date_parts[0] and date_parts[0][0]:
+                year = date_parts[0][0]
+                break
+
+        return {
+            'title': self._first(message.get('title')),
+            'authors': authors,
+            'year': year,
+            'journal': self._first(message.get('container-title')),
+            'publisher': message.get('publisher') or ''
+        }
+
+    @staticmethod
+    def _first(value: Any) -> str:
+        """CrossRefのリスト形式フィールドの先頭要素"""
+        if isinstance(value, list):
+            return str(value[0]) if value else ''
+        return str(value) if value else ''
+
+    def _path(self, api_name: str, doi: str) -> Path:
+        """キャッシュファイルパス"""
+        digest = hashlib.sha1(self.normalize_key(doi).encode('utf-8')).hexdigest()
+        return self.cache_dir / api_name / digest[:2] / f"{digest}.json"
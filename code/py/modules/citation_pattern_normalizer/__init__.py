@@ -5,5 +5,8 @@ publishers into a unified [n] format.
 """
 
 from .citation_pattern_normalizer_workflow import CitationPatternNormalizerWorkflow
+from .pattern_registry import CompiledPublisherParser, PublisherPatternRegistry
+from .detection_index import PublisherDetectionIndex
 
-__all__ = ['CitationPatternNormalizerWorkflow']
\ No newline at end of file
+__all__ = ['CitationPatternNormalizerWorkflow', 'CompiledPublisherParser', 'PublisherPatternRegistry',
+           'PublisherDetectionIndex']
\ No newline at end of file
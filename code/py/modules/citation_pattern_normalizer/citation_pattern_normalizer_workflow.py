@@ -3,13 +3,74 @@
 
 import os
 import re
+import json
 import yaml
+import hashlib
+import logging
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, List, Optional, Tuple, Any
-from collections import OrderedDict
+from collections import OrderedDict, Counter
 from datetime import datetime
 
 from ..shared_modules.exceptions import ProcessingError
 from ..status_management_yaml.status_manager import StatusManager
+from .pattern_registry import CompiledPublisherParser, PublisherPatternRegistry
+from .detection_index import PublisherDetectionIndex
+
+
+# Superscript digits used by publishers for numeric citations
+SUPERSCRIPT_DIGITS = {
+    '¹': '1', '²': '2', '³': '3', '⁴': '4', '⁵': '5',
+    '⁶': '6', '⁷': '7', '⁸': '8', '⁹': '9', '⁰': '0'
+}
+
+_REPEATED_COMMAS = re.compile(r',+')
+
+# Bump when normalization logic outside publisher_patterns.yaml changes,
+# so previously normalized files are processed again
+NORMALIZATION_ENGINE_VERSION = 1
+
+# Common citation pattern indicators that might not be handled by a parser
+_UNSUPPORTED_PATTERNS = [re.compile(pattern) for pattern in [
+    r'\[[a-zA-Z]+\d+\]',  # [Smith2020] style
+    r'\([a-zA-Z]+\s+\d+\)',  # (Smith 2020) style
+    r'\([a-zA-Z]+\s+et\s+al\.?\s*,?\s*\d+\)',  # (Smith et al., 2020) style
+    r'ref\s*\(\s*\d+\s*\)',  # ref(1) style
+    r'reference\s*\[\s*\d+\s*\]',  # reference [1] style
+    r'\[\d+\-\d+\]',  # [1-3] range style
+    r'[⁰¹²³⁴⁵⁶⁷⁸⁹]+',  # Remaining superscripts
+    r'<sup>\d+</sup>',  # HTML superscript
+]]
+
+# Markdown/HTML links wrapped around citation numbers: [citation](url) or [citation][ref]
+_CITATION_LINK_PATTERNS = [re.compile(pattern) for pattern in [
+    # Handle escaped patterns like \[4–8](url) with ranges and em-dashes, including ^ patterns
+    r'\\?\[([¹²³⁴⁵⁶⁷⁸⁹⁰\d,\s–\-\^]+)\]\\?\([^)]+\\?\)',  # \[citation](url) or [citation](url) - includes ^
+    r'\\?\[([¹²³⁴⁵⁶⁷⁸⁹⁰\d,\s–\-\^]+)\]\\?\[[^\]]+\\?\]',  # \[citation][ref] or [citation][ref] - includes ^
+    r'<a[^>]*>([¹²³⁴⁵⁶⁷⁸⁹⁰\d,\s–\-\^]+)</a>',             # HTML links - includes ^
+    # Simple citation patterns
+    r'\\?\[([¹²³⁴⁵⁶⁷⁸⁹⁰\d,\s\^]+)\]\\?\([^)]+\\?\)',      # \[citation](url) or [citation](url) - includes ^
+    r'\\?\[([¹²³⁴⁵⁶⁷⁸⁹⁰\d,\s\^]+)\]\\?\[[^\]]+\\?\]',      # \[citation][ref] or [citation][ref] - includes ^
+    r'<a[^>]*>([¹²³⁴⁵⁶⁷⁸⁹⁰\d,\s\^]+)</a>',                 # HTML links - includes ^
+]]
+
+# Escaped backslashes around citation brackets
+_ESCAPED_SIMPLE_CITATION = re.compile(r'\\(\[[\d,\s–\-\^]+\])\\?')
+_ESCAPED_CITATION = re.compile(r'\\(\[[\d,\s–\-\^]+\])')
+_ESCAPED_NESTED_CITATION = re.compile(r'\\(\[[\[\]\d,\s–\-\^]+\])')
+_TRAILING_BACKSLASH_CITATION = re.compile(r'(\[[\[\]\d,\s–\-\^]+\])\\')
+
+# Footnote-style ^ citations
+_CARET_NUMBER = re.compile(r'\^?(\d+)')
+_CARET_CITATION_LIST = re.compile(r'\[\[?\^(\d+)(?:,\s*\[?\^(\d+)\]?)*\]?\]?')
+_CARET_CITATION_SIMPLE = re.compile(r'\[+\^(\d+)\]+')
+_CARET_CITATION_REMAINING = re.compile(r'\[+[^\]]*\^[^\]]*\]+')
+
+# Double bracket patterns left after link removal
+_DOUBLE_BRACKET_LIST = re.compile(r'\[\[(\d+(?:[–-]\d+)?(?:,\s*\d+(?:[–-]\d+)?)*)\]\]')
+_DOUBLE_BRACKET_PAIR = re.compile(r'\[\[(\d+)\],\s*\[(\d+)\]\]')
+_DOUBLE_BRACKET_RANGE_PAIR = re.compile(r'\[\[(\d+(?:[–-]\d+)?)\],\s*\[(\d+(?:[–-]\d+)?)\]\]')
+_DOUBLE_BRACKET_TRIPLE = re.compile(r'\[\[(\d+)\],\s*\[(\d+)\],\s*\[(\d+)\]\]')
 
 
 class CitationPatternNormalizerWorkflow:
@@ -30,11 +91,18 @@ class CitationPatternNormalizerWorkflow:
             self.logger = logger
         self.status_manager = StatusManager(config_manager, logger)
         
-        # Load publisher patterns configuration
+        # Load publisher patterns configuration (compiled once per process)
+        self.pattern_registry: Optional[PublisherPatternRegistry] = None
+        self._compiled_parsers: Dict[str, CompiledPublisherParser] = {}
         self.publisher_parsers = self._load_publisher_parsers()
+        self._detection_index: Optional[PublisherDetectionIndex] = None
+        self._pattern_set_hash: Optional[Tuple[Dict[str, Any], int, str]] = None
+        # Detection counts keyed by (rule, publisher)
+        self.detection_counts: Counter = Counter()
         
         # Get configuration
         self.enabled = self.config.config.get('citation_pattern_normalizer', {}).get('enabled', True)
+        self.skip_unchanged = self.config.config.get('citation_pattern_normalizer', {}).get('skip_unchanged', True)
         self.batch_size = self.config.config.get('citation_pattern_normalizer', {}).get('batch_size', 20)
         self.retry_attempts = self.config.config.get('citation_pattern_normalizer', {}).get('retry_attempts', 3)
         
@@ -48,11 +116,21 @@ class CitationPatternNormalizerWorkflow:
         self.unsupported_pattern_alert = notification_config.get('unsupported_pattern_alert', True)
         self.new_parser_suggestion = notification_config.get('new_parser_suggestion', True)
         
+        # Parallel execution settings (process pool)
+        parallel_config = self.config.config.get('citation_pattern_normalizer', {}).get('parallel', {})
+        self.parallel_enabled = parallel_config.get('enabled', True)
+        self.max_workers = parallel_config.get('max_workers') or os.cpu_count() or 1
+        self.chunk_size = parallel_config.get('chunk_size', 4)
+        self.parallel_min_files = parallel_config.get('min_files', 16)
+        
         self.logger.info(f"CitationPatternNormalizerWorkflow initialized with {len(self.publisher_parsers)} parsers")
     
     def _load_publisher_parsers(self) -> Dict[str, Any]:
         """Load publisher patterns from configuration file.
         
+        Patterns are held by a process-wide PublisherPatternRegistry that compiles
+        them once and reloads them when the file's modification time changes.
+        
         Returns:
             Dict containing publisher parser configurations
         """
@@ -70,10 +148,8 @@ class CitationPatternNormalizerWorkflow:
                 self.logger.warning(f"Publisher patterns file not found: {patterns_file}")
                 return {}
             
-            with open(patterns_file, 'r', encoding='utf-8') as f:
-                patterns_data = yaml.safe_load(f)
-            
-            return patterns_data.get('parsers', {})
+            self.pattern_registry = PublisherPatternRegistry.get_registry(patterns_file, self.logger)
+            return self.pattern_registry.parsers
         
         except Exception as e:
             self.logger.error(f"Failed to load publisher patterns: {e}")
@@ -95,6 +171,10 @@ class CitationPatternNormalizerWorkflow:
         
         self.logger.info(f"Starting citation pattern normalization in {input_dir}")
         
+        # Reload publisher patterns if publisher_patterns.yaml changed
+        self._refresh_publisher_parsers()
+        self.detection_counts.clear()
+        
         processed = 0
         skipped = 0
         failed = 0
@@ -103,30 +183,18 @@ class CitationPatternNormalizerWorkflow:
             # Get list of markdown files to process
             markdown_files = self._find_markdown_files(input_dir, target_items)
             
-            for file_path in markdown_files:
+            pending_files = [(file_path, os.path.basename(os.path.dirname(file_path)))
+                             for file_path in markdown_files]
+            
+            # Normalization runs in worker processes; writes and status updates stay here
+            for file_path, citation_key, normalized in self._normalize_files(pending_files):
+                if normalized.get('skip_reason'):
+                    skipped += 1
+                    self.logger.debug(f"Skipping {citation_key}: {normalized['skip_reason']}")
+                    continue
+                
                 try:
-                    citation_key = os.path.basename(os.path.dirname(file_path))
-                    
-                    # Check if already processed
-                    try:
-                        if hasattr(self.status_manager, 'should_skip_processing'):
-                            if self.status_manager.should_skip_processing(citation_key, 'citation_pattern_normalizer'):
-                                self.logger.info(f"Skipping {citation_key}: already processed")
-                                skipped += 1
-                                continue
-                        else:
-                            # Alternative method to check processing status
-                            if hasattr(self.status_manager, 'get_processing_status'):
-                                status = self.status_manager.get_processing_status(citation_key, 'citation_pattern_normalizer')
-                                if status == 'completed':
-                                    self.logger.info(f"Skipping {citation_key}: already processed")
-                                    skipped += 1
-                                    continue
-                    except Exception as e:
-                        self.logger.debug(f"Status check failed for {citation_key}: {e}, proceeding with processing")
-                    
-                    # Process the file
-                    result = self._process_single_file(file_path, citation_key)
+                    result = self._finish_single_file(file_path, citation_key, normalized)
                     
                     if result:
                         processed += 1
@@ -140,6 +208,8 @@ class CitationPatternNormalizerWorkflow:
                     self.logger.error(f"Error processing {file_path}: {e}")
             
             self.logger.info(f"Citation pattern normalization completed: {processed} processed, {skipped} skipped, {failed} failed")
+            if self.detection_counts:
+                self.logger.info(f"Publisher detection rules fired: {self.get_detection_stats()}")
             
             return {
                 "status": "completed",
@@ -181,15 +251,99 @@ class CitationPatternNormalizerWorkflow:
             self.logger.error(f"Error finding markdown files: {e}")
             return []
     
-    def _process_single_file(self, file_path: str, citation_key: str) -> bool:
-        """Process a single markdown file for citation normalization.
+    def _normalize_files(self, pending_files: List[Tuple[str, str]]):
+        """Normalize files, using a process pool for large batches.
+        
+        Args:
+            pending_files: List of (file_path, citation_key) to normalize
+            
+        Yields:
+            Tuple of (file_path, citation_key, normalized result) in input order
+        """
+        use_pool = (self.parallel_enabled and self.max_workers > 1
+                    and len(pending_files) >= self.parallel_min_files)
+        # Number of files already yielded (a pool failure only reprocesses the rest serially)
+        completed = 0
+        
+        if use_pool:
+            file_paths = [file_path for file_path, _ in pending_files]
+            max_workers = min(self.max_workers, len(pending_files))
+            self.logger.info(f"Normalizing {len(pending_files)} files with {max_workers} "
+                             f"worker processes (chunk size: {self.chunk_size})")
+            try:
+                with ProcessPoolExecutor(
+                    max_workers=max_workers,
+                    initializer=_init_normalizer_worker,
+                    initargs=(self.publisher_parsers, self._get_worker_settings())
+                ) as executor:
+                    # Consume results lazily so each one is written and released as it arrives
+                    results = executor.map(_normalize_file_in_worker, file_paths,
+                                           chunksize=max(1, self.chunk_size))
+                    for (file_path, citation_key), normalized in zip(pending_files, results):
+                        completed += 1
+                        yield file_path, citation_key, normalized
+            except Exception as e:
+                self.logger.warning(f"Process pool normalization failed ({e}), falling back to serial "
+                                    f"execution for {len(pending_files) - completed} remaining files")
+                use_pool = False
+        
+        if not use_pool:
+            for file_path, citation_key in pending_files[completed:]:
+                yield file_path, citation_key, self._normalize_file(file_path)
+    
+    def _get_worker_settings(self) -> Dict[str, Any]:
+        """Settings needed to normalize files in a worker process.
+        
+        Returns:
+            Dict of picklable settings
+        """
+        return {
+            'skip_unchanged': self.skip_unchanged,
+            'auto_detect': self.auto_detect,
+            'fallback_parser': self.fallback_parser,
+            'unsupported_pattern_alert': self.unsupported_pattern_alert
+        }
+    
+    @classmethod
+    def _create_worker_instance(cls, publisher_parsers: Dict[str, Any],
+                                settings: Dict[str, Any]) -> 'CitationPatternNormalizerWorkflow':
+        """Create a minimal instance that only normalizes content (no I/O side effects).
+        
+        Args:
+            publisher_parsers: Publisher parser configurations
+            settings: Settings from _get_worker_settings
+            
+        Returns:
+            Worker-side workflow instance
+        """
+        workflow = cls.__new__(cls)
+        workflow.config = None
+        workflow.logger = logging.getLogger('citation_pattern_normalizer.worker')
+        workflow.status_manager = None
+        workflow.pattern_registry = None
+        workflow._compiled_parsers = {}
+        workflow._detection_index = None
+        workflow._pattern_set_hash = None
+        workflow.detection_counts = Counter()
+        workflow.skip_unchanged = settings['skip_unchanged']
+        workflow.publisher_parsers = publisher_parsers
+        workflow.auto_detect = settings['auto_detect']
+        workflow.fallback_parser = settings['fallback_parser']
+        # Unsupported patterns are collected and reported by the main process
+        workflow.unsupported_pattern_alert = False
+        workflow.new_parser_suggestion = False
+        workflow.collect_unsupported_patterns = settings['unsupported_pattern_alert']
+        return workflow
+    
+    def _normalize_file(self, file_path: str) -> Dict[str, Any]:
+        """Read a markdown file and compute its normalized content without writing.
         
         Args:
             file_path: Path to the markdown file
-            citation_key: Citation key for the paper
             
         Returns:
-            True if processing succeeded, False otherwise
+            Dict with updated_content, publisher and unsupported_patterns,
+            skip_reason if no write is needed, or error
         """
         try:
             # Read the file
@@ -199,8 +353,12 @@ class CitationPatternNormalizerWorkflow:
             # Extract YAML header and content
             yaml_header, markdown_content = self._extract_yaml_and_content(content)
             
+            # Body and patterns unchanged since the last normalization
+            if self.skip_unchanged and self._is_up_to_date(yaml_header, markdown_content):
+                return {'skip_reason': 'already normalized with current patterns', 'error': None}
+            
             # Detect publisher
-            publisher = self.detect_publisher(markdown_content, yaml_header)
+            publisher, detection_rule = self._detect_publisher_with_rule(markdown_content, yaml_header)
             
             # Remove links from citations if present
             content_without_links = self._remove_citation_links(markdown_content)
@@ -208,23 +366,61 @@ class CitationPatternNormalizerWorkflow:
             # Normalize citations
             normalized_content, normalization_results = self.normalize_citations(content_without_links, publisher)
             
+            # Worker processes return unsupported patterns for the main process to report;
+            # otherwise normalize_citations has already reported them
+            unsupported_patterns = None
+            if getattr(self, 'collect_unsupported_patterns', False):
+                unsupported_patterns = self._find_unsupported_patterns(normalized_content) or None
+            
             # Update YAML header with normalization results
-            updated_yaml_header = self._update_yaml_header(yaml_header, publisher, normalization_results)
+            updated_yaml_header = self._update_yaml_header(yaml_header, publisher, normalization_results,
+                                                           normalized_content)
             
-            # Write back the updated content
-            updated_content = self._combine_yaml_and_content(updated_yaml_header, normalized_content)
+            # Keep the previous timestamp if nothing else changed, so unchanged files are not rewritten
+            previous = yaml_header.get('citation_normalization')
+            if isinstance(previous, dict) and 'generated_at' in previous:
+                current = updated_yaml_header['citation_normalization']
+                if dict(current, generated_at=previous['generated_at']) == previous:
+                    current['generated_at'] = previous['generated_at']
+            
+            if updated_yaml_header == yaml_header and normalized_content == markdown_content:
+                return {'skip_reason': 'normalization output equals input', 'error': None}
             
+            return {
+                'updated_content': self._combine_yaml_and_content(updated_yaml_header, normalized_content),
+                'publisher': publisher,
+                'detection_rule': detection_rule,
+                'unsupported_patterns': unsupported_patterns,
+                'error': None
+            }
+        
+        except Exception as e:
+            return {'error': str(e)}
+    
+    def _finish_single_file(self, file_path: str, citation_key: str, normalized: Dict[str, Any]) -> bool:
+        """Write normalized content (processing status is part of the updated header).
+        
+        Args:
+            file_path: Path to the markdown file
+            citation_key: Citation key for the paper
+            normalized: Result of _normalize_file
+            
+        Returns:
+            True if processing succeeded, False otherwise
+        """
+        if normalized.get('error'):
+            self.logger.error(f"Error processing file {file_path}: {normalized['error']}")
+            return False
+        
+        try:
+            if normalized.get('unsupported_patterns'):
+                self._report_unsupported_patterns(normalized['publisher'], normalized['unsupported_patterns'])
+            
+            # Write back the updated content
             with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(updated_content)
+                f.write(normalized['updated_content'])
             
-            # Update processing status
-            try:
-                if hasattr(self.status_manager, 'update_processing_status'):
-                    self.status_manager.update_processing_status(citation_key, 'citation_pattern_normalizer', 'completed')
-                else:
-                    self.logger.debug(f"StatusManager does not have update_processing_status method, skipping status update for {citation_key}")
-            except Exception as e:
-                self.logger.debug(f"Failed to update processing status for {citation_key}: {e}")
+            self.detection_counts[(normalized['detection_rule'], normalized['publisher'])] += 1
             
             return True
         
@@ -232,6 +428,18 @@ class CitationPatternNormalizerWorkflow:
             self.logger.error(f"Error processing file {file_path}: {e}")
             return False
     
+    def _process_single_file(self, file_path: str, citation_key: str) -> bool:
+        """Process a single markdown file for citation normalization.
+        
+        Args:
+            file_path: Path to the markdown file
+            citation_key: Citation key for the paper
+            
+        Returns:
+            True if processing succeeded, False otherwise
+        """
+        return self._finish_single_file(file_path, citation_key, self._normalize_file(file_path))
+    
     def _extract_yaml_and_content(self, content: str) -> Tuple[Dict[str, Any], str]:
         """Extract YAML header and markdown content.
         
@@ -287,44 +495,76 @@ class CitationPatternNormalizerWorkflow:
         Returns:
             Publisher identifier
         """
+        publisher, _ = self._detect_publisher_with_rule(content, metadata)
+        return publisher
+    
+    def _detect_publisher_with_rule(self, content: str, metadata: Dict[str, Any]) -> Tuple[str, str]:
+        """Detect publisher and report which detection rule fired.
+        
+        Args:
+            content: Markdown content
+            metadata: YAML header metadata
+            
+        Returns:
+            Tuple of (publisher identifier, rule) where rule is one of
+            'manual', 'doi_prefix', 'journal_keyword' or 'fallback'
+        """
         # Check if publisher is manually specified in metadata
         if 'publisher' in metadata:
             manual_publisher = metadata['publisher'].lower()
             for parser_name in self.publisher_parsers:
                 if parser_name in manual_publisher or manual_publisher in parser_name:
                     self.logger.info(f"Using manually specified publisher: {parser_name}")
-                    return parser_name
+                    return parser_name, 'manual'
         
         # Auto-detect publisher if enabled
         if self.auto_detect:
-            # Try DOI-based detection
+            detection_index = self._get_detection_index()
+            
+            # Try DOI-based detection (one walk of the prefix trie)
             doi = metadata.get('doi', '')
             if doi:
-                for parser_name, parser_config in self.publisher_parsers.items():
-                    detection_config = parser_config.get('detection', {})
-                    doi_prefixes = detection_config.get('doi_prefixes', [])
-                    
-                    for prefix in doi_prefixes:
-                        if doi.startswith(prefix):
-                            self.logger.info(f"Detected publisher from DOI: {parser_name}")
-                            return parser_name
-            
-            # Try journal name-based detection
-            title = metadata.get('title', '')
-            journal = metadata.get('journal', '')
-            
-            for parser_name, parser_config in self.publisher_parsers.items():
-                detection_config = parser_config.get('detection', {})
-                journal_keywords = detection_config.get('journal_keywords', [])
-                
-                for keyword in journal_keywords:
-                    if keyword.lower() in title.lower() or keyword.lower() in journal.lower():
-                        self.logger.info(f"Detected publisher from journal: {parser_name}")
-                        return parser_name
+                match = detection_index.match_doi(str(doi))
+                if match:
+                    self.logger.info(f"Detected publisher from DOI: {match[0]} (prefix: {match[1]})")
+                    return match[0], 'doi_prefix'
+            
+            # Try journal name-based detection (one keyword automaton pass per field)
+            title = metadata.get('title', '') or ''
+            journal = metadata.get('journal', '') or ''
+            
+            match = detection_index.match_keywords(str(title), str(journal))
+            if match:
+                self.logger.info(f"Detected publisher from journal: {match[0]} (keyword: {match[1]})")
+                return match[0], 'journal_keyword'
         
         # Use fallback parser
         self.logger.info(f"Using fallback parser: {self.fallback_parser}")
-        return self.fallback_parser
+        return self.fallback_parser, 'fallback'
+    
+    def _get_detection_index(self) -> PublisherDetectionIndex:
+        """Get the detection index, rebuilding it when publisher parsers change.
+        
+        Returns:
+            Detection index over the current publisher parsers
+        """
+        index = self._detection_index
+        if (index is None or index.parsers is not self.publisher_parsers
+                or index.parser_count != len(self.publisher_parsers)):
+            index = PublisherDetectionIndex(self.publisher_parsers)
+            self._detection_index = index
+        return index
+    
+    def get_detection_stats(self) -> Dict[str, Dict[str, int]]:
+        """Get how often each detection rule fired, per publisher.
+        
+        Returns:
+            Dict mapping rule to {publisher: count}
+        """
+        stats: Dict[str, Dict[str, int]] = {}
+        for (rule, publisher), count in sorted(self.detection_counts.items()):
+            stats.setdefault(rule, {})[publisher] = count
+        return stats
     
     def normalize_citations(self, content: str, publisher: str) -> Tuple[str, List[Dict[str, Any]]]:
         """Normalize citation patterns in content.
@@ -340,43 +580,24 @@ class CitationPatternNormalizerWorkflow:
             self.logger.warning(f"No parser found for publisher: {publisher}")
             return content, []
         
-        parser_config = self.publisher_parsers[publisher]
-        patterns = parser_config.get('patterns', [])
+        compiled_parser = self._get_compiled_parser(publisher)
         
         normalized_content = content
         normalization_results = []
         
-        for pattern_config in patterns:
-            regex_pattern = pattern_config.get('regex', '')
-            replacement_template = pattern_config.get('replacement', '')
-            description = pattern_config.get('description', '')
-            
-            try:
-                # Find all matches
-                matches = list(re.finditer(regex_pattern, normalized_content))
+        # Patterns are applied in order, each to the output of the previous one.
+        # Every pattern is a single linear re.sub pass (output assembled in C from
+        # slices) instead of re-splicing the whole document once per match.
+        # If the combined detector finds nothing, no pattern can change the content.
+        if compiled_parser.may_match(content):
+            for compiled_pattern, replacement_template, description in compiled_parser.patterns:
+                normalized_content, pattern_results = self._apply_pattern(
+                    compiled_pattern, replacement_template, description, normalized_content
+                )
                 
-                for match in reversed(matches):  # Process in reverse to maintain positions
-                    original_text = match.group(0)
-                    
-                    # Create replacement text
-                    replacement_text = self._create_replacement_text(match, replacement_template)
-                    
-                    # Replace in content
-                    start_pos = match.start()
-                    end_pos = match.end()
-                    normalized_content = normalized_content[:start_pos] + replacement_text + normalized_content[end_pos:]
-                    
-                    # Record normalization
-                    normalization_results.append({
-                        'original': original_text,
-                        'normalized': replacement_text,
-                        'position': start_pos,
-                        'pattern_description': description
-                    })
-            
-            except re.error as e:
-                self.logger.error(f"Invalid regex pattern '{regex_pattern}': {e}")
-                continue
+                # Results are recorded last-match-first within each pattern
+                pattern_results.reverse()
+                normalization_results.extend(pattern_results)
         
         # Detect unsupported patterns if enabled
         if self.unsupported_pattern_alert:
@@ -384,6 +605,71 @@ class CitationPatternNormalizerWorkflow:
         
         return normalized_content, normalization_results
     
+    def _get_compiled_parser(self, publisher: str) -> CompiledPublisherParser:
+        """Get precompiled patterns for a publisher parser.
+        
+        Parsers loaded from publisher_patterns.yaml are compiled once per process by
+        the shared registry; parsers registered at runtime are compiled on first use.
+        
+        Args:
+            publisher: Publisher identifier (must exist in publisher_parsers)
+            
+        Returns:
+            Compiled publisher parser
+        """
+        parser_config = self.publisher_parsers[publisher]
+        
+        if self.pattern_registry is not None:
+            compiled_parser = self.pattern_registry.get_compiled(publisher)
+            if compiled_parser is not None and compiled_parser.config is parser_config:
+                return compiled_parser
+        
+        compiled_parser = self._compiled_parsers.get(publisher)
+        if compiled_parser is None or compiled_parser.config is not parser_config:
+            compiled_parser = CompiledPublisherParser(publisher, parser_config, self.logger)
+            self._compiled_parsers[publisher] = compiled_parser
+        
+        return compiled_parser
+    
+    def _refresh_publisher_parsers(self) -> None:
+        """Pick up publisher_patterns.yaml changes made since the last load."""
+        if self.pattern_registry is None:
+            return
+        
+        # The registry is shared, so another workflow may already have reloaded it
+        self.pattern_registry.reload_if_changed()
+        if self.pattern_registry.parsers is not self.publisher_parsers:
+            self.publisher_parsers = self.pattern_registry.parsers
+    
+    def _apply_pattern(self, compiled_pattern: re.Pattern, replacement_template: str, description: str,
+                       content: str) -> Tuple[str, List[Dict[str, Any]]]:
+        """Apply one publisher pattern to content in a single pass.
+        
+        Args:
+            compiled_pattern: Compiled regular expression of the pattern
+            replacement_template: Replacement template ({number} / {numbers})
+            description: Pattern description recorded in the results
+            content: Content to normalize
+            
+        Returns:
+            Tuple of (normalized_content, normalization_results in match order)
+            
+        """
+        pattern_results = []
+        
+        def replace(match: re.Match) -> str:
+            replacement_text = self._create_replacement_text(match, replacement_template)
+            pattern_results.append({
+                'original': match.group(0),
+                'normalized': replacement_text,
+                'position': match.start(),
+                'pattern_description': description
+            })
+            return replacement_text
+        
+        normalized_content = compiled_pattern.sub(replace, content)
+        return normalized_content, pattern_results
+    
     def _create_replacement_text(self, match: re.Match, template: str) -> str:
         """Create replacement text from regex match and template.
         
@@ -395,10 +681,7 @@ class CitationPatternNormalizerWorkflow:
             Replacement text
         """
         # Convert superscript numbers to regular numbers
-        superscript_map = {
-            '¹': '1', '²': '2', '³': '3', '⁴': '4', '⁵': '5',
-            '⁶': '6', '⁷': '7', '⁸': '8', '⁹': '9', '⁰': '0'
-        }
+        superscript_map = SUPERSCRIPT_DIGITS
         
         # Get the captured group (first group in parentheses)
         if match.groups():
@@ -434,8 +717,7 @@ class CitationPatternNormalizerWorkflow:
             number_string = matched_text
         
         # Clean up multiple commas and ensure proper formatting
-        import re as regex_module
-        number_string = regex_module.sub(r',+', ',', number_string)
+        number_string = _REPEATED_COMMAS.sub(',', number_string)
         number_string = number_string.strip(',')
         
         # Process template
@@ -464,31 +746,39 @@ class CitationPatternNormalizerWorkflow:
             publisher: Publisher identifier
             normalized_content: Content after normalization
         """
-        # Common citation pattern indicators that might not be handled
-        potential_patterns = [
-            r'\[[a-zA-Z]+\d+\]',  # [Smith2020] style
-            r'\([a-zA-Z]+\s+\d+\)',  # (Smith 2020) style
-            r'\([a-zA-Z]+\s+et\s+al\.?\s*,?\s*\d+\)',  # (Smith et al., 2020) style
-            r'ref\s*\(\s*\d+\s*\)',  # ref(1) style
-            r'reference\s*\[\s*\d+\s*\]',  # reference [1] style
-            r'\[\d+\-\d+\]',  # [1-3] range style
-            r'[⁰¹²³⁴⁵⁶⁷⁸⁹]+',  # Remaining superscripts
-            r'<sup>\d+</sup>',  # HTML superscript
-        ]
+        self._report_unsupported_patterns(publisher, self._find_unsupported_patterns(normalized_content))
+    
+    def _find_unsupported_patterns(self, normalized_content: str) -> List[Dict[str, Any]]:
+        """Find citation-like patterns left after normalization.
         
+        Args:
+            normalized_content: Content after normalization
+            
+        Returns:
+            List of unsupported pattern information
+        """
         unsupported_found = []
         
-        for pattern in potential_patterns:
-            matches = list(re.finditer(pattern, normalized_content))
+        for pattern in _UNSUPPORTED_PATTERNS:
+            matches = list(pattern.finditer(normalized_content))
             if matches:
                 for match in matches:
                     unsupported_found.append({
                         'pattern': match.group(0),
                         'position': match.start(),
-                        'regex_used': pattern,
+                        'regex_used': pattern.pattern,
                         'context': self._extract_context(normalized_content, match.start(), match.end())
                     })
         
+        return unsupported_found
+    
+    def _report_unsupported_patterns(self, publisher: str, unsupported_found: List[Dict[str, Any]]) -> None:
+        """Log unsupported citation patterns and suggest new parser patterns.
+        
+        Args:
+            publisher: Publisher identifier
+            unsupported_found: List of unsupported pattern information
+        """
         # Log unsupported patterns
         if unsupported_found:
             self.logger.warning(f"Found {len(unsupported_found)} potentially unsupported citation patterns for publisher '{publisher}':")
@@ -601,13 +891,16 @@ class CitationPatternNormalizerWorkflow:
             self.logger.error(f"Failed to log unsupported patterns: {e}")
     
     def _update_yaml_header(self, yaml_header: Dict[str, Any], publisher: str, 
-                           normalization_results: List[Dict[str, Any]]) -> Dict[str, Any]:
+                           normalization_results: List[Dict[str, Any]],
+                           normalized_content: Optional[str] = None) -> Dict[str, Any]:
         """Update YAML header with normalization results.
         
         Args:
             yaml_header: Original YAML header
             publisher: Detected publisher
             normalization_results: Normalization results
+            normalized_content: Normalized body; when given, its hash and the pattern set
+                hash are recorded so unchanged files can be skipped next time
             
         Returns:
             Updated YAML header
@@ -620,18 +913,73 @@ class CitationPatternNormalizerWorkflow:
             'patterns_normalized': normalization_results,
             'total_citations_normalized': len(normalization_results)
         }
+        if normalized_content is not None:
+            citation_normalization['body_hash'] = self._hash_body(normalized_content)
+            citation_normalization['pattern_set_hash'] = self._get_pattern_set_hash()
         
         # Update YAML header
         updated_header = yaml_header.copy()
         updated_header['citation_normalization'] = citation_normalization
         
         # Update processing status
-        processing_status = updated_header.get('processing_status', {})
+        processing_status = dict(updated_header.get('processing_status') or {})
         processing_status['citation_pattern_normalizer'] = 'completed'
         updated_header['processing_status'] = processing_status
         
         return updated_header
     
+    @staticmethod
+    def _hash_body(markdown_content: str) -> str:
+        """Hash a markdown body.
+        
+        Args:
+            markdown_content: Markdown content without the YAML header
+            
+        Returns:
+            SHA-256 hex digest
+        """
+        return hashlib.sha256(markdown_content.encode('utf-8')).hexdigest()
+    
+    def _get_pattern_set_hash(self) -> str:
+        """Hash the active publisher pattern set and detection settings.
+        
+        Returns:
+            SHA-256 hex digest, cached until publisher parsers change
+        """
+        cached = self._pattern_set_hash
+        if cached and cached[0] is self.publisher_parsers and cached[1] == len(self.publisher_parsers):
+            return cached[2]
+        
+        pattern_set = {
+            'engine_version': NORMALIZATION_ENGINE_VERSION,
+            'auto_detect': self.auto_detect,
+            'fallback_parser': self.fallback_parser,
+            'parsers': self.publisher_parsers
+        }
+        digest = hashlib.sha256(
+            json.dumps(pattern_set, sort_keys=True, ensure_ascii=False, default=str).encode('utf-8')
+        ).hexdigest()
+        self._pattern_set_hash = (self.publisher_parsers, len(self.publisher_parsers), digest)
+        return digest
+    
+    def _is_up_to_date(self, yaml_header: Dict[str, Any], markdown_content: str) -> bool:
+        """Check whether a file was normalized with the current patterns and not edited since.
+        
+        Args:
+            yaml_header: YAML header of the file
+            markdown_content: Current markdown body
+            
+        Returns:
+            True if normalizing again cannot change the file
+        """
+        processing_status = yaml_header.get('processing_status') or {}
+        normalization = yaml_header.get('citation_normalization')
+        if processing_status.get('citation_pattern_normalizer') != 'completed' or not isinstance(normalization, dict):
+            return False
+        
+        return (normalization.get('pattern_set_hash') == self._get_pattern_set_hash()
+                and normalization.get('body_hash') == self._hash_body(markdown_content))
+    
     def _remove_citation_links(self, content: str) -> str:
         """Remove hyperlinks from citation patterns.
         
@@ -643,54 +991,43 @@ class CitationPatternNormalizerWorkflow:
         """
         # Remove markdown links from citation patterns
         # Pattern: [citation](url) or [citation][ref]
-        link_patterns = [
-            # Handle escaped patterns like \[4–8](url) with ranges and em-dashes, including ^ patterns
-            r'\\?\[([¹²³⁴⁵⁶⁷⁸⁹⁰\d,\s–\-\^]+)\]\\?\([^)]+\\?\)',  # \[citation](url) or [citation](url) - includes ^
-            r'\\?\[([¹²³⁴⁵⁶⁷⁸⁹⁰\d,\s–\-\^]+)\]\\?\[[^\]]+\\?\]',  # \[citation][ref] or [citation][ref] - includes ^
-            r'<a[^>]*>([¹²³⁴⁵⁶⁷⁸⁹⁰\d,\s–\-\^]+)</a>',             # HTML links - includes ^
-            # Simple citation patterns  
-            r'\\?\[([¹²³⁴⁵⁶⁷⁸⁹⁰\d,\s\^]+)\]\\?\([^)]+\\?\)',      # \[citation](url) or [citation](url) - includes ^
-            r'\\?\[([¹²³⁴⁵⁶⁷⁸⁹⁰\d,\s\^]+)\]\\?\[[^\]]+\\?\]',      # \[citation][ref] or [citation][ref] - includes ^
-            r'<a[^>]*>([¹²³⁴⁵⁶⁷⁸⁹⁰\d,\s\^]+)</a>',                 # HTML links - includes ^
-        ]
-        
-        for pattern in link_patterns:
-            content = re.sub(pattern, r'[\1]', content)
+        for pattern in _CITATION_LINK_PATTERNS:
+            content = pattern.sub(r'[\1]', content)
         
         # Remove escaped backslashes from citation patterns (more comprehensive)
         # First handle simple patterns
-        content = re.sub(r'\\(\[[\d,\s–\-\^]+\])\\?', r'\1', content)
-        content = re.sub(r'\\(\[[\d,\s–\-\^]+\])', r'\1', content)
+        content = _ESCAPED_SIMPLE_CITATION.sub(r'\1', content)
+        content = _ESCAPED_CITATION.sub(r'\1', content)
         # Handle complex nested patterns like \[[^1],[^2],[^3]\]
-        content = re.sub(r'\\(\[[\[\]\d,\s–\-\^]+\])', r'\1', content)
+        content = _ESCAPED_NESTED_CITATION.sub(r'\1', content)
         # Handle remaining backslashes at end
-        content = re.sub(r'(\[[\[\]\d,\s–\-\^]+\])\\', r'\1', content)
+        content = _TRAILING_BACKSLASH_CITATION.sub(r'\1', content)
         
         # Remove ^ symbols and normalize citation format from patterns like [[^1]], [^2],[^3] to [1], [2,3]
         def normalize_citation_numbers(match):
             citation_text = match.group(0)
             # Extract all numbers from patterns like [^1],[^2],[^3] or [[^1],[^2]]
-            numbers = re.findall(r'\^?(\d+)', citation_text)
+            numbers = _CARET_NUMBER.findall(citation_text)
             if numbers:
                 return '[' + ','.join(numbers) + ']'
             return citation_text
         
         # Handle complex patterns with ^ symbols first
-        content = re.sub(r'\[\[?\^(\d+)(?:,\s*\[?\^(\d+)\]?)*\]?\]?', normalize_citation_numbers, content)
+        content = _CARET_CITATION_LIST.sub(normalize_citation_numbers, content)
         # Handle simple patterns like [^1] or [[^1]]
-        content = re.sub(r'\[+\^(\d+)\]+', r'[\1]', content)
+        content = _CARET_CITATION_SIMPLE.sub(r'[\1]', content)
         # Handle remaining patterns with ^ symbols
-        content = re.sub(r'\[+[^\]]*\^[^\]]*\]+', normalize_citation_numbers, content)
+        content = _CARET_CITATION_REMAINING.sub(normalize_citation_numbers, content)
         
         # Fix various double bracket patterns left after link removal
         # [[1]] -> [1]
-        content = re.sub(r'\[\[(\d+(?:[–-]\d+)?(?:,\s*\d+(?:[–-]\d+)?)*)\]\]', r'[\1]', content)
+        content = _DOUBLE_BRACKET_LIST.sub(r'[\1]', content)
         # [[1], [2]] -> [1,2]
-        content = re.sub(r'\[\[(\d+)\],\s*\[(\d+)\]\]', r'[\1,\2]', content)
+        content = _DOUBLE_BRACKET_PAIR.sub(r'[\1,\2]', content)
         # [[26–28], [34]] -> [26–28,34]
-        content = re.sub(r'\[\[(\d+(?:[–-]\d+)?)\],\s*\[(\d+(?:[–-]\d+)?)\]\]', r'[\1,\2]', content)
+        content = _DOUBLE_BRACKET_RANGE_PAIR.sub(r'[\1,\2]', content)
         # More complex: [[1], [2], [3]] -> [1,2,3]
-        content = re.sub(r'\[\[(\d+)\],\s*\[(\d+)\],\s*\[(\d+)\]\]', r'[\1,\2,\3]', content)
+        content = _DOUBLE_BRACKET_TRIPLE.sub(r'[\1,\2,\3]', content)
         
         return content
     
@@ -712,6 +1049,8 @@ class CitationPatternNormalizerWorkflow:
             
             # Add to in-memory parsers
             self.publisher_parsers[publisher] = pattern_config
+            self._detection_index = None
+            self._pattern_set_hash = None
             
             # Optionally save to configuration file for persistence
             if self._save_parser_to_config(publisher, pattern_config):
@@ -811,4 +1150,31 @@ class CitationPatternNormalizerWorkflow:
         
         except Exception as e:
             self.logger.error(f"Failed to save parser configuration: {e}")
-            return False
\ No newline at end of file
+            return False
+
+
+# Worker process state for parallel normalization
+_worker_workflow: Optional[CitationPatternNormalizerWorkflow] = None
+
+
+def _init_normalizer_worker(publisher_parsers: Dict[str, Any], settings: Dict[str, Any]) -> None:
+    """Initialize a normalization worker process.
+    
+    Args:
+        publisher_parsers: Publisher parser configurations
+        settings: Settings from CitationPatternNormalizerWorkflow._get_worker_settings
+    """
+    global _worker_workflow
+    _worker_workflow = CitationPatternNormalizerWorkflow._create_worker_instance(publisher_parsers, settings)
+
+
+def _normalize_file_in_worker(file_path: str) -> Dict[str, Any]:
+    """Normalize one file in a worker process.
+    
+    Args:
+        file_path: Path to the markdown file
+        
+    Returns:
+        Result of CitationPatternNormalizerWorkflow._normalize_file
+    """
+    return _worker_workflow._normalize_file(file_path)
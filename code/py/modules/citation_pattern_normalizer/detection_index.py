@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""Publisher Detection Index"""
+
+from collections import deque
+from typing import Dict, List, Optional, Tuple, Any
+
+
+# Trie node key holding the parser of a complete prefix (never a single character)
+_PREFIX_END = ''
+
+
+class DoiPrefixTrie:
+    """Character trie of DOI prefixes."""
+
+    def __init__(self):
+        """Initialize an empty trie."""
+        self._root: Dict[str, Any] = {}
+
+    def insert(self, prefix: str, value: Tuple[int, str]) -> None:
+        """Register a DOI prefix.
+
+        Args:
+            prefix: DOI prefix (e.g. "10.1016")
+            value: (priority, parser name); lower priority wins
+        """
+        node = self._root
+        for char in prefix:
+            node = node.setdefault(char, {})
+        # Keep the highest-priority parser for duplicate prefixes
+        current = node.get(_PREFIX_END)
+        if current is None or value[0] < current[0]:
+            node[_PREFIX_END] = value
+
+    def match(self, doi: str) -> Optional[Tuple[int, str, str]]:
+        """Find the highest-priority prefix of doi in one walk.
+
+        Args:
+            doi: DOI to look up
+
+        Returns:
+            (priority, parser name, matched prefix), or None if no prefix matches
+        """
+        best = None
+        node = self._root
+        depth = 0
+        while True:
+            value = node.get(_PREFIX_END)
+            if value is not None and (best is None or value[0] < best[0]):
+                best = (value[0], value[1], doi[:depth])
+            if depth == len(doi):
+                break
+            node = node.get(doi[depth])
+            if node is None:
+                break
+            depth += 1
+        return best
+
+
+class KeywordMatcher:
+    """Aho-Corasick automaton matching many keywords in one pass over a text."""
+
+    def __init__(self):
+        """Initialize an empty matcher."""
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        # Best (priority, parser name, keyword) ending at each state, including via fail links
+        self._output: List[Optional[Tuple[int, str, str]]] = [None]
+        self._built = True
+
+    def add(self, keyword: str, value: Tuple[int, str]) -> None:
+        """Register a keyword.
+
+        Args:
+            keyword: Lowercase keyword
+            value: (priority, parser name); lower priority wins
+        """
+        state = 0
+        for char in keyword:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(None)
+            state = next_state
+        candidate = (value[0], value[1], keyword)
+        if self._output[state] is None or candidate[0] < self._output[state][0]:
+            self._output[state] = candidate
+        self._built = False
+
+    def build(self) -> None:
+        """Compute failure links (breadth-first) after all keywords are added."""
+        queue = deque()
+        for state in self._goto[0].values():
+            self._fail[state] = 0
+            queue.append(state)
+
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                fail_state = self._goto[fail].get(char, 0)
+                self._fail[next_state] = fail_state if fail_state != next_state else 0
+                # Merge outputs reachable through the failure link
+                inherited = self._output[self._fail[next_state]]
+                own = self._output[next_state]
+                if inherited is not None and (own is None or inherited[0] < own[0]):
+                    self._output[next_state] = inherited
+
+        self._built = True
+
+    def search(self, text: str) -> Optional[Tuple[int, str, str]]:
+        """Find the highest-priority keyword occurring in text.
+
+        Args:
+            text: Lowercase text to scan
+
+        Returns:
+            (priority, parser name, keyword), or None if no keyword occurs
+        """
+        if not self._built:
+            self.build()
+
+        best = None
+        state = 0
+        for char in text:
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            output = self._output[state]
+            if output is not None and (best is None or output[0] < best[0]):
+                best = output
+                if best[0] == 0:
+                    break
+        return best
+
+
+class PublisherDetectionIndex:
+    """Precomputed DOI prefix and journal keyword index over publisher parsers.
+
+    Matching follows parser definition order: when several parsers match, the
+    one defined first wins, as with a sequential scan of the parsers.
+    """
+
+    def __init__(self, publisher_parsers: Dict[str, Any]):
+        """Build the index from publisher parser configurations.
+
+        Args:
+            publisher_parsers: Publisher parser configurations (detection section is used)
+        """
+        self.parsers = publisher_parsers
+        self.parser_count = len(publisher_parsers)
+        self.doi_trie = DoiPrefixTrie()
+        self.keyword_matcher = KeywordMatcher()
+        # Parsers with an empty keyword match any title/journal
+        self._match_all_keyword: Optional[Tuple[int, str, str]] = None
+
+        for priority, (parser_name, parser_config) in enumerate(publisher_parsers.items()):
+            detection_config = (parser_config or {}).get('detection', {}) or {}
+
+            for prefix in detection_config.get('doi_prefixes', []) or []:
+                self.doi_trie.insert(str(prefix), (priority, parser_name))
+
+            for keyword in detection_config.get('journal_keywords', []) or []:
+                keyword = str(keyword).lower()
+                if keyword:
+                    self.keyword_matcher.add(keyword, (priority, parser_name))
+                elif self._match_all_keyword is None:
+                    self._match_all_keyword = (priority, parser_name, keyword)
+
+        self.keyword_matcher.build()
+
+    def match_doi(self, doi: str) -> Optional[Tuple[str, str]]:
+        """Find the parser whose DOI prefix matches doi.
+
+        Args:
+            doi: DOI from metadata
+
+        Returns:
+            (parser name, matched prefix), or None
+        """
+        match = self.doi_trie.match(doi)
+        if match is None:
+            return None
+        return match[1], match[2]
+
+    def match_keywords(self, *texts: str) -> Optional[Tuple[str, str]]:
+        """Find the parser whose journal keyword occurs in any of texts.
+
+        Args:
+            texts: Metadata fields to scan (e.g. title, journal)
+
+        Returns:
+            (parser name, matched keyword), or None
+        """
+        best = self._match_all_keyword
+        for text in texts:
+            if best is not None and best[0] == 0:
+                break
+            match = self.keyword_matcher.search(text.lower())
+            if match is not None and (best is None or match[0] < best[0]):
+                best = match
+        if best is None:
+            return None
+        return best[1], best[2]
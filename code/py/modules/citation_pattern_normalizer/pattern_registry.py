@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""Publisher Pattern Registry"""
+
+import os
+import re
+import threading
+import yaml
+from typing import Dict, List, Optional, Any
+
+
+class CompiledPublisherParser:
+    """Precompiled patterns of a single publisher parser."""
+
+    def __init__(self, name: str, config: Dict[str, Any], logger=None):
+        """Compile the patterns of a publisher parser.
+
+        Args:
+            name: Publisher identifier
+            config: Parser configuration (detection and patterns)
+            logger: Logger used to report invalid patterns
+        """
+        self.name = name
+        self.config = config
+        # (compiled regex, replacement template, description) in definition order
+        self.patterns: List[tuple] = []
+        self.invalid_patterns: List[str] = []
+
+        for pattern_config in config.get('patterns', []) or []:
+            regex_pattern = pattern_config.get('regex', '')
+            try:
+                compiled = re.compile(regex_pattern)
+            except re.error as e:
+                self.invalid_patterns.append(regex_pattern)
+                if logger:
+                    logger.error(f"Invalid regex pattern '{regex_pattern}' in parser '{name}': {e}")
+                continue
+            self.patterns.append((
+                compiled,
+                pattern_config.get('replacement', ''),
+                pattern_config.get('description', '')
+            ))
+
+        self.detector = self._build_detector()
+
+    def _build_detector(self) -> Optional[re.Pattern]:
+        """Combine all patterns into one alternation used to test for any match.
+
+        Returns:
+            Compiled detector, or None if the patterns cannot be combined
+        """
+        if not self.patterns:
+            return None
+
+        # Group references are renumbered inside an alternation, so patterns that
+        # use backreferences are only checked individually.
+        sources = [compiled.pattern for compiled, _, _ in self.patterns]
+        if any(compiled.groupindex or re.search(r'\\\d', source)
+               for (compiled, _, _), source in zip(self.patterns, sources)):
+            return None
+
+        try:
+            return re.compile('|'.join(f'(?:{source})' for source in sources))
+        except re.error:
+            return None
+
+    def may_match(self, content: str) -> bool:
+        """Check whether any pattern of this parser matches content.
+
+        Args:
+            content: Content to check
+
+        Returns:
+            False only if no pattern can match content
+        """
+        if self.detector is None:
+            return bool(self.patterns)
+        return self.detector.search(content) is not None
+
+
+class PublisherPatternRegistry:
+    """Process-wide registry of compiled publisher patterns.
+
+    One registry exists per patterns file. Patterns are compiled once and
+    recompiled automatically when the file's modification time changes.
+    """
+
+    _lock = threading.Lock()
+    _registries: Dict[str, 'PublisherPatternRegistry'] = {}
+
+    @classmethod
+    def get_registry(cls, patterns_file: str, logger=None) -> 'PublisherPatternRegistry':
+        """Get the shared registry for a patterns file.
+
+        Args:
+            patterns_file: Path to publisher_patterns.yaml
+            logger: Logger instance
+
+        Returns:
+            Shared PublisherPatternRegistry
+        """
+        key = os.path.abspath(patterns_file)
+        with cls._lock:
+            registry = cls._registries.get(key)
+            if registry is None:
+                registry = cls(key, logger)
+                cls._registries[key] = registry
+        registry.reload_if_changed()
+        return registry
+
+    @classmethod
+    def clear(cls) -> None:
+        """Discard all shared registries."""
+        with cls._lock:
+            cls._registries.clear()
+
+    def __init__(self, patterns_file: str, logger=None):
+        """Initialize an empty registry for a patterns file.
+
+        Args:
+            patterns_file: Path to publisher_patterns.yaml
+            logger: Logger instance
+        """
+        self.patterns_file = patterns_file
+        self.logger = logger
+        self.parsers: Dict[str, Any] = {}
+        self.compiled: Dict[str, CompiledPublisherParser] = {}
+        self.loaded_mtime: Optional[int] = None
+        self._failed_mtime: Optional[int] = None
+        self.reload_count = 0
+        self._reload_lock = threading.Lock()
+
+    def _current_mtime(self) -> Optional[int]:
+        """Get the modification time of the patterns file.
+
+        Returns:
+            Modification time in nanoseconds, or None if the file is missing
+        """
+        try:
+            return os.stat(self.patterns_file).st_mtime_ns
+        except OSError:
+            return None
+
+    def reload_if_changed(self) -> bool:
+        """Reload and recompile patterns if the file changed since the last load.
+
+        Returns:
+            True if the patterns were reloaded
+        """
+        mtime = self._current_mtime()
+        if mtime is None or mtime in (self.loaded_mtime, self._failed_mtime):
+            return False
+
+        with self._reload_lock:
+            if mtime in (self.loaded_mtime, self._failed_mtime):
+                return False
+
+            try:
+                with open(self.patterns_file, 'r', encoding='utf-8') as f:
+                    patterns_data = yaml.safe_load(f) or {}
+            except Exception as e:
+                # Keep the previous patterns until the file is fixed
+                self._failed_mtime = mtime
+                if self.logger:
+                    self.logger.error(f"Failed to load publisher patterns: {e}")
+                return False
+
+            parsers = patterns_data.get('parsers', {}) or {}
+            self.compiled = {
+                name: CompiledPublisherParser(name, config, self.logger)
+                for name, config in parsers.items()
+            }
+            self.parsers = parsers
+            self.reload_count += 1
+            is_reload = self.loaded_mtime is not None
+            self.loaded_mtime = mtime
+
+        if self.logger and is_reload:
+            self.logger.info(f"Reloaded {len(parsers)} publisher parsers from {self.patterns_file}")
+        return True
+
+    def get_compiled(self, publisher: str) -> Optional[CompiledPublisherParser]:
+        """Get the compiled parser of a publisher.
+
+        Args:
+            publisher: Publisher identifier
+
+        Returns:
+            Compiled parser, or None if not registered
+        """
+        return self.compiled.get(publisher)
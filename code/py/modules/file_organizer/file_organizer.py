@@ -20,7 +20,11 @@ from ..shared_modules.integrated_logger import IntegratedLogger
 from ..shared_modules.exceptions import FileSystemError, ProcessingError, YAMLError
 from ..shared_modules.file_utils import FileUtils, PathUtils, BackupManager
 from ..shared_modules.bibtex_parser import BibTeXParser
+from ..shared_modules.clippings_layout import ClippingsLayout
 from ..status_management_yaml.yaml_header_processor import YAMLHeaderProcessor
+from ..status_management_yaml.metadata_scanner import MetadataScanner
+from .paper_index import PaperIndex
+from .organize_journal import OrganizeJournal
 
 
 class FileOrganizer:
@@ -28,6 +32,10 @@ class FileOrganizer:
     DOIマッチングベースのファイル整理クラス
     """
     
+    # organize時に更新するYAMLヘッダーのキー（トランザクション取り消し時に復元）
+    ORGANIZE_HEADER_KEYS = ('citation_key', 'processing_status', 'last_updated', 'workflow_version')
+    RECOVERY_MODES = ('replay', 'rollback')
+    
     def __init__(self, config_manager: ConfigManager, logger: IntegratedLogger):
         """
         FileOrganizerの初期化
@@ -37,6 +45,7 @@ class FileOrganizer:
             logger: ログ管理インスタンス
         """
         self.config_manager = config_manager
+        self.integrated_logger = logger
         self.logger = logger.get_logger('FileOrganizer')
         
         # 設定読み込み
@@ -44,13 +53,22 @@ class FileOrganizer:
         self.create_backup = organize_config.get('create_backup', True)
         self.handle_duplicates = organize_config.get('handle_duplicates', True)
         self.update_yaml_header = organize_config.get('update_yaml_header', True)
+        # rename: os.replaceで移動しヘッダーのみ更新 / rewrite: 移動先へ全体を書き直し（従来方式）
+        self.rename_moves = organize_config.get('move_strategy', 'rename') != 'rewrite'
+        # 中断したorganizeトランザクションの復旧方法（replay: 残りを実行 / rollback: 取り消し）
+        transaction_config = organize_config.get('transaction', {})
+        recovery_mode = transaction_config.get('recovery') if isinstance(transaction_config, dict) else None
+        self.recovery_mode = recovery_mode if recovery_mode in self.RECOVERY_MODES else 'replay'
         
         # 依存モジュール初期化
         self.file_utils = FileUtils()
         self.path_utils = PathUtils()
-        self.backup_manager = BackupManager()  # BackupManagerは引数なしで初期化
+        self.backup_manager = BackupManager(config_manager=config_manager)
         self.bibtex_parser = BibTeXParser(logger.get_logger('BibTeXParser'))
         self.yaml_processor = YAMLHeaderProcessor(config_manager, logger)
+        self.metadata_scanner = MetadataScanner(config_manager, logger)
+        self.paper_index = PaperIndex(config_manager, logger)
+        self.clippings_layout = ClippingsLayout(config_manager, logger)
         
         self.logger.info("FileOrganizer initialized")
     
@@ -70,50 +88,56 @@ class FileOrganizer:
         try:
             self.logger.info(f"Starting workspace organize: {workspace_path}")
             
+            # 0. 前回中断したorganizeトランザクションの復旧
+            recovered_transaction = self.recover_organize_transaction(clippings_dir)
+            
             # 1. CurrentManuscript.bibからDOI-citation_keyマッピング作成
             doi_mapping = self._create_doi_mapping(bibtex_file)
             self.logger.info(f"Created DOI mapping for {len(doi_mapping)} entries")
             
             # 2. Clippings/*.mdからDOI情報抽出
-            markdown_dois = self._extract_markdown_dois(clippings_dir)
+            markdown_dois, markdown_without_doi = self._extract_markdown_dois(clippings_dir)
             self.logger.info(f"Found DOI information in {len(markdown_dois)} markdown files")
             
             # 3. DOIベースでの論文マッチング
             matched_papers = self._match_papers_by_doi(doi_mapping, markdown_dois)
-            self.logger.info(f"Matched {len(matched_papers)} papers for processing")
+            
+            # 3-2. DOIがない・不正なファイルはタイトル索引で照合
+            unmatched_without_doi = []
+            title_matched_papers = self._match_papers_by_title(
+                markdown_without_doi, {paper['citation_key'] for paper in matched_papers}, unmatched_without_doi
+            )
+            matched_papers.extend(title_matched_papers)
+            self.logger.info(f"Matched {len(matched_papers)} papers for processing "
+                             f"({len(title_matched_papers)} by title)")
             
             # 4. マッチした論文の整理処理
             results = {
                 'status': 'success',
                 'total_bibtex_entries': len(doi_mapping),
-                'total_markdown_files': len(markdown_dois),
+                'total_markdown_files': len(markdown_dois) + len(markdown_without_doi),
                 'matched_papers': len(matched_papers),
+                'title_matched_papers': len(title_matched_papers),
                 'processed_papers': 0,
                 'skipped_papers': {
                     'missing_in_clippings': [],
                     'orphaned_in_clippings': [],
-                    'no_doi_in_markdown': [],
+                    'no_doi_in_markdown': unmatched_without_doi,
                     'processing_failed': []
                 },
+                'recovered_transaction': recovered_transaction,
                 'execution_time': 0
             }
             
             start_time = datetime.now()
             
-            # マッチした論文の処理
-            for paper_info in matched_papers:
-                try:
-                    success = self._organize_matched_paper(paper_info, clippings_dir)
-                    if success:
-                        results['processed_papers'] += 1
-                    else:
-                        results['skipped_papers']['processing_failed'].append(paper_info)
-                except Exception as e:
-                    self.logger.error(f"Failed to organize paper {paper_info['citation_key']}: {e}")
-                    results['skipped_papers']['processing_failed'].append(paper_info)
+            # マッチした論文の移動を全て計画し、ジャーナルに記録してから実行
+            planned_moves = self._plan_moves(matched_papers, clippings_dir, results)
+            self._execute_moves(planned_moves, clippings_dir, results)
             
             # エッジケース検出
-            self._detect_edge_cases(doi_mapping, markdown_dois, results)
+            self._detect_edge_cases(doi_mapping, markdown_dois, results,
+                                    {paper['citation_key'] for paper in title_matched_papers})
             
             # 実行時間計算
             end_time = datetime.now()
@@ -136,20 +160,10 @@ class FileOrganizer:
             )
 
     def _create_doi_mapping(self, bibtex_file: str) -> Dict[str, str]:
-        """CurrentManuscript.bibからDOI-citation_keyマッピングを作成"""
+        """CurrentManuscript.bibからDOI-citation_keyマッピングを作成（永続化インデックスを利用）"""
         try:
-            bibtex_entries = self.bibtex_parser.parse_file(bibtex_file)
-            doi_mapping = {}
-            
-            for citation_key, entry_data in bibtex_entries.items():
-                doi = entry_data.get('doi')
-                if doi:
-                    # DOI正規化
-                    normalized_doi = self._normalize_doi(doi)
-                    if normalized_doi:
-                        doi_mapping[normalized_doi] = citation_key
-                        
-            return doi_mapping
+            self.paper_index.load_or_build(bibtex_file)
+            return dict(self.paper_index.doi_index)
             
         except Exception as e:
             self.logger.error(f"Failed to create DOI mapping: {e}")
@@ -160,28 +174,30 @@ class FileOrganizer:
                 cause=e
             )
 
-    def _extract_markdown_dois(self, clippings_dir: str) -> Dict[str, str]:
-        """Clippings/*.mdからDOI情報を抽出"""
+    def _extract_markdown_dois(self, clippings_dir: str) -> Tuple[Dict[str, str], Dict[str, Dict[str, Any]]]:
+        """
+        Clippings/*.mdからDOI情報を抽出
+        
+        Returns:
+            Tuple: (ファイルパス -> 正規化DOI, DOIがない・不正なファイルパス -> YAMLヘッダーのdoi/title/year)
+        """
         try:
-            clippings_path = Path(clippings_dir)
             markdown_dois = {}
-            
-            # .mdファイルを再帰的に検索
-            for md_file in clippings_path.rglob("*.md"):
-                try:
-                    yaml_header, _ = self.yaml_processor.parse_yaml_header(md_file)
-                    doi = yaml_header.get('doi')
-                    
-                    if doi:
-                        normalized_doi = self._normalize_doi(doi)
-                        if normalized_doi:
-                            markdown_dois[str(md_file)] = normalized_doi
-                            
-                except Exception as e:
-                    self.logger.warning(f"Failed to extract DOI from {md_file}: {e}")
-                    continue
+            markdown_without_doi = {}
+            
+            # .mdファイルを再帰的に検索し、YAMLヘッダーの照合用フィールドのみを並列に読み取り
+            headers, errors = self.metadata_scanner.scan_directory(clippings_dir, ['doi', 'title', 'year'])
+            for md_file, error in errors.items():
+                self.logger.warning(f"Failed to extract DOI from {md_file}: {error}")
+            
+            for md_file, fields in headers.items():
+                normalized_doi = self._normalize_doi(fields.get('doi'))
+                if normalized_doi:
+                    markdown_dois[md_file] = normalized_doi
+                else:
+                    markdown_without_doi[md_file] = fields
                     
-            return markdown_dois
+            return markdown_dois, markdown_without_doi
             
         except Exception as e:
             self.logger.error(f"Failed to extract markdown DOIs: {e}")
@@ -203,63 +219,280 @@ class FileOrganizer:
                 matched_papers.append({
                     'file_path': file_path,
                     'doi': md_doi,
-                    'citation_key': citation_key
+                    'citation_key': citation_key,
+                    'match_method': 'doi',
+                    'confidence': 1.0
                 })
                 
         return matched_papers
 
-    def _organize_matched_paper(self, paper_info: Dict, clippings_dir: str) -> bool:
-        """マッチした論文の整理処理"""
-        try:
-            file_path = Path(paper_info['file_path'])
-            citation_key = paper_info['citation_key']
-            
-            self.logger.info(f"Organizing paper: {citation_key}")
-            
-            # citation_keyディレクトリ作成
-            target_dir = self.create_citation_directory(clippings_dir, citation_key)
-            target_file_path = Path(target_dir) / f"{citation_key}.md"
-            
-            # YAMLヘッダー読み込みと更新
-            yaml_header, content = self.yaml_processor.parse_yaml_header(file_path)
-            yaml_header['citation_key'] = citation_key
-            
-            if self.update_yaml_header:
-                yaml_header = self._update_organize_status(yaml_header)
-            
-            # 衝突処理
-            if target_file_path.exists() and self.handle_duplicates:
-                target_file_path = self._handle_file_collision(target_file_path, file_path)
-            
-            # バックアップ作成（必要に応じて）
-            if self.create_backup and target_file_path.exists():
-                backup_path = self.backup_manager.create_backup(str(target_file_path))
-                self.logger.info(f"Backup created: {backup_path}")
-            
-            # ファイル移動と内容更新
-            self.yaml_processor.write_yaml_header(target_file_path, yaml_header, content)
+    def _match_papers_by_title(self, markdown_without_doi: Dict[str, Dict[str, Any]],
+                               matched_keys: set, unmatched: List[Dict]) -> List[Dict]:
+        """
+        DOIがない・不正なファイルのタイトル索引による照合
+        
+        Args:
+            markdown_without_doi: ファイルパス -> YAMLヘッダーのdoi/title/year
+            matched_keys: DOIで照合済みのcitation_key（候補から除外）
+            unmatched: 照合できなかったファイル情報の追加先（no_doi_in_markdown）
             
-            # 元ファイル削除（移動が成功した場合）
-            if target_file_path.exists() and file_path != target_file_path:
-                file_path.unlink()
-                self.logger.info(f"Moved file from {file_path} to {target_file_path}")
+        Returns:
+            List[Dict]: タイトルで照合した論文（match_method: title、confidence付き）
+        """
+        matched_papers = []
+        claimed_keys = set(matched_keys)
+        
+        for file_path, fields in markdown_without_doi.items():
+            # タイトルがない場合はファイル名（Web Clipperはタイトルをファイル名にする）
+            title = fields.get('title') or Path(file_path).stem
+            match = self.paper_index.match_title(title, fields.get('year'), exclude=claimed_keys)
+            
+            if match and match['accepted']:
+                citation_key = match['citation_key']
+                claimed_keys.add(citation_key)
+                matched_papers.append({
+                    'file_path': file_path,
+                    'doi': self.paper_index.entries[citation_key].get('doi'),
+                    'citation_key': citation_key,
+                    'match_method': 'title',
+                    'confidence': match['confidence']
+                })
+                self.logger.info(f"Matched by title: {file_path} -> {citation_key} "
+                                 f"(confidence: {match['confidence']})")
+            else:
+                unmatched.append({
+                    'file_path': file_path,
+                    'doi': fields.get('doi'),
+                    'best_candidate': match['citation_key'] if match else None,
+                    'confidence': match['confidence'] if match else 0.0
+                })
+                self.logger.warning(f"No valid DOI in markdown file: {file_path}"
+                                    + (f" (best title candidate: {match['citation_key']}, "
+                                       f"confidence: {match['confidence']})" if match else ""))
+        
+        return matched_papers
+
+    def _plan_moves(self, matched_papers: List[Dict], clippings_dir: str,
+                    results: Dict[str, Any]) -> List[Tuple[Dict, Dict[str, Any]]]:
+        """
+        マッチした論文の移動計画を作成（ファイルは変更しない）
+        
+        移動先が既に存在する場合・他の論文の移動先と重なる場合は衝突回避名を割り当てるため、
+        既存ファイルを上書きする移動は計画しない（上書き前のバックアップは不要）。
+        
+        Args:
+            matched_papers: マッチした論文情報
+            clippings_dir: Clippingsディレクトリパス
+            results: 処理結果サマリー（整理済み・計画失敗を反映）
             
-            return True
+        Returns:
+            List[Tuple[Dict, Dict[str, Any]]]: (論文情報, 移動計画) のリスト
+        """
+        planned_moves = []
+        planned_targets = set()
+        
+        for paper_info in matched_papers:
+            try:
+                file_path = Path(os.path.abspath(paper_info['file_path']))
+                citation_key = paper_info['citation_key']
+                
+                # YAMLヘッダーの検証（移動前に読み込み可能か確認）
+                yaml_header = self.yaml_processor.parse_yaml_header_only(file_path)
+                
+                # 移動先はレイアウト設定に従う（year方式ではBibTeXの出版年でシャードを決定）
+                target_file_path = self.clippings_layout.markdown_path(
+                    os.path.abspath(clippings_dir), citation_key,
+                    self.paper_index.entries.get(citation_key, {}).get('year')
+                )
+                target_dir = target_file_path.parent
+                
+                if file_path == target_file_path and self._is_organized(yaml_header, citation_key):
+                    # 整理済み（再実行時）
+                    results['processed_papers'] += 1
+                    continue
+                
+                if file_path != target_file_path and (target_file_path.exists() or str(target_file_path) in planned_targets):
+                    if not self.handle_duplicates:
+                        raise FileSystemError(
+                            f"Target file already exists: {target_file_path}",
+                            error_code="ORGANIZE_TARGET_EXISTS",
+                            context={"file_path": str(file_path), "target": str(target_file_path)}
+                        )
+                    target_file_path = self._collision_free_path(target_file_path, planned_targets)
+                
+                planned_targets.add(str(target_file_path))
+                planned_moves.append((paper_info, {
+                    'source': str(file_path),
+                    'target': str(target_file_path),
+                    'citation_key': citation_key,
+                    'new_dir': not target_dir.exists(),
+                    'restore': {key: yaml_header[key] for key in self.ORGANIZE_HEADER_KEYS if key in yaml_header}
+                }))
+                
+            except Exception as e:
+                self.logger.error(f"Failed to organize paper {paper_info['citation_key']}: {e}")
+                results['skipped_papers']['processing_failed'].append(paper_info)
+        
+        return planned_moves
+
+    def _execute_moves(self, planned_moves: List[Tuple[Dict, Dict[str, Any]]], clippings_dir: str,
+                       results: Dict[str, Any]):
+        """
+        移動計画をジャーナルに記録して実行
+        
+        個別の移動失敗は処理失敗として記録し続行する（該当ファイルは_move_paper_fileが元の位置に戻す）。
+        処理自体が中断した場合はジャーナルが残り、次回のrecover_organize_transactionで復旧する。
+        
+        Args:
+            planned_moves: _plan_movesの結果
+            clippings_dir: Clippingsディレクトリパス
+            results: 処理結果サマリー
+        """
+        if not planned_moves:
+            return
+        
+        journal = OrganizeJournal(self.config_manager, self.integrated_logger, clippings_dir)
+        journal.begin([move for _, move in planned_moves])
+        
+        try:
+            for index, (paper_info, move) in enumerate(planned_moves):
+                try:
+                    self.logger.info(f"Organizing paper: {move['citation_key']}")
+                    self._apply_move(move)
+                    journal.mark_done(index)
+                    results['processed_papers'] += 1
+                except Exception as e:
+                    self.logger.error(f"Failed to organize paper {move['citation_key']}: {e}")
+                    results['skipped_papers']['processing_failed'].append(paper_info)
+        except BaseException:
+            journal.close()
+            raise
+        
+        journal.finish()
+
+    def _apply_move(self, move: Dict[str, Any]):
+        """移動計画1件の実行（ディレクトリ作成・移動・YAMLヘッダー更新）"""
+        target_file_path = Path(move['target'])
+        self.file_utils.ensure_directory(target_file_path.parent)
+        self._move_paper_file(Path(move['source']), target_file_path,
+                              self._organize_header_updater(move['citation_key']))
+
+    def recover_organize_transaction(self, clippings_dir: str, mode: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        中断したorganizeトランザクションの復旧
+        
+        replayは未完了の移動を実行し（移動済みでヘッダー未更新のファイルはヘッダーのみ更新）、
+        rollbackは移動済みのファイルを逆順に元の位置へ戻してorganizeで更新したヘッダー値を復元する。
+        どちらもファイルシステムの状態から各移動の進行状況を判定するため、復旧自体が中断しても再実行できる。
+        
+        Args:
+            clippings_dir: Clippingsディレクトリパス
+            mode: 'replay' または 'rollback'（未指定時は設定値）
             
-        except Exception as e:
-            self.logger.error(f"Failed to organize paper {paper_info['citation_key']}: {e}")
-            return False
+        Returns:
+            Optional[Dict[str, Any]]: 復旧結果（未完了トランザクションがない場合None）
+        """
+        mode = mode or self.recovery_mode
+        if mode not in self.RECOVERY_MODES:
+            raise ProcessingError(
+                f"Invalid organize recovery mode: {mode}",
+                error_code="INVALID_RECOVERY_MODE",
+                context={"mode": mode}
+            )
+        
+        journal = OrganizeJournal(self.config_manager, self.integrated_logger, clippings_dir)
+        transaction = journal.load()
+        if transaction is None:
+            return None
+        
+        moves = transaction['moves']
+        self.logger.warning(f"Recovering interrupted organize transaction {transaction['txn_id']} "
+                            f"({len(moves)} moves, {len(transaction['done'])} completed) by {mode}")
+        summary = {'txn_id': transaction['txn_id'], 'mode': mode, 'moves': len(moves), 'applied': 0, 'failed': []}
+        
+        journal.resume()
+        try:
+            if mode == 'replay':
+                self._replay_moves(journal, moves, transaction['done'], summary)
+            else:
+                self._rollback_moves(moves, summary)
+        except BaseException:
+            journal.close()
+            raise
+        
+        journal.finish()
+        self.logger.info(f"Organize transaction {transaction['txn_id']} recovered by {mode}: "
+                         f"{summary['applied']} moves applied, {len(summary['failed'])} failed")
+        return summary
+
+    def _replay_moves(self, journal: OrganizeJournal, moves: List[Dict[str, Any]], done: set,
+                      summary: Dict[str, Any]):
+        """未完了の移動を再実行"""
+        for index, move in enumerate(moves):
+            if index in done:
+                continue
+            source, target = Path(move['source']), Path(move['target'])
+            try:
+                if source.exists():
+                    self._apply_move(move)
+                elif target.exists():
+                    # 移動済み（ヘッダー更新は冪等なため再適用）
+                    self.yaml_processor.patch_yaml_header(target, self._organize_header_updater(move['citation_key']))
+                else:
+                    raise FileSystemError(
+                        f"Neither source nor target exists: {source}",
+                        error_code="ORGANIZE_REPLAY_FILE_MISSING",
+                        context={"source": str(source), "target": str(target)}
+                    )
+                journal.mark_done(index)
+                summary['applied'] += 1
+            except Exception as e:
+                self.logger.error(f"Failed to replay organize move {source} -> {target}: {e}")
+                summary['failed'].append(move['source'])
+
+    def _rollback_moves(self, moves: List[Dict[str, Any]], summary: Dict[str, Any]):
+        """移動済みのファイルを逆順に元の位置へ戻す"""
+        for move in reversed(moves):
+            source, target = Path(move['source']), Path(move['target'])
+            try:
+                if source != target and source.exists():
+                    # 未実行、または別ファイルシステムへのコピー途中（移動元を正とする）
+                    if target.exists():
+                        target.unlink()
+                elif target.exists():
+                    if source != target:
+                        os.replace(target, source)
+                    self.yaml_processor.patch_yaml_header(source, self._restore_header_updater(move['restore']))
+                    summary['applied'] += 1
+                else:
+                    raise FileSystemError(
+                        f"Neither source nor target exists: {source}",
+                        error_code="ORGANIZE_ROLLBACK_FILE_MISSING",
+                        context={"source": str(source), "target": str(target)}
+                    )
+                
+                if move.get('new_dir') and source.parent != target.parent:
+                    try:
+                        target.parent.rmdir()
+                    except OSError:
+                        pass  # 空でないディレクトリは残す
+            except Exception as e:
+                self.logger.error(f"Failed to roll back organize move {source} <- {target}: {e}")
+                summary['failed'].append(move['source'])
 
     def _detect_edge_cases(self, doi_mapping: Dict[str, str], 
-                          markdown_dois: Dict[str, str], results: Dict[str, Any]):
+                          markdown_dois: Dict[str, str], results: Dict[str, Any],
+                          title_matched_keys: Optional[set] = None):
         """エッジケース検出"""
-        # missing_in_clippings: BibTeXにあるがMarkdownにない
+        # missing_in_clippings: BibTeXにあるがMarkdownにない（タイトルで照合できたものを除く）
         bibtex_dois = set(doi_mapping.keys())
         markdown_doi_values = set(markdown_dois.values())
         
         missing_dois = bibtex_dois - markdown_doi_values
         for doi in missing_dois:
             citation_key = doi_mapping[doi]
+            if title_matched_keys and citation_key in title_matched_keys:
+                continue
             results['skipped_papers']['missing_in_clippings'].append({
                 'citation_key': citation_key,
                 'doi': doi
@@ -277,26 +510,8 @@ class FileOrganizer:
                 self.logger.warning(f"Orphaned markdown file: {file_path} (DOI: {doi})")
 
     def _normalize_doi(self, doi: str) -> Optional[str]:
-        """DOI正規化"""
-        if not doi:
-            return None
-            
-        # 基本的な正規化
-        normalized = doi.strip().lower()
-        
-        # URLプレフィックス除去
-        if normalized.startswith('https://doi.org/'):
-            normalized = normalized[16:]
-        elif normalized.startswith('http://doi.org/'):
-            normalized = normalized[15:]
-        elif normalized.startswith('doi:'):
-            normalized = normalized[4:]
-            
-        # 10.で始まらない場合は無効
-        if not normalized.startswith('10.'):
-            return None
-            
-        return normalized
+        """DOI正規化（10.で始まるDOIとして解釈できない場合None）"""
+        return PaperIndex.normalize_doi(doi)
 
     def organize_file(self, file_path: Union[str, Path], base_dir: Union[str, Path]) -> bool:
         """
@@ -327,8 +542,8 @@ class FileOrganizer:
                     context={"file_path": str(file_path)}
                 )
             
-            # YAMLヘッダー読み込みとcitation_key抽出
-            yaml_header, content = self.yaml_processor.parse_yaml_header(file_path)
+            # YAMLヘッダー読み込みとcitation_key抽出（本文は読まない）
+            yaml_header = self.yaml_processor.parse_yaml_header_only(file_path)
             citation_key = yaml_header.get('citation_key')
             
             if not citation_key:
@@ -341,12 +556,10 @@ class FileOrganizer:
                         context={"file_path": str(file_path)}
                     )
                 
-                # YAMLヘッダーにcitation_keyを追加
-                yaml_header['citation_key'] = citation_key
                 self.logger.info(f"Inferred citation_key: {citation_key}")
             
             # citation_keyディレクトリ作成
-            target_dir = self.create_citation_directory(str(base_dir), citation_key)
+            target_dir = self.create_citation_directory(str(base_dir), citation_key, yaml_header.get('year'))
             target_dir = Path(target_dir)
             
             # 移動先ファイルパス決定
@@ -357,22 +570,16 @@ class FileOrganizer:
                 target_file_path = self._handle_file_collision(target_file_path, file_path)
             
             # バックアップ作成（必要に応じて）
+            # ハードリンクで済ませるのは別ファイルのos.replaceで移動先が置き換えられる場合のみ
+            # （移動先が移動元自身の場合はその場でヘッダーを更新するため、リンクではバックアップも書き換わる）
             if self.create_backup and target_file_path.exists():
-                backup_path = self.backup_manager.create_backup(str(target_file_path))
+                replaced_by_rename = self.rename_moves and not os.path.samefile(file_path, target_file_path)
+                backup_path = self.backup_manager.create_backup(str(target_file_path), link=replaced_by_rename,
+                                                               backup_type="organize_overwrite")
                 self.logger.info(f"Backup created: {backup_path}")
             
-            # YAMLヘッダー更新
-            if self.update_yaml_header:
-                yaml_header = self._update_organize_status(yaml_header)
-            
-            # ファイル移動と内容更新
-            # アトミック書き込みで移動先に保存
-            self.yaml_processor.write_yaml_header(target_file_path, yaml_header, content)
-            
-            # 元ファイル削除（移動が成功した場合）
-            if target_file_path.exists() and file_path != target_file_path:
-                file_path.unlink()
-                self.logger.info(f"Moved file from {file_path} to {target_file_path}")
+            # ファイル移動とYAMLヘッダー更新
+            self._move_paper_file(file_path, target_file_path, self._organize_header_updater(citation_key))
             
             self.logger.info(f"Organize process completed for: {citation_key}")
             return True
@@ -388,13 +595,15 @@ class FileOrganizer:
                 cause=e
             )
     
-    def create_citation_directory(self, base_dir: Union[str, Path], citation_key: str) -> str:
+    def create_citation_directory(self, base_dir: Union[str, Path], citation_key: str,
+                                  year: Any = None) -> str:
         """
-        citation_keyベースのディレクトリを作成
+        citation_keyベースのディレクトリを作成（シャード配置の場合はシャード配下）
         
         Args:
             base_dir: ベースディレクトリパス
             citation_key: 論文の識別キー
+            year: 出版年（year方式のシャード決定に使用）
             
         Returns:
             str: 作成されたディレクトリパス
@@ -403,11 +612,8 @@ class FileOrganizer:
             FileSystemError: ディレクトリ作成エラー
         """
         try:
-            base_path = Path(base_dir)
-            
-            # 安全なディレクトリ名生成
-            safe_citation_key = self.path_utils.generate_safe_directory_name(citation_key)
-            target_dir = base_path / safe_citation_key
+            # 安全なディレクトリ名生成とレイアウト解決
+            target_dir = self.clippings_layout.paper_dir(base_dir, citation_key, year)
             
             # ディレクトリ作成
             self.file_utils.ensure_directory(target_dir)
@@ -455,6 +661,114 @@ class FileOrganizer:
         
         return results
     
+    def _organize_header_updater(self, citation_key: str):
+        """
+        organize時のYAMLヘッダー更新関数を作成
+        
+        Args:
+            citation_key: 設定するcitation_key
+            
+        Returns:
+            Callable: ヘッダー辞書を受け取り更新後の辞書を返す関数
+        """
+        def update(yaml_header: Dict[str, Any]) -> Dict[str, Any]:
+            yaml_header['citation_key'] = citation_key
+            if self.update_yaml_header:
+                yaml_header = self._update_organize_status(yaml_header)
+            return yaml_header
+        
+        return update
+    
+    def _restore_header_updater(self, restore: Dict[str, Any]):
+        """
+        organize前のYAMLヘッダー値を復元する関数を作成
+        
+        Args:
+            restore: organize前のORGANIZE_HEADER_KEYSの値（存在しなかったキーは含まない）
+            
+        Returns:
+            Callable: ヘッダー辞書を受け取り更新後の辞書を返す関数
+        """
+        def update(yaml_header: Dict[str, Any]) -> Dict[str, Any]:
+            for key in self.ORGANIZE_HEADER_KEYS:
+                if key in restore:
+                    yaml_header[key] = restore[key]
+                else:
+                    yaml_header.pop(key, None)
+            return yaml_header
+        
+        return update
+    
+    @staticmethod
+    def _is_organized(yaml_header: Dict[str, Any], citation_key: str) -> bool:
+        """citation_keyとorganize完了状態が設定済みかどうか"""
+        processing_status = yaml_header.get('processing_status')
+        return (yaml_header.get('citation_key') == citation_key
+                and isinstance(processing_status, dict)
+                and processing_status.get('organize') == 'completed')
+    
+    def _collision_free_path(self, target_path: Path, planned_targets: set) -> Path:
+        """
+        既存ファイル・計画済みの移動先と重ならない衝突回避名を生成
+        
+        Args:
+            target_path: 本来の移動先ファイルパス
+            planned_targets: 計画済みの移動先パス
+            
+        Returns:
+            Path: 衝突回避名（{stem}_{timestamp}[_{n}]{suffix}）
+        """
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        candidate = target_path.parent / f"{target_path.stem}_{timestamp}{target_path.suffix}"
+        counter = 2
+        while candidate.exists() or str(candidate) in planned_targets:
+            candidate = target_path.parent / f"{target_path.stem}_{timestamp}_{counter}{target_path.suffix}"
+            counter += 1
+        
+        self.logger.warning(f"File collision detected. Using alternative name: {candidate}")
+        return candidate
+    
+    def _move_paper_file(self, file_path: Path, target_file_path: Path, update_header) -> None:
+        """
+        論文ファイルを移動しYAMLヘッダーを更新
+        
+        renameモードではos.replaceで移動（同一ファイルシステムならメタデータ操作のみ）した後、
+        YAMLHeaderProcessor.patch_yaml_headerでヘッダー部分のみを更新する。
+        ヘッダー更新に失敗した場合はファイルを元の位置に戻す。
+        
+        Args:
+            file_path: 移動元ファイルパス
+            target_file_path: 移動先ファイルパス
+            update_header: ヘッダー辞書を受け取り更新後の辞書を返す関数
+        """
+        if not self.rename_moves:
+            # 従来方式：移動先へ全体を書き直して元ファイルを削除
+            yaml_header, content = self.yaml_processor.parse_yaml_header(file_path)
+            self.yaml_processor.write_yaml_header(target_file_path, update_header(yaml_header), content)
+            if target_file_path.exists() and file_path != target_file_path:
+                file_path.unlink()
+                self.logger.info(f"Moved file from {file_path} to {target_file_path}")
+            return
+        
+        moved = file_path != target_file_path
+        if moved:
+            try:
+                os.replace(file_path, target_file_path)
+            except OSError:
+                # 別ファイルシステム等でリネームできない場合はコピーで移動
+                shutil.move(str(file_path), str(target_file_path))
+        
+        try:
+            in_place = self.yaml_processor.patch_yaml_header(target_file_path, update_header)
+        except Exception:
+            if moved:
+                os.replace(target_file_path, file_path)
+            raise
+        
+        if moved:
+            self.logger.info(f"Moved file from {file_path} to {target_file_path}")
+        self.logger.debug(f"Updated YAML header {'in place' if in_place else 'with rewrite'}: {target_file_path}")
+    
     def _handle_file_collision(self, target_path: Path, source_path: Path) -> Path:
         """
         ファイル衝突時の処理
@@ -477,7 +791,7 @@ class FileOrganizer:
             
             # 既存ファイルのバックアップ作成
             if self.create_backup:
-                backup_path = self.backup_manager.create_backup(str(target_path))
+                backup_path = self.backup_manager.create_backup(str(target_path), backup_type="organize_collision")
                 self.logger.info(f"Created backup for existing file: {backup_path}")
             
             self.logger.warning(f"File collision detected. Using alternative name: {collision_avoided_path}")
@@ -531,22 +845,20 @@ class FileOrganizer:
             base_path = Path(base_dir)
             
             # 統計情報収集
-            organized_dirs = [d for d in base_path.iterdir() if d.is_dir()]
+            organized_dirs = [paper_dir for paper_dir, _ in self.clippings_layout.scan(base_path)[0]]
             organized_files = []
             pending_files = []
             
-            for md_file in base_path.rglob("*.md"):
-                try:
-                    yaml_header, _ = self.yaml_processor.parse_yaml_header(md_file)
-                    status = yaml_header.get('processing_status', {}).get('organize', 'pending')
-                    
-                    if status == 'completed':
-                        organized_files.append(str(md_file))
-                    else:
-                        pending_files.append(str(md_file))
-                        
-                except Exception:
-                    pending_files.append(str(md_file))
+            headers, errors = self.metadata_scanner.scan_directory(base_path, ['processing_status'])
+            for md_file, fields in headers.items():
+                processing_status = fields.get('processing_status')
+                status = processing_status.get('organize', 'pending') if isinstance(processing_status, dict) else 'pending'
+                
+                if status == 'completed':
+                    organized_files.append(md_file)
+                else:
+                    pending_files.append(md_file)
+            pending_files.extend(errors)
             
             summary = {
                 'total_directories': len(organized_dirs),
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+OrganizeJournal - organize一括移動のジャーナル
+
+organize_workspaceが計画した移動（移動元・移動先・citation_key・復元用ヘッダー値）を
+実行前に1レコードで書き込み、移動完了ごとに完了レコードを追記する。
+処理が途中で停止した場合は、次回実行時にジャーナルから再実行（replay）または
+取り消し（rollback）を行う。
+"""
+
+import os
+import json
+import uuid
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, Any, List, Optional, Set
+
+from ..shared_modules.config_manager import ConfigManager
+from ..shared_modules.integrated_logger import IntegratedLogger
+from ..shared_modules.exceptions import FileSystemError
+
+
+class OrganizeJournal:
+    """
+    organizeトランザクションのジャーナル管理クラス
+
+    追記専用のJSON Linesファイルに以下のレコードを記録する。
+    - plan: トランザクションID・全移動計画（fsync後に移動を開始）
+    - done: 完了した移動のインデックス
+    完了（commit）または取り消し（rollback）後はジャーナルを削除するため、
+    ジャーナルが残っている場合は未完了のトランザクションがあることを意味する。
+    doneレコードは再実行・取り消し時の確認を省くためのもので、失われても
+    ファイルシステムの状態から各移動の進行状況を判定できる。
+    """
+
+    JOURNAL_FILE_NAME = '.organize_journal.jsonl'
+
+    def __init__(self, config_manager: ConfigManager, logger: IntegratedLogger, journal_dir: str):
+        """
+        OrganizeJournal初期化
+
+        Args:
+            config_manager: 設定管理インスタンス
+            logger: ログ管理インスタンス
+            journal_dir: ジャーナルファイルを配置するディレクトリ（Clippingsディレクトリ）
+        """
+        self.config_manager = config_manager
+        self.logger = logger.get_logger('OrganizeJournal')
+
+        transaction_config = config_manager.get_config()
+        for key in ('workflows', 'organize', 'transaction'):
+            transaction_config = transaction_config.get(key, {}) if isinstance(transaction_config, dict) else {}
+        if not isinstance(transaction_config, dict):
+            transaction_config = {}
+        self.fsync = transaction_config.get('fsync', True) is not False
+
+        self.journal_path = Path(journal_dir) / self.JOURNAL_FILE_NAME
+        self._handle = None
+
+    def has_pending(self) -> bool:
+        """
+        未完了のトランザクションがあるかどうか
+
+        Returns:
+            bool: ジャーナルに計画が記録されている場合True
+        """
+        return self.load() is not None
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        """
+        未完了トランザクションの読み込み（途中で切れた最終行は無視）
+
+        Returns:
+            Optional[Dict[str, Any]]: txn_id・moves・done（完了インデックス集合）。
+                ジャーナルがない・計画が記録されていない場合None
+        """
+        if not self.journal_path.exists():
+            return None
+
+        transaction = None
+        done: Set[int] = set()
+        try:
+            with open(self.journal_path, 'r', encoding='utf-8') as f:
+                for line_number, line in enumerate(f, 1):
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        record = json.loads(line)
+                        if record['op'] == 'plan':
+                            transaction = {'txn_id': record['txn_id'], 'moves': record['moves'],
+                                           'created_at': record.get('created_at')}
+                        elif record['op'] == 'done':
+                            done.add(record['index'])
+                    except (ValueError, KeyError, TypeError):
+                        self.logger.warning(f"Ignoring corrupted organize journal record at "
+                                            f"{self.journal_path}:{line_number}")
+        except OSError as e:
+            raise FileSystemError(
+                f"Failed to read organize journal {self.journal_path}: {e}",
+                error_code="ORGANIZE_JOURNAL_READ_FAILED",
+                context={"journal": str(self.journal_path)},
+                cause=e
+            )
+
+        if transaction is None:
+            return None
+        transaction['done'] = done
+        return transaction
+
+    def begin(self, moves: List[Dict[str, Any]]) -> str:
+        """
+        移動計画を書き込みトランザクションを開始
+
+        Args:
+            moves: 移動計画（source、target、citation_key、restore、new_dir）
+
+        Returns:
+            str: トランザクションID
+
+        Raises:
+            FileSystemError: ジャーナル書き込みエラーの場合（移動は開始しない）
+        """
+        txn_id = uuid.uuid4().hex
+        try:
+            self._handle = open(self.journal_path, 'w', encoding='utf-8')
+            self._write({'op': 'plan', 'txn_id': txn_id, 'created_at': datetime.now().isoformat(),
+                         'moves': moves}, sync=True)
+        except OSError as e:
+            self.close()
+            raise FileSystemError(
+                f"Failed to write organize journal {self.journal_path}: {e}",
+                error_code="ORGANIZE_JOURNAL_WRITE_FAILED",
+                context={"journal": str(self.journal_path)},
+                cause=e
+            )
+        self.logger.debug(f"Started organize transaction {txn_id} with {len(moves)} moves")
+        return txn_id
+
+    def resume(self):
+        """未完了トランザクションへの完了レコード追記を再開"""
+        self._handle = open(self.journal_path, 'a', encoding='utf-8')
+
+    def mark_done(self, index: int):
+        """
+        移動完了を記録
+
+        Args:
+            index: 移動計画内のインデックス
+        """
+        if self._handle is not None:
+            self._write({'op': 'done', 'index': index}, sync=False)
+
+    def finish(self):
+        """トランザクションを終了しジャーナルを削除"""
+        self.close()
+        try:
+            self.journal_path.unlink()
+        except FileNotFoundError:
+            pass
+
+    def close(self):
+        """ジャーナルファイルを閉じる（未完了のまま残す場合にも使用）"""
+        if self._handle is not None:
+            try:
+                self._handle.flush()
+                if self.fsync:
+                    os.fsync(self._handle.fileno())
+            finally:
+                self._handle.close()
+                self._handle = None
+
+    def _write(self, record: Dict[str, Any], sync: bool):
+        """レコードを1行で追記（計画レコードのみ毎回fsync）"""
+        self._handle.write(json.dumps(record, ensure_ascii=False, default=str, separators=(',', ':')) + '\n')
+        self._handle.flush()
+        if sync and self.fsync:
+            os.fsync(self._handle.fileno())
@@ -0,0 +1,375 @@
+#!/usr/bin/env python3
+"""
+PaperIndex - DOI・タイトル照合インデックス
+
+CurrentManuscript.bibから作成する永続化インデックス。
+- 正規化DOI → citation_key
+- タイトルの文字n-gram（shingle） → citation_key の転置インデックス
+- 出版年バケット → citation_key
+DOIがない・不正なClippingsをタイトルで照合し、信頼度スコア付きで返す。
+"""
+
+import os
+import re
+import json
+import unicodedata
+from pathlib import Path
+from collections import Counter
+from urllib.parse import unquote
+from typing import Dict, Any, List, Optional, Set, Iterable, Union
+
+from ..shared_modules.config_manager import ConfigManager
+from ..shared_modules.integrated_logger import IntegratedLogger
+from ..shared_modules.bibtex_parser import BibTeXParser
+
+
+class PaperIndex:
+    """
+    CurrentManuscript.bibのDOI・タイトル照合インデックスクラス
+
+    インデックスはBibTeXファイルと同じディレクトリの`.paper_index.json`に保存し、
+    BibTeXファイルのサイズ・更新時刻が変わらない限り再解析せずに読み込む。
+    タイトル照合は転置インデックスから候補を絞り込むため、論文数に比例した総当たり比較は行わない。
+    """
+
+    INDEX_FILE_NAME = '.paper_index.json'
+    INDEX_VERSION = 1
+    SHINGLE_SIZE = 3
+    UNDATED_BUCKET = 'undated'
+    # 出版年が1年ずれている候補の信頼度係数（オンライン先行公開と巻号発行年の差を許容）
+    ADJACENT_YEAR_FACTOR = 0.95
+
+    DOI_PATTERN = re.compile(r'10\.\d{4,9}/\S+')
+    DOI_PREFIX_PATTERN = re.compile(r'^(?:https?://(?:dx\.)?doi\.org/|doi\s*:\s*|doi\s+)', re.IGNORECASE)
+    LATEX_COMMAND_PATTERN = re.compile(r'\\(?:[a-zA-Z]+|[^a-zA-Z\s])\s*')
+    NON_ALNUM_PATTERN = re.compile(r'[^0-9a-z]+')
+
+    def __init__(self, config_manager: ConfigManager, logger: IntegratedLogger):
+        """
+        PaperIndexの初期化
+
+        Args:
+            config_manager: 設定管理インスタンス
+            logger: ログ管理インスタンス
+        """
+        self.config_manager = config_manager
+        self.logger = logger.get_logger('PaperIndex')
+        self.bibtex_parser = BibTeXParser(logger.get_logger('BibTeXParser'))
+
+        # 設定読み込み（workflows.organize.paper_index）
+        index_config = config_manager.get_config()
+        for key in ('workflows', 'organize', 'paper_index'):
+            index_config = index_config.get(key, {}) if isinstance(index_config, dict) else {}
+        if not isinstance(index_config, dict):
+            index_config = {}
+        self.persist = index_config.get('persist', True) is not False
+        self.min_confidence = self._float_setting(index_config, 'min_confidence', 0.85)
+        self.ambiguity_margin = self._float_setting(index_config, 'ambiguity_margin', 0.05)
+        self.max_candidates = int(self._float_setting(index_config, 'max_candidates', 20))
+        self.max_shingle_ratio = self._float_setting(index_config, 'max_shingle_ratio', 0.05)
+
+        self.clear()
+
+    @staticmethod
+    def _float_setting(config: Dict[str, Any], key: str, default: float) -> float:
+        """数値設定の取得（不正値はデフォルト）"""
+        value = config.get(key, default)
+        return float(value) if isinstance(value, (int, float)) and not isinstance(value, bool) else default
+
+    def clear(self):
+        """インデックスを空にする"""
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self.doi_index: Dict[str, str] = {}
+        self.shingle_index: Dict[str, List[str]] = {}
+        self.year_buckets: Dict[str, List[str]] = {}
+        self._entry_shingles: Dict[str, Set[str]] = {}
+
+    # ------------------------------------------------------------------
+    # 正規化
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def normalize_doi(cls, doi: Any) -> Optional[str]:
+        """
+        DOI正規化（URL・doi:プレフィックス、URLエンコード、前後の記号を除去）
+
+        Args:
+            doi: DOI文字列
+
+        Returns:
+            Optional[str]: 小文字化した正規化DOI（DOIとして解釈できない場合None）
+        """
+        if not doi or not isinstance(doi, str):
+            return None
+
+        normalized = unquote(doi.strip()).lower()
+        normalized = cls.DOI_PREFIX_PATTERN.sub('', normalized)
+        if not normalized.startswith('10.'):
+            # 文中に埋め込まれたDOI（"available at https://doi.org/10..." 等）
+            match = cls.DOI_PATTERN.search(normalized)
+            if not match:
+                return None
+            normalized = match.group(0)
+
+        normalized = normalized.split()[0].rstrip('.,;:)]}>"\'')
+        return normalized if cls.DOI_PATTERN.fullmatch(normalized) else None
+
+    @classmethod
+    def normalize_title(cls, title: Any) -> str:
+        """
+        タイトル正規化（LaTeXコマンド・波括弧・アクセント・記号を除去し小文字の単語列にする）
+
+        Args:
+            title: タイトル文字列
+
+        Returns:
+            str: 空白区切りの正規化タイトル
+        """
+        if not title or not isinstance(title, str):
+            return ''
+
+        text = cls.LATEX_COMMAND_PATTERN.sub('', title).replace('{', '').replace('}', '')
+        text = unicodedata.normalize('NFKD', text)
+        text = ''.join(char for char in text if not unicodedata.combining(char)).lower()
+        return cls.NON_ALNUM_PATTERN.sub(' ', text).strip()
+
+    @classmethod
+    def title_shingles(cls, normalized_title: str) -> Set[str]:
+        """
+        正規化タイトルの文字n-gram集合
+
+        Args:
+            normalized_title: normalize_title()の結果
+
+        Returns:
+            Set[str]: shingle集合
+        """
+        text = normalized_title.replace(' ', '_')
+        if len(text) < cls.SHINGLE_SIZE:
+            return {text} if text else set()
+        return {text[i:i + cls.SHINGLE_SIZE] for i in range(len(text) - cls.SHINGLE_SIZE + 1)}
+
+    @staticmethod
+    def parse_year(value: Any) -> Optional[int]:
+        """
+        出版年の取得（"2023"、2023、"2023-05-01"等）
+
+        Args:
+            value: 年を含む値
+
+        Returns:
+            Optional[int]: 出版年（解釈できない場合None）
+        """
+        if isinstance(value, bool):
+            return None
+        if isinstance(value, int):
+            return value if 1000 <= value <= 9999 else None
+        if hasattr(value, 'year'):
+            return value.year
+        if isinstance(value, str):
+            match = re.search(r'(?<!\d)(\d{4})(?!\d)', value)
+            if match:
+                return int(match.group(1))
+        return None
+
+    # ------------------------------------------------------------------
+    # 作成・永続化
+    # ------------------------------------------------------------------
+
+    def load_or_build(self, bibtex_file: Union[str, Path]) -> 'PaperIndex':
+        """
+        保存済みインデックスの読み込み（BibTeXファイルが変更されていれば再作成して保存）
+
+        Args:
+            bibtex_file: CurrentManuscript.bibファイルパス
+
+        Returns:
+            PaperIndex: 自身
+        """
+        bibtex_path = Path(bibtex_file)
+        index_path = bibtex_path.parent / self.INDEX_FILE_NAME
+        signature = self._source_signature(bibtex_path)
+
+        if self.persist and self._load(index_path, signature):
+            self.logger.debug(f"Loaded paper index for {len(self.entries)} entries from {index_path}")
+            return self
+
+        self.build(self.bibtex_parser.parse_file(str(bibtex_path)))
+        if self.persist:
+            self._save(index_path, signature)
+        self.logger.info(f"Built paper index: {len(self.entries)} entries, {len(self.doi_index)} DOIs, "
+                         f"{len(self.shingle_index)} title shingles")
+        return self
+
+    def build(self, bibtex_entries: Dict[str, Dict[str, Any]]):
+        """
+        BibTeXエントリからインデックスを作成
+
+        Args:
+            bibtex_entries: citation_keyをキーとしたエントリ辞書
+        """
+        self.clear()
+        for citation_key, entry_data in bibtex_entries.items():
+            self._add_entry(citation_key, {
+                'doi': self.normalize_doi(entry_data.get('doi')),
+                'title': self.normalize_title(entry_data.get('title')),
+                'year': self.parse_year(entry_data.get('year'))
+            })
+
+    def _add_entry(self, citation_key: str, entry: Dict[str, Any]):
+        """エントリを各インデックスへ登録"""
+        self.entries[citation_key] = entry
+        if entry['doi']:
+            self.doi_index[entry['doi']] = citation_key
+
+        shingles = self.title_shingles(entry['title'])
+        self._entry_shingles[citation_key] = shingles
+        for shingle in shingles:
+            self.shingle_index.setdefault(shingle, []).append(citation_key)
+
+        bucket = str(entry['year']) if entry['year'] else self.UNDATED_BUCKET
+        self.year_buckets.setdefault(bucket, []).append(citation_key)
+
+    @staticmethod
+    def _source_signature(bibtex_path: Path) -> Dict[str, Any]:
+        """BibTeXファイルの変更検知用シグネチャ"""
+        stat = os.stat(bibtex_path)
+        return {'path': str(bibtex_path.resolve()), 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+    def _load(self, index_path: Path, signature: Dict[str, Any]) -> bool:
+        """保存済みインデックスの読み込み（無効・古い場合False）"""
+        if not index_path.exists():
+            return False
+
+        try:
+            with open(index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if (data.get('version') != self.INDEX_VERSION
+                    or data.get('shingle_size') != self.SHINGLE_SIZE
+                    or data.get('source') != signature):
+                return False
+
+            self.clear()
+            self.entries = data['entries']
+            self.shingle_index = data['shingles']
+            self.year_buckets = data['years']
+            for citation_key, entry in self.entries.items():
+                if entry.get('doi'):
+                    self.doi_index[entry['doi']] = citation_key
+            return True
+        except (OSError, ValueError, KeyError, AttributeError, TypeError) as e:
+            self.logger.warning(f"Ignoring unreadable paper index {index_path}: {e}")
+            self.clear()
+            return False
+
+    def _save(self, index_path: Path, signature: Dict[str, Any]):
+        """インデックスを一時ファイル経由で保存"""
+        data = {
+            'version': self.INDEX_VERSION,
+            'shingle_size': self.SHINGLE_SIZE,
+            'source': signature,
+            'entries': self.entries,
+            'shingles': self.shingle_index,
+            'years': self.year_buckets
+        }
+        temp_path = index_path.with_name(index_path.name + '.tmp')
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+            os.replace(temp_path, index_path)
+        except OSError as e:
+            self.logger.warning(f"Failed to save paper index {index_path}: {e}")
+            if temp_path.exists():
+                temp_path.unlink()
+
+    # ------------------------------------------------------------------
+    # 照合
+    # ------------------------------------------------------------------
+
+    def lookup_doi(self, doi: Any) -> Optional[str]:
+        """
+        DOIによる完全一致検索
+
+        Args:
+            doi: DOI文字列（未正規化可）
+
+        Returns:
+            Optional[str]: citation_key
+        """
+        normalized = self.normalize_doi(doi)
+        return self.doi_index.get(normalized) if normalized else None
+
+    def match_title(self, title: Any, year: Any = None,
+                    exclude: Iterable[str] = ()) -> Optional[Dict[str, Any]]:
+        """
+        タイトル（と出版年）による曖昧照合
+
+        Args:
+            title: Clippingsのタイトル
+            year: Clippingsの出版年（不明な場合None）
+            exclude: 候補から除外するcitation_key（DOIで照合済み等）
+
+        Returns:
+            Optional[Dict[str, Any]]: 最良候補（citation_key、confidence、runner_up_confidence、accepted）。
+                候補がない場合None
+        """
+        query_shingles = self.title_shingles(self.normalize_title(title))
+        if not query_shingles or not self.entries:
+            return None
+
+        year = self.parse_year(year)
+        allowed = self._year_candidates(year)
+        excluded = set(exclude)
+
+        # 多数の論文に現れるshingle（"ion"、"the"等）は候補生成に使わない
+        max_postings = max(50, int(len(self.entries) * self.max_shingle_ratio))
+        hits = Counter()
+        for shingle in query_shingles:
+            postings = self.shingle_index.get(shingle)
+            if postings and len(postings) <= max_postings:
+                hits.update(postings)
+
+        scored = []
+        for citation_key, _ in hits.most_common():
+            if citation_key in excluded or (allowed is not None and citation_key not in allowed):
+                continue
+            scored.append((self._confidence(query_shingles, year, citation_key), citation_key))
+            if len(scored) >= self.max_candidates:
+                break
+
+        if not scored:
+            return None
+
+        scored.sort(key=lambda item: (-item[0], item[1]))
+        confidence, citation_key = scored[0]
+        runner_up = scored[1][0] if len(scored) > 1 else 0.0
+        return {
+            'citation_key': citation_key,
+            'confidence': round(confidence, 3),
+            'runner_up_confidence': round(runner_up, 3),
+            'accepted': confidence >= self.min_confidence and confidence - runner_up >= self.ambiguity_margin
+        }
+
+    def _year_candidates(self, year: Optional[int]) -> Optional[Set[str]]:
+        """出版年バケットから候補を取得（前後1年と出版年不明を含む。年不明の場合None=制限なし）"""
+        if year is None:
+            return None
+        candidates = set(self.year_buckets.get(self.UNDATED_BUCKET, ()))
+        for bucket_year in (year - 1, year, year + 1):
+            candidates.update(self.year_buckets.get(str(bucket_year), ()))
+        return candidates
+
+    def _confidence(self, query_shingles: Set[str], year: Optional[int], citation_key: str) -> float:
+        """shingle集合のJaccard係数（出版年が1年ずれている場合は減点）"""
+        entry_shingles = self._entry_shingles.get(citation_key)
+        if entry_shingles is None:
+            entry_shingles = self.title_shingles(self.entries[citation_key]['title'])
+            self._entry_shingles[citation_key] = entry_shingles
+
+        shared = len(query_shingles & entry_shingles)
+        confidence = shared / (len(query_shingles) + len(entry_shingles) - shared)
+
+        entry_year = self.entries[citation_key].get('year')
+        if year is not None and entry_year and entry_year != year:
+            confidence *= self.ADJACENT_YEAR_FACTOR
+        return confidence
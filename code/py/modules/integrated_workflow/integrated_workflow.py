@@ -26,11 +26,13 @@ from code.py.modules.ai_citation_support.ai_citation_support_workflow import AIC
 from code.py.modules.ai_tagging_translation.tagger_workflow import TaggerWorkflow
 from code.py.modules.ai_tagging_translation.translate_workflow import TranslateWorkflow
 from code.py.modules.ai_tagging_translation.ochiai_format_workflow import OchiaiFormatWorkflow
+from code.py.modules.ai_tagging_translation.claude_api_client import ClaudeClientRegistry
 from code.py.modules.citation_pattern_normalizer.citation_pattern_normalizer_workflow import CitationPatternNormalizerWorkflow
 
 # 状態管理・ユーティリティ
 from code.py.modules.status_management_yaml.status_manager import StatusManager
 from code.py.modules.shared_modules.bibtex_parser import BibTeXParser
+from code.py.modules.shared_modules.clippings_layout import ClippingsLayout
 
 
 class IntegratedWorkflow:
@@ -60,6 +62,8 @@ class IntegratedWorkflow:
         self.status_manager = StatusManager(config_manager, logger)
         # BibTeXParserには単一ロガーを渡す
         self.bibtex_parser = BibTeXParser(self.logger)
+        # Clippingsレイアウト（シャード配置の論文ディレクトリからのcitation_key取得）
+        self.clippings_layout = ClippingsLayout(config_manager, logger)
         
         # 各ワークフローモジュールを初期化（遅延初期化）
         self._workflow_modules = {}
@@ -204,6 +208,11 @@ class IntegratedWorkflow:
             execution_results['status'] = 'completed'
             self.logger.info("Integrated workflow execution completed successfully")
             
+            # AIステップ共有クライアントの接続再利用メトリクス
+            ai_client_metrics = ClaudeClientRegistry.get_metrics()
+            if ai_client_metrics['requests']:
+                self.logger.info(f"Claude API client metrics: {ai_client_metrics}")
+            
         except Exception as e:
             self.logger.error(f"Integrated workflow failed: {e}")
             execution_results['status'] = 'failed'
@@ -254,7 +263,7 @@ class IntegratedWorkflow:
             clippings_keys = set()
             if clippings_dir.exists():
                 for md_file in clippings_dir.rglob("*.md"):
-                    citation_key = self._extract_citation_key_from_path(md_file)
+                    citation_key = self._extract_citation_key_from_path(md_file, clippings_dir)
                     self.logger.debug(f"MD file: {md_file}, extracted key: {citation_key}")
                     if citation_key:
                         clippings_keys.add(citation_key)
@@ -281,12 +290,10 @@ class IntegratedWorkflow:
             self.logger.error(f"Failed to detect edge cases: {e}")
             return [], {'missing_in_clippings': [], 'orphaned_in_clippings': []}
     
-    def _extract_citation_key_from_path(self, md_file: Path) -> str:
+    def _extract_citation_key_from_path(self, md_file: Path, clippings_dir: Path = None) -> str:
         """MarkdownファイルパスからCitation keyを抽出"""
-        # ディレクトリ名をcitation_keyとして使用
-        if md_file.parent.name != "Clippings":
-            return md_file.parent.name
-        return None
+        # 論文ディレクトリ名をcitation_keyとして使用（シャード配置でも親ディレクトリが論文ディレクトリ）
+        return self.clippings_layout.citation_key_from_path(md_file, clippings_dir)
     
     def _show_execution_plan(self, valid_papers: list, ai_controller) -> None:
         """実行計画を表示"""
@@ -357,8 +364,9 @@ class IntegratedWorkflow:
     def _execute_translate(self, workspace_path: Path, target_papers: list, **options) -> dict:
         """enhanced-translate機能実行"""
         translate_workflow = self._get_workflow_module('translate', TranslateWorkflow)
+        clippings_dir = workspace_path / "Clippings"
         
-        result = translate_workflow.process_items(str(workspace_path), target_papers)
+        result = translate_workflow.process_items(str(clippings_dir), target_papers)
         return result
     
     def _execute_ochiai(self, workspace_path: Path, target_papers: list, **options) -> dict:
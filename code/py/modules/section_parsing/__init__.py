@@ -7,13 +7,16 @@ Classes:
     SectionParsingWorkflow: メインワークフロークラス
     Section: セクション情報を表すデータクラス
     PaperStructure: 論文構造全体を表すデータクラス
+    SectionReader: バイトオフセットによるセクション単位読み込みクラス
 """
 
 from .section_parsing_workflow import SectionParsingWorkflow
 from .section_structure import Section, PaperStructure
+from .section_reader import SectionReader
 
 __all__ = [
     'SectionParsingWorkflow',
     'Section',
-    'PaperStructure'
+    'PaperStructure',
+    'SectionReader'
 ] 
\ No newline at end of file
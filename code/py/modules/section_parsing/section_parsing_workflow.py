@@ -4,14 +4,22 @@ section_parsing_workflow.py - セクション分割ワークフロー
 学術論文のMarkdownファイルからセクション構造を解析・抽出する機能
 """
 
+import io
 import os
 import re
-from typing import List, Dict, Any, Optional
+import queue
+import hashlib
+import logging
+import threading
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Iterable, Tuple, NamedTuple
 from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
 
 from ..shared_modules.config_manager import ConfigManager
 from ..shared_modules.integrated_logger import IntegratedLogger
 from ..shared_modules.exceptions import ProcessingError
+from ..shared_modules.clippings_layout import ClippingsLayout
 from ..status_management_yaml.yaml_header_processor import YAMLHeaderProcessor
 from .section_structure import Section, PaperStructure
 
@@ -31,17 +39,75 @@ class SectionParsingWorkflow:
         'acknowledgments': ['acknowledgments', 'acknowledgements', 'thanks']
     }
     
+    # 見出し行パターン（レベルとタイトルを1回のマッチで取得）
+    HEADING_PATTERN = re.compile(r'^(#{2,4})\s+(.+)')
+    
+    # タイトル→セクション種別キャッシュの上限
+    SECTION_TYPE_CACHE_SIZE = 4096
+    
+    # セクションハッシュの桁数（SHA-256の先頭16桁、論文内の変更検出用）
+    SECTION_HASH_LENGTH = 16
+    
+    # 後続処理と入力に使うセクション種別の既定値（該当セクションが変化した場合のみ再実行）
+    # tagger・ochiai_formatは各処理のsection_priority設定があればそちらを使用
+    DOWNSTREAM_SECTION_TYPES = {
+        'tagger': ('introduction', 'results', 'discussion'),
+        'translate_abstract': ('abstract',),
+        'ochiai_format': ('abstract', 'conclusion', 'results', 'discussion', 'methods', 'introduction')
+    }
+    
     def __init__(self, config_manager: ConfigManager, logger: IntegratedLogger):
         """初期化"""
         self.config_manager = config_manager
         self.logger = logger.get_logger('SectionParsingWorkflow')
         self.yaml_processor = YAMLHeaderProcessor(config_manager, logger)
+        self.clippings_layout = ClippingsLayout(config_manager, logger)
         
         # 設定読み込み
         self.config = self.config_manager.get_config().get('section_parsing', {})
         self.min_section_words = self.config.get('min_section_words', 50)
         self.max_heading_level = self.config.get('max_heading_level', 4)
         self.enable_subsection_analysis = self.config.get('enable_subsection_analysis', True)
+        self.skip_unchanged = self.config.get('skip_unchanged', True)
+        
+        # 並列実行設定（解析はワーカープロセス、YAML書き込みは単一の書き込みスレッド）
+        parallel_config = self.config.get('parallel', {})
+        self.parallel_enabled = parallel_config.get('enabled', True)
+        self.max_workers = parallel_config.get('max_workers') or os.cpu_count() or 1
+        self.chunk_size = parallel_config.get('chunk_size', 8)
+        self.parallel_min_papers = parallel_config.get('min_papers', 32)
+        self.write_queue_size = parallel_config.get('write_queue_size', 200)
+        
+        self.downstream_section_types = self._load_downstream_section_types()
+        self._init_section_type_lookup()
+    
+    def _load_downstream_section_types(self) -> Dict[str, Tuple[str, ...]]:
+        """後続処理の入力セクション種別を各処理のsection_priority設定から取得
+        
+        Returns:
+            Dict[str, Tuple[str, ...]]: 後続処理名→入力セクション種別
+        """
+        full_config = self.config_manager.get_config()
+        ochiai_config = full_config.get('ochiai_format', {}) if isinstance(full_config, dict) else {}
+        configured = {
+            'tagger': self.config_manager.get_ai_setting('tagger', 'section_priority'),
+            'ochiai_format': ochiai_config.get('section_priority') if isinstance(ochiai_config, dict) else None
+        }
+        
+        downstream_section_types = dict(self.DOWNSTREAM_SECTION_TYPES)
+        for step, section_types in configured.items():
+            if isinstance(section_types, (list, tuple)) and section_types:
+                downstream_section_types[step] = tuple(section_types)
+        return downstream_section_types
+    
+    def _init_section_type_lookup(self) -> None:
+        """セクション種別ルックアップとキャッシュを初期化"""
+        # セクション種別の事前計算済みルックアップ（パターン語と完全一致するタイトル用）
+        self._section_type_lookup = {
+            pattern: self._scan_section_type(pattern)
+            for patterns in self.SECTION_TYPE_PATTERNS.values() for pattern in patterns
+        }
+        self._section_type_cache: Dict[str, str] = {}
         
     def process_papers(self, clippings_dir: str, target_papers: List[str] = None) -> Dict[str, Any]:
         """論文の一括セクション分割処理"""
@@ -58,35 +124,44 @@ class SectionParsingWorkflow:
             'papers_with_sections': 0,
             'papers_without_sections': 0,
             'total_sections_found': 0,
-            'section_types_found': set()
+            'section_types_found': set(),
+            'unchanged_papers': 0,
+            'changed_section_types': {}
         }
         
+        paper_entries = []
         for paper_name in target_papers:
-            paper_path = os.path.join(clippings_dir, paper_name, f"{paper_name}.md")
+            md_file = self.clippings_layout.find_markdown_file(clippings_dir, paper_name)
+            paper_path = str(md_file) if md_file else os.path.join(clippings_dir, paper_name, f"{paper_name}.md")
             
-            if not os.path.exists(paper_path):
+            if md_file is None:
                 self.logger.warning(f"Paper file not found: {paper_path}")
                 results['failed_papers'] += 1
                 continue
-                
-            try:
-                paper_structure = self.parse_sections_single(paper_path)
-                self.update_yaml_with_structure(paper_path, paper_structure)
-                
-                results['processed_papers'] += 1
-                if paper_structure.total_sections > 0:
-                    results['papers_with_sections'] += 1
-                    results['total_sections_found'] += paper_structure.total_sections
-                    results['section_types_found'].update(paper_structure.section_types_found)
-                else:
-                    results['papers_without_sections'] += 1
-                    
-                self.logger.info(f"Successfully parsed sections for: {paper_name} "
-                               f"({paper_structure.total_sections} sections)")
-                
-            except Exception as e:
-                self.logger.error(f"Failed to parse sections for {paper_name}: {e}")
-                results['failed_papers'] += 1
+            
+            # 本文が前回解析時から変更されていない論文は再解析・再書き込みしない
+            stored_structure = self._load_current_structure(paper_path) if self.skip_unchanged else None
+            if stored_structure is not None:
+                results['unchanged_papers'] += 1
+                self._record_parsed_paper(results, paper_name, stored_structure, [])
+                continue
+            
+            paper_entries.append((paper_name, paper_path))
+        
+        use_pool = (self.parallel_enabled and self.max_workers > 1
+                    and len(paper_entries) >= self.parallel_min_papers)
+        
+        if use_pool:
+            self._process_papers_parallel(paper_entries, results)
+        else:
+            for paper_name, paper_path in paper_entries:
+                try:
+                    paper_structure = self.parse_sections_single(paper_path)
+                    changed_types = self.update_yaml_with_structure(paper_path, paper_structure)
+                    self._record_parsed_paper(results, paper_name, paper_structure, changed_types)
+                except Exception as e:
+                    self.logger.error(f"Failed to parse sections for {paper_name}: {e}")
+                    results['failed_papers'] += 1
         
         # section_types_found を list に変換（JSON serializable）
         results['section_types_found'] = list(results['section_types_found'])
@@ -96,31 +171,262 @@ class SectionParsingWorkflow:
         
         return results
     
+    def _record_parsed_paper(self, results: Dict[str, Any], paper_name: str,
+                             paper_structure: PaperStructure,
+                             changed_types: Optional[List[str]] = None) -> None:
+        """解析・書き込みが完了した論文を集計に反映
+        
+        Args:
+            results: 集計結果（この中で更新）
+            paper_name: 論文名
+            paper_structure: 論文構造
+            changed_types: 前回解析から変化したセクション種別（初回解析はNone）
+        """
+        results['processed_papers'] += 1
+        if changed_types is not None:
+            results['changed_section_types'][paper_name] = changed_types
+        if changed_types:
+            affected_steps = self._steps_affected_by(changed_types)
+            if affected_steps:
+                self.logger.info(f"Section changes {changed_types} in {paper_name} "
+                                 f"require re-running {affected_steps}")
+        if paper_structure.total_sections > 0:
+            results['papers_with_sections'] += 1
+            results['total_sections_found'] += paper_structure.total_sections
+            results['section_types_found'].update(paper_structure.section_types_found)
+        else:
+            results['papers_without_sections'] += 1
+            
+        self.logger.info(f"Successfully parsed sections for: {paper_name} "
+                       f"({paper_structure.total_sections} sections)")
+    
+    def _process_papers_parallel(self, paper_entries: List[Tuple[str, str]], results: Dict[str, Any]) -> None:
+        """ワーカープロセスで解析・YAMLヘッダー更新内容の作成を行い、単一の書き込みスレッドで書き込む
+        
+        Args:
+            paper_entries: (論文名, 論文ファイルパス) のリスト
+            results: 集計結果（この中で更新）
+        """
+        max_workers = min(self.max_workers, len(paper_entries))
+        self.logger.info(f"Parsing {len(paper_entries)} papers with {max_workers} worker processes "
+                         f"(chunk size: {self.chunk_size}, write queue size: {self.write_queue_size})")
+        
+        # 上限付きキューで解析が書き込みより先行しすぎないようにする
+        write_queue = queue.Queue(maxsize=max(1, self.write_queue_size))
+        write_outcomes = []
+        writer = threading.Thread(
+            target=self._write_structures, args=(write_queue, write_outcomes),
+            name='SectionParsingWriter', daemon=True
+        )
+        
+        try:
+            for paper_name, paper_path, prepared, error in self._parse_papers(paper_entries, max_workers):
+                # ワーカープロセス起動（fork）後に書き込みスレッドを開始する
+                if writer.ident is None:
+                    writer.start()
+                if error is not None:
+                    self.logger.error(f"Failed to parse sections for {paper_name}: {error}")
+                    results['failed_papers'] += 1
+                    continue
+                write_queue.put((paper_name, paper_path, prepared))
+        finally:
+            if writer.ident is not None:
+                write_queue.put(None)
+                writer.join()
+        
+        for paper_name, paper_structure, changed_types, error in write_outcomes:
+            if error is not None:
+                self.logger.error(f"Failed to parse sections for {paper_name}: {error}")
+                results['failed_papers'] += 1
+            else:
+                self._record_parsed_paper(results, paper_name, paper_structure, changed_types)
+    
+    def _parse_papers(self, paper_entries: List[Tuple[str, str]], max_workers: int):
+        """ワーカープロセスで論文を解析し書き込み内容を作成（プール異常時は残りを単一プロセスで処理）
+        
+        Args:
+            paper_entries: (論文名, 論文ファイルパス) のリスト
+            max_workers: ワーカープロセス数
+            
+        Yields:
+            Tuple: (論文名, 論文ファイルパス, PreparedStructureUpdate, エラー) を入力順に返す
+        """
+        completed = 0
+        paper_paths = [paper_path for _, paper_path in paper_entries]
+        
+        try:
+            with ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_init_section_worker,
+                initargs=(self._get_worker_settings(),)
+            ) as executor:
+                parsed = executor.map(_parse_paper_in_worker, paper_paths,
+                                      chunksize=max(1, self.chunk_size))
+                for (paper_name, paper_path), (prepared, error) in zip(paper_entries, parsed):
+                    completed += 1
+                    yield paper_name, paper_path, prepared, error
+        except Exception as e:
+            if completed >= len(paper_entries):
+                raise
+            self.logger.warning(f"Process pool section parsing failed ({e}), "
+                                f"parsing remaining {len(paper_entries) - completed} papers serially")
+            for paper_name, paper_path in paper_entries[completed:]:
+                try:
+                    yield paper_name, paper_path, self.parse_and_prepare(paper_path), None
+                except Exception as parse_error:
+                    yield paper_name, paper_path, None, parse_error
+    
+    def _write_structures(self, write_queue: queue.Queue, write_outcomes: List[Tuple]) -> None:
+        """書き込みスレッド本体：ワーカーが作成したファイル内容を1件ずつ書き込む
+        
+        YAMLヘッダーの解析・オフセット再計算・差分・シリアライズはワーカープロセスで済んでいるため、
+        このスレッドはファイルI/Oのみを行う。書き込みを1スレッドに集約することで
+        同一ファイルへの同時書き込みを避け、解析（ワーカープロセス）と書き込みを並行させる。
+        解析後に論文ファイルが変更されていた場合は、その論文のみこのスレッドで解析し直す。
+        
+        Args:
+            write_queue: (論文名, 論文ファイルパス, PreparedStructureUpdate) のキュー（Noneで終了）
+            write_outcomes: (論文名, PaperStructure, 変化したセクション種別, エラー) の書き込み結果リスト（この中で追加）
+        """
+        for item in iter(write_queue.get, None):
+            paper_name, paper_path, prepared = item
+            paper_structure = prepared.paper_structure
+            try:
+                if self._file_signature(paper_path) != prepared.source_signature:
+                    self.logger.debug(f"Paper changed after parsing, re-parsing: {paper_path}")
+                    prepared = self.parse_and_prepare(paper_path)
+                    paper_structure = prepared.paper_structure
+                self.yaml_processor.write_rendered_file(Path(paper_path), prepared.file_bytes)
+                write_outcomes.append((paper_name, paper_structure, prepared.changed_types, None))
+            except Exception as e:
+                write_outcomes.append((paper_name, paper_structure, None, e))
+        
+        self.logger.debug(f"Wrote section structures for {len(write_outcomes)} papers")
+    
+    def _get_worker_settings(self) -> Dict[str, Any]:
+        """ワーカープロセスでの解析に必要な設定（pickle可能な値のみ）"""
+        return {
+            'min_section_words': self.min_section_words,
+            'max_heading_level': self.max_heading_level,
+            'enable_subsection_analysis': self.enable_subsection_analysis,
+            'downstream_section_types': self.downstream_section_types
+        }
+    
+    @classmethod
+    def _create_worker_instance(cls, settings: Dict[str, Any]) -> 'SectionParsingWorkflow':
+        """解析と書き込み内容の作成のみを行う最小構成のインスタンスを作成（書き込みはメインプロセスで実施）
+        
+        Args:
+            settings: _get_worker_settingsで取得した設定
+            
+        Returns:
+            SectionParsingWorkflow: ワーカー用インスタンス
+        """
+        workflow = cls.__new__(cls)
+        workflow.config_manager = None
+        workflow.logger = logging.getLogger('section_parsing.worker')
+        workflow.yaml_processor = None
+        workflow.config = {}
+        workflow.min_section_words = settings['min_section_words']
+        workflow.max_heading_level = settings['max_heading_level']
+        workflow.enable_subsection_analysis = settings['enable_subsection_analysis']
+        workflow.downstream_section_types = settings['downstream_section_types']
+        workflow.parallel_enabled = False
+        workflow._init_section_type_lookup()
+        return workflow
+    
     def parse_sections_single(self, paper_path: str) -> PaperStructure:
         """単一論文のセクション分割処理"""
         self.logger.debug(f"Parsing sections for: {paper_path}")
         
         try:
-            # Markdownファイル読み込み
-            content_lines = self._read_markdown_content(paper_path)
-            
-            # セクション抽出
-            sections = self._extract_sections(content_lines)
+            # Markdownファイルを1行ずつ読みながらセクション抽出（ファイル全体を保持しない）
+            # 改行を変換せずに読み込み、バイトオフセットを正確に記録する
+            body_index = {}
+            try:
+                with open(paper_path, 'r', encoding='utf-8', newline='') as f:
+                    sections = self._extract_sections(f, body_index)
+            except (OSError, UnicodeDecodeError) as e:
+                raise ProcessingError(f"Failed to read markdown file {paper_path}: {e}")
             
             # 論文構造構築
             paper_structure = self._build_paper_structure(sections)
             paper_structure.parsed_at = datetime.now().isoformat()
+            paper_structure.body_hash = body_index['body_hash']
+            paper_structure.body_bytes = body_index['body_bytes']
             
             return paper_structure
             
         except Exception as e:
             raise ProcessingError(f"Failed to parse sections for {paper_path}: {e}")
     
-    def update_yaml_with_structure(self, paper_path: str, paper_structure: PaperStructure) -> None:
-        """YAMLヘッダーにセクション構造を更新"""
+    def parse_and_prepare(self, paper_path: str) -> 'PreparedStructureUpdate':
+        """単一論文を解析し、YAMLヘッダー更新後のファイル内容を作成（書き込みは行わない）
+        
+        Args:
+            paper_path: 論文ファイルパス
+            
+        Returns:
+            PreparedStructureUpdate: 書き込み内容
+        """
+        source_signature = self._file_signature(paper_path)
+        paper_structure = self.parse_sections_single(paper_path)
+        changed_types, file_bytes = self.prepare_structure_update(paper_path, paper_structure)
+        return PreparedStructureUpdate(paper_structure, changed_types, file_bytes, source_signature)
+    
+    def update_yaml_with_structure(self, paper_path: str, paper_structure: PaperStructure) -> Optional[List[str]]:
+        """YAMLヘッダーにセクション構造を更新
+        
+        前回の解析結果にセクションハッシュがある場合は差分を取り、
+        入力セクションが変化した後続処理のみprocessing_statusをpendingに戻す。
+        
+        Args:
+            paper_path: 論文ファイルパス
+            paper_structure: 解析済み論文構造
+            
+        Returns:
+            Optional[List[str]]: 変化したセクション種別（前回のセクションハッシュがない場合None）
+        """
+        changed_types, file_bytes = self.prepare_structure_update(paper_path, paper_structure)
+        
+        try:
+            self.yaml_processor.write_rendered_file(Path(paper_path), file_bytes)
+        except Exception as e:
+            raise ProcessingError(f"Failed to update YAML header for {paper_path}: {e}")
+        
+        self.logger.debug(f"Updated YAML header with section structure: {paper_path}")
+        return changed_types
+    
+    def prepare_structure_update(self, paper_path: str,
+                                 paper_structure: PaperStructure) -> Tuple[Optional[List[str]], bytes]:
+        """セクション構造を反映したファイル内容を作成（書き込みは行わない）
+        
+        YAMLHeaderProcessorのインスタンスを使わないため、ワーカープロセスでも実行できる。
+        バイトオフセット・ハッシュは書き込まれる本文から求め、ファイル内容は
+        write_yaml_headerと同じ書式・改行コード（os.linesep）でエンコードする。
+        
+        Args:
+            paper_path: 論文ファイルパス
+            paper_structure: 解析済み論文構造（オフセット・ハッシュをこの中で更新）
+            
+        Returns:
+            Tuple[Optional[List[str]], bytes]: (変化したセクション種別, 書き込むファイル内容)
+        """
         try:
-            from pathlib import Path
-            yaml_data, content = self.yaml_processor.parse_yaml_header(Path(paper_path))
+            with open(paper_path, 'r', encoding='utf-8') as f:
+                yaml_data, content = YAMLHeaderProcessor.split_yaml_header(f.read())
+            
+            # 書き込み時に本文先頭の空行と改行コードが正規化されるため、バイトオフセットを書き込み後の本文に合わせる
+            self._rebase_byte_offsets(paper_structure, ('\n' + content).replace('\n', os.linesep))
+            
+            # 前回の解析結果との差分
+            changed_types = None
+            previous_structure = yaml_data.get('paper_structure')
+            if isinstance(previous_structure, dict) and previous_structure.get('body_hash'):
+                previous_structure = PaperStructure.from_yaml_dict(previous_structure)
+                # セクションハッシュ導入前の解析結果とは差分を取らない（後続処理の状態を維持）
+                if all(section.content_hash for section in previous_structure.iter_sections()):
+                    changed_types = self.diff_section_types(previous_structure, paper_structure)
             
             # paper_structure セクション更新
             yaml_data['paper_structure'] = paper_structure.to_yaml_dict()
@@ -129,50 +435,170 @@ class SectionParsingWorkflow:
             if 'processing_status' not in yaml_data:
                 yaml_data['processing_status'] = {}
             yaml_data['processing_status']['section_parsing'] = 'completed'
+            if changed_types:
+                for step in self._steps_affected_by(changed_types):
+                    if yaml_data['processing_status'].get(step, 'pending') != 'pending':
+                        yaml_data['processing_status'][step] = 'pending'
             
             # last_updated 更新
             yaml_data['last_updated'] = datetime.now().isoformat()
             
-            # ファイル保存
-            self.yaml_processor.write_yaml_header(Path(paper_path), yaml_data, content)
-            
-            self.logger.debug(f"Updated YAML header with section structure: {paper_path}")
+            full_content = YAMLHeaderProcessor.render_yaml_file(yaml_data, content)
+            return changed_types, full_content.replace('\n', os.linesep).encode('utf-8')
             
         except Exception as e:
             raise ProcessingError(f"Failed to update YAML header for {paper_path}: {e}")
     
-    def _get_paper_list(self, clippings_dir: str) -> List[str]:
-        """処理対象論文リストを取得"""
-        papers = []
+    @staticmethod
+    def _file_signature(paper_path: str) -> Tuple[int, int]:
+        """解析後の変更検出用のファイル署名（更新時刻・サイズ）"""
+        stat = os.stat(paper_path)
+        return stat.st_mtime_ns, stat.st_size
+    
+    def diff_section_types(self, previous: PaperStructure, current: PaperStructure) -> List[str]:
+        """セクションハッシュを比較し、内容が変化したセクション種別を取得
         
-        for item in os.listdir(clippings_dir):
-            item_path = os.path.join(clippings_dir, item)
-            if os.path.isdir(item_path):
-                # サブディレクトリ内の.mdファイルを検索
-                for file in os.listdir(item_path):
-                    if file.endswith('.md'):
-                        papers.append(item)
-                        break  # 最初の.mdファイルが見つかったらOK
+        セクション（子セクションを含む）のハッシュ列を種別ごとに比較するため、
+        見出しの変更・本文の編集・セクションの追加/削除のいずれも検出される。
         
-        return papers
+        Args:
+            previous: 前回の論文構造
+            current: 今回の論文構造
+            
+        Returns:
+            List[str]: 変化したセクション種別（今回の出現順、削除された種別は末尾）
+        """
+        previous_hashes = self._section_hashes_by_type(previous)
+        current_hashes = self._section_hashes_by_type(current)
+        
+        changed = [section_type for section_type in current_hashes
+                   if previous_hashes.get(section_type) != current_hashes[section_type]]
+        changed.extend(section_type for section_type in previous_hashes if section_type not in current_hashes)
+        return changed
+    
+    def _section_hashes_by_type(self, paper_structure: PaperStructure) -> Dict[str, List[Tuple]]:
+        """セクション種別ごとのセクションハッシュ列（子セクションは親の種別に含める）"""
+        hashes: Dict[str, List[Tuple]] = {}
+        for section in paper_structure.sections:
+            hashes.setdefault(section.section_type, []).append(
+                (section.content_hash, tuple(subsection.content_hash for subsection in section.subsections))
+            )
+        return hashes
     
-    def _read_markdown_content(self, paper_path: str) -> List[str]:
-        """Markdownファイル読み込み"""
+    def _steps_affected_by(self, changed_types: List[str]) -> List[str]:
+        """変化したセクション種別を入力とする後続処理"""
+        changed = set(changed_types)
+        return [step for step, section_types in self.downstream_section_types.items()
+                if changed.intersection(section_types)]
+    
+    def _load_current_structure(self, paper_path: str) -> Optional[PaperStructure]:
+        """本文が前回解析時から変更されていない場合、記録済みの論文構造を取得
+        
+        Args:
+            paper_path: 論文ファイルパス
+            
+        Returns:
+            Optional[PaperStructure]: 記録済みの論文構造（再解析が必要な場合None）
+        """
+        from .section_reader import SectionReader
+        
         try:
-            with open(paper_path, 'r', encoding='utf-8') as f:
-                return f.readlines()
+            reader = SectionReader(paper_path)
+            if (reader.yaml_header.get('processing_status', {}).get('section_parsing') != 'completed'
+                    or not reader.verify_body_hash()):
+                return None
+            paper_structure = PaperStructure.from_yaml_dict(reader.paper_structure)
         except Exception as e:
-            raise ProcessingError(f"Failed to read markdown file {paper_path}: {e}")
+            self.logger.debug(f"Stored section structure not reusable for {paper_path}: {e}")
+            return None
+        
+        # セクションハッシュ導入前の解析結果は差分を取れないため再解析する
+        if any(section.content_hash is None for section in paper_structure.iter_sections()):
+            return None
+        
+        return paper_structure
     
-    def _extract_sections(self, content_lines: List[str]) -> List[Section]:
-        """見出し構造からセクションを抽出"""
+    def _rebase_byte_offsets(self, paper_structure: PaperStructure, written_body: str) -> None:
+        """書き込み後の本文からバイトオフセット・セクションハッシュ・本文ハッシュを再計算
+        
+        write_yaml_headerは本文先頭の空行を1行に正規化し、改行コードもCRLFからLFへ
+        変換し得るため、解析時のオフセットをずらすのではなく書き込まれる本文のバイト列で
+        セクション範囲を求め直す（見出し構成は変わらないため行番号は解析時の値を維持）。
+        
+        Args:
+            paper_structure: 解析済み論文構造
+            written_body: 書き込まれる本文（YAMLヘッダー終了行の直後から、改行コード変換後）
+        """
+        if paper_structure.body_bytes is None:
+            return
+        
+        # 本文中の'---'行をYAMLヘッダーと誤認しないよう、空のヘッダーを付けて抽出する
+        body_index = {}
+        written_lines = io.StringIO(written_body, newline='')
+        written_sections = list(self._build_paper_structure(
+            self._extract_sections(self._with_empty_header(written_lines), body_index)
+        ).iter_sections())
+        sections = list(paper_structure.iter_sections())
+        
+        if [section.title for section in sections] != [section.title for section in written_sections]:
+            # 想定外の構成差異: オフセットを出力せず行番号ベースの読み込みにフォールバックさせる
+            self.logger.warning("Section layout changed while writing; dropping byte offsets")
+            paper_structure.body_hash = None
+            paper_structure.body_bytes = None
+            return
+        
+        for section, written_section in zip(sections, written_sections):
+            section.byte_start = written_section.byte_start
+            section.byte_end = written_section.byte_end
+            section.content_hash = written_section.content_hash
+        
+        paper_structure.body_hash = body_index['body_hash']
+        paper_structure.body_bytes = body_index['body_bytes']
+    
+    @staticmethod
+    def _with_empty_header(lines: Iterable[str]) -> Iterable[str]:
+        """本文の行の前に空のYAMLヘッダーを付ける"""
+        yield '---\n'
+        yield '---\n'
+        yield from lines
+    
+    def _get_paper_list(self, clippings_dir: str) -> List[str]:
+        """処理対象論文リストを取得"""
+        # .mdファイルを含む論文ディレクトリ（シャード配置も含む）
+        paper_dirs, _ = self.clippings_layout.scan(clippings_dir)
+        return [paper_dir.name for paper_dir, _ in paper_dirs]
+    
+    def _extract_sections(self, content_lines: Iterable[str],
+                          body_index: Optional[Dict[str, Any]] = None) -> List[Section]:
+        """見出し構造からセクションを抽出
+        
+        行を1回だけ走査し、見出し判定・レベル・タイトルを1回の正規表現マッチで取得、
+        文字数は走査しながら累積する。ファイルオブジェクトを渡せば全行を保持せずに処理できる。
+        
+        Args:
+            content_lines: ファイル全体の行（リストまたはファイルオブジェクト）
+            body_index: 指定時は本文のハッシュ（body_hash）とサイズ（body_bytes）を格納
+            
+        Returns:
+            List[Section]: 抽出されたセクション（byte_start/byte_endは本文先頭からのバイト位置）
+        """
         sections = []
         current_section = None
+        current_word_count = 0
         in_yaml_header = False
         yaml_header_count = 0
         yaml_header_end_line = 0  # YAMLヘッダー終了行を記録
+        heading_match = self.HEADING_PATTERN.match
+        line_num = 0
+        offset = 0                # ファイル先頭からのバイト位置
+        body_start = 0            # 本文開始位置（YAMLヘッダー終了行の直後）
+        body_digest = hashlib.sha256()
+        section_digest = None     # 現在のセクション（見出し行から次の見出し直前まで）のハッシュ
         
         for line_num, line in enumerate(content_lines, 1):
+            encoded_line = line.encode('utf-8')
+            line_offset = offset
+            offset += len(encoded_line)
             line_stripped = line.strip()
             
             # YAMLヘッダーのスキップ処理
@@ -184,48 +610,64 @@ class SectionParsingWorkflow:
                 elif yaml_header_count == 2:
                     in_yaml_header = False
                     yaml_header_end_line = line_num  # YAMLヘッダー終了行を記録
+                    body_start = offset
+                    body_digest = hashlib.sha256()
                     continue
             
             if in_yaml_header:
                 continue
             
-            # YAMLヘッダー終了後のMarkdown部分の相対行数を計算
-            markdown_line_num = line_num - yaml_header_end_line
+            body_digest.update(encoded_line)
             
             # 見出し行の処理
-            if self._is_heading(line_stripped):
+            match = heading_match(line_stripped)
+            if match:
+                # YAMLヘッダー終了後のMarkdown部分の相対行数を計算
+                markdown_line_num = line_num - yaml_header_end_line
+                
                 # 前のセクションを完了
                 if current_section:
                     current_section.end_line = markdown_line_num - 1
-                    current_section.word_count = self._count_words_from_markdown_lines(
-                        content_lines, yaml_header_end_line, current_section.start_line, current_section.end_line
-                    )
+                    current_section.word_count = current_word_count
+                    current_section.byte_end = line_offset - body_start
+                    current_section.content_hash = section_digest.hexdigest()[:self.SECTION_HASH_LENGTH]
                     
                     # 階層構造の処理
                     self._add_section_with_hierarchy(sections, current_section)
                 
                 # 新しいセクション開始
+                title = match.group(2).strip()
                 current_section = Section(
-                    title=self._extract_title(line_stripped),
-                    level=self._get_heading_level(line_stripped),
-                    section_type=self._identify_section_type(line_stripped),
+                    title=title,
+                    level=len(match.group(1)),
+                    section_type=self._section_type_for_title(title),
                     start_line=markdown_line_num,
                     end_line=0,  # 後で設定
                     word_count=0,  # 後で計算
-                    content_lines=[]
+                    byte_start=line_offset - body_start
                 )
+                current_word_count = 0
+                section_digest = hashlib.sha256()
                 
                 self.logger.debug(f"Found section: {current_section.title} at markdown line {markdown_line_num} (file line {line_num})")
+            
+            # 見出し行を含むセクション範囲の文字数を累積
+            if current_section:
+                current_word_count += len(line.split())
+                section_digest.update(encoded_line)
         
         # 最後のセクションを完了
         if current_section:
-            markdown_total_lines = len(content_lines) - yaml_header_end_line
-            current_section.end_line = markdown_total_lines
-            current_section.word_count = self._count_words_from_markdown_lines(
-                content_lines, yaml_header_end_line, current_section.start_line, current_section.end_line
-            )
+            current_section.end_line = line_num - yaml_header_end_line
+            current_section.word_count = current_word_count
+            current_section.byte_end = offset - body_start
+            current_section.content_hash = section_digest.hexdigest()[:self.SECTION_HASH_LENGTH]
             self._add_section_with_hierarchy(sections, current_section)
         
+        if body_index is not None:
+            body_index['body_hash'] = body_digest.hexdigest()
+            body_index['body_bytes'] = offset - body_start
+        
         return sections
     
     def _add_section_with_hierarchy(self, sections: List[Section], new_section: Section) -> None:
@@ -245,7 +687,7 @@ class SectionParsingWorkflow:
             
             # 親セクションのレベルより1つ深い場合のみ子セクションとして追加
             if new_section.level == parent_section.level + 1:
-                parent_section.subsections.append(new_section)
+                parent_section.add_subsection(new_section)
                 return
         
         # 条件に合わない場合はトップレベルに追加
@@ -253,22 +695,38 @@ class SectionParsingWorkflow:
     
     def _is_heading(self, line: str) -> bool:
         """見出し行の判定"""
-        return bool(re.match(r'^#{2,4}\s+.+', line))
+        return self.HEADING_PATTERN.match(line) is not None
     
     def _get_heading_level(self, line: str) -> int:
         """見出しレベルの取得"""
-        match = re.match(r'^(#{2,4})\s+', line)
+        match = self.HEADING_PATTERN.match(line)
         return len(match.group(1)) if match else 0
     
     def _extract_title(self, line: str) -> str:
         """見出しからタイトルを抽出"""
-        match = re.match(r'^#{2,4}\s+(.+)', line)
-        return match.group(1).strip() if match else ""
+        match = self.HEADING_PATTERN.match(line)
+        return match.group(2).strip() if match else ""
     
     def _identify_section_type(self, line: str) -> str:
         """セクション種別の識別"""
-        title = self._extract_title(line).lower()
+        return self._section_type_for_title(self._extract_title(line))
+    
+    def _section_type_for_title(self, title: str) -> str:
+        """見出しタイトルからセクション種別を取得（事前計算ルックアップ＋キャッシュ）"""
+        title = title.lower()
         
+        section_type = self._section_type_lookup.get(title)
+        if section_type is None:
+            section_type = self._section_type_cache.get(title)
+        if section_type is None:
+            section_type = self._scan_section_type(title)
+            if len(self._section_type_cache) < self.SECTION_TYPE_CACHE_SIZE:
+                self._section_type_cache[title] = section_type
+        
+        return section_type
+    
+    def _scan_section_type(self, title: str) -> str:
+        """小文字化済みタイトルに含まれる識別パターンを定義順に検索"""
         for section_type, patterns in self.SECTION_TYPE_PATTERNS.items():
             for pattern in patterns:
                 if pattern in title:
@@ -297,4 +755,41 @@ class SectionParsingWorkflow:
         for section in sections:
             paper_structure.add_section(section)
         
-        return paper_structure 
\ No newline at end of file
+        return paper_structure 
+
+
+class PreparedStructureUpdate(NamedTuple):
+    """ワーカープロセスで作成した論文1件分の書き込み内容"""
+    paper_structure: PaperStructure
+    changed_types: Optional[List[str]]
+    file_bytes: bytes
+    source_signature: Tuple[int, int]
+
+
+# 並列解析用ワーカープロセスの状態
+_worker_workflow: Optional[SectionParsingWorkflow] = None
+
+
+def _init_section_worker(settings: Dict[str, Any]) -> None:
+    """セクション解析ワーカープロセスを初期化
+    
+    Args:
+        settings: SectionParsingWorkflow._get_worker_settingsで取得した設定
+    """
+    global _worker_workflow
+    _worker_workflow = SectionParsingWorkflow._create_worker_instance(settings)
+
+
+def _parse_paper_in_worker(paper_path: str) -> Tuple[Optional[PreparedStructureUpdate], Optional[str]]:
+    """ワーカープロセスで1論文を解析し、書き込み内容を作成
+    
+    Args:
+        paper_path: 論文ファイルパス
+        
+    Returns:
+        Tuple: (PreparedStructureUpdate, エラーメッセージ)（いずれか一方はNone）
+    """
+    try:
+        return _worker_workflow.parse_and_prepare(paper_path), None
+    except Exception as e:
+        return None, str(e)
@@ -0,0 +1,185 @@
+"""
+section_reader.py - セクション単位読み込み
+
+paper_structureに記録されたバイトオフセットを使い、論文全体を読み込まずに
+特定セクションだけをseekで取得する
+"""
+
+import os
+import hashlib
+import yaml
+from typing import Dict, Any, List, Optional
+
+from .section_parsing_workflow import SectionParsingWorkflow
+
+
+class SectionReader:
+    """paper_structureのバイトオフセットによるセクション読み込みクラス
+
+    YAMLヘッダーのみを読み込んで本文の開始位置を求め、セクションはseekで直接読む。
+    本文サイズがpaper_structureの記録と一致しない場合や、読み込んだ範囲の先頭が
+    記録された見出しでない場合は古いインデックスとみなしNoneを返すため、
+    呼び出し側は行番号ベースの従来処理にフォールバックする。
+    """
+
+    def __init__(self, paper_path: str):
+        """初期化（YAMLヘッダー部分のみ読み込み）
+
+        Args:
+            paper_path: 論文ファイルパス
+        """
+        self.paper_path = paper_path
+        self.yaml_header: Dict[str, Any] = {}
+        self.body_start = 0      # 本文開始位置（ファイル先頭からのバイト数）
+        self.body_bytes = 0      # 本文サイズ（バイト）
+        self.has_header = False
+        self._load_header()
+
+    def _load_header(self) -> None:
+        """YAMLヘッダーを読み込み、本文開始位置を記録"""
+        header_lines = []
+        marker_count = 0
+
+        with open(self.paper_path, 'rb') as f:
+            first_line = f.readline()
+            if first_line.strip() == b'---':
+                marker_count = 1
+                for raw_line in f:
+                    if raw_line.strip() == b'---':
+                        marker_count = 2
+                        break
+                    header_lines.append(raw_line)
+
+            file_size = os.fstat(f.fileno()).st_size
+            if marker_count == 2:
+                self.body_start = f.tell()
+            else:
+                # ヘッダーなし（またはヘッダーが閉じていない）ファイル
+                self.body_start = 0
+
+        self.body_bytes = file_size - self.body_start
+
+        if marker_count == 2:
+            self.has_header = True
+            try:
+                header = yaml.safe_load(b''.join(header_lines).decode('utf-8'))
+            except (yaml.YAMLError, UnicodeDecodeError):
+                header = None
+            self.yaml_header = header if isinstance(header, dict) else {}
+
+    @property
+    def paper_structure(self) -> Dict[str, Any]:
+        """YAMLヘッダーのpaper_structure"""
+        paper_structure = self.yaml_header.get('paper_structure')
+        return paper_structure if isinstance(paper_structure, dict) else {}
+
+    @property
+    def sections(self) -> List[Dict[str, Any]]:
+        """paper_structureのトップレベルセクション"""
+        return self.paper_structure.get('sections') or []
+
+    def is_current(self) -> bool:
+        """バイトオフセットが現在の本文に対して有効かどうか（サイズ比較のみ）
+
+        Returns:
+            bool: インデックスが記録されており本文サイズが一致する場合True
+        """
+        return (self.has_header
+                and bool(self.paper_structure.get('body_hash'))
+                and self.paper_structure.get('body_bytes') == self.body_bytes)
+
+    def verify_body_hash(self) -> bool:
+        """本文全体のハッシュを計算してpaper_structureの記録と照合
+
+        Returns:
+            bool: 本文が解析時から変更されていない場合True
+        """
+        if not self.is_current():
+            return False
+
+        digest = hashlib.sha256()
+        with open(self.paper_path, 'rb') as f:
+            f.seek(self.body_start)
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(chunk)
+
+        return digest.hexdigest() == self.paper_structure.get('body_hash')
+
+    def count_leading_blank_lines(self) -> int:
+        """本文先頭の空行数（YAMLHeaderProcessor.parse_yaml_headerが本文から除去する行数）
+
+        行番号ベースの読み込みでparse_yaml_headerの本文を使う場合、start_line/end_line
+        （YAMLヘッダー終端行の次を1行目とする）との行のずれを補正するために使用する。
+
+        Returns:
+            int: 本文先頭の空行数
+        """
+        count = 0
+        with open(self.paper_path, 'rb') as f:
+            f.seek(self.body_start)
+            for raw_line in f:
+                if raw_line.rstrip(b'\r\n'):
+                    break
+                count += 1
+        return count
+
+    def read_section(self, section: Dict[str, Any], include_heading: bool = True,
+                     include_subsections: bool = False) -> Optional[str]:
+        """セクション本文をseekで直接読み込み
+
+        Args:
+            section: paper_structureのセクション辞書
+            include_heading: 見出し行を含める場合True
+            include_subsections: 子セクションの範囲まで含める場合True
+
+        Returns:
+            Optional[str]: セクション内容（インデックスが無効な場合None）
+        """
+        if not self.is_current():
+            return None
+
+        byte_start = section.get('byte_start')
+        byte_end = section.get('byte_end')
+        if not isinstance(byte_start, int) or not isinstance(byte_end, int):
+            return None
+
+        if include_subsections:
+            for subsection in section.get('subsections') or []:
+                if isinstance(subsection.get('byte_end'), int):
+                    byte_end = max(byte_end, subsection['byte_end'])
+
+        if not 0 <= byte_start <= byte_end <= self.body_bytes:
+            return None
+
+        try:
+            with open(self.paper_path, 'rb') as f:
+                f.seek(self.body_start + byte_start)
+                text = f.read(byte_end - byte_start).decode('utf-8')
+        except (OSError, UnicodeDecodeError):
+            return None
+
+        heading, _, remainder = text.partition('\n')
+
+        # 同サイズの編集で位置がずれていないか見出しで確認
+        match = SectionParsingWorkflow.HEADING_PATTERN.match(heading.strip())
+        if not match or match.group(2).strip() != section.get('title'):
+            return None
+
+        return text if include_heading else remainder
+
+    def read_section_by_type(self, section_type: str, include_heading: bool = True,
+                             include_subsections: bool = False) -> Optional[str]:
+        """指定タイプの最初のセクションを読み込み
+
+        Args:
+            section_type: セクション種別（abstract、introduction等）
+            include_heading: 見出し行を含める場合True
+            include_subsections: 子セクションの範囲まで含める場合True
+
+        Returns:
+            Optional[str]: セクション内容（該当なし・インデックス無効の場合None）
+        """
+        for section in self.sections:
+            if section.get('section_type') == section_type:
+                return self.read_section(section, include_heading, include_subsections)
+        return None
@@ -4,14 +4,19 @@ section_structure.py - セクション構造定義
 論文のセクション情報を構造化するデータクラス群
 """
 
-from dataclasses import dataclass, field
-from typing import List, Optional
+from dataclasses import dataclass, field, InitVar
+from typing import List, Optional, Dict, Set, Sequence
 from datetime import datetime
+import sys
 
 
-@dataclass
+@dataclass(slots=True)
 class Section:
-    """論文のセクション情報を表すデータクラス"""
+    """論文のセクション情報を表すデータクラス
+    
+    大量の論文構造を保持できるよう__slots__でインスタンス辞書を持たず、
+    セクション本文の行コピーも保持しない（本文はbyte_start/byte_endで参照）。
+    """
     
     title: str                          # セクションタイトル
     level: int                         # 見出しレベル (2=##, 3=###, 4=####)
@@ -19,40 +24,129 @@ class Section:
     start_line: int                    # 開始行番号
     end_line: int                      # 終了行番号
     word_count: int                    # 文字数
-    content_lines: List[str] = field(default_factory=list)  # セクション内容の行リスト
-    subsections: List['Section'] = field(default_factory=list)  # 子セクション
+    content_lines: InitVar[Optional[List[str]]] = None  # 互換用引数（保持しない）
+    subsections: Sequence['Section'] = ()  # 子セクション（追加時にリスト化）
+    byte_start: int = 0                # 本文先頭からの開始バイト位置（見出し行を含む）
+    byte_end: int = 0                  # 本文先頭からの終了バイト位置（排他的）
+    content_hash: Optional[str] = None  # 見出し行から次の見出し直前までのハッシュ（差分検出用）
+    
+    def __post_init__(self, content_lines: Optional[List[str]]) -> None:
+        # セクション種別は少数の値のみのため文字列を共有する
+        self.section_type = sys.intern(self.section_type)
+    
+    def add_subsection(self, subsection: 'Section') -> None:
+        """子セクションを追加（子セクションのないセクションは空リストを持たない）"""
+        if not isinstance(self.subsections, list):
+            self.subsections = list(self.subsections)
+        self.subsections.append(subsection)
 
 
-@dataclass
+@dataclass(slots=True)
 class PaperStructure:
-    """論文構造全体を表すデータクラス"""
+    """論文構造全体を表すデータクラス
+    
+    セクションタイプは出現順のリストに加えて集合でも管理し、
+    タイプ→最初のセクションの対応表によりget_section_by_typeをO(1)で行う。
+    """
     
     sections: List[Section] = field(default_factory=list)  # トップレベルセクション
     total_sections: int = 0            # 総セクション数
-    section_types_found: List[str] = field(default_factory=list)  # 発見されたセクションタイプ
+    section_types_found: List[str] = field(default_factory=list)  # 発見されたセクションタイプ（出現順）
     parsed_at: Optional[str] = None    # 解析日時
+    body_hash: Optional[str] = None    # 解析時の本文SHA-256（バイトオフセットの有効性確認用）
+    body_bytes: Optional[int] = None   # 解析時の本文サイズ（バイト）
+    _section_types: Set[str] = field(default_factory=set, init=False, repr=False, compare=False)
+    _sections_by_type: Dict[str, Section] = field(default_factory=dict, init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        # コンストラクタでセクションが渡された場合も索引を構築
+        self._section_types.update(self.section_types_found)
+        for section in self.sections:
+            self._index_section(section)
     
+    def _index_section(self, section: Section) -> None:
+        """セクションタイプの集合・対応表に登録"""
+        section_type = section.section_type
+        if section_type not in self._section_types:
+            self._section_types.add(section_type)
+            self.section_types_found.append(section_type)
+        self._sections_by_type.setdefault(section_type, section)
     
     def add_section(self, section: Section) -> None:
         """セクションを追加"""
         self.sections.append(section)
         self.total_sections += 1
-        
-        if section.section_type not in self.section_types_found:
-            self.section_types_found.append(section.section_type)
+        self._index_section(section)
+    
+    def iter_sections(self):
+        """トップレベルセクションと子セクションを出現順に列挙"""
+        for section in self.sections:
+            yield section
+            for subsection in section.subsections:
+                yield subsection
     
     
     def get_section_by_type(self, section_type: str) -> Optional[Section]:
         """指定されたタイプのセクションを取得"""
-        for section in self.sections:
-            if section.section_type == section_type:
-                return section
-        return None
+        return self._sections_by_type.get(section_type)
+    
+    
+    def has_section_type(self, section_type: str) -> bool:
+        """指定されたタイプのセクションが存在するか"""
+        return section_type in self._section_types
+    
+    
+    @classmethod
+    def from_yaml_dict(cls, yaml_dict: dict) -> 'PaperStructure':
+        """YAMLヘッダーのpaper_structureから復元（to_yaml_dictの逆変換）
+        
+        Args:
+            yaml_dict: paper_structure辞書
+            
+        Returns:
+            PaperStructure: 復元した論文構造（子セクションのsection_typeは親から継承）
+        """
+        def build_section(data: dict, section_type: str) -> Section:
+            return Section(
+                title=data.get('title', ''),
+                level=data.get('level', 2),
+                section_type=data.get('section_type', section_type),
+                start_line=data.get('start_line', 0),
+                end_line=data.get('end_line', 0),
+                word_count=data.get('word_count', 0),
+                byte_start=data.get('byte_start', 0),
+                byte_end=data.get('byte_end', 0),
+                content_hash=data.get('content_hash')
+            )
+        
+        paper_structure = cls(
+            parsed_at=yaml_dict.get('parsed_at'),
+            body_hash=yaml_dict.get('body_hash'),
+            body_bytes=yaml_dict.get('body_bytes')
+        )
+        for section_data in yaml_dict.get('sections') or []:
+            section = build_section(section_data, 'unknown')
+            for subsection_data in section_data.get('subsections') or []:
+                section.add_subsection(build_section(subsection_data, section.section_type))
+            paper_structure.add_section(section)
+        
+        return paper_structure
     
     
     def to_yaml_dict(self) -> dict:
-        """YAML出力用の辞書に変換"""
-        return {
+        """YAML出力用の辞書に変換
+        
+        本文ハッシュがある（ファイルから解析した）場合はバイトオフセットとセクションハッシュも出力する
+        """
+        indexed = self.body_hash is not None
+        
+        def byte_range(section: Section) -> dict:
+            if not indexed:
+                return {}
+            return {'byte_start': section.byte_start, 'byte_end': section.byte_end,
+                    'content_hash': section.content_hash}
+        
+        yaml_dict = {
             'parsed_at': self.parsed_at or datetime.now().isoformat(),
             'total_sections': self.total_sections,
             'sections': [
@@ -63,16 +157,24 @@ class PaperStructure:
                     'start_line': section.start_line,
                     'end_line': section.end_line,
                     'word_count': section.word_count,
+                    **byte_range(section),
                     'subsections': [
                         {
                             'title': subsection.title,
                             'level': subsection.level,
                             'start_line': subsection.start_line,
                             'end_line': subsection.end_line,
-                            'word_count': subsection.word_count
+                            'word_count': subsection.word_count,
+                            **byte_range(subsection)
                         } for subsection in section.subsections
                     ] if section.subsections else []
                 } for section in self.sections
             ],
             'section_types_found': self.section_types_found
-        } 
\ No newline at end of file
+        }
+        
+        if indexed:
+            yaml_dict['body_hash'] = self.body_hash
+            yaml_dict['body_bytes'] = self.body_bytes
+        
+        return yaml_dict 
\ No newline at end of file
@@ -0,0 +1,670 @@
+#!/usr/bin/env python3
+"""
+BackupStore - 内容アドレス型バックアップストア
+
+ファイル内容のSHA-256をキーとしてオブジェクトを1回だけ保存し（重複排除、任意でgzip圧縮）、
+どのファイル（citation_key）のいつのバックアップかは追記専用のインデックスに記録する。
+保持期間・合計サイズ・ファイルごとの世代数の上限はバックアップ作成ごとに適用する。
+YAMLヘッダーのみを変更する処理の前には、ヘッダーと本文ハッシュだけを記録する
+差分バックアップ（ヘッダー差分）を作成できる。
+
+ストア構成:
+    {store_dir}/objects/{sha256先頭2文字}/{sha256}（圧縮時はgzip形式）
+    {store_dir}/backup_index.jsonl
+    {store_dir}/.lock（インデックス更新・オブジェクト削除時の排他ロック）
+"""
+
+import os
+import gzip
+import json
+import time
+import uuid
+import hashlib
+import tempfile
+import threading
+from pathlib import Path
+from contextlib import contextmanager
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Tuple, Union
+
+from .exceptions import FileSystemError
+
+try:
+    import fcntl
+except ImportError:  # Windows: プロセス内のロックのみ
+    fcntl = None
+
+
+class BackupStore:
+    """
+    内容アドレス型バックアップストアクラス
+
+    インデックスの各行は以下のいずれか。
+    - バックアップ記録: id、sha256、source、citation_key、backup_type、created_at、size、stored_size、
+      body_sha256（YAMLヘッダーがある場合の本文ハッシュ）
+    - ヘッダー差分記録: 上記に加えbase_sha256・base_stored_size。sha256はヘッダー部分のオブジェクト、
+      base_sha256は同じ本文を含む完全なオブジェクト（復元時に本文が変わっていた場合に使用）
+    - 削除記録: op=remove、ids（上限適用で削除した記録のID）
+    削除記録が有効な記録数を超えた時点でインデックスを書き直す（コンパクション）。
+    どの記録からも参照されなくなったオブジェクトはその場で削除する。
+    圧縮の有無はオブジェクト先頭のgzipマジックで判定するため、圧縮設定を変更しても
+    既存のオブジェクトはそのまま読み込める。
+
+    同じディレクトリを複数のインスタンス・プロセスが使う前提で、記録の追加・上限適用・
+    コンパクションはロックファイルの排他ロック下で、他者が追記した記録（インデックスの末尾）を
+    読み込んでから行う。このため他のインスタンスの記録が参照するオブジェクトは削除されない。
+    プロセス内では shared() で1ディレクトリ1インスタンスを共有する。
+    """
+
+    INDEX_FILE_NAME = 'backup_index.jsonl'
+    OBJECTS_DIR_NAME = 'objects'
+    GZIP_MAGIC = b'\x1f\x8b'
+    HEADER_DELIMITER = b'---'
+    LOCK_FILE_NAME = '.lock'
+    MIN_COMPACTION_RECORDS = 256
+
+    _instances: Dict[str, 'BackupStore'] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, store_dir: Union[str, Path], compression: bool = True,
+                 retention_days: Optional[float] = 30, max_size_mb: Optional[float] = 1000,
+                 max_versions_per_file: Optional[int] = 20):
+        """
+        BackupStoreの初期化
+
+        Args:
+            store_dir: ストアディレクトリ
+            compression: Trueの場合はオブジェクトをgzip圧縮して保存
+            retention_days: バックアップの保持日数（None・0以下は無制限）
+            max_size_mb: オブジェクト合計サイズの上限MB（None・0以下は無制限）
+            max_versions_per_file: ファイルごとに保持する世代数（None・0以下は無制限）
+        """
+        self.store_dir = Path(store_dir)
+        self.objects_dir = self.store_dir / self.OBJECTS_DIR_NAME
+        self.index_path = self.store_dir / self.INDEX_FILE_NAME
+        self._configure(compression, retention_days, max_size_mb, max_versions_per_file)
+
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+        self._loaded = False
+        self._index_offset = 0
+        self._index_inode = None
+        self._thread_lock = threading.RLock()
+        self._lock_depth = 0
+
+    @classmethod
+    def shared(cls, store_dir: Union[str, Path], **settings) -> 'BackupStore':
+        """
+        ディレクトリごとに共有するインスタンスを取得（初回のみ作成、設定は最新の指定で更新）
+
+        Args:
+            store_dir: ストアディレクトリ
+            **settings: compression、retention_days、max_size_mb、max_versions_per_file
+
+        Returns:
+            BackupStore: 同じディレクトリに対して常に同じインスタンス
+        """
+        key = os.path.abspath(store_dir)
+        with cls._instances_lock:
+            store = cls._instances.get(key)
+            if store is None:
+                store = cls._instances[key] = cls(key, **settings)
+            else:
+                store._configure(**settings)
+            return store
+
+    def _configure(self, compression: bool = True, retention_days: Optional[float] = 30,
+                   max_size_mb: Optional[float] = 1000, max_versions_per_file: Optional[int] = 20):
+        """圧縮・上限の設定（共有インスタンスは取得のたびに更新）"""
+        self.compression = compression
+        self.retention_seconds = retention_days * 86400 if retention_days and retention_days > 0 else None
+        self.max_size_bytes = int(max_size_mb * 1024 * 1024) if max_size_mb and max_size_mb > 0 else None
+        self.max_versions_per_file = max_versions_per_file \
+            if max_versions_per_file and max_versions_per_file > 0 else None
+
+    def put(self, source_path: Union[str, Path], citation_key: Optional[str] = None,
+            backup_type: Optional[str] = None, link: bool = False,
+            header_only: bool = False) -> Dict[str, Any]:
+        """
+        ファイルのバックアップを記録（同じ内容のオブジェクトが既にあれば書き込まない）
+
+        Args:
+            source_path: バックアップ対象ファイル
+            citation_key: 論文の識別キー（省略時はファイル名の拡張子なし部分）
+            backup_type: バックアップ種別（status_update、yaml_error等）
+            link: Trueかつ非圧縮の場合、新規オブジェクトをハードリンクで作成
+                （対象ファイルをその場で編集しない場合のみ使用）
+            header_only: Trueの場合、同じファイルの既存バックアップに同じ本文があれば
+                YAMLヘッダー部分のみを保存（ない場合は完全なバックアップ）
+
+        Returns:
+            Dict[str, Any]: バックアップ記録（objectにオブジェクトパス）
+
+        Raises:
+            FileSystemError: 読み込み・書き込みエラーの場合
+        """
+        source = Path(os.path.abspath(source_path))
+        try:
+            data = source.read_bytes()
+        except OSError as e:
+            raise FileSystemError(
+                f"Failed to read backup source {source}: {e}",
+                error_code="BACKUP_SOURCE_READ_FAILED",
+                context={"source": str(source)},
+                cause=e
+            )
+
+        with self._locked():
+            return self._put_data(source, data, citation_key, backup_type, link, header_only)
+
+    def _put_data(self, source: Path, data: bytes, citation_key: Optional[str], backup_type: Optional[str],
+                  link: bool, header_only: bool) -> Dict[str, Any]:
+        """読み込んだ内容を記録（ロック取得済み）"""
+        sha256 = hashlib.sha256(data).hexdigest()
+        parts = self.split_front_matter(data)
+        body_sha256 = hashlib.sha256(parts[1]).hexdigest() if parts else None
+        entry = {
+            'id': uuid.uuid4().hex,
+            'source': str(source),
+            'citation_key': citation_key or source.stem,
+            'backup_type': backup_type,
+            'created_at': time.time(),
+            'size': len(data),
+            'body_sha256': body_sha256
+        }
+
+        stored_size = self._object_sizes.get(sha256)
+        base_sha256 = self._find_body_base(str(source), body_sha256) \
+            if header_only and stored_size is None and body_sha256 else None
+        if base_sha256 is not None:
+            # ヘッダー差分: 本文は既存オブジェクトを参照し、ヘッダーのみ保存
+            header = parts[0]
+            header_sha256 = hashlib.sha256(header).hexdigest()
+            header_size = self._object_sizes.get(header_sha256)
+            if header_size is None:
+                header_size = self._write_object(header_sha256, header, None)
+            entry.update(sha256=header_sha256, stored_size=header_size,
+                         base_sha256=base_sha256, base_stored_size=self._object_sizes[base_sha256])
+        else:
+            if stored_size is None:
+                stored_size = self._write_object(sha256, data, source if link else None)
+            entry.update(sha256=sha256, stored_size=stored_size)
+
+        self._append_records([entry])
+        self._add_entry(entry)
+        self._enforce_limits(entry['source'])
+
+        return dict(entry, object=str(self.object_path(entry['sha256'])))
+
+    def object_path(self, sha256: str) -> Path:
+        """
+        オブジェクトファイルパス
+
+        Args:
+            sha256: 内容のSHA-256
+
+        Returns:
+            Path: オブジェクトファイルパス
+        """
+        return self.objects_dir / sha256[:2] / sha256
+
+    def is_object_path(self, path: Union[str, Path]) -> bool:
+        """
+        ストア内のオブジェクトファイルかどうか
+
+        Args:
+            path: 判定するパス
+
+        Returns:
+            bool: objectsディレクトリ配下の場合True
+        """
+        try:
+            Path(os.path.abspath(path)).relative_to(os.path.abspath(self.objects_dir))
+            return True
+        except ValueError:
+            return False
+
+    def entry_for_object(self, path: Union[str, Path]) -> Optional[Dict[str, Any]]:
+        """
+        オブジェクトを保存した最新のバックアップ記録
+
+        Args:
+            path: オブジェクトファイルパス
+
+        Returns:
+            Optional[Dict[str, Any]]: バックアップ記録（ない場合None）
+        """
+        self._refresh()
+        sha256 = Path(path).name
+        for entry in reversed(self._entries.values()):
+            if entry['sha256'] == sha256:
+                return dict(entry, object=str(self.object_path(sha256)))
+        return None
+
+    def read_object(self, path: Union[str, Path]) -> bytes:
+        """
+        オブジェクトの内容を取得（圧縮オブジェクトは展開）
+
+        Args:
+            path: オブジェクトファイルパス
+
+        Returns:
+            bytes: バックアップ時のファイル内容
+        """
+        data = Path(path).read_bytes()
+        return gzip.decompress(data) if data[:2] == self.GZIP_MAGIC else data
+
+    def entries(self, citation_key: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        有効なバックアップ記録の一覧（新しい順）
+
+        Args:
+            citation_key: 指定時はその論文の記録のみ
+
+        Returns:
+            List[Dict[str, Any]]: バックアップ記録（objectにオブジェクトパス）
+        """
+        self._refresh()
+        if citation_key is None:
+            selected = list(self._entries.values())
+        else:
+            selected = [self._entries[entry_id] for entry_id in self._by_key.get(citation_key, ())]
+        return [dict(entry, object=str(self.object_path(entry['sha256'])))
+                for entry in reversed(selected)]
+
+    def latest(self, citation_key: str) -> Optional[Dict[str, Any]]:
+        """
+        論文の最新バックアップ記録
+
+        Args:
+            citation_key: 論文の識別キー
+
+        Returns:
+            Optional[Dict[str, Any]]: 最新の記録（ない場合None）
+        """
+        self._refresh()
+        entry_ids = self._by_key.get(citation_key)
+        if not entry_ids:
+            return None
+        entry = self._entries[entry_ids[-1]]
+        return dict(entry, object=str(self.object_path(entry['sha256'])))
+
+    def restore(self, entry: Dict[str, Any], target_path: Optional[Union[str, Path]] = None) -> str:
+        """
+        バックアップ記録からファイルを復元（一時ファイル経由で置き換え）
+
+        ヘッダー差分記録は、復元先の現在の本文がバックアップ時と同じ（ハッシュが一致）ならその本文に、
+        異なる場合は参照先の完全なオブジェクトの本文にヘッダーを結合して復元する。
+
+        Args:
+            entry: バックアップ記録
+            target_path: 復元先（省略時はバックアップ元のパス）
+
+        Returns:
+            str: 復元したファイルパス
+
+        Raises:
+            FileSystemError: オブジェクトがない・本文を復元できない・書き込みエラーの場合
+        """
+        target = Path(target_path or entry['source'])
+        object_path = self.object_path(entry['sha256'])
+        try:
+            data = self.read_object(object_path)
+            if entry.get('base_sha256'):
+                data += self._delta_body(entry, target)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            self._atomic_write(target, data)
+        except OSError as e:
+            raise FileSystemError(
+                f"Failed to restore backup {object_path} to {target}: {e}",
+                error_code="RESTORE_FAILED",
+                context={"backup_path": str(object_path), "target_path": str(target)},
+                cause=e
+            )
+        return str(target)
+
+    def remove_object(self, path: Union[str, Path]) -> int:
+        """
+        オブジェクトと、それを参照するバックアップ記録を削除
+
+        Args:
+            path: オブジェクトファイルパス
+
+        Returns:
+            int: 削除した記録数
+        """
+        sha256 = Path(path).name
+        with self._locked():
+            removed = [entry_id for entry_id, entry in self._entries.items()
+                       if sha256 in (entry['sha256'], entry.get('base_sha256'))]
+            self._remove_entries(removed)
+        return len(removed)
+
+    def enforce_limits(self, source: Optional[str] = None) -> int:
+        """
+        世代数・保持期間・合計サイズの上限を適用
+
+        Args:
+            source: 指定時は世代数の上限をこのファイルのみに適用（バックアップ作成直後の確認用）
+
+        Returns:
+            int: 削除したバックアップ記録数
+        """
+        with self._locked():
+            return self._enforce_limits(source)
+
+    def _enforce_limits(self, source: Optional[str]) -> int:
+        """上限を適用（ロック取得済み）"""
+        removed = []
+        released: Dict[str, int] = {}
+        stored_bytes = self._stored_bytes
+
+        def mark_removed(entry_id: str) -> int:
+            freed = 0
+            for sha256, _ in self._entry_objects(self._entries[entry_id]):
+                released[sha256] = released.get(sha256, 0) + 1
+                if released[sha256] == self._refcount[sha256]:
+                    freed += self._object_sizes[sha256]
+            removed.append(entry_id)
+            return freed
+
+        # 1. ファイルごとの世代数（古い世代から削除）
+        if self.max_versions_per_file:
+            sources = [source] if source is not None else list(self._by_source)
+            for source_path in sources:
+                for entry_id in self._by_source.get(source_path, [])[:-self.max_versions_per_file]:
+                    stored_bytes -= mark_removed(entry_id)
+
+        # 2. 保持期間・合計サイズ（古い記録から削除）
+        cutoff = time.time() - self.retention_seconds if self.retention_seconds else None
+        removed_set = set(removed)
+        for entry_id, entry in self._entries.items():
+            if entry_id in removed_set:
+                continue
+            expired = cutoff is not None and entry['created_at'] < cutoff
+            oversized = self.max_size_bytes is not None and stored_bytes > self.max_size_bytes
+            if not (expired or oversized):
+                break
+            stored_bytes -= mark_removed(entry_id)
+
+        self._remove_entries(removed)
+        return len(removed)
+
+    @classmethod
+    def split_front_matter(cls, data: bytes) -> Optional[Tuple[bytes, bytes]]:
+        """
+        YAMLヘッダー（前後の区切り行を含む）と本文に分割
+
+        Args:
+            data: ファイル内容
+
+        Returns:
+            Optional[Tuple[bytes, bytes]]: (ヘッダー, 本文)。YAMLヘッダーがない場合None
+        """
+        first_end = data.find(b'\n')
+        if first_end < 0 or data[:first_end].rstrip() != cls.HEADER_DELIMITER:
+            return None
+        position = first_end + 1
+        while position < len(data):
+            line_end = data.find(b'\n', position)
+            end = len(data) if line_end < 0 else line_end + 1
+            if data[position:end].rstrip() == cls.HEADER_DELIMITER:
+                return data[:end], data[end:]
+            position = end
+        return None
+
+    def stats(self) -> Dict[str, int]:
+        """
+        ストアの統計
+
+        Returns:
+            Dict[str, int]: entries（記録数）、objects（オブジェクト数）、
+                logical_bytes（元ファイル合計）、stored_bytes（オブジェクト合計）
+        """
+        self._refresh()
+        return {
+            'entries': len(self._entries),
+            'objects': len(self._object_sizes),
+            'logical_bytes': sum(entry['size'] for entry in self._entries.values()),
+            'stored_bytes': self._stored_bytes
+        }
+
+    @contextmanager
+    def _locked(self):
+        """排他ロックを取得し、他のインスタンス・プロセスの記録を読み込んでから処理（再入可）"""
+        with self._thread_lock:
+            if self._lock_depth:
+                self._lock_depth += 1
+                try:
+                    yield
+                finally:
+                    self._lock_depth -= 1
+                return
+
+            lock_file = None
+            self.objects_dir.mkdir(parents=True, exist_ok=True)
+            if fcntl is not None:
+                lock_file = open(self.store_dir / self.LOCK_FILE_NAME, 'a')
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            self._lock_depth = 1
+            try:
+                self._refresh()
+                yield
+            finally:
+                self._lock_depth = 0
+                if lock_file is not None:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+                    lock_file.close()
+
+    def _refresh(self):
+        """
+        インデックスの未読部分を読み込み
+
+        初回・コンパクション等でファイルが置き換えられた場合（inode・サイズ・先頭の記録で判定）は
+        全体を読み直し、それ以外は前回読んだ位置以降（他者が追記した記録）のみ反映する。
+        途中で切れた最終行は次回に読む。
+        """
+        with self._thread_lock:
+            try:
+                stat = os.stat(self.index_path)
+            except FileNotFoundError:
+                stat = None
+            if not self._loaded or stat is None or stat.st_ino != self._index_inode \
+                    or stat.st_size < self._index_offset:
+                self._reset_index()
+                self._index_inode = stat.st_ino if stat is not None else None
+                self._loaded = True
+            if stat is None or stat.st_size == self._index_offset:
+                return
+
+            with open(self.index_path, 'rb') as f:
+                if self._index_offset and f.read(len(self._index_head)) != self._index_head:
+                    self._reset_index()
+                f.seek(self._index_offset)
+                data = f.read()
+            complete = data.rfind(b'\n') + 1
+            if not self._index_offset:
+                self._index_head = data[:min(complete, 64)]
+            for line in data[:complete].splitlines():
+                try:
+                    self._apply_record(json.loads(line))
+                except ValueError:
+                    continue
+            self._index_offset += complete
+
+    def _reset_index(self):
+        """メモリ上のインデックスを初期化"""
+        self._entries: 'OrderedDict[str, Dict[str, Any]]' = OrderedDict()
+        self._by_source: Dict[str, List[str]] = {}
+        self._by_key: Dict[str, List[str]] = {}
+        self._refcount: Dict[str, int] = {}
+        self._object_sizes: Dict[str, int] = {}
+        self._stored_bytes = 0
+        self._dead_records = 0
+        self._index_offset = 0
+        self._index_head = b''
+
+    def _apply_record(self, record: Dict[str, Any]):
+        """インデックスの1行をメモリ上のインデックスに反映"""
+        if record.get('op') == 'remove':
+            self._dead_records += 1
+            for entry_id in record.get('ids', ()):
+                if entry_id in self._entries:
+                    self._dead_records += 1
+                    self._forget_entry(entry_id)
+        elif 'sha256' in record and record.get('id') not in self._entries \
+                and all(self.object_path(sha256).exists() for sha256, _ in self._entry_objects(record)):
+            self._add_entry(record)
+        else:
+            self._dead_records += 1
+
+    def _add_entry(self, entry: Dict[str, Any]):
+        """記録をメモリ上のインデックスに追加"""
+        entry_id = entry['id']
+        self._entries[entry_id] = entry
+        self._by_source.setdefault(entry['source'], []).append(entry_id)
+        self._by_key.setdefault(entry['citation_key'], []).append(entry_id)
+        for sha256, stored_size in self._entry_objects(entry):
+            if sha256 not in self._object_sizes:
+                self._object_sizes[sha256] = stored_size
+                self._stored_bytes += stored_size
+            self._refcount[sha256] = self._refcount.get(sha256, 0) + 1
+
+    def _forget_entry(self, entry_id: str) -> List[str]:
+        """記録をメモリ上のインデックスから除外（参照がなくなったオブジェクトのSHA-256を返す）"""
+        entry = self._entries.pop(entry_id)
+        for index, key in ((self._by_source, entry['source']), (self._by_key, entry['citation_key'])):
+            index[key].remove(entry_id)
+            if not index[key]:
+                del index[key]
+        released = []
+        for sha256, _ in self._entry_objects(entry):
+            self._refcount[sha256] -= 1
+            if self._refcount[sha256] == 0:
+                del self._refcount[sha256]
+                self._stored_bytes -= self._object_sizes.pop(sha256)
+                released.append(sha256)
+        return released
+
+    @staticmethod
+    def _entry_objects(entry: Dict[str, Any]) -> List[Tuple[str, int]]:
+        """記録が参照するオブジェクト（SHA-256, 保存サイズ）の一覧"""
+        objects = [(entry['sha256'], entry['stored_size'])]
+        if entry.get('base_sha256'):
+            objects.append((entry['base_sha256'], entry['base_stored_size']))
+        return objects
+
+    def _find_body_base(self, source: str, body_sha256: str) -> Optional[str]:
+        """同じファイルの既存記録から、同じ本文を含む完全なオブジェクトを検索"""
+        for entry_id in reversed(self._by_source.get(source, ())):
+            entry = self._entries[entry_id]
+            if entry.get('body_sha256') == body_sha256:
+                return entry.get('base_sha256') or entry['sha256']
+        return None
+
+    def _delta_body(self, entry: Dict[str, Any], target: Path) -> bytes:
+        """ヘッダー差分記録の本文（復元先の現在の本文、異なる場合は参照先オブジェクトの本文）"""
+        sources = [lambda: target.read_bytes() if target.exists() else b'',
+                   lambda: self.read_object(self.object_path(entry['base_sha256']))]
+        for read in sources:
+            parts = self.split_front_matter(read())
+            if parts and hashlib.sha256(parts[1]).hexdigest() == entry['body_sha256']:
+                return parts[1]
+        raise FileSystemError(
+            f"Backup base object does not match the recorded body: {entry['base_sha256']}",
+            error_code="BACKUP_BASE_MISMATCH",
+            context={"backup_id": entry.get('id'), "base_sha256": entry['base_sha256']}
+        )
+
+    def _remove_entries(self, entry_ids: List[str]):
+        """記録を削除し、参照がなくなったオブジェクトを削除"""
+        entry_ids = [entry_id for entry_id in dict.fromkeys(entry_ids) if entry_id in self._entries]
+        if not entry_ids:
+            return
+
+        self._append_records([{'op': 'remove', 'ids': entry_ids}])
+        self._dead_records += len(entry_ids) + 1
+        for entry_id in entry_ids:
+            for sha256 in self._forget_entry(entry_id):
+                try:
+                    self.object_path(sha256).unlink()
+                except FileNotFoundError:
+                    pass
+
+        if self._dead_records > max(self.MIN_COMPACTION_RECORDS, len(self._entries)):
+            self._compact()
+
+    def _compact(self):
+        """有効な記録のみでインデックスを書き直し"""
+        lines = ''.join(json.dumps(entry, ensure_ascii=False, separators=(',', ':')) + '\n'
+                        for entry in self._entries.values())
+        data = lines.encode('utf-8')
+        self._atomic_write(self.index_path, data)
+        self._dead_records = 0
+        self._index_offset = len(data)
+        self._index_inode = os.stat(self.index_path).st_ino
+        self._index_head = data[:64]
+
+    def _append_records(self, records: List[Dict[str, Any]]):
+        """インデックスに記録を追記"""
+        try:
+            with open(self.index_path, 'ab') as f:
+                # 中断した書き込みの不完全な行が末尾に残っている場合は行を区切る
+                if f.tell() > self._index_offset:
+                    f.write(b'\n')
+                lines = [(json.dumps(record, ensure_ascii=False, separators=(',', ':')) + '\n').encode('utf-8')
+                         for record in records]
+                first_line = lines[0]
+                f.write(b''.join(lines))
+                if not self._index_offset:
+                    self._index_head = first_line[:64]
+                self._index_offset = f.tell()
+            if self._index_inode is None:
+                self._index_inode = os.stat(self.index_path).st_ino
+        except OSError as e:
+            raise FileSystemError(
+                f"Failed to write backup index {self.index_path}: {e}",
+                error_code="BACKUP_INDEX_WRITE_FAILED",
+                context={"index": str(self.index_path)},
+                cause=e
+            )
+
+    def _write_object(self, sha256: str, data: bytes, link_source: Optional[Path]) -> int:
+        """オブジェクトを書き込み（一時ファイル経由）、保存サイズを返す"""
+        object_path = self.object_path(sha256)
+        try:
+            object_path.parent.mkdir(parents=True, exist_ok=True)
+            if object_path.exists():
+                return object_path.stat().st_size
+            # 非圧縮設定でも内容がgzipマジックで始まる場合は読み込み時に区別できるよう圧縮する
+            compress = self.compression or data[:2] == self.GZIP_MAGIC
+            if link_source is not None and not compress:
+                try:
+                    os.link(link_source, object_path)
+                    return len(data)
+                except OSError:
+                    pass
+            stored = gzip.compress(data, compresslevel=6, mtime=0) if compress else data
+            self._atomic_write(object_path, stored)
+            return len(stored)
+        except OSError as e:
+            raise FileSystemError(
+                f"Failed to write backup object {object_path}: {e}",
+                error_code="BACKUP_CREATION_FAILED",
+                context={"object": str(object_path)},
+                cause=e
+            )
+
+    @staticmethod
+    def _atomic_write(path: Path, data: bytes):
+        """一時ファイルに書き込んでから置き換え"""
+        fd, temp_path = tempfile.mkstemp(dir=str(path.parent), prefix=f".{path.name}.", suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(temp_path, path)
+        except BaseException:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+            raise
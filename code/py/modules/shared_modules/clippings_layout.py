@@ -0,0 +1,365 @@
+#!/usr/bin/env python3
+"""
+ClippingsLayout - Clippingsディレクトリのレイアウト解決
+
+organize済み論文ディレクトリ（citation_key/citation_key.md）の配置を一元的に解決する。
+大規模なVaultでは直下に数万ディレクトリが並ぶと一覧取得が遅くなるため、
+出版年またはcitation_key先頭文字によるシャード（中間ディレクトリ）配置を選択できる。
+
+- flat: Clippings/{citation_key}/{citation_key}.md（従来）
+- key_prefix: Clippings/{citation_keyの先頭N文字}/{citation_key}/{citation_key}.md
+- year: Clippings/{出版年 | undated}/{citation_key}/{citation_key}.md
+"""
+
+import os
+import re
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple, Union
+
+from .config_manager import ConfigManager
+from .integrated_logger import IntegratedLogger
+from .exceptions import FileSystemError
+from .file_utils import PathUtils
+
+
+class ClippingsLayout:
+    """
+    Clippingsレイアウト解決クラス
+
+    論文パスの構築・検索・列挙はすべてこのクラスを経由する（StatusManager、SyncChecker、
+    FileOrganizer、SectionParsingWorkflow、IntegratedWorkflow）。
+    検索・列挙は設定と異なるレイアウトの論文も見つけるため、移行途中のVaultでも動作する。
+    シャードディレクトリはMarkdownファイルを直接含まないことで論文ディレクトリと区別する。
+    """
+
+    SCHEMES = ('flat', 'key_prefix', 'year')
+    UNDATED_SHARD = 'undated'
+    MAX_PREFIX_LENGTH = 8
+
+    YEAR_SHARD_PATTERN = re.compile(r'^(?:\d{4}|undated)$')
+    PREFIX_SHARD_PATTERN = re.compile(r'^[a-z0-9_]{1,8}$')
+    YEAR_PATTERN = re.compile(r'(?<!\d)(\d{4})(?!\d)')
+
+    def __init__(self, config_manager: ConfigManager, logger: IntegratedLogger):
+        """
+        ClippingsLayoutの初期化
+
+        Args:
+            config_manager: 設定管理インスタンス
+            logger: ログ管理インスタンス
+        """
+        self.config_manager = config_manager
+        self.logger = logger.get_logger('ClippingsLayout')
+
+        layout_config = config_manager.get_config()
+        layout_config = layout_config.get('clippings_layout', {}) if isinstance(layout_config, dict) else {}
+        if not isinstance(layout_config, dict):
+            layout_config = {}
+
+        scheme = layout_config.get('scheme', 'flat')
+        if scheme not in self.SCHEMES:
+            self.logger.warning(f"Unknown clippings layout scheme '{scheme}', using 'flat'")
+            scheme = 'flat'
+        self.scheme = scheme
+
+        prefix_length = layout_config.get('prefix_length', 2)
+        self.prefix_length = prefix_length if isinstance(prefix_length, int) \
+            and 0 < prefix_length <= self.MAX_PREFIX_LENGTH else 2
+
+    @property
+    def is_sharded(self) -> bool:
+        """シャード配置が有効かどうか"""
+        return self.scheme != 'flat'
+
+    def shard_for(self, citation_key: str, year: Any = None, scheme: Optional[str] = None) -> Optional[str]:
+        """
+        論文のシャードディレクトリ名を決定
+
+        Args:
+            citation_key: 論文の識別キー
+            year: 出版年（year方式のみ使用。不明な場合None）
+            scheme: レイアウト方式（省略時は設定値）
+
+        Returns:
+            Optional[str]: シャードディレクトリ名（flat方式の場合None）
+        """
+        scheme = scheme or self.scheme
+        if scheme == 'key_prefix':
+            safe_key = PathUtils.generate_safe_directory_name(citation_key).lower()
+            return re.sub(r'[^a-z0-9]', '_', safe_key[:self.prefix_length]) or '_'
+        if scheme == 'year':
+            match = self.YEAR_PATTERN.search(str(year)) if year is not None else None
+            return match.group(1) if match else self.UNDATED_SHARD
+        return None
+
+    def paper_dir(self, clippings_dir: Union[str, Path], citation_key: str, year: Any = None) -> Path:
+        """
+        設定レイアウトでの論文ディレクトリパス
+
+        Args:
+            clippings_dir: Clippingsディレクトリパス
+            citation_key: 論文の識別キー
+            year: 出版年（year方式のみ使用）
+
+        Returns:
+            Path: 論文ディレクトリパス（作成はしない）
+        """
+        return self.markdown_path(clippings_dir, citation_key, year).parent
+
+    def markdown_path(self, clippings_dir: Union[str, Path], citation_key: str, year: Any = None) -> Path:
+        """
+        設定レイアウトでの論文Markdownファイルパス
+
+        Args:
+            clippings_dir: Clippingsディレクトリパス
+            citation_key: 論文の識別キー
+            year: 出版年（year方式のみ使用）
+
+        Returns:
+            Path: {paper_dir}/{citation_key}.md
+        """
+        return PathUtils.build_clippings_file_path(clippings_dir, citation_key,
+                                                   shard=self.shard_for(citation_key, year))
+
+    def find_paper_dir(self, clippings_dir: Union[str, Path], citation_key: str) -> Optional[Path]:
+        """
+        既存の論文ディレクトリを検索（設定レイアウト → flat → 他のシャード方式の順）
+
+        Args:
+            clippings_dir: Clippingsディレクトリパス
+            citation_key: 論文の識別キー
+
+        Returns:
+            Optional[Path]: 論文ディレクトリ（見つからない場合None）
+        """
+        root = Path(clippings_dir)
+        safe_key = PathUtils.generate_safe_directory_name(citation_key)
+        schemes = [self.scheme] + [scheme for scheme in self.SCHEMES if scheme != self.scheme]
+
+        for scheme in schemes:
+            if scheme == 'year':
+                candidates = [root / shard / safe_key for shard in self._year_shards(root)]
+            else:
+                shard = self.shard_for(citation_key, scheme=scheme)
+                candidates = [root / shard / safe_key if shard else root / safe_key]
+            for candidate in candidates:
+                if candidate.is_dir():
+                    return candidate
+        return None
+
+    def find_markdown_file(self, clippings_dir: Union[str, Path], citation_key: str) -> Optional[Path]:
+        """
+        既存の論文Markdownファイル（{paper_dir}/{citation_key}.md）を検索
+
+        Args:
+            clippings_dir: Clippingsディレクトリパス
+            citation_key: 論文の識別キー
+
+        Returns:
+            Optional[Path]: Markdownファイルパス（見つからない場合None）
+        """
+        paper_dir = self.find_paper_dir(clippings_dir, citation_key)
+        if paper_dir is None:
+            return None
+        md_file = paper_dir / f"{citation_key}.md"
+        return md_file if md_file.is_file() else None
+
+    def scan(self, clippings_dir: Union[str, Path]) -> Tuple[List[Tuple[Path, List[Path]]], List[Path]]:
+        """
+        Clippingsディレクトリの論文を列挙（各ディレクトリを1回だけ一覧取得）
+
+        Args:
+            clippings_dir: Clippingsディレクトリパス
+
+        Returns:
+            Tuple: ([(論文ディレクトリ, 含まれるMarkdownファイル（名前順）)], 直下の未整理Markdownファイル)
+        """
+        root = Path(clippings_dir)
+        paper_dirs = []
+        loose_files = []
+
+        for entry in self._sorted_entries(root):
+            if entry.is_dir():
+                subdirs, md_files = self._list_directory(entry.path)
+                if md_files:
+                    paper_dirs.append((Path(entry.path), md_files))
+                elif self._is_shard_name(entry.name):
+                    for subdir in subdirs:
+                        _, sub_md_files = self._list_directory(subdir)
+                        if sub_md_files:
+                            paper_dirs.append((Path(subdir), sub_md_files))
+            elif entry.name.endswith('.md') and entry.is_file():
+                loose_files.append(Path(entry.path))
+
+        return paper_dirs, loose_files
+
+    def citation_key_from_path(self, md_file: Union[str, Path],
+                               clippings_dir: Optional[Union[str, Path]] = None) -> Optional[str]:
+        """
+        Markdownファイルパスからcitation_key（論文ディレクトリ名）を取得
+
+        Args:
+            md_file: Markdownファイルパス
+            clippings_dir: Clippingsディレクトリパス（省略時はディレクトリ名"Clippings"で判定）
+
+        Returns:
+            Optional[str]: citation_key（Clippings直下の未整理ファイルの場合None）
+        """
+        parent = Path(md_file).parent
+        if clippings_dir is not None:
+            if os.path.abspath(parent) == os.path.abspath(clippings_dir):
+                return None
+        elif parent.name == "Clippings":
+            return None
+        return parent.name
+
+    def plan_migration(self, clippings_dir: Union[str, Path],
+                       years: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        既存の論文ディレクトリを設定レイアウトへ移すための計画を作成（ファイルは変更しない）
+
+        Args:
+            clippings_dir: Clippingsディレクトリパス
+            years: citation_key -> 出版年（year方式で使用。ない論文はundated）
+
+        Returns:
+            Dict[str, Any]: moves（citation_key・source・target）、in_place、conflicts
+        """
+        root = Path(clippings_dir)
+        years = years or {}
+        plan = {'moves': [], 'in_place': 0, 'conflicts': []}
+        planned_targets = set()
+
+        paper_dirs, _ = self.scan(root)
+        for paper_dir, _ in paper_dirs:
+            citation_key = paper_dir.name
+            shard = self.shard_for(citation_key, years.get(citation_key))
+            target = root / shard / paper_dir.name if shard else root / paper_dir.name
+
+            if target == paper_dir:
+                plan['in_place'] += 1
+            elif target.exists() or str(target) in planned_targets:
+                plan['conflicts'].append({'citation_key': citation_key, 'source': str(paper_dir),
+                                          'target': str(target)})
+            else:
+                planned_targets.add(str(target))
+                plan['moves'].append({'citation_key': citation_key, 'source': str(paper_dir),
+                                      'target': str(target)})
+
+        return plan
+
+    def migrate(self, clippings_dir: Union[str, Path], years: Optional[Dict[str, Any]] = None,
+                dry_run: bool = False) -> Dict[str, Any]:
+        """
+        既存Vaultを設定レイアウトへ移行
+
+        論文ディレクトリ単位のrenameで移動するため、中断しても各論文は移動前・移動後の
+        どちらかに完全な状態で存在する。再実行すると残りの論文のみ移動する。
+
+        Args:
+            clippings_dir: Clippingsディレクトリパス
+            years: citation_key -> 出版年（year方式で使用）
+            dry_run: Trueの場合は計画のみ作成
+
+        Returns:
+            Dict[str, Any]: scheme、moved、in_place、conflicts、failed、moves、removed_shards
+
+        Raises:
+            FileSystemError: Clippingsディレクトリが存在しない場合
+        """
+        root = Path(clippings_dir)
+        if not root.is_dir():
+            raise FileSystemError(
+                f"Clippings directory not found: {root}",
+                error_code="CLIPPINGS_DIR_NOT_FOUND",
+                context={"clippings_dir": str(root)}
+            )
+
+        plan = self.plan_migration(root, years)
+        result = {
+            'scheme': self.scheme,
+            'dry_run': dry_run,
+            'moved': 0,
+            'in_place': plan['in_place'],
+            'conflicts': plan['conflicts'],
+            'failed': [],
+            'moves': plan['moves'],
+            'removed_shards': []
+        }
+        for conflict in plan['conflicts']:
+            self.logger.warning(f"Layout migration target already exists, skipping: {conflict['target']}")
+
+        if dry_run:
+            return result
+
+        moved_sources = []
+        for move in plan['moves']:
+            try:
+                Path(move['target']).parent.mkdir(parents=True, exist_ok=True)
+                os.rename(move['source'], move['target'])
+                moved_sources.append(move['source'])
+                result['moved'] += 1
+            except OSError as e:
+                self.logger.error(f"Failed to move {move['source']} to {move['target']}: {e}")
+                result['failed'].append(dict(move, error=str(e)))
+
+        result['removed_shards'] = self._remove_empty_shards(root, moved_sources)
+        self.logger.info(f"Migrated clippings layout to '{self.scheme}': {result['moved']} moved, "
+                         f"{result['in_place']} already in place, {len(result['conflicts'])} conflicts, "
+                         f"{len(result['failed'])} failed")
+        return result
+
+    def _is_shard_name(self, name: str) -> bool:
+        """シャードディレクトリ名として有効かどうか（いずれかの方式）"""
+        return bool(self.YEAR_SHARD_PATTERN.match(name) or self.PREFIX_SHARD_PATTERN.match(name))
+
+    def _year_shards(self, root: Path) -> List[str]:
+        """Clippings直下の出版年シャード名一覧"""
+        return [entry.name for entry in self._sorted_entries(root)
+                if self.YEAR_SHARD_PATTERN.match(entry.name) and entry.is_dir()]
+
+    def _remove_empty_shards(self, root: Path, moved_sources: List[str]) -> List[str]:
+        """
+        移行で空になったシャードディレクトリを削除
+
+        移動した論文の移動元シャードのみを対象とし、ユーザーが作成した空ディレクトリ等は残す。
+
+        Args:
+            root: Clippingsディレクトリ
+            moved_sources: 移動した論文ディレクトリの移動元パス
+
+        Returns:
+            List[str]: 削除したシャード名
+        """
+        shard_names = {
+            Path(source).parent.name for source in moved_sources
+            if Path(source).parent.parent == root and self._is_shard_name(Path(source).parent.name)
+        }
+        removed = []
+        for shard_name in sorted(shard_names):
+            try:
+                os.rmdir(root / shard_name)
+                removed.append(shard_name)
+            except OSError:
+                pass
+        return removed
+
+    @staticmethod
+    def _sorted_entries(directory: Union[str, Path]) -> List[os.DirEntry]:
+        """ディレクトリエントリー一覧（名前順、存在しない場合は空）"""
+        try:
+            with os.scandir(directory) as entries:
+                return sorted(entries, key=lambda e: e.name)
+        except FileNotFoundError:
+            return []
+
+    def _list_directory(self, directory: Union[str, Path]) -> Tuple[List[str], List[Path]]:
+        """サブディレクトリとMarkdownファイルの一覧（名前順）"""
+        subdirs = []
+        md_files = []
+        for entry in self._sorted_entries(directory):
+            if entry.is_dir():
+                subdirs.append(entry.path)
+            elif entry.name.endswith('.md') and entry.is_file():
+                md_files.append(Path(entry.path))
+        return subdirs, md_files
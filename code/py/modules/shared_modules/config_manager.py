@@ -101,15 +101,38 @@ class ConfigManager:
             'ai_generation': {
                 'default_model': 'claude-3-5-haiku-20241022',
                 'api_key_env': 'ANTHROPIC_API_KEY',
+                'max_tokens': 4096,
+                'streaming': {
+                    'enabled': True
+                },
+                'connection_pool': {
+                    'max_keepalive_connections': 10,
+                    'keepalive_expiry': 120
+                },
+                'model_routing': {
+                    'enabled': True,
+                    'escalation_model': 'claude-3-5-sonnet-20241022',
+                    'quality_threshold': 0.6
+                },
+                'job_queue': {
+                    'enabled': True,
+                    'max_attempts': 3,
+                    'fsync': True,
+                    'compact_threshold': 5000
+                },
                 'tagger': {
                     'enabled': True,
                     'batch_size': 8,
-                    'tag_count_range': [10, 20]
+                    'tag_count_range': [10, 20],
+                    'max_tokens': 1024,
+                    'token_budget': 8000,
+                    'section_priority': ['introduction', 'results', 'discussion']
                 },
                 'translate_abstract': {
                     'enabled': True,
                     'batch_size': 5,
-                    'preserve_formatting': True
+                    'preserve_formatting': True,
+                    'max_tokens': 2048
                 },
                 'ochiai_format': {
                     'enabled': True,
@@ -138,7 +161,11 @@ class ConfigManager:
                 'backup_location': 'backups/',
                 'retention_days': 30,
                 'max_backup_size_mb': 1000,
-                'compress_old_backups': True
+                'compress_old_backups': True,
+                'store': 'content_addressed',
+                'compression': 'gzip',
+                'max_versions_per_file': 20,
+                'header_delta': True
             }
         }
     
@@ -11,6 +11,7 @@ ObsClippingsManager File System Utilities
 """
 
 import os
+import re
 import shutil
 import tempfile
 import fnmatch
@@ -21,6 +22,7 @@ import hashlib
 
 from .exceptions import FileSystemError, ObsClippingsManagerError
 from .config_manager import ConfigManager
+from .backup_store import BackupStore
 
 
 class FileUtils:
@@ -134,7 +136,7 @@ class FileUtils:
                 cause=e
             )
     
-    def atomic_write(self, file_path: Union[str, Path], content: str, 
+    def atomic_write(self, file_path: Union[str, Path], content: Union[str, bytes], 
                      encoding: str = 'utf-8') -> bool:
         """
         アトミックファイル書き込み
@@ -143,8 +145,8 @@ class FileUtils:
         
         Args:
             file_path (Union[str, Path]): 書き込み先ファイルパス
-            content (str): 書き込み内容
-            encoding (str): 文字エンコーディング
+            content (Union[str, bytes]): 書き込み内容（bytesの場合はそのまま書き込む）
+            encoding (str): 文字エンコーディング（strの場合のみ使用）
             
         Returns:
             bool: 書き込み成功時True
@@ -159,9 +161,10 @@ class FileUtils:
             target_path.parent.mkdir(parents=True, exist_ok=True)
             
             # 一時ファイルを同じディレクトリに作成
+            is_bytes = isinstance(content, bytes)
             with tempfile.NamedTemporaryFile(
-                mode='w',
-                encoding=encoding,
+                mode='wb' if is_bytes else 'w',
+                encoding=None if is_bytes else encoding,
                 dir=target_path.parent,
                 delete=False,
                 suffix='.tmp'
@@ -473,7 +476,8 @@ class PathUtils:
     @staticmethod
     def build_clippings_file_path(base_dir: Union[str, Path], 
                                  citation_key: str, 
-                                 title: Optional[str] = None) -> Path:
+                                 title: Optional[str] = None,
+                                 shard: Optional[str] = None) -> Path:
         """
         クリッピングファイルパスの構築
         
@@ -481,6 +485,7 @@ class PathUtils:
             base_dir (Union[str, Path]): ベースディレクトリ
             citation_key (str): citation_key
             title (Optional[str]): ファイルタイトル
+            shard (Optional[str]): シャードディレクトリ名（ClippingsLayoutが決定、flat配置ではNone）
             
         Returns:
             Path: 構築されたファイルパス
@@ -489,6 +494,8 @@ class PathUtils:
         safe_citation_key = PathUtils.generate_safe_directory_name(citation_key)
         
         # ディレクトリ作成
+        if shard:
+            base_path = base_path / shard
         target_dir = base_path / safe_citation_key
         
         # ファイル名決定
@@ -935,14 +942,23 @@ class BackupManager:
     バックアップ・リストア管理クラス
     
     ファイルのバックアップ作成、リストア、クリーンアップ機能を提供。
+    config_managerを渡した場合は内容アドレス型ストア（BackupStore）に保存し、
+    同一内容は1回だけ保存・保持期間と容量上限を適用する（backup_settings.store）。
+    YAMLヘッダーのみを変更する処理の前のバックアップは、本文が既存バックアップと同じであれば
+    ヘッダー部分のみを保存する（backup_settings.header_delta）。
+    渡さない場合は従来通りタイムスタンプ付きのファイルとしてコピーする。
     """
     
-    def __init__(self, backup_dir: Optional[Union[str, Path]] = None):
+    STORE_DIR_NAME = "store"
+    
+    def __init__(self, backup_dir: Optional[Union[str, Path]] = None,
+                 config_manager: Optional[ConfigManager] = None):
         """
         BackupManagerの初期化
         
         Args:
             backup_dir (Union[str, Path], optional): バックアップディレクトリ
+            config_manager (ConfigManager, optional): 設定管理インスタンス（backup_settingsを使用）
         """
         if backup_dir:
             self.backup_dir = Path(backup_dir)
@@ -951,16 +967,49 @@ class BackupManager:
         
         # バックアップディレクトリの作成
         self.backup_dir.mkdir(parents=True, exist_ok=True)
+        
+        # 内容アドレス型ストア（設定がある場合のみ）
+        self.store = None
+        self.header_delta = False
+        if config_manager is not None:
+            full_config = config_manager.get_config()
+            backup_settings = full_config.get('backup_settings', {}) if isinstance(full_config, dict) else {}
+            if not isinstance(backup_settings, dict):
+                backup_settings = {}
+            if backup_settings.get('store', 'content_addressed') == 'content_addressed':
+                # 同じディレクトリのストアはプロセス内で共有（StatusManager等が個別に作成するため）
+                self.store = BackupStore.shared(
+                    self.backup_dir / self.STORE_DIR_NAME,
+                    compression=backup_settings.get('compression', 'gzip') != 'none',
+                    retention_days=self._number_setting(backup_settings, 'retention_days', 30),
+                    max_size_mb=self._number_setting(backup_settings, 'max_backup_size_mb', 1000),
+                    max_versions_per_file=int(self._number_setting(backup_settings, 'max_versions_per_file', 20))
+                )
+                self.header_delta = backup_settings.get('header_delta', True) is not False
+    
+    @staticmethod
+    def _number_setting(settings: dict, key: str, default: float) -> float:
+        """数値設定の取得（null・不正値は0=無制限、未指定はデフォルト）"""
+        value = settings.get(key, default)
+        return value if isinstance(value, (int, float)) and not isinstance(value, bool) else 0
     
-    def create_backup(self, file_path: Union[str, Path]) -> str:
+    def create_backup(self, file_path: Union[str, Path], link: bool = False,
+                      backup_type: Optional[str] = None, citation_key: Optional[str] = None,
+                      header_only: bool = False) -> str:
         """
         ファイルバックアップ作成
         
         Args:
             file_path (Union[str, Path]): バックアップ対象ファイル
+            link (bool): Trueの場合はハードリンクで作成（別ファイルシステム等で失敗した場合はコピー）。
+                対象ファイルを置き換える（その場で編集しない）直前のバックアップにのみ使用する
+            backup_type (str, optional): バックアップ種別（status_update、yaml_error等。ストアに記録）
+            citation_key (str, optional): 論文の識別キー（省略時はファイル名の拡張子なし部分）
+            header_only (bool): 直後の処理がYAMLヘッダーのみを変更する場合True。
+                ストア使用時は本文が既存バックアップと同じならヘッダーのみ保存（それ以外は完全なバックアップ）
             
         Returns:
-            str: バックアップファイルパス
+            str: バックアップファイルパス（ストア使用時はオブジェクトパス）
             
         Raises:
             FileSystemError: バックアップ作成エラー
@@ -975,12 +1024,23 @@ class BackupManager:
                     context={"source": str(source_path)}
                 )
             
+            # 内容アドレス型ストア（同一内容は保存済みオブジェクトを参照）
+            if self.store is not None:
+                return self.store.put(source_path, citation_key, backup_type, link=link,
+                                      header_only=header_only and self.header_delta)['object']
+            
             # バックアップファイル名生成（タイムスタンプ付き）
             timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
             backup_name = f"{source_path.stem}_{timestamp}{source_path.suffix}"
             backup_path = self.backup_dir / backup_name
             
-            # バックアップファイルコピー
+            # バックアップファイル作成（ハードリンクならデータのコピーなし）
+            if link:
+                try:
+                    os.link(source_path, backup_path)
+                    return str(backup_path)
+                except OSError:
+                    pass
             shutil.copy2(source_path, backup_path)
             
             return str(backup_path)
@@ -1024,8 +1084,12 @@ class BackupManager:
             # 親ディレクトリの作成
             target_file.parent.mkdir(parents=True, exist_ok=True)
             
-            # リストア実行
-            shutil.copy2(backup_file, target_file)
+            # リストア実行（ストアのオブジェクトは圧縮を展開し、ヘッダー差分は本文と結合）
+            if self.store is not None and self.store.is_object_path(backup_file):
+                entry = self.store.entry_for_object(backup_file) or {'sha256': backup_file.name}
+                self.store.restore(entry, target_file)
+            else:
+                shutil.copy2(backup_file, target_file)
             
             return True
             
@@ -1055,7 +1119,10 @@ class BackupManager:
         try:
             backup_file = Path(backup_path)
             
-            if backup_file.exists():
+            # ストアのオブジェクトは参照する記録ごと削除
+            if self.store is not None and self.store.is_object_path(backup_file):
+                self.store.remove_object(backup_file)
+            elif backup_file.exists():
                 backup_file.unlink()
             
             return True
@@ -1075,7 +1142,43 @@ class BackupManager:
         Returns:
             List[Path]: バックアップファイルのリスト
         """
+        if self.store is not None:
+            return list(dict.fromkeys(Path(entry['object']) for entry in self.store.entries()))
+        
         if not self.backup_dir.exists():
             return []
         
-        return [f for f in self.backup_dir.iterdir() if f.is_file()] 
\ No newline at end of file
+        return [f for f in self.backup_dir.iterdir() if f.is_file()]
+    
+    def restore_by_citation_key(self, citation_key: str,
+                                target_path: Optional[Union[str, Path]] = None) -> str:
+        """
+        論文の最新バックアップからリストア
+        
+        Args:
+            citation_key (str): 論文の識別キー
+            target_path (Union[str, Path], optional): リストア先（ストア使用時は省略でバックアップ元のパス）
+            
+        Returns:
+            str: リストアしたファイルパス
+            
+        Raises:
+            FileSystemError: バックアップが見つからない・リストアエラーの場合
+        """
+        if self.store is not None:
+            entry = self.store.latest(citation_key)
+            if entry is not None:
+                return self.store.restore(entry, target_path)
+        elif target_path is not None:
+            # 従来形式: {citation_key}_{YYYYmmdd_HHMMSS}{拡張子}の最新ファイル
+            pattern = re.compile(rf'^{re.escape(citation_key)}_\d{{8}}_\d{{6}}(\.[^.]+)?$')
+            candidates = sorted(f for f in self.list_backups() if pattern.match(f.name))
+            if candidates:
+                self.restore_backup(candidates[-1], target_path)
+                return str(target_path)
+        
+        raise FileSystemError(
+            f"No backup found for citation_key: {citation_key}",
+            error_code="BACKUP_NOT_FOUND",
+            context={"citation_key": citation_key, "backup_dir": str(self.backup_dir)}
+        ) 
\ No newline at end of file
@@ -10,11 +10,13 @@ from .processing_status import ProcessingStatus
 from .status_manager import StatusManager
 from .timestamp_manager import TimestampManager
 from .status_checker import StatusChecker
+from .metadata_scanner import MetadataScanner
 
 __all__ = [
     'YAMLHeaderProcessor',
     'ProcessingStatus',
     'StatusManager',
     'TimestampManager',
-    'StatusChecker'
+    'StatusChecker',
+    'MetadataScanner'
 ]
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+MetadataScanner
+
+Markdownファイル群のYAMLヘッダーから指定フィールドのみを並列に読み取るスキャナー。
+organize・sync・final-syncで共通利用する（doi、citation_key等の取得用）。
+"""
+
+import os
+import re
+import yaml
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Iterable, Sequence, Tuple, Union
+
+from ..shared_modules.config_manager import ConfigManager
+from ..shared_modules.integrated_logger import IntegratedLogger
+from ..shared_modules.exceptions import YAMLError, FileSystemError
+
+
+class MetadataScanner:
+    """
+    YAMLヘッダー指定フィールドの並列スキャンクラス
+
+    - ファイル読み込みはYAMLヘッダー部分のみ（本文は読まない）
+    - 指定されたトップレベルキーの行だけをYAMLとして解析（citations等の大きなブロックは解析しない）
+    - 一定数以上のファイルはスレッドプールで読み込み、ネットワークドライブ等のI/O待ちを重ねる
+    """
+
+    # トップレベルキー行（インデントなし、コメント・リスト項目以外）
+    TOP_LEVEL_KEY_PATTERN = re.compile(r'^([^\s#\-][^:]*):(?:\s|$)')
+
+    def __init__(self, config_manager: ConfigManager, logger: IntegratedLogger):
+        """
+        MetadataScannerの初期化
+
+        Args:
+            config_manager: 設定管理インスタンス
+            logger: ログ管理インスタンス
+        """
+        self.config_manager = config_manager
+        self.logger = logger.get_logger('MetadataScanner')
+
+        scanner_config = config_manager.get_config().get('metadata_scanner', {})
+        if not isinstance(scanner_config, dict):
+            scanner_config = {}
+        max_workers = scanner_config.get('max_workers')
+        min_parallel_files = scanner_config.get('min_parallel_files', 8)
+        self.max_workers = max_workers if isinstance(max_workers, int) and max_workers > 0 \
+            else min(32, (os.cpu_count() or 1) * 4)
+        self.min_parallel_files = min_parallel_files if isinstance(min_parallel_files, int) else 8
+
+    def find_markdown_files(self, directory: Union[str, Path], recursive: bool = True) -> List[Path]:
+        """
+        ディレクトリ内のMarkdownファイルを列挙
+
+        Args:
+            directory: 検索ディレクトリ
+            recursive: サブディレクトリも検索する場合True
+
+        Returns:
+            List[Path]: Markdownファイルパスのリスト（ディレクトリ毎に名前順）
+        """
+        markdown_files = []
+        pending_dirs = [Path(directory)]
+
+        while pending_dirs:
+            current_dir = pending_dirs.pop()
+            subdirs = []
+            with os.scandir(current_dir) as entries:
+                for entry in sorted(entries, key=lambda e: e.name):
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(Path(entry.path))
+                    elif entry.name.endswith('.md') and entry.is_file():
+                        markdown_files.append(Path(entry.path))
+            if recursive:
+                pending_dirs.extend(reversed(subdirs))
+
+        return markdown_files
+
+    def scan_directory(self, directory: Union[str, Path], fields: Sequence[str],
+                       recursive: bool = True) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, str]]:
+        """
+        ディレクトリ内の全MarkdownファイルからYAMLヘッダーの指定フィールドを取得
+
+        Args:
+            directory: 検索ディレクトリ
+            fields: 取得するトップレベルフィールド名
+            recursive: サブディレクトリも検索する場合True
+
+        Returns:
+            Tuple: (ファイルパス -> フィールド辞書, ファイルパス -> エラーメッセージ)
+        """
+        return self.scan_files(self.find_markdown_files(directory, recursive), fields)
+
+    def scan_files(self, files: Iterable[Union[str, Path]],
+                   fields: Sequence[str]) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, str]]:
+        """
+        複数ファイルのYAMLヘッダーから指定フィールドを取得
+
+        Args:
+            files: 対象ファイルパス
+            fields: 取得するトップレベルフィールド名
+
+        Returns:
+            Tuple: (ファイルパス -> フィールド辞書, ファイルパス -> エラーメッセージ)。
+                フィールド辞書には存在するフィールドのみ含まれ、結果は入力順に並ぶ
+        """
+        files = [Path(file_path) for file_path in files]
+        fields = tuple(fields)
+
+        def read(file_path: Path):
+            try:
+                return self.read_fields(file_path, fields), None
+            except Exception as e:
+                return None, str(e)
+
+        if len(files) >= self.min_parallel_files and self.max_workers > 1:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(files)),
+                                    thread_name_prefix='MetadataScanner') as executor:
+                outcomes = list(executor.map(read, files))
+        else:
+            outcomes = [read(file_path) for file_path in files]
+
+        metadata = {}
+        errors = {}
+        for file_path, (values, error) in zip(files, outcomes):
+            if error is None:
+                metadata[str(file_path)] = values
+            else:
+                errors[str(file_path)] = error
+
+        self.logger.debug(f"Scanned {len(files)} headers for {list(fields)} ({len(errors)} errors)")
+        return metadata, errors
+
+    def read_fields(self, file_path: Union[str, Path], fields: Sequence[str]) -> Dict[str, Any]:
+        """
+        1ファイルのYAMLヘッダーから指定フィールドを取得
+
+        Args:
+            file_path: 対象ファイルパス
+            fields: 取得するトップレベルフィールド名
+
+        Returns:
+            Dict[str, Any]: 存在するフィールドの値
+
+        Raises:
+            FileSystemError: ファイル読み込みエラーの場合
+            YAMLError: YAMLヘッダーがない・解析エラーの場合
+        """
+        file_path = Path(file_path)
+        header_lines = self._read_header_lines(file_path)
+        wanted = set(fields)
+
+        # 指定キーのブロック（キー行＋インデント行）のみを抽出
+        blocks = []
+        current_block = None
+        for line in header_lines:
+            match = self.TOP_LEVEL_KEY_PATTERN.match(line)
+            if match:
+                current_block = [line] if match.group(1).strip() in wanted else None
+                if current_block is not None:
+                    blocks.append(current_block)
+            elif current_block is not None:
+                current_block.append(line)
+
+        values = {}
+        try:
+            for block in blocks:
+                parsed = yaml.safe_load(''.join(block))
+                if not isinstance(parsed, dict):
+                    raise yaml.YAMLError("unexpected block structure")
+                values.update(parsed)
+        except yaml.YAMLError:
+            # 行単位で切り出せない書式の場合はヘッダー全体を解析
+            values = self._parse_full_header(file_path, header_lines)
+
+        return {field: values[field] for field in fields if field in values}
+
+    def _read_header_lines(self, file_path: Path) -> List[str]:
+        """YAMLヘッダー部分の行を読み込み（区切り行を除く）"""
+        header_lines = []
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                if f.readline().strip() != '---':
+                    raise YAMLError(
+                        f"No YAML front matter found: {file_path.name}",
+                        error_code="NO_YAML_HEADER"
+                    )
+                for line in f:
+                    if line.strip() == '---':
+                        return header_lines
+                    header_lines.append(line)
+        except (OSError, UnicodeDecodeError) as e:
+            raise FileSystemError(
+                f"Failed to read file {file_path}: {e}",
+                error_code="FILE_READ_ERROR",
+                context={"file": str(file_path)}
+            )
+
+        raise YAMLError(
+            f"Incomplete YAML front matter (missing closing ---): {file_path.name}",
+            error_code="INCOMPLETE_YAML_HEADER"
+        )
+
+    def _parse_full_header(self, file_path: Path, header_lines: List[str]) -> Dict[str, Any]:
+        """YAMLヘッダー全体を解析"""
+        try:
+            yaml_header = yaml.safe_load(''.join(header_lines))
+        except yaml.YAMLError as e:
+            raise YAMLError(
+                f"YAML parsing error in {file_path.name}: {e}",
+                error_code="YAML_PARSE_ERROR",
+                context={"file": str(file_path)}
+            )
+        if not isinstance(yaml_header, dict):
+            raise YAMLError(
+                "YAML header must be a dictionary",
+                error_code="INVALID_YAML_STRUCTURE"
+            )
+        return yaml_header
@@ -19,6 +19,7 @@ from ..shared_modules.config_manager import ConfigManager
 from ..shared_modules.integrated_logger import IntegratedLogger
 from ..shared_modules.exceptions import ProcessingError, YAMLError, FileSystemError
 from ..shared_modules.file_utils import BackupManager
+from ..shared_modules.clippings_layout import ClippingsLayout
 
 
 class StatusManager:
@@ -40,7 +41,8 @@ class StatusManager:
         self.config_manager = config_manager
         self.logger = logger.get_logger('StatusManager')
         self.yaml_processor = YAMLHeaderProcessor(config_manager, logger)
-        self.backup_manager = BackupManager()
+        self.backup_manager = BackupManager(config_manager=config_manager)
+        self.clippings_layout = ClippingsLayout(config_manager, logger)
         
         self.logger.info("StatusManager initialized")
     
@@ -111,7 +113,8 @@ class StatusManager:
             # 更新前バックアップ作成
             backup_before_update = self.config_manager.config.get('status_management', {}).get('backup_strategy', {}).get('backup_before_status_update', True)
             if backup_before_update:
-                self.backup_manager.create_backup(md_file, backup_type="status_update")
+                self.backup_manager.create_backup(md_file, backup_type="status_update", citation_key=citation_key,
+                                                  header_only=True)
             
             yaml_header, content = self.yaml_processor.parse_yaml_header(Path(md_file))
             
@@ -139,7 +142,7 @@ class StatusManager:
             # YAML構造エラー：バックアップ作成後修復試行
             create_backup_on_yaml_error = self.config_manager.config.get('status_management', {}).get('error_handling', {}).get('create_backup_on_yaml_error', True)
             if create_backup_on_yaml_error:
-                self.backup_manager.create_backup(md_file, backup_type="yaml_error")
+                self.backup_manager.create_backup(md_file, backup_type="yaml_error", citation_key=citation_key)
             
             auto_repair = self.config_manager.config.get('status_management', {}).get('error_handling', {}).get('auto_repair_corrupted_headers', True)
             if auto_repair:
@@ -204,15 +207,15 @@ class StatusManager:
         Returns:
             Optional[str]: ファイルパス（見つからない場合はNone）
         """
-        # 直接的なファイル名パターンで検索
-        possible_paths = [
-            os.path.join(clippings_dir, f"{citation_key}.md"),
-            os.path.join(clippings_dir, citation_key, f"{citation_key}.md")
-        ]
+        # レイアウト（flat・シャード配置）に従った論文ディレクトリで検索
+        md_file = self.clippings_layout.find_markdown_file(clippings_dir, citation_key)
+        if md_file is not None:
+            return str(md_file)
         
-        for path in possible_paths:
-            if os.path.exists(path):
-                return path
+        # Clippings直下の未整理ファイル
+        path = os.path.join(clippings_dir, f"{citation_key}.md")
+        if os.path.exists(path):
+            return path
         
         # 再帰的検索
         pattern = os.path.join(clippings_dir, "**", f"{citation_key}.md")
@@ -52,7 +52,7 @@ class WorkflowVersionManager:
         self.config_manager = config_manager
         self.logger = logger.get_logger('WorkflowVersionManager')
         self.yaml_processor = YAMLHeaderProcessor(config_manager, logger)
-        self.backup_manager = BackupManager()
+        self.backup_manager = BackupManager(config_manager=config_manager)
         
         self.current_version = self.CURRENT_VERSION
         
@@ -189,7 +189,7 @@ class WorkflowVersionManager:
             
             # バックアップ作成
             if self.config_manager.get_config().get('version_management', {}).get('backup_before_migration', True):
-                self.backup_manager.create_backup(file_path)
+                self.backup_manager.create_backup(file_path, backup_type="version_migration", header_only=True)
             
             # マイグレーション実行
             from_version = compatibility['file_version']
@@ -6,11 +6,14 @@ YAMLヘッダーの読み書き、検証、修復機能を提供するクラス
 状態管理システムの基盤となるYAMLフロントマター処理を担当。
 """
 
+import os
 import yaml
 import re
+import shutil
+import tempfile
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any, Tuple, List, Optional
+from typing import Dict, Any, Tuple, List, Optional, Callable
 
 from ..shared_modules.config_manager import ConfigManager
 from ..shared_modules.integrated_logger import IntegratedLogger
@@ -28,6 +31,12 @@ class YAMLHeaderProcessor:
     読み書き、検証、修復、一括処理機能を提供。
     """
     
+    # ヘッダー書き換え時に確保する余白（次回以降のヘッダー更新をその場で行うため）
+    HEADER_SLACK_BYTES = 64
+    
+    # その場での上書きを許可するヘッダー領域の上限（ページサイズ。ブロックサイズがこれより小さい場合はブロックサイズ）
+    IN_PLACE_MAX_BYTES = 4096
+    
     def __init__(self, config_manager: ConfigManager, logger: IntegratedLogger):
         """
         YAMLHeaderProcessorの初期化
@@ -39,7 +48,7 @@ class YAMLHeaderProcessor:
         self.config_manager = config_manager
         self.logger = logger.get_logger('YAMLHeaderProcessor')
         self.file_utils = FileUtils(config_manager)
-        self.backup_manager = BackupManager()
+        self.backup_manager = BackupManager(config_manager=config_manager)
         self.string_utils = StringUtils()
         
         # 必須フィールドの定義
@@ -114,11 +123,8 @@ class YAMLHeaderProcessor:
             FileSystemError: ファイル書き込みエラーの場合
         """
         try:
-            # YAMLヘッダーの文字列化
-            yaml_str = yaml.dump(yaml_header, default_flow_style=False, allow_unicode=True)
-            
             # ファイル内容の構築
-            full_content = f"---\n{yaml_str}---\n\n{content}"
+            full_content = self.render_yaml_file(yaml_header, content)
             
             # アトミック書き込み
             self.file_utils.atomic_write(file_path, full_content)
@@ -132,6 +138,277 @@ class YAMLHeaderProcessor:
                 context={"file": str(file_path)}
             )
     
+    def write_rendered_file(self, file_path: Path, file_bytes: bytes) -> None:
+        """
+        render_yaml_fileで作成済みのファイル内容（エンコード済み）を書き込み
+        
+        YAMLのシリアライズを別プロセスで済ませ、書き込み側ではI/Oのみを行う場合に使用。
+        
+        Args:
+            file_path: 書き込み先ファイルのパス
+            file_bytes: 改行コード変換・エンコード済みのファイル内容
+            
+        Raises:
+            YAMLError: ファイル書き込みエラーの場合
+        """
+        try:
+            self.file_utils.atomic_write(file_path, file_bytes)
+            self.logger.debug(f"Written YAML header to {file_path.name}")
+        except Exception as e:
+            raise YAMLError(
+                f"Failed to write YAML header to {file_path}: {e}",
+                error_code="YAML_WRITE_ERROR",
+                context={"file": str(file_path)}
+            )
+    
+    @staticmethod
+    def render_yaml_file(yaml_header: Dict[str, Any], content: str) -> str:
+        """
+        YAMLヘッダーとコンテンツからファイル内容を作成（write_yaml_headerと同一の書式）
+        
+        Args:
+            yaml_header: YAMLヘッダー辞書
+            content: Markdownコンテンツ
+            
+        Returns:
+            str: ファイル全体の内容（改行はLF）
+        """
+        yaml_str = yaml.dump(yaml_header, default_flow_style=False, allow_unicode=True)
+        return f"---\n{yaml_str}---\n\n{content}"
+    
+    @staticmethod
+    def split_yaml_header(content: str) -> Tuple[Dict[str, Any], str]:
+        """
+        ファイル内容からYAMLヘッダーとMarkdownコンテンツを分離（インスタンス不要）
+        
+        Args:
+            content: ファイル全体の内容
+            
+        Returns:
+            Tuple[Dict[str, Any], str]: YAMLヘッダーとMarkdownコンテンツ
+            
+        Raises:
+            YAMLError: YAML解析エラーの場合
+        """
+        if not content.startswith('---'):
+            raise YAMLError(
+                "No YAML front matter found",
+                error_code="NO_YAML_HEADER"
+            )
+        
+        # 2番目の --- を探す
+        yaml_end = content.find('---', 3)
+        if yaml_end == -1:
+            raise YAMLError(
+                "Incomplete YAML front matter (missing closing ---)",
+                error_code="INCOMPLETE_YAML_HEADER"
+            )
+        
+        # YAML部分とMarkdown部分を分離
+        yaml_content = content[3:yaml_end].strip()
+        markdown_content = content[yaml_end + 3:].lstrip('\n')
+        
+        try:
+            yaml_header = yaml.safe_load(yaml_content)
+            if not isinstance(yaml_header, dict):
+                raise YAMLError(
+                    "YAML header must be a dictionary",
+                    error_code="INVALID_YAML_STRUCTURE"
+                )
+            
+            return yaml_header, markdown_content
+            
+        except yaml.YAMLError as e:
+            raise YAMLError(
+                f"YAML parsing error: {e}",
+                error_code="YAML_PARSE_ERROR"
+            )
+    
+    def parse_yaml_header_only(self, file_path: Path) -> Dict[str, Any]:
+        """
+        YAMLヘッダー部分のみを読み込み（本文は読まない）
+        
+        Args:
+            file_path: 対象ファイルのパス
+            
+        Returns:
+            Dict[str, Any]: YAMLヘッダー辞書
+            
+        Raises:
+            FileSystemError: ファイル読み込みエラーの場合
+            YAMLError: YAMLヘッダーがない・解析エラーの場合
+        """
+        yaml_header, _ = self._read_header_block(Path(file_path))
+        return yaml_header
+    
+    def patch_yaml_header(self, file_path: Path,
+                          update_func: Callable[[Dict[str, Any]], Dict[str, Any]]) -> bool:
+        """
+        本文を読み込まずにYAMLヘッダーのみを更新
+        
+        更新後のヘッダーが既存ヘッダー領域に収まり、かつヘッダー領域全体がファイル先頭の
+        1ブロック（st_blksizeとIN_PLACE_MAX_BYTESの小さい方）以内で、ファイルが他のパスから
+        ハードリンクされていない場合は、空白行で
+        長さを揃えてその場で上書きする。1回のブロック書き込みで済むため、書き込み中の停止で
+        ヘッダーの一部だけが新しくなる危険を避けられる（ブロック単位の書き込みが不可分でない
+        ファイルシステムでは、書き込み前のバックアップから復元する）。
+        それ以外は余白付きの新ヘッダーと元の本文バイト列を一時ファイルに書き出して置き換える
+        （本文はデコード・再エンコードせずにコピー）。
+        
+        Args:
+            file_path: 対象ファイルのパス
+            update_func: ヘッダー辞書を受け取り更新後の辞書を返す関数
+            
+        Returns:
+            bool: その場で上書きした場合True、ファイルを書き換えた場合False
+            
+        Raises:
+            FileSystemError: ファイル操作エラーの場合
+            YAMLError: YAMLヘッダーがない・解析/書き込みエラーの場合
+        """
+        file_path = Path(file_path)
+        yaml_header, header_end = self._read_header_block(file_path)
+        yaml_header = update_func(yaml_header)
+        
+        try:
+            yaml_str = yaml.dump(yaml_header, default_flow_style=False, allow_unicode=True)
+        except yaml.YAMLError as e:
+            raise YAMLError(
+                f"Failed to write YAML header to {file_path}: {e}",
+                error_code="YAML_WRITE_ERROR",
+                context={"file": str(file_path)}
+            )
+        header_bytes = f"---\n{yaml_str}".encode('utf-8')
+        closing = b'---\n'
+        
+        try:
+            available = header_end - len(header_bytes) - len(closing)
+            file_stat = os.stat(file_path)
+            block_size = min(getattr(file_stat, 'st_blksize', 0) or self.IN_PLACE_MAX_BYTES,
+                             self.IN_PLACE_MAX_BYTES)
+            # ハードリンクされたファイル（リンクで作成したバックアップ等）はその場で上書きすると
+            # リンク先も書き換わるため、置き換えで更新してリンクを切り離す
+            if available >= 0 and header_end <= block_size and file_stat.st_nlink <= 1:
+                # 既存ヘッダー領域（先頭1ブロック内）に収まる：空白のみの行で長さを揃えてその場で上書き
+                padding = b' ' * (available - 1) + b'\n' if available else b''
+                with open(file_path, 'r+b') as f:
+                    f.write(header_bytes + padding + closing)
+                    f.flush()
+                    os.fsync(f.fileno())
+                self.logger.debug(f"Patched YAML header in place: {file_path.name}")
+                return True
+            
+            # 収まらない：余白付きヘッダー＋元の本文バイト列で置き換え
+            padding = b' ' * (self.HEADER_SLACK_BYTES - 1) + b'\n'
+            with tempfile.NamedTemporaryFile(dir=file_path.parent, suffix='.tmp', delete=False) as temp_file:
+                temp_path = Path(temp_file.name)
+                try:
+                    temp_file.write(header_bytes + padding + closing)
+                    temp_file.flush()
+                    with open(file_path, 'rb') as source:
+                        self._copy_body(source, temp_file, header_end)
+                    temp_file.flush()
+                    os.fsync(temp_file.fileno())
+                except BaseException:
+                    temp_file.close()
+                    temp_path.unlink(missing_ok=True)
+                    raise
+            shutil.copymode(file_path, temp_path)
+            os.replace(temp_path, file_path)
+            self.logger.debug(f"Rewrote YAML header with slack: {file_path.name}")
+            return False
+            
+        except OSError as e:
+            raise FileSystemError(
+                f"Failed to patch YAML header in {file_path}: {e}",
+                error_code="YAML_PATCH_ERROR",
+                context={"file": str(file_path)}
+            )
+    
+    def _copy_body(self, source, destination, offset: int) -> None:
+        """
+        本文バイト列をコピー（カーネル内コピーが使える場合はユーザー空間を経由しない）
+        
+        Args:
+            source: 読み込み元（バイナリモード）
+            destination: 書き込み先（バイナリモード、書き込み位置は末尾）
+            offset: 読み込み元の本文開始位置
+        """
+        remaining = os.fstat(source.fileno()).st_size - offset
+        if hasattr(os, 'copy_file_range'):
+            try:
+                while remaining > 0:
+                    copied = os.copy_file_range(source.fileno(), destination.fileno(), remaining, offset)
+                    if copied == 0:
+                        break
+                    offset += copied
+                    remaining -= copied
+                destination.seek(0, os.SEEK_END)
+                if remaining <= 0:
+                    return
+            except OSError:
+                destination.seek(0, os.SEEK_END)
+        
+        source.seek(offset)
+        shutil.copyfileobj(source, destination)
+    
+    def _read_header_block(self, file_path: Path) -> Tuple[Dict[str, Any], int]:
+        """
+        YAMLヘッダー部分のみを読み込み、ヘッダー辞書とヘッダー終端位置を取得
+        
+        Args:
+            file_path: 対象ファイルのパス
+            
+        Returns:
+            Tuple[Dict[str, Any], int]: YAMLヘッダー辞書と閉じ行（---）直後のバイト位置
+        """
+        if not file_path.exists():
+            raise FileSystemError(
+                f"File not found: {file_path}",
+                error_code="FILE_NOT_FOUND"
+            )
+        
+        header_lines = []
+        try:
+            with open(file_path, 'rb') as f:
+                if f.readline().strip() != b'---':
+                    raise YAMLError(
+                        "No YAML front matter found",
+                        error_code="NO_YAML_HEADER"
+                    )
+                for line in iter(f.readline, b''):
+                    if line.strip() == b'---':
+                        header_end = f.tell()
+                        break
+                    header_lines.append(line)
+                else:
+                    raise YAMLError(
+                        "Incomplete YAML front matter (missing closing ---)",
+                        error_code="INCOMPLETE_YAML_HEADER"
+                    )
+        except OSError as e:
+            raise FileSystemError(
+                f"Failed to read file {file_path}: {e}",
+                error_code="FILE_READ_ERROR",
+                context={"file": str(file_path)}
+            )
+        
+        try:
+            yaml_header = yaml.safe_load(b''.join(header_lines).decode('utf-8'))
+        except (yaml.YAMLError, UnicodeDecodeError) as e:
+            raise YAMLError(
+                f"YAML parsing error in {file_path.name}: {e}",
+                error_code="YAML_PARSE_ERROR",
+                context={"file": str(file_path)}
+            )
+        if not isinstance(yaml_header, dict):
+            raise YAMLError(
+                "YAML header must be a dictionary",
+                error_code="INVALID_YAML_STRUCTURE"
+            )
+        
+        return yaml_header, header_end
+    
     def validate_yaml_structure(self, yaml_header: Dict[str, Any]) -> bool:
         """
         YAMLヘッダーの構造を検証
@@ -196,7 +473,7 @@ class YAMLHeaderProcessor:
                 should_backup = True  # デフォルト値
             
             if should_backup:
-                self.backup_manager.create_backup(file_path)
+                self.backup_manager.create_backup(file_path, backup_type="yaml_repair")
             
             # ファイル内容の読み込み
             with open(file_path, 'r', encoding='utf-8') as f:
@@ -353,39 +630,7 @@ class YAMLHeaderProcessor:
         Raises:
             YAMLError: YAML解析エラーの場合
         """
-        if not content.startswith('---'):
-            raise YAMLError(
-                "No YAML front matter found",
-                error_code="NO_YAML_HEADER"
-            )
-        
-        # 2番目の --- を探す
-        yaml_end = content.find('---', 3)
-        if yaml_end == -1:
-            raise YAMLError(
-                "Incomplete YAML front matter (missing closing ---)",
-                error_code="INCOMPLETE_YAML_HEADER"
-            )
-        
-        # YAML部分とMarkdown部分を分離
-        yaml_content = content[3:yaml_end].strip()
-        markdown_content = content[yaml_end + 3:].lstrip('\n')
-        
-        try:
-            yaml_header = yaml.safe_load(yaml_content)
-            if not isinstance(yaml_header, dict):
-                raise YAMLError(
-                    "YAML header must be a dictionary",
-                    error_code="INVALID_YAML_STRUCTURE"
-                )
-            
-            return yaml_header, markdown_content
-            
-        except yaml.YAMLError as e:
-            raise YAMLError(
-                f"YAML parsing error: {e}",
-                error_code="YAML_PARSE_ERROR"
-            )
+        return self.split_yaml_header(content)
     
     def _create_basic_yaml_template(self, citation_key: str) -> Dict[str, Any]:
         """
@@ -7,9 +7,12 @@ organize処理完了後の実行を想定
 """
 
 import os
+import csv
+import json
 import yaml
 from pathlib import Path
 from datetime import datetime
+from dataclasses import dataclass
 from typing import Dict, List, Any, Optional, Tuple
 
 # インポート（relative import対応）
@@ -18,6 +21,7 @@ try:
     from ..shared_modules.integrated_logger import IntegratedLogger
     from ..shared_modules.bibtex_parser import BibTeXParser
     from ..status_management_yaml.yaml_header_processor import YAMLHeaderProcessor
+    from ..status_management_yaml.metadata_scanner import MetadataScanner
     from ..shared_modules.exceptions import (
         ObsClippingsManagerError,
         ValidationError,
@@ -25,6 +29,8 @@ try:
         ProcessingError
     )
     from ..shared_modules.file_utils import FileUtils
+    from ..shared_modules.clippings_layout import ClippingsLayout
+    from ..citation_fetcher.response_cache import APIResponseCache
 except ImportError:
     # テスト環境での絶対インポート
     import sys
@@ -35,6 +41,7 @@ except ImportError:
     from code.py.modules.shared_modules.integrated_logger import IntegratedLogger
     from code.py.modules.shared_modules.bibtex_parser import BibTeXParser
     from code.py.modules.status_management_yaml.yaml_header_processor import YAMLHeaderProcessor
+    from code.py.modules.status_management_yaml.metadata_scanner import MetadataScanner
     from code.py.modules.shared_modules.exceptions import (
         ObsClippingsManagerError,
         ValidationError,
@@ -42,6 +49,23 @@ except ImportError:
         ProcessingError
     )
     from code.py.modules.shared_modules.file_utils import FileUtils
+    from code.py.modules.shared_modules.clippings_layout import ClippingsLayout
+    from code.py.modules.citation_fetcher.response_cache import APIResponseCache
+
+
+@dataclass
+class PaperRecord:
+    """
+    sync対象Markdownファイルの記録
+    
+    検出時にYAMLヘッダー（SyncChecker.SYNC_HEADER_FIELDS）を1回だけ解析し、
+    整合性チェック・sync状態更新まで引き継ぐ。
+    """
+    citation_key: str
+    markdown_file: Path
+    location: str                                   # organized / orphaned
+    yaml_header: Optional[Dict[str, Any]] = None    # 解析失敗時None
+    parse_error: Optional[str] = None
 
 
 class SyncChecker:
@@ -53,9 +77,18 @@ class SyncChecker:
     - メタデータ一致確認（DOI、タイトル、著者など）
     - 軽微な不整合の自動修正
     - 整合性レポート生成
+    - 不足・孤立論文のDOIレポート出力（JSON/CSV）
     - YAMLヘッダーのsync状態更新
     """
     
+    # sync状態の変更判定から除外する揮発性フィールド（実行ごとに変わる時刻）
+    VOLATILE_SYNC_METADATA_FIELDS = ('checked_at',)
+    # 検出時に読み取るYAMLヘッダーのフィールド（整合性チェック・sync状態比較に使用）
+    SYNC_HEADER_FIELDS = ('citation_key', 'doi', 'title', 'processing_status', 'sync_metadata')
+    # DOIレポートの列（CSVの列順）
+    DOI_REPORT_FIELDS = ('category', 'citation_key', 'doi', 'doi_link', 'title', 'authors', 'year',
+                         'journal', 'markdown_file', 'metadata_source', 'recommended_action')
+    
     def __init__(self, config_manager: ConfigManager, logger: IntegratedLogger):
         """
         SyncCheckerの初期化
@@ -70,6 +103,8 @@ class SyncChecker:
         # 依存クラスの初期化
         self.bibtex_parser = BibTeXParser(logger.get_logger('BibTeXParser'))
         self.yaml_processor = YAMLHeaderProcessor(config_manager, logger)
+        self.metadata_scanner = MetadataScanner(config_manager, logger)
+        self.clippings_layout = ClippingsLayout(config_manager, logger)
         self.file_utils = FileUtils()
         
         # sync設定の取得（ConfigManagerの全設定から取得、デフォルト値を設定）
@@ -87,7 +122,8 @@ class SyncChecker:
         self, 
         workspace_path: str, 
         bibtex_file: str, 
-        clippings_dir: str
+        clippings_dir: str,
+        update_yaml_headers: bool = True
     ) -> Dict[str, Any]:
         """
         ワークスペース全体の整合性チェック
@@ -96,6 +132,7 @@ class SyncChecker:
             workspace_path: ワークスペースのパス
             bibtex_file: BibTeXファイルのパス
             clippings_dir: Clippingsディレクトリのパス
+            update_yaml_headers: Falseの場合はYAMLヘッダーのsync状態を書き込まない（レポート作成等の読み取り専用実行）
         
         Returns:
             Dict[str, Any]: 整合性チェック結果
@@ -107,13 +144,13 @@ class SyncChecker:
             bibtex_entries = self._parse_bibtex_file(bibtex_file)
             self.logger.info(f"Found {len(bibtex_entries)} BibTeX entries")
             
-            # Clippingsディレクトリ内のMarkdownファイル検索
-            markdown_files = self._find_markdown_files(clippings_dir)
-            self.logger.info(f"Found {len(markdown_files)} organized markdown files")
+            # Clippingsディレクトリ内のMarkdownファイル検索（YAMLヘッダーはここで1回だけ解析）
+            paper_records = self._find_markdown_files(clippings_dir)
+            self.logger.info(f"Found {len(paper_records)} organized markdown files")
             
             # 整合性チェック実行
             consistency_results = self._perform_consistency_checks(
-                bibtex_entries, markdown_files, clippings_dir
+                bibtex_entries, paper_records, clippings_dir
             )
             
             # 結果サマリー作成
@@ -123,10 +160,13 @@ class SyncChecker:
             result['clippings_dir'] = clippings_dir
             result['checked_at'] = datetime.now().isoformat()
             
-            # YAMLヘッダー更新
-            self._update_sync_status_in_yaml_headers(
-                consistency_results['papers_checked'], result
-            )
+            # YAMLヘッダー更新（変更がある論文のみ書き込み）
+            if update_yaml_headers:
+                result['sync_status_updates'] = self._update_sync_status_in_yaml_headers(
+                    consistency_results['papers_checked'], result, paper_records
+                )
+            else:
+                result['sync_status_updates'] = {'updated': 0, 'skipped': 0, 'failed': 0}
             
             self.logger.info(f"Workspace consistency check completed: {result['consistency_status']}")
             return result
@@ -167,40 +207,74 @@ class SyncChecker:
                     'issues': ['Markdown file not found']
                 }
             
-            # YAMLヘッダーの解析
-            yaml_data, _ = self.yaml_processor.parse_yaml_header(markdown_file)
-            
-            # メタデータ比較
-            metadata_mismatches = self._compare_metadata(yaml_data, bibtex_entry)
-            
-            # ファイル名チェック
-            filename_issues = self._check_filename_consistency(
-                citation_key, markdown_file, paper_path
-            )
+            # YAMLヘッダーの解析（本文は読まない）
+            yaml_data = self.yaml_processor.parse_yaml_header_only(markdown_file)
             
-            # 結果構築
-            issues = metadata_mismatches + filename_issues
-            consistency_status = 'validated' if len(issues) == 0 else 'inconsistent'
-            
-            result = {
-                'citation_key': citation_key,
-                'consistency_status': consistency_status,
-                'markdown_file_exists': True,
-                'markdown_file_path': str(markdown_file),
-                'metadata_mismatches': metadata_mismatches,
-                'filename_issues': filename_issues,
-                'issues': issues,
-                'checked_at': datetime.now().isoformat()
-            }
-            
-            self.logger.debug(f"Paper consistency check completed: {citation_key} - {consistency_status}")
-            return result
+            return self._build_paper_result(citation_key, markdown_file, yaml_data, bibtex_entry)
             
         except Exception as e:
             error_msg = f"Paper consistency check failed for {citation_key}: {str(e)}"
             self.logger.error(error_msg)
             raise ProcessingError(error_msg, cause=e)
     
+    def _check_record_consistency(
+        self, 
+        record: PaperRecord, 
+        bibtex_entry: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        検出済みレコードの整合性チェック（YAMLヘッダーを再解析しない）
+        
+        Args:
+            record: 検出時に作成した論文レコード
+            bibtex_entry: BibTeXエントリー辞書
+        
+        Returns:
+            Dict[str, Any]: 個別論文の整合性チェック結果
+        """
+        self.logger.debug(f"Checking paper consistency: {record.citation_key}")
+        
+        if record.yaml_header is None:
+            error_msg = f"Paper consistency check failed for {record.citation_key}: {record.parse_error}"
+            self.logger.error(error_msg)
+            raise ProcessingError(error_msg)
+        
+        return self._build_paper_result(record.citation_key, record.markdown_file, record.yaml_header, bibtex_entry)
+    
+    def _build_paper_result(
+        self, 
+        citation_key: str, 
+        markdown_file: Path, 
+        yaml_data: Dict[str, Any], 
+        bibtex_entry: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """メタデータ・ファイル名の比較と個別論文の結果構築"""
+        # メタデータ比較
+        metadata_mismatches = self._compare_metadata(yaml_data, bibtex_entry)
+        
+        # ファイル名チェック
+        filename_issues = self._check_filename_consistency(
+            citation_key, markdown_file, markdown_file.parent
+        )
+        
+        # 結果構築
+        issues = metadata_mismatches + filename_issues
+        consistency_status = 'validated' if len(issues) == 0 else 'inconsistent'
+        
+        result = {
+            'citation_key': citation_key,
+            'consistency_status': consistency_status,
+            'markdown_file_exists': True,
+            'markdown_file_path': str(markdown_file),
+            'metadata_mismatches': metadata_mismatches,
+            'filename_issues': filename_issues,
+            'issues': issues,
+            'checked_at': datetime.now().isoformat()
+        }
+        
+        self.logger.debug(f"Paper consistency check completed: {citation_key} - {consistency_status}")
+        return result
+    
     def auto_fix_minor_inconsistencies(self, check_results: Dict[str, Any]) -> Dict[str, Any]:
         """
         軽微な不整合の自動修正
@@ -270,62 +344,45 @@ class SyncChecker:
         except Exception as e:
             raise ProcessingError(f"Failed to parse BibTeX file: {bibtex_file}", cause=e)
     
-    def _find_markdown_files(self, clippings_dir: str) -> Dict[str, str]:
-        """Clippingsディレクトリ内のMarkdownファイル検索"""
+    def _find_markdown_files(self, clippings_dir: str) -> Dict[str, PaperRecord]:
+        """Clippingsディレクトリ内のMarkdownファイル検索（citation_key -> 論文レコード）"""
         try:
             clippings_path = Path(clippings_dir)
             markdown_files = {}
             
-            # 1. organize済みのディレクトリ構造を検索（citation_key/citation_key.md）
-            for paper_dir in clippings_path.iterdir():
-                if paper_dir.is_dir():
-                    # Markdownファイルを検索
-                    md_files = list(paper_dir.glob("*.md"))
-                    if md_files:
-                        md_file = md_files[0]  # 最初のMarkdownファイルを使用
-                        
-                        try:
-                            # YAMLヘッダーからcitation_keyを読み取り
-                            yaml_data, _ = self.yaml_processor.parse_yaml_header(md_file)
-                            citation_key = yaml_data.get('citation_key')
-                            
-                            if citation_key:
-                                # 実際のcitation_keyを使用
-                                markdown_files[citation_key] = str(md_file)
-                                self.logger.debug(f"Found organized markdown with citation_key: {citation_key} at {md_file}")
-                            else:
-                                # citation_keyがない場合はディレクトリ名を使用（フォールバック）
-                                dir_name = paper_dir.name
-                                markdown_files[dir_name] = str(md_file)
-                                self.logger.warning(f"No citation_key in YAML header, using directory name: {dir_name}")
-                        except Exception as e:
-                            # YAMLヘッダー解析に失敗した場合はディレクトリ名を使用
-                            dir_name = paper_dir.name
-                            markdown_files[dir_name] = str(md_file)
-                            self.logger.warning(f"Failed to parse YAML header for {md_file}, using directory name: {dir_name}")
+            # 1. organize済みのディレクトリ構造（citation_key/citation_key.md）
+            #    2. Clippingsディレクトリ直下の孤立Markdownファイル
+            #    （シャード配置の論文ディレクトリもClippingsLayoutが列挙）
+            candidates = []
+            paper_dirs, loose_files = self.clippings_layout.scan(clippings_path)
+            for paper_dir, md_files in paper_dirs:
+                # 最初のMarkdownファイルを使用（citation_keyがない場合はディレクトリ名）
+                candidates.append((md_files[0], paper_dir.name, 'organized'))
+            for md_file in loose_files:
+                # citation_keyがない場合はファイル名（拡張子なし）を使用
+                candidates.append((md_file, md_file.stem, 'orphaned'))
+            
+            # sync処理に必要なYAMLヘッダーのフィールドを並列に読み取り（以降の処理で再解析しない）
+            headers, errors = self.metadata_scanner.scan_files(
+                [md_file for md_file, _, _ in candidates], self.SYNC_HEADER_FIELDS
+            )
             
-            # 2. Clippingsディレクトリ直下の孤立Markdownファイルを検索
-            for md_file in clippings_path.glob("*.md"):
-                if md_file.is_file():
-                    try:
-                        # YAMLヘッダーからcitation_keyを読み取り
-                        yaml_data, _ = self.yaml_processor.parse_yaml_header(md_file)
-                        citation_key = yaml_data.get('citation_key')
-                        
-                        if citation_key:
-                            # citation_keyが存在する場合はそれを使用
-                            markdown_files[citation_key] = str(md_file)
-                            self.logger.debug(f"Found orphaned markdown with citation_key: {citation_key} at {md_file}")
-                        else:
-                            # citation_keyがない場合はファイル名（拡張子なし）を使用
-                            file_stem = md_file.stem
-                            markdown_files[file_stem] = str(md_file)
-                            self.logger.warning(f"Found orphaned markdown without citation_key, using filename: {file_stem}")
-                    except Exception as e:
-                        # YAMLヘッダー解析に失敗した場合はファイル名を使用
-                        file_stem = md_file.stem
-                        markdown_files[file_stem] = str(md_file)
-                        self.logger.warning(f"Failed to parse YAML header for orphaned file {md_file}, using filename: {file_stem}")
+            for md_file, fallback_key, location in candidates:
+                fields = headers.get(str(md_file))
+                citation_key = fields.get('citation_key') if fields else None
+                
+                if citation_key:
+                    markdown_files[citation_key] = PaperRecord(citation_key, md_file, location, fields)
+                    self.logger.debug(f"Found {location} markdown with citation_key: {citation_key} at {md_file}")
+                else:
+                    markdown_files[fallback_key] = PaperRecord(fallback_key, md_file, location, fields,
+                                                               errors.get(str(md_file)))
+                    if fields is None:
+                        self.logger.warning(f"Failed to parse YAML header for {location} file {md_file}, "
+                                            f"using fallback key: {fallback_key}")
+                    else:
+                        self.logger.warning(f"No citation_key in YAML header of {location} file {md_file}, "
+                                            f"using fallback key: {fallback_key}")
             
             self.logger.info(f"Found {len(markdown_files)} total markdown files in {clippings_dir}")
             return markdown_files
@@ -336,7 +393,7 @@ class SyncChecker:
     def _perform_consistency_checks(
         self, 
         bibtex_entries: Dict[str, Dict[str, Any]], 
-        markdown_files: Dict[str, str], 
+        paper_records: Dict[str, PaperRecord], 
         clippings_dir: str
     ) -> Dict[str, Any]:
         """整合性チェックの実行"""
@@ -347,11 +404,10 @@ class SyncChecker:
         
         # BibTeXエントリーに対応するMarkdownファイルのチェック
         for citation_key, bibtex_entry in bibtex_entries.items():
-            if citation_key in markdown_files:
-                # 個別論文の整合性チェック
-                paper_dir = Path(markdown_files[citation_key]).parent
-                paper_result = self.check_paper_consistency(
-                    citation_key, str(paper_dir), bibtex_entry
+            if citation_key in paper_records:
+                # 個別論文の整合性チェック（検出時に解析したヘッダーを使用）
+                paper_result = self._check_record_consistency(
+                    paper_records[citation_key], bibtex_entry
                 )
                 papers_checked.append(paper_result)
                 
@@ -366,11 +422,13 @@ class SyncChecker:
                 issues_detected += 1
         
         # 孤立Markdownファイルのチェック
-        for citation_key, markdown_file in markdown_files.items():
+        for citation_key, record in paper_records.items():
             if citation_key not in bibtex_entries:
                 orphaned_markdown.append({
                     'citation_key': citation_key,
-                    'markdown_file': markdown_file
+                    'markdown_file': str(record.markdown_file),
+                    'doi': (record.yaml_header or {}).get('doi') or '',
+                    'title': (record.yaml_header or {}).get('title') or ''
                 })
                 issues_detected += 1
         
@@ -462,40 +520,88 @@ class SyncChecker:
     def _update_sync_status_in_yaml_headers(
         self, 
         papers_checked: List[Dict[str, Any]], 
-        overall_result: Dict[str, Any]
-    ) -> None:
-        """YAMLヘッダーのsync状態更新"""
+        overall_result: Dict[str, Any],
+        paper_records: Optional[Dict[str, PaperRecord]] = None
+    ) -> Dict[str, int]:
+        """
+        YAMLヘッダーのsync状態更新
+        
+        現在のヘッダーと比較し、揮発性フィールド（checked_at）以外に変更がある論文のみ
+        ヘッダー部分を書き込む。変更のないワークスペースではファイルへの書き込みは発生しない。
+        
+        Args:
+            papers_checked: 個別論文の整合性チェック結果
+            overall_result: 全体の整合性チェック結果
+            paper_records: 検出時の論文レコード（比較に使用し、ヘッダーを再解析しない）
+        
+        Returns:
+            Dict[str, int]: 書き込み件数（updated）、変更なしでスキップした件数（skipped）、失敗件数（failed）
+        """
+        update_stats = {'updated': 0, 'skipped': 0, 'failed': 0}
+        
         for paper_result in papers_checked:
             if paper_result.get('markdown_file_exists', False):
                 try:
-                    markdown_file = paper_result['markdown_file_path']
+                    markdown_file = Path(paper_result['markdown_file_path'])
                     
-                    # 現在のYAMLヘッダーとコンテンツの取得
-                    yaml_data, content = self.yaml_processor.parse_yaml_header(Path(markdown_file))
-                    
-                    # sync_metadataの追加/更新
-                    yaml_data['sync_metadata'] = {
+                    sync_metadata = {
                         'checked_at': paper_result['checked_at'],
                         'consistency_status': paper_result['consistency_status'],
                         'issues_detected': len(paper_result['issues']),
                         'auto_corrections_applied': 0,  # 実際の修正後に更新
                         'corrections_applied': []
                     }
+                    sync_status = 'completed' if paper_result['consistency_status'] == 'validated' else 'failed'
                     
-                    # processing_statusの更新
-                    if 'processing_status' not in yaml_data:
-                        yaml_data['processing_status'] = {}
+                    # 現在のYAMLヘッダーと比較（レコードがない場合のみヘッダーを読み込み）
+                    record = (paper_records or {}).get(paper_result['citation_key'])
+                    if record is not None and record.yaml_header is not None and record.markdown_file == markdown_file:
+                        yaml_data = record.yaml_header
+                    else:
+                        yaml_data = self.yaml_processor.parse_yaml_header_only(markdown_file)
+                    if self._sync_status_unchanged(yaml_data, sync_metadata, sync_status):
+                        update_stats['skipped'] += 1
+                        continue
                     
-                    yaml_data['processing_status']['sync'] = (
-                        'completed' if paper_result['consistency_status'] == 'validated' 
-                        else 'failed'
-                    )
+                    def update(yaml_header: Dict[str, Any]) -> Dict[str, Any]:
+                        yaml_header['sync_metadata'] = sync_metadata
+                        if not isinstance(yaml_header.get('processing_status'), dict):
+                            yaml_header['processing_status'] = {}
+                        yaml_header['processing_status']['sync'] = sync_status
+                        return yaml_header
                     
-                    # YAMLヘッダーの書き戻し
-                    self.yaml_processor.write_yaml_header(Path(markdown_file), yaml_data, content)
+                    # YAMLヘッダー部分のみ書き戻し
+                    self.yaml_processor.patch_yaml_header(markdown_file, update)
+                    update_stats['updated'] += 1
                     
                 except Exception as e:
+                    update_stats['failed'] += 1
                     self.logger.error(f"Failed to update YAML header for {paper_result['citation_key']}: {str(e)}")
+        
+        self.logger.info(f"Sync status updates: {update_stats['updated']} written, "
+                         f"{update_stats['skipped']} unchanged (skipped), {update_stats['failed']} failed")
+        return update_stats
+    
+    def _sync_status_unchanged(
+        self, 
+        yaml_data: Dict[str, Any], 
+        sync_metadata: Dict[str, Any], 
+        sync_status: str
+    ) -> bool:
+        """記録済みのsync状態が今回の結果と同じかどうか（揮発性フィールドを除いて比較）"""
+        processing_status = yaml_data.get('processing_status')
+        if not isinstance(processing_status, dict) or processing_status.get('sync') != sync_status:
+            return False
+        
+        stored_metadata = yaml_data.get('sync_metadata')
+        if not isinstance(stored_metadata, dict):
+            return False
+        
+        def stable_fields(metadata: Dict[str, Any]) -> Dict[str, Any]:
+            return {key: value for key, value in metadata.items()
+                    if key not in self.VOLATILE_SYNC_METADATA_FIELDS}
+        
+        return stable_fields(stored_metadata) == stable_fields(sync_metadata)
     
     def _create_backup_before_auto_fix(self, check_results: Dict[str, Any]) -> None:
         """自動修正前のバックアップ作成"""
@@ -559,8 +665,8 @@ class SyncChecker:
                 citation_key = paper.get('citation_key', 'Unknown')
                 markdown_file = paper.get('markdown_file', '')
                 
-                # MarkdownファイルからDOI情報を取得
-                doi = self._extract_doi_from_markdown(markdown_file)
+                # MarkdownファイルからDOI情報を取得（sync結果に含まれる場合は再解析しない）
+                doi = paper['doi'] if 'doi' in paper else self._extract_doi_from_markdown(markdown_file)
                 
                 # ファイル名を適切な長さに切り詰め
                 file_name = Path(markdown_file).name if markdown_file else 'Unknown'
@@ -577,6 +683,148 @@ class SyncChecker:
                 print(f"│ 推奨アクション: BibTeXエントリーを追加してください{'':<31} │")
                 print("└─────────────────────────────────────────────────────────────────────────────────┘")
     
+    def build_doi_report(self, check_result: Dict[str, Any],
+                         use_api_cache: Optional[bool] = None) -> Dict[str, Any]:
+        """
+        不足・孤立論文のDOIレポート作成
+
+        sync結果に含まれるBibTeXエントリー・YAMLヘッダーの情報を使い、Markdownは再解析しない
+        （DOIを持たない古い形式の結果のみ、該当ファイルをまとめて1回走査する）。
+        use_api_cacheが有効な場合は、引用文献取得時に保存したCrossRefレスポンスのキャッシュから
+        不足しているタイトル・著者・年・ジャーナルを補完する（APIは呼び出さない）。
+
+        Args:
+            check_result: check_workspace_consistencyの結果
+            use_api_cache: APIレスポンスキャッシュで補完するか（省略時はsync_checker.doi_report_use_api_cache）
+
+        Returns:
+            Dict[str, Any]: generated_at、workspace_path、summary、papers（DOI_REPORT_FIELDSの行）
+        """
+        doi_link_format = self.sync_config.get('doi_link_format', 'https://doi.org/{doi}')
+        if use_api_cache is None:
+            use_api_cache = self.sync_config.get('doi_report_use_api_cache', True)
+
+        rows = []
+        for paper in check_result.get('missing_markdown_files', []):
+            bibtex_entry = paper.get('bibtex_entry') or {}
+            author = bibtex_entry.get('author') or ''
+            rows.append({
+                'category': 'missing_markdown',
+                'citation_key': paper.get('citation_key', ''),
+                'doi': bibtex_entry.get('doi') or '',
+                'title': bibtex_entry.get('title') or '',
+                'authors': [name.strip() for name in author.split(' and ') if name.strip()],
+                'year': str(bibtex_entry.get('year') or ''),
+                'journal': bibtex_entry.get('journal') or '',
+                'markdown_file': '',
+                'metadata_source': 'bibtex',
+                'recommended_action': 'Markdownファイルを作成してください'
+            })
+
+        orphaned_papers = check_result.get('orphaned_markdown_files', [])
+        unresolved = [paper['markdown_file'] for paper in orphaned_papers
+                      if paper.get('markdown_file') and ('doi' not in paper or 'title' not in paper)]
+        headers = self.metadata_scanner.scan_files(unresolved, ('doi', 'title'))[0] if unresolved else {}
+        for paper in orphaned_papers:
+            fields = headers.get(str(Path(paper.get('markdown_file') or '')), {})
+            rows.append({
+                'category': 'orphaned_markdown',
+                'citation_key': paper.get('citation_key', ''),
+                'doi': paper.get('doi', fields.get('doi')) or '',
+                'title': paper.get('title', fields.get('title')) or '',
+                'authors': [],
+                'year': '',
+                'journal': '',
+                'markdown_file': paper.get('markdown_file') or '',
+                'metadata_source': 'markdown',
+                'recommended_action': 'BibTeXエントリーを追加してください'
+            })
+
+        # APIレスポンスキャッシュから空欄を補完（同じDOIは1回だけ参照）
+        enriched = 0
+        cache = None
+        if use_api_cache and check_result.get('clippings_dir'):
+            cache = APIResponseCache.for_workspace(self.config_manager, Path(check_result['clippings_dir']).parent)
+        work_metadata: Dict[str, Optional[Dict[str, Any]]] = {}
+        for row in rows:
+            row['doi'] = str(row['doi']).strip()
+            row['doi_link'] = doi_link_format.format(doi=row['doi']) if row['doi'] else ''
+            if cache is None or not row['doi']:
+                continue
+            key = cache.normalize_key(row['doi'])
+            if key not in work_metadata:
+                work_metadata[key] = cache.work_metadata(row['doi'])
+            metadata = work_metadata[key]
+            if not metadata:
+                continue
+            filled = [field for field in ('title', 'authors', 'year', 'journal')
+                      if not row[field] and metadata.get(field)]
+            for field in filled:
+                row[field] = str(metadata[field]) if field == 'year' else metadata[field]
+            if filled:
+                row['metadata_source'] += '+api_cache'
+                enriched += 1
+
+        return {
+            'generated_at': datetime.now().isoformat(),
+            'workspace_path': check_result.get('workspace_path', ''),
+            'summary': {
+                'missing_markdown': len(check_result.get('missing_markdown_files', [])),
+                'orphaned_markdown': len(orphaned_papers),
+                'without_doi': sum(1 for row in rows if not row['doi']),
+                'enriched_from_api_cache': enriched
+            },
+            'papers': [{field: row[field] for field in self.DOI_REPORT_FIELDS} for row in rows]
+        }
+
+    def write_doi_report(self, report: Dict[str, Any], output_path: str,
+                         report_format: Optional[str] = None) -> str:
+        """
+        DOIレポートをファイルに出力
+
+        Args:
+            report: build_doi_reportの結果
+            output_path: 出力先ファイルパス
+            report_format: json または csv（省略時は拡張子から判定、不明な場合はjson）
+
+        Returns:
+            str: 出力したファイルパス
+
+        Raises:
+            ValidationError: 未対応の形式の場合
+            FileSystemError: 書き込みエラーの場合
+        """
+        output_file = Path(output_path)
+        report_format = (report_format or output_file.suffix.lstrip('.') or 'json').lower()
+        if report_format not in ('json', 'csv'):
+            raise ValidationError(
+                f"Unsupported DOI report format: {report_format}",
+                error_code="INVALID_REPORT_FORMAT",
+                context={"output_path": str(output_file)}
+            )
+
+        try:
+            output_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(output_file, 'w', encoding='utf-8', newline='') as f:
+                if report_format == 'json':
+                    json.dump(report, f, ensure_ascii=False, indent=2)
+                    f.write('\n')
+                else:
+                    writer = csv.DictWriter(f, fieldnames=self.DOI_REPORT_FIELDS)
+                    writer.writeheader()
+                    for row in report['papers']:
+                        writer.writerow(dict(row, authors='; '.join(row['authors'])))
+        except OSError as e:
+            raise FileSystemError(
+                f"Failed to write DOI report: {output_file}",
+                error_code="REPORT_WRITE_FAILED",
+                context={"output_path": str(output_file)},
+                cause=e
+            )
+
+        self.logger.info(f"DOI report written: {output_file} ({len(report['papers'])} papers)")
+        return str(output_file)
+
     def _extract_doi_from_markdown(self, markdown_file: str) -> str:
         """MarkdownファイルからDOI情報を抽出"""
         try:
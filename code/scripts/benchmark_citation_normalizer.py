@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""引用文献正規化エンジンのベンチマークスクリプト
+
+大量の引用マーカーを含む合成論文で、従来のマッチ毎の文字列再構築方式と
+単一パス方式（CitationPatternNormalizerWorkflow.normalize_citations）の
+処理時間を比較し、出力がバイト単位で一致することを検証します。
+"""
+
+import sys
+import re
+import time
+import random
+import logging
+import argparse
+from pathlib import Path
+
+# プロジェクトルートをPythonパスに追加
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from code.py.modules.shared_modules.config_manager import ConfigManager
+from code.py.modules.shared_modules.integrated_logger import IntegratedLogger
+from code.py.modules.citation_pattern_normalizer.citation_pattern_normalizer_workflow import (
+    CitationPatternNormalizerWorkflow
+)
+
+
+def parse_arguments():
+    """コマンドライン引数を解析"""
+    parser = argparse.ArgumentParser(description="引用文献正規化ベンチマーク")
+    parser.add_argument('--citations', type=int, nargs='+', default=[500, 2000, 5000],
+                        help='合成論文あたりの引用マーカー数')
+    parser.add_argument('--publishers', nargs='+',
+                        default=['oxford_academic', 'elsevier', 'generic'],
+                        help='ベンチマーク対象の出版社パーサー')
+    parser.add_argument('--repeat', type=int, default=3, help='計測回数（最小値を採用）')
+    parser.add_argument('--seed', type=int, default=42, help='乱数シード')
+    return parser.parse_args()
+
+
+def generate_synthetic_paper(citation_count: int, seed: int) -> str:
+    """引用マーカーを大量に含む合成論文本文を生成"""
+    rng = random.Random(seed)
+    superscripts = '¹²³⁴⁵⁶⁷⁸⁹⁰'
+    sentences = []
+
+    for i in range(citation_count):
+        style = i % 4
+        number = rng.randint(1, 300)
+        if style == 0:
+            marker = ''.join(rng.choice(superscripts) for _ in range(rng.randint(1, 2)))
+        elif style == 1:
+            marker = f" ({number}, {number + 1})"
+        elif style == 2:
+            marker = f" [{number}]"
+        else:
+            marker = f" ({number})"
+        sentences.append(
+            f"Supplementary analysis {i} showed a {rng.randint(2, 95)}% change in expression{marker}."
+        )
+        if i % 20 == 19:
+            sentences.append(f"\n\n## Supplementary Section {i // 20}\n")
+
+    return "# Synthetic Paper\n\n" + " ".join(sentences) + "\n"
+
+
+def legacy_normalize_citations(workflow, content: str, publisher: str):
+    """従来方式（マッチ毎に文書全体を再構築）の参照実装"""
+    patterns = workflow.publisher_parsers.get(publisher, {}).get('patterns', [])
+    normalized_content = content
+    normalization_results = []
+
+    for pattern_config in patterns:
+        regex_pattern = pattern_config.get('regex', '')
+        replacement_template = pattern_config.get('replacement', '')
+        description = pattern_config.get('description', '')
+
+        matches = list(re.finditer(regex_pattern, normalized_content))
+        for match in reversed(matches):
+            replacement_text = workflow._create_replacement_text(match, replacement_template)
+            start_pos = match.start()
+            normalized_content = normalized_content[:start_pos] + replacement_text + normalized_content[match.end():]
+            normalization_results.append({
+                'original': match.group(0),
+                'normalized': replacement_text,
+                'position': start_pos,
+                'pattern_description': description
+            })
+
+    return normalized_content, normalization_results
+
+
+def measure(func, repeat: int):
+    """関数の最小実行時間と戻り値を取得"""
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    """ベンチマーク実行"""
+    args = parse_arguments()
+
+    config_manager = ConfigManager()
+    integrated_logger = IntegratedLogger(config_manager)
+    workflow = CitationPatternNormalizerWorkflow(config_manager, integrated_logger)
+    # 未対応パターン検出のログ出力はベンチマーク対象外
+    workflow.unsupported_pattern_alert = False
+    workflow.logger = logging.getLogger('citation_normalizer_benchmark')
+    workflow.logger.disabled = True
+
+    print(f"{'publisher':<18}{'citations':>10}{'chars':>10}{'legacy(s)':>12}{'single(s)':>12}{'speedup':>9}  identical")
+
+    all_identical = True
+    for publisher in args.publishers:
+        if publisher not in workflow.publisher_parsers:
+            print(f"{publisher:<18} (parser not found, skipped)")
+            continue
+
+        for citation_count in args.citations:
+            content = generate_synthetic_paper(citation_count, args.seed)
+
+            legacy_time, legacy_result = measure(
+                lambda: legacy_normalize_citations(workflow, content, publisher), args.repeat
+            )
+            single_time, single_result = measure(
+                lambda: workflow.normalize_citations(content, publisher), args.repeat
+            )
+
+            identical = legacy_result == single_result
+            all_identical = all_identical and identical
+            speedup = legacy_time / single_time if single_time > 0 else float('inf')
+            print(f"{publisher:<18}{citation_count:>10}{len(content):>10}"
+                  f"{legacy_time:>12.4f}{single_time:>12.4f}{speedup:>8.1f}x  {identical}")
+
+    if not all_identical:
+        print("❌ Output mismatch between legacy and single-pass normalization")
+        return 1
+
+    print("✅ Single-pass output is byte-identical to legacy output")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
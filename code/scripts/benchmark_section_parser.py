@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""セクション分割パーサーのベンチマークスクリプト
+
+補足資料を大量に含む合成論文で、従来の全行読み込み＋見出し毎の複数回マッチ方式と
+逐次読み込みの単一パス方式（SectionParsingWorkflow.parse_sections_single）の
+処理時間とピークメモリを比較し、抽出結果が一致することを検証します。
+"""
+
+import os
+import re
+import sys
+import time
+import random
+import logging
+import argparse
+import tempfile
+import tracemalloc
+from pathlib import Path
+
+# プロジェクトルートをPythonパスに追加
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from code.py.modules.shared_modules.config_manager import ConfigManager
+from code.py.modules.shared_modules.integrated_logger import IntegratedLogger
+from code.py.modules.section_parsing.section_parsing_workflow import SectionParsingWorkflow
+
+
+def parse_arguments():
+    """コマンドライン引数を解析"""
+    parser = argparse.ArgumentParser(description="セクション分割パーサーベンチマーク")
+    parser.add_argument('--sizes-mb', type=float, nargs='+', default=[1, 5, 20],
+                        help='合成論文のサイズ（MB）')
+    parser.add_argument('--repeat', type=int, default=3, help='計測回数（最小値を採用）')
+    parser.add_argument('--seed', type=int, default=42, help='乱数シード')
+    return parser.parse_args()
+
+
+def write_synthetic_paper(path: str, size_mb: float, seed: int) -> None:
+    """本文と大量の補足表を含む合成論文を書き出す"""
+    rng = random.Random(seed)
+    headings = ['## Abstract', '## Introduction', '## Materials and Methods', '## Results',
+                '### Supplementary Table {i}', '#### Supplementary Note {i}', '## Discussion']
+    target_bytes = int(size_mb * 1024 * 1024)
+    written = 0
+
+    with open(path, 'w', encoding='utf-8') as f:
+        written += f.write("---\ncitation_key: synthetic2024\ntitle: Synthetic Paper\n---\n\n")
+        i = 0
+        while written < target_bytes:
+            written += f.write(headings[i % len(headings)].format(i=i) + "\n\n")
+            for _ in range(rng.randint(5, 40)):
+                cells = " | ".join(str(rng.randint(0, 99999)) for _ in range(8))
+                written += f.write(f"| {cells} |\n")
+            written += f.write("\n")
+            i += 1
+
+
+def legacy_parse_sections(workflow, path: str):
+    """従来方式（readlines＋見出し毎に3回のre.match＋行範囲の再スライス）の参照実装"""
+    with open(path, 'r', encoding='utf-8') as f:
+        content_lines = f.readlines()
+
+    sections = []
+    current = None
+    header_count = 0
+    in_header = False
+    header_end = 0
+    for line_num, line in enumerate(content_lines, 1):
+        stripped = line.strip()
+        if stripped == '---':
+            header_count += 1
+            if header_count == 1:
+                in_header = True
+                continue
+            elif header_count == 2:
+                in_header = False
+                header_end = line_num
+                continue
+        if in_header or not re.match(r'^#{2,4}\s+.+', stripped):
+            continue
+        if current:
+            current[4] = line_num - header_end - 1
+            sections.append(current)
+        title = re.match(r'^#{2,4}\s+(.+)', stripped).group(1).strip()
+        level = len(re.match(r'^(#{2,4})\s+', stripped).group(1))
+        current = [title, level, workflow._scan_section_type(title.lower()), line_num - header_end, 0]
+    if current:
+        current[4] = len(content_lines) - header_end
+        sections.append(current)
+
+    return [
+        (title, level, section_type, start, end,
+         sum(len(line.split()) for line in content_lines[header_end + start - 1:header_end + end]))
+        for title, level, section_type, start, end in sections
+    ]
+
+
+def streaming_parse_sections(workflow, path: str):
+    """単一パス方式の結果を比較用タプルに変換"""
+    workflow.enable_subsection_analysis = False
+    structure = workflow.parse_sections_single(path)
+    return [(s.title, s.level, s.section_type, s.start_line, s.end_line, s.word_count)
+            for s in structure.sections]
+
+
+def measure(func, repeat: int):
+    """関数の最小実行時間・ピークメモリと戻り値を取得"""
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak, result
+
+
+def main():
+    """ベンチマーク実行"""
+    args = parse_arguments()
+
+    config_manager = ConfigManager()
+    integrated_logger = IntegratedLogger(config_manager)
+    workflow = SectionParsingWorkflow(config_manager, integrated_logger)
+    workflow.logger = logging.getLogger('section_parser_benchmark')
+    workflow.logger.disabled = True
+
+    print(f"{'size(MB)':>9}{'sections':>10}{'legacy(s)':>11}{'single(s)':>11}"
+          f"{'legacy peak':>13}{'single peak':>13}  identical")
+
+    all_identical = True
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for size_mb in args.sizes_mb:
+            path = os.path.join(temp_dir, f"synthetic_{size_mb}.md")
+            write_synthetic_paper(path, size_mb, args.seed)
+
+            legacy_time, legacy_peak, legacy_result = measure(
+                lambda: legacy_parse_sections(workflow, path), args.repeat
+            )
+            single_time, single_peak, single_result = measure(
+                lambda: streaming_parse_sections(workflow, path), args.repeat
+            )
+
+            identical = legacy_result == single_result
+            all_identical = all_identical and identical
+            print(f"{size_mb:>9.1f}{len(single_result):>10}{legacy_time:>11.3f}{single_time:>11.3f}"
+                  f"{legacy_peak / 1024 / 1024:>11.1f}MB{single_peak / 1024 / 1024:>11.1f}MB  {identical}")
+
+    if not all_identical:
+        print("❌ Section mismatch between legacy and single-pass parsing")
+        return 1
+
+    print("✅ Single-pass sections are identical to legacy parsing")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""セクション分割の並列処理ベンチマークスクリプト
+
+補足資料を大量に含む合成論文を複数作成し、SectionParsingWorkflow.process_papersの
+逐次処理とワーカープロセス＋書き込みスレッドによる並列処理の処理時間を比較します。
+並列処理では書き込みスレッドが行う処理（ファイルI/Oのみ）の累計時間も計測し、
+書き込みスレッドが律速になっていないこと、書き込まれた内容が逐次処理と一致することを検証します。
+"""
+
+import os
+import sys
+import time
+import shutil
+import logging
+import argparse
+import tempfile
+from pathlib import Path
+
+# プロジェクトルートをPythonパスに追加
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from code.py.modules.shared_modules.config_manager import ConfigManager
+from code.py.modules.shared_modules.integrated_logger import IntegratedLogger
+from code.py.modules.section_parsing.section_parsing_workflow import SectionParsingWorkflow
+from code.py.modules.status_management_yaml.yaml_header_processor import YAMLHeaderProcessor
+from code.scripts.benchmark_section_parser import write_synthetic_paper
+
+
+def parse_arguments():
+    """コマンドライン引数を解析"""
+    parser = argparse.ArgumentParser(description="セクション分割並列処理ベンチマーク")
+    parser.add_argument('--papers', type=int, default=64, help='合成論文数')
+    parser.add_argument('--size-kb', type=float, default=400, help='合成論文1件のサイズ（KB）')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='ワーカープロセス数')
+    parser.add_argument('--repeat', type=int, default=3, help='計測回数（最小値を採用）')
+    parser.add_argument('--seed', type=int, default=42, help='乱数シード')
+    return parser.parse_args()
+
+
+def create_workflow(config_manager, integrated_logger, workers: int) -> SectionParsingWorkflow:
+    """ログ出力を抑止したワークフローを作成（本文未変更でも毎回再解析する）"""
+    workflow = SectionParsingWorkflow(config_manager, integrated_logger)
+    workflow.logger = logging.getLogger('section_parsing_parallel_benchmark')
+    workflow.logger.disabled = True
+    workflow.yaml_processor.logger = workflow.logger
+    workflow.skip_unchanged = False
+    workflow.parallel_enabled = workers > 1
+    workflow.max_workers = workers
+    workflow.parallel_min_papers = 1
+    return workflow
+
+
+def time_writer(workflow: SectionParsingWorkflow) -> list:
+    """書き込みスレッドのファイル書き込み時間を記録するようにする"""
+    write_times = []
+    write_rendered_file = workflow.yaml_processor.write_rendered_file
+
+    def timed_write(file_path, file_bytes):
+        start = time.perf_counter()
+        try:
+            return write_rendered_file(file_path, file_bytes)
+        finally:
+            write_times.append(time.perf_counter() - start)
+
+    workflow.yaml_processor.write_rendered_file = timed_write
+    return write_times
+
+
+def measure(workflow: SectionParsingWorkflow, clippings_dir: str, papers: list, repeat: int) -> float:
+    """process_papersの最小実行時間を取得"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        results = workflow.process_papers(clippings_dir, papers)
+        best = min(best, time.perf_counter() - start)
+        if results['processed_papers'] != len(papers):
+            raise RuntimeError(f"Only {results['processed_papers']}/{len(papers)} papers were processed")
+    return best
+
+
+def read_bodies_and_structures(clippings_dir: str, papers: list) -> dict:
+    """書き込まれた本文とpaper_structure（解析日時を除く）を取得"""
+    contents = {}
+    for paper_name in papers:
+        with open(os.path.join(clippings_dir, paper_name, f"{paper_name}.md"), 'r', encoding='utf-8') as f:
+            yaml_data, content = YAMLHeaderProcessor.split_yaml_header(f.read())
+        yaml_data['paper_structure'].pop('parsed_at')
+        contents[paper_name] = (yaml_data['paper_structure'], content)
+    return contents
+
+
+def main():
+    """ベンチマーク実行"""
+    args = parse_arguments()
+
+    config_manager = ConfigManager()
+    integrated_logger = IntegratedLogger(config_manager)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        serial_dir = os.path.join(temp_dir, 'serial')
+        papers = []
+        for i in range(args.papers):
+            paper_name = f"synthetic{i:03d}"
+            os.makedirs(os.path.join(serial_dir, paper_name))
+            write_synthetic_paper(os.path.join(serial_dir, paper_name, f"{paper_name}.md"),
+                                  args.size_kb / 1024, args.seed + i)
+            papers.append(paper_name)
+        parallel_dir = os.path.join(temp_dir, 'parallel')
+        shutil.copytree(serial_dir, parallel_dir)
+
+        serial_workflow = create_workflow(config_manager, integrated_logger, 1)
+        parallel_workflow = create_workflow(config_manager, integrated_logger, args.workers)
+        write_times = time_writer(parallel_workflow)
+
+        serial_time = measure(serial_workflow, serial_dir, papers, args.repeat)
+        parallel_time = measure(parallel_workflow, parallel_dir, papers, args.repeat)
+        writer_time = sum(write_times) / args.repeat
+
+        identical = read_bodies_and_structures(parallel_dir, papers) == read_bodies_and_structures(serial_dir, papers)
+
+    print(f"CPUs: {os.cpu_count()}, workers: {args.workers}, papers: {args.papers} x {args.size_kb:.0f}KB")
+    print(f"{'serial(s)':>10}{'parallel(s)':>13}{'speedup':>9}{'writer(s)':>11}{'writer/paper(ms)':>18}  identical")
+    print(f"{serial_time:>10.2f}{parallel_time:>13.2f}{serial_time / parallel_time:>8.2f}x"
+          f"{writer_time:>11.2f}{writer_time / args.papers * 1000:>18.1f}  {identical}")
+
+    if not identical:
+        print("❌ Parallel section parsing wrote different content than serial parsing")
+        return 1
+
+    print("✅ Parallel section parsing wrote the same content as serial parsing")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
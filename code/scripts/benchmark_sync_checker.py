@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""SyncCheckerのベンチマークスクリプト
+
+大きなYAMLヘッダー（citations・paper_structure）を持つ合成ワークスペースで、
+従来の「検出・整合性チェック・sync状態更新でそれぞれヘッダーを解析する」方式と
+検出時に1回だけ解析したレコードを引き継ぐ方式（SyncChecker.check_workspace_consistency）の
+論文あたりのヘッダー解析回数と処理時間を比較します。
+"""
+
+import sys
+import time
+import random
+import logging
+import argparse
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import yaml
+
+# プロジェクトルートをPythonパスに追加
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from code.py.modules.shared_modules.config_manager import ConfigManager
+from code.py.modules.shared_modules.integrated_logger import IntegratedLogger
+from code.py.modules.sync_checker.sync_checker import SyncChecker
+
+
+def parse_arguments():
+    """コマンドライン引数を解析"""
+    parser = argparse.ArgumentParser(description="SyncCheckerベンチマーク")
+    parser.add_argument('--papers', type=int, nargs='+', default=[50, 200],
+                        help='合成ワークスペースの論文数')
+    parser.add_argument('--citations', type=int, default=40, help='論文あたりのcitations件数')
+    parser.add_argument('--repeat', type=int, default=3, help='計測回数（最小値を採用）')
+    parser.add_argument('--seed', type=int, default=42, help='乱数シード')
+    return parser.parse_args()
+
+
+def write_synthetic_workspace(workspace: Path, papers: int, citations: int, seed: int) -> Path:
+    """organize済みの論文ディレクトリとCurrentManuscript.bibを書き出す"""
+    rng = random.Random(seed)
+    clippings_dir = workspace / "Clippings"
+    clippings_dir.mkdir(parents=True)
+    bibtex_entries = []
+
+    for i in range(papers):
+        citation_key = f"paper{i:05d}"
+        doi = f"10.1234/bench.{i:05d}"
+        title = f"Synthetic paper number {i}"
+        header = {
+            'citation_key': citation_key,
+            'doi': doi,
+            'title': title,
+            'processing_status': {'organize': 'completed', 'sync': 'pending'},
+            'citations': {
+                n: {'title': f"Reference {n} of {citation_key}", 'doi': f"10.5555/ref.{i}.{n}",
+                    'authors': [f"Author {rng.randint(1, 999)}" for _ in range(4)]}
+                for n in range(1, citations + 1)
+            },
+            'paper_structure': {
+                'sections': [{'title': name, 'section_type': name.lower(), 'start_line': n * 10}
+                             for n, name in enumerate(['Abstract', 'Introduction', 'Methods',
+                                                       'Results', 'Discussion'])]
+            }
+        }
+        paper_dir = clippings_dir / citation_key
+        paper_dir.mkdir()
+        (paper_dir / f"{citation_key}.md").write_text(
+            f"---\n{yaml.dump(header, allow_unicode=True)}---\n\n# {title}\n\nBody text.\n",
+            encoding='utf-8'
+        )
+        bibtex_entries.append(f"@article{{{citation_key},\n    title = {{{title}}},\n"
+                              f"    doi = {{{doi}}},\n    year = {{2024}}\n}}\n")
+
+    bibtex_file = workspace / "CurrentManuscript.bib"
+    bibtex_file.write_text("\n".join(bibtex_entries), encoding='utf-8')
+    return bibtex_file
+
+
+class ParseCounter:
+    """YAMLヘッダー解析の入口（スキャナー・YAMLHeaderProcessor）の呼び出し回数を計数"""
+
+    def __init__(self, sync_checker: SyncChecker):
+        scanner = sync_checker.metadata_scanner
+        processor = sync_checker.yaml_processor
+        self.patches = [
+            patch.object(scanner, 'read_fields', wraps=scanner.read_fields),
+            patch.object(processor, '_read_header_block', wraps=processor._read_header_block),
+            patch.object(processor, 'parse_yaml_header', wraps=processor.parse_yaml_header),
+        ]
+        self.mocks = []
+
+    def __enter__(self):
+        self.mocks = [p.__enter__() for p in self.patches]
+        return self
+
+    def __exit__(self, *exc_info):
+        for p in reversed(self.patches):
+            p.__exit__(*exc_info)
+
+    @property
+    def count(self) -> int:
+        return sum(mock.call_count for mock in self.mocks)
+
+
+def legacy_check(sync_checker: SyncChecker, clippings_dir: Path, bibtex_entries):
+    """従来方式の参照実装（検出でcitation_key、チェックとsync状態更新で全体を解析。書き込みは省略）"""
+    for paper_dir in sorted(clippings_dir.iterdir()):
+        md_file = next(paper_dir.glob("*.md"))
+        citation_key = sync_checker.metadata_scanner.read_fields(md_file, ['citation_key'])['citation_key']
+        yaml_data, _ = sync_checker.yaml_processor.parse_yaml_header(md_file)
+        sync_checker._compare_metadata(yaml_data, bibtex_entries[citation_key])
+        sync_checker.yaml_processor.parse_yaml_header(md_file)
+
+
+def measure(func, repeat: int) -> float:
+    """関数の最小実行時間を取得"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    """ベンチマーク実行"""
+    args = parse_arguments()
+
+    config_manager = ConfigManager()
+    integrated_logger = IntegratedLogger(config_manager)
+    logging.disable(logging.CRITICAL)
+
+    print(f"{'papers':>7}{'legacy parses/paper':>21}{'record parses/paper':>21}"
+          f"{'legacy(s)':>11}{'record(s)':>11}{'writes':>8}")
+
+    all_single = True
+    for papers in args.papers:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            workspace = Path(temp_dir)
+            bibtex_file = write_synthetic_workspace(workspace, papers, args.citations, args.seed)
+            clippings_dir = workspace / "Clippings"
+            sync_checker = SyncChecker(config_manager, integrated_logger)
+            bibtex_entries = sync_checker._parse_bibtex_file(str(bibtex_file))
+
+            def run_sync():
+                return sync_checker.check_workspace_consistency(
+                    str(workspace), str(bibtex_file), str(clippings_dir)
+                )
+
+            # 1回目でsync状態を記録し、以降は変更のないワークスペースとして計測
+            run_sync()
+
+            with ParseCounter(sync_checker) as legacy_counter:
+                legacy_check(sync_checker, clippings_dir, bibtex_entries)
+            with ParseCounter(sync_checker) as record_counter:
+                result = run_sync()
+
+            legacy_time = measure(lambda: legacy_check(sync_checker, clippings_dir, bibtex_entries), args.repeat)
+            record_time = measure(run_sync, args.repeat)
+
+            record_per_paper = record_counter.count / papers
+            all_single = all_single and record_per_paper == 1
+            print(f"{papers:>7}{legacy_counter.count / papers:>21.1f}{record_per_paper:>21.1f}"
+                  f"{legacy_time:>11.3f}{record_time:>11.3f}{result['sync_status_updates']['updated']:>8}")
+
+    if not all_single:
+        print("❌ Headers were parsed more than once per paper")
+        return 1
+
+    print("✅ Each header is parsed once per sync run")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,192 @@
+"""
+AIJobQueue のユニットテスト
+
+ジャーナルによる再開・隔離・破損行の扱いをテストします。
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import Mock
+
+from code.py.modules.shared_modules.config_manager import ConfigManager
+from code.py.modules.shared_modules.integrated_logger import IntegratedLogger
+from code.py.modules.ai_tagging_translation.ai_job_queue import AIJobQueue
+
+
+class TestAIJobQueue(unittest.TestCase):
+    """AIJobQueueテスト"""
+
+    def setUp(self):
+        """テストのセットアップ"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.config_manager = Mock(spec=ConfigManager)
+        self.config_manager.get_ai_setting.side_effect = lambda *keys, default=None: {
+            ('job_queue', 'max_attempts'): 2
+        }.get(keys, default)
+        self.logger = Mock(spec=IntegratedLogger)
+        self.logger.get_logger.return_value = Mock()
+
+        self.papers = []
+        for citation_key in ['paper1', 'paper2', 'paper3']:
+            paper_dir = Path(self.temp_dir) / citation_key
+            paper_dir.mkdir()
+            paper_path = paper_dir / f"{citation_key}.md"
+            paper_path.write_text("# Paper", encoding='utf-8')
+            self.papers.append(str(paper_path))
+
+    def tearDown(self):
+        """テスト後のクリーンアップ"""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _new_queue(self):
+        return AIJobQueue(self.config_manager, self.logger, self.temp_dir)
+
+    def test_collect_jobs_enqueues_scanned_papers(self):
+        """スキャン結果がキューに登録されジャーナルに記録される"""
+        queue = self._new_queue()
+        jobs = queue.collect_jobs('tagger', lambda: list(self.papers))
+
+        self.assertEqual(jobs, self.papers)
+        self.assertEqual(queue.get_job('tagger', 'paper1')['status'], AIJobQueue.STATUS_QUEUED)
+
+        journal = Path(self.temp_dir) / AIJobQueue.JOURNAL_FILE_NAME
+        records = [json.loads(line) for line in journal.read_text(encoding='utf-8').splitlines()]
+        self.assertEqual(len(records), 3)
+
+    def test_resume_unfinished_jobs_first(self):
+        """中断されたジョブは次回実行時に先頭で再開される"""
+        queue = self._new_queue()
+        queue.collect_jobs('tagger', lambda: list(self.papers))
+        queue.mark_started('tagger', self.papers[0])
+        queue.mark_completed('tagger', self.papers[0])
+        queue.mark_started('tagger', self.papers[1])
+        # ここでプロセスが停止したと想定
+
+        resumed_queue = self._new_queue()
+        scan = Mock(return_value=[self.papers[2]])
+        jobs = resumed_queue.collect_jobs('tagger', scan)
+
+        self.assertEqual(jobs, [self.papers[1], self.papers[2]])
+        self.assertEqual(resumed_queue.last_run_stats['resumed'], 2)
+        self.assertEqual(resumed_queue.last_run_stats['scanned'], 0)
+        self.assertTrue(resumed_queue.last_run_stats['scan_deferred'])
+        scan.assert_not_called()
+
+        # 再開ジョブがなくなった実行では走査を行う
+        for paper_path in jobs:
+            resumed_queue.mark_completed('tagger', paper_path)
+        self.assertEqual(resumed_queue.collect_jobs('tagger', scan), [self.papers[2]])
+        scan.assert_called_once()
+
+    def test_resume_respects_target_items_and_step(self):
+        """再開ジョブは対象citation_keyとステップで絞り込まれる"""
+        queue = self._new_queue()
+        queue.collect_jobs('tagger', lambda: list(self.papers))
+
+        resumed_queue = self._new_queue()
+        self.assertEqual(resumed_queue.collect_jobs('tagger', lambda: [], ['paper2']), [self.papers[1]])
+        self.assertEqual(resumed_queue.collect_jobs('ochiai_format', lambda: []), [])
+
+    def test_quarantine_after_max_attempts(self):
+        """max_attempts回失敗した論文は隔離されスキップされる"""
+        queue = self._new_queue()
+        queue.mark_failed('translate_abstract', self.papers[0], "API error")
+        self.assertFalse(queue.is_quarantined('translate_abstract', 'paper1'))
+        queue.mark_failed('translate_abstract', self.papers[0], "API error")
+
+        reloaded = self._new_queue()
+        self.assertTrue(reloaded.is_quarantined('translate_abstract', 'paper1'))
+        jobs = reloaded.collect_jobs('translate_abstract', lambda: [self.papers[0], self.papers[1]])
+        self.assertEqual(jobs, [self.papers[1]])
+        self.assertEqual(reloaded.last_run_stats['quarantined_skipped'], 1)
+        self.assertEqual(len(reloaded.get_quarantined_jobs()), 1)
+
+        self.assertTrue(reloaded.release('translate_abstract', 'paper1'))
+        self.assertFalse(reloaded.is_quarantined('translate_abstract', 'paper1'))
+        self.assertEqual(reloaded.get_job('translate_abstract', 'paper1')['attempts'], 0)
+
+    def test_quarantine_released_when_input_changes(self):
+        """隔離時から本文または処理状態が変わった論文は自動で隔離解除される"""
+        paper_path = Path(self.papers[0])
+        paper_path.write_text("---\nprocessing_status:\n  tagger: failed\n---\n# Paper\n", encoding='utf-8')
+        queue = self._new_queue()
+        queue.mark_failed('tagger', self.papers[0], "API error")
+        queue.mark_failed('tagger', self.papers[0], "API error")
+
+        # 変更なし: 隔離を維持
+        self.assertEqual(self._new_queue().collect_jobs('tagger', lambda: [self.papers[0]]), [])
+
+        # 処理状態のリセット
+        paper_path.write_text("---\nprocessing_status:\n  tagger: pending\n---\n# Paper\n", encoding='utf-8')
+        reloaded = self._new_queue()
+        self.assertEqual(reloaded.collect_jobs('tagger', lambda: [self.papers[0]]), [self.papers[0]])
+        self.assertEqual(reloaded.last_run_stats['released'], 1)
+        self.assertEqual(reloaded.get_job('tagger', 'paper1')['attempts'], 0)
+
+        # 本文の修正
+        reloaded.mark_failed('tagger', self.papers[0], "API error")
+        reloaded.mark_failed('tagger', self.papers[0], "API error")
+        paper_path.write_text("---\nprocessing_status:\n  tagger: pending\n---\n# Paper (fixed)\n",
+                              encoding='utf-8')
+        self.assertEqual(self._new_queue().collect_jobs('tagger', lambda: [self.papers[0]]), [self.papers[0]])
+
+    def test_release_quarantined_by_step_and_key(self):
+        """隔離ジョブをステップ・citation_key指定でまとめて解除できる"""
+        queue = self._new_queue()
+        for step in ['tagger', 'ochiai_format']:
+            for paper_path in self.papers[:2]:
+                queue.mark_failed(step, paper_path, "error")
+                queue.mark_failed(step, paper_path, "error")
+
+        self.assertEqual(queue.release_quarantined('tagger', ['paper2']), [('tagger', 'paper2')])
+        self.assertEqual(sorted(queue.release_quarantined('ochiai_format')),
+                         [('ochiai_format', 'paper1'), ('ochiai_format', 'paper2')])
+        self.assertEqual(self._new_queue().release_quarantined(), [('tagger', 'paper1')])
+        self.assertEqual(self._new_queue().get_quarantined_jobs(), [])
+
+    def test_torn_journal_line_is_ignored(self):
+        """書き込み途中で切れた最終行は無視される"""
+        queue = self._new_queue()
+        queue.collect_jobs('tagger', lambda: [self.papers[0]])
+
+        journal = Path(self.temp_dir) / AIJobQueue.JOURNAL_FILE_NAME
+        with open(journal, 'a', encoding='utf-8') as f:
+            f.write('{"step": "tagger", "citation_key": "pap')
+
+        reloaded = self._new_queue()
+        self.assertEqual(reloaded.get_job('tagger', 'paper1')['status'], AIJobQueue.STATUS_QUEUED)
+        self.assertIsNone(reloaded.get_job('tagger', 'paper2'))
+
+    def test_compaction_keeps_latest_state(self):
+        """ジャーナル圧縮後も最新状態が保持される"""
+        queue = self._new_queue()
+        for _ in range(5):
+            queue.mark_started('tagger', self.papers[0])
+        queue.mark_completed('tagger', self.papers[0])
+
+        queue.compact_threshold = 0
+        queue._compact_if_needed()
+
+        journal = Path(self.temp_dir) / AIJobQueue.JOURNAL_FILE_NAME
+        self.assertEqual(len(journal.read_text(encoding='utf-8').splitlines()), 1)
+        self.assertEqual(self._new_queue().get_job('tagger', 'paper1')['status'], AIJobQueue.STATUS_COMPLETED)
+
+    def test_unwritable_directory_falls_back_to_memory(self):
+        """ジャーナルに書き込めない場合もメモリ上で処理を継続"""
+        missing_dir = os.path.join(self.temp_dir, 'missing')
+        queue = AIJobQueue(self.config_manager, self.logger, missing_dir)
+
+        jobs = queue.collect_jobs('tagger', lambda: list(self.papers))
+        queue.mark_failed('tagger', self.papers[0], "error")
+
+        self.assertEqual(jobs, self.papers)
+        self.assertEqual(queue.get_job('tagger', 'paper1')['attempts'], 1)
+        self.assertFalse(os.path.exists(missing_dir))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+BackupStore テストスイート
+
+内容アドレス型バックアップストアのテスト。
+- 同一内容の重複排除と圧縮
+- 世代数・保持期間・合計サイズの上限適用
+- インデックスの再読み込みとコンパクション
+- citation_keyによるリストア
+- YAMLヘッダーのみの差分バックアップ
+- 同じディレクトリを使う複数インスタンス間の整合性
+"""
+
+import time
+import gzip
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+from unittest.mock import patch
+
+from code.py.modules.shared_modules.backup_store import BackupStore
+
+
+class TestBackupStore(unittest.TestCase):
+    """BackupStoreクラスのテストケース"""
+
+    def setUp(self):
+        """テスト環境の初期化"""
+        self.test_dir = Path(tempfile.mkdtemp(prefix="BackupStore_Test_"))
+        self.store_dir = self.test_dir / "store"
+        self.paper_file = self.test_dir / "Clippings" / "smith2023" / "smith2023.md"
+        self.paper_file.parent.mkdir(parents=True)
+        self.paper_file.write_text("---\ncitation_key: smith2023\n---\n\n" + "Body text.\n" * 200,
+                                   encoding='utf-8')
+
+    def tearDown(self):
+        """テスト環境のクリーンアップ"""
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def _objects(self):
+        return [path for path in (self.store_dir / "objects").rglob("*") if path.is_file()]
+
+    def test_identical_content_stored_once(self):
+        """同一内容のバックアップはオブジェクトを共有し、圧縮して保存されることを確認"""
+        store = BackupStore(self.store_dir)
+        first = store.put(self.paper_file, backup_type="status_update")
+        second = store.put(self.paper_file, backup_type="status_update")
+
+        self.assertEqual(first['object'], second['object'])
+        self.assertEqual(len(self._objects()), 1)
+        self.assertEqual(first['citation_key'], "smith2023")
+        stats = store.stats()
+        self.assertEqual(stats['entries'], 2)
+        self.assertEqual(stats['logical_bytes'], 2 * self.paper_file.stat().st_size)
+        self.assertLess(stats['stored_bytes'], self.paper_file.stat().st_size)
+        self.assertEqual(store.read_object(first['object']), self.paper_file.read_bytes())
+
+    def test_restore_latest_by_citation_key(self):
+        """citation_keyの最新バックアップを元のパスへリストアできることを確認"""
+        store = BackupStore(self.store_dir, compression=False)
+        original = self.paper_file.read_bytes()
+        store.put(self.paper_file)
+        self.paper_file.write_text("---\ncitation_key: smith2023\nstatus: v2\n---\n", encoding='utf-8')
+        store.put(self.paper_file)
+        self.paper_file.write_text("corrupted", encoding='utf-8')
+
+        entries = store.entries("smith2023")
+        self.assertEqual(len(entries), 2)
+        restored = store.restore(store.latest("smith2023"))
+        self.assertEqual(restored, str(self.paper_file))
+        self.assertIn("status: v2", self.paper_file.read_text(encoding='utf-8'))
+
+        store.restore(entries[-1])
+        self.assertEqual(self.paper_file.read_bytes(), original)
+        self.assertIsNone(store.latest("unknown2020"))
+
+    def test_version_and_size_limits_enforced(self):
+        """世代数・合計サイズの上限を超えた古いバックアップと未参照オブジェクトが削除されることを確認"""
+        store = BackupStore(self.store_dir, compression=False, max_versions_per_file=2)
+        for version in range(4):
+            self.paper_file.write_text(f"version {version}", encoding='utf-8')
+            store.put(self.paper_file)
+
+        self.assertEqual([store.read_object(e['object']) for e in store.entries()],
+                         [b"version 3", b"version 2"])
+        self.assertEqual(len(self._objects()), 2)
+
+        other_file = self.paper_file.parent / "other.md"
+        other_file.write_bytes(b"x" * 2048)
+        store.max_size_bytes = 2048
+        store.put(other_file)
+        self.assertEqual([entry['citation_key'] for entry in store.entries()], ["other"])
+        self.assertEqual(store.stats()['stored_bytes'], 2048)
+
+    def test_retention_and_reload(self):
+        """保持期間の適用と、再読み込み時に削除記録が反映されることを確認"""
+        store = BackupStore(self.store_dir, retention_days=1)
+        with patch('code.py.modules.shared_modules.backup_store.time.time', return_value=time.time() - 3 * 86400):
+            store.put(self.paper_file)
+        self.paper_file.write_text("new content", encoding='utf-8')
+        store.put(self.paper_file)
+
+        self.assertEqual(len(store.entries()), 1)
+        reloaded = BackupStore(self.store_dir, retention_days=1)
+        self.assertEqual([store.read_object(e['object']) for e in reloaded.entries()], [b"new content"])
+        self.assertEqual(reloaded.stats()['objects'], 1)
+
+    def test_compaction_and_gzip_content_without_compression(self):
+        """インデックスのコンパクションと、gzip形式の内容を非圧縮設定で保存した場合の読み込みを確認"""
+        store = BackupStore(self.store_dir, compression=False, max_versions_per_file=1)
+        store.MIN_COMPACTION_RECORDS = 4
+        for version in range(10):
+            self.paper_file.write_text(f"version {version}", encoding='utf-8')
+            store.put(self.paper_file)
+        index_lines = store.index_path.read_text(encoding='utf-8').splitlines()
+        self.assertLess(len(index_lines), 10)
+
+        gzip_file = self.paper_file.parent / "data.md"
+        gzip_file.write_bytes(gzip.compress(b"already compressed"))
+        entry = store.put(gzip_file)
+        self.assertEqual(store.read_object(entry['object']), gzip_file.read_bytes())
+
+        reloaded = BackupStore(self.store_dir, compression=True)
+        self.assertEqual(len(reloaded.entries()), 2)
+        self.assertEqual(reloaded.read_object(reloaded.latest("smith2023")['object']), b"version 9")
+
+    def test_header_only_backup_falls_back_and_restores(self):
+        """ヘッダー差分は本文が同じ場合のみ作成され、本文が変わっていても完全な内容を復元できることを確認"""
+        store = BackupStore(self.store_dir, compression=False, max_versions_per_file=2)
+        body = b"\n# smith2023\n" + b"Body text.\n" * 200
+        self.paper_file.write_bytes(b"---\nstatus: pending\n---\n" + body)
+
+        # 既存バックアップがない場合は完全なバックアップ
+        base = store.put(self.paper_file, header_only=True)
+        self.assertNotIn('base_sha256', base)
+
+        self.paper_file.write_bytes(b"---\nstatus: completed\n---\n" + body)
+        delta = store.put(self.paper_file, header_only=True)
+        self.assertEqual(delta['base_sha256'], base['sha256'])
+        self.assertEqual(store.read_object(delta['object']), b"---\nstatus: completed\n---\n")
+        self.assertEqual(delta['size'], self.paper_file.stat().st_size)
+
+        # 本文が変わった場合は完全なバックアップ
+        self.paper_file.write_bytes(b"---\nstatus: completed\n---\nrewritten body\n")
+        full = store.put(self.paper_file, header_only=True)
+        self.assertNotIn('base_sha256', full)
+
+        # 世代数の上限で元の完全なバックアップの記録が削除されても、差分が参照する本文は残る
+        self.assertEqual([entry['id'] for entry in store.entries()], [full['id'], delta['id']])
+        store.restore(store.entries()[-1])
+        self.assertEqual(self.paper_file.read_bytes(), b"---\nstatus: completed\n---\n" + body)
+
+        # 現在の本文が同じ場合はそのまま使用し、再読み込み後も復元できる
+        self.paper_file.write_bytes(b"---\nstatus: failed\n---\n" + body)
+        reloaded = BackupStore(self.store_dir, compression=False)
+        reloaded.restore(reloaded.entry_for_object(delta['object']))
+        self.assertEqual(self.paper_file.read_bytes(), b"---\nstatus: completed\n---\n" + body)
+
+        self.assertIsNone(BackupStore.split_front_matter(b"# no header\n"))
+        self.assertIsNone(BackupStore.split_front_matter(b"---\nunterminated: true\n"))
+
+    def test_two_instances_do_not_delete_each_others_objects(self):
+        """別インスタンスの上限適用・コンパクションが、もう一方の新しい記録のオブジェクトを削除しないことを確認"""
+        store_a = BackupStore(self.store_dir, compression=False, max_versions_per_file=1)
+        store_b = BackupStore(self.store_dir, compression=False, max_versions_per_file=1)
+        store_a.MIN_COMPACTION_RECORDS = store_b.MIN_COMPACTION_RECORDS = 1
+
+        self.paper_file.write_text("version 1", encoding='utf-8')
+        store_a.put(self.paper_file, citation_key="k")
+        self.paper_file.write_text("version 2", encoding='utf-8')
+        store_b.put(self.paper_file, citation_key="k")
+        self.paper_file.write_text("version 3", encoding='utf-8')
+        store_a.put(self.paper_file, citation_key="k")
+
+        latest = store_b.latest("k")
+        self.assertTrue(Path(latest['object']).exists())
+        self.assertEqual(store_b.read_object(latest['object']), b"version 3")
+        self.assertEqual(len(store_b.entries("k")), 1)
+        self.assertEqual(len(self._objects()), 1)
+        self.assertEqual(BackupStore(self.store_dir).stats()['entries'], 1)
+
+        self.assertIs(BackupStore.shared(self.store_dir), BackupStore.shared(str(self.store_dir) + "/"))
+
+    def test_header_delta_restores_after_other_instance_applies_limits(self):
+        """別インスタンスが上限を適用した後も、ヘッダー差分の参照先オブジェクトから本文を復元できることを確認"""
+        store_a = BackupStore(self.store_dir, compression=False, max_versions_per_file=2)
+        store_b = BackupStore(self.store_dir, compression=False, max_versions_per_file=2)
+        body = b"\n" + b"Body text.\n" * 50
+        self.paper_file.write_bytes(b"---\nstatus: pending\n---\n" + body)
+        store_a.put(self.paper_file, header_only=True)
+        self.paper_file.write_bytes(b"---\nstatus: completed\n---\n" + body)
+        delta = store_b.put(self.paper_file, header_only=True)
+        self.assertIn('base_sha256', delta)
+
+        # Aの世代数上限で元の完全なバックアップの記録が削除される
+        self.paper_file.write_bytes(b"---\nstatus: completed\n---\nrewritten body\n")
+        store_a.put(self.paper_file, header_only=True)
+
+        store_b.restore(delta)
+        self.assertEqual(self.paper_file.read_bytes(), b"---\nstatus: completed\n---\n" + body)
+
+
+if __name__ == '__main__':
+    unittest.main()
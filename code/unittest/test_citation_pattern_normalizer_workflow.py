@@ -2,6 +2,7 @@
 """Test Citation Pattern Normalizer Workflow"""
 
 import os
+import re
 import sys
 import unittest
 import tempfile
@@ -155,6 +156,15 @@ class TestCitationPatternNormalizerWorkflow(unittest.TestCase):
         publisher = self.workflow.detect_publisher(content, metadata)
         self.assertEqual(publisher, "nature")
     
+    def test_detect_publisher_by_journal_keyword(self):
+        """Test publisher detection using journal keywords and the rule that fired"""
+        metadata = {"title": "A study", "journal": "Oxford Academic Journal"}
+        
+        self.assertEqual(self.workflow._detect_publisher_with_rule("", metadata),
+                         ("oxford_academic", "journal_keyword"))
+        self.assertEqual(self.workflow._detect_publisher_with_rule("", {"doi": "10.1016/j.x"}),
+                         ("elsevier", "doi_prefix"))
+    
     def test_detect_publisher_fallback(self):
         """Test publisher detection fallback to generic"""
         content = "Sample content"
@@ -338,6 +348,141 @@ class TestCitationPatternNormalizerWorkflow(unittest.TestCase):
         
         # Check processing status was updated
         self.assertEqual(updated_header['processing_status']['citation_pattern_normalizer'], 'completed')
+    
+    def _legacy_normalize_citations(self, content, publisher):
+        """Reference implementation that re-splices the document once per match"""
+        normalized_content = content
+        normalization_results = []
+        for pattern_config in self.workflow.publisher_parsers[publisher]['patterns']:
+            for match in reversed(list(re.finditer(pattern_config['regex'], normalized_content))):
+                replacement_text = self.workflow._create_replacement_text(match, pattern_config['replacement'])
+                normalized_content = (normalized_content[:match.start()] + replacement_text
+                                      + normalized_content[match.end():])
+                normalization_results.append({
+                    'original': match.group(0),
+                    'normalized': replacement_text,
+                    'position': match.start(),
+                    'pattern_description': pattern_config['description']
+                })
+        return normalized_content, normalization_results
+    
+    def test_normalize_citations_matches_legacy_splicing(self):
+        """Test single-pass normalization is identical to per-match splicing"""
+        content = ("Radiation affects cells¹²,³ and tissue (4, 5). Prior work (6) and [7] "
+                   "agree 8, 9 times.\n") * 200
+        
+        for publisher in ['oxford_academic', 'elsevier', 'nature', 'generic']:
+            with self.subTest(publisher=publisher):
+                self.assertEqual(self.workflow.normalize_citations(content, publisher),
+                                 self._legacy_normalize_citations(content, publisher))
+
+    
+    def test_parallel_normalization_matches_serial(self):
+        """Test process-pool normalization returns the same results as serial execution"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            pending_files = []
+            for i in range(6):
+                citation_key = f"paper{i}2024"
+                paper_dir = os.path.join(temp_dir, citation_key)
+                os.makedirs(paper_dir)
+                file_path = os.path.join(paper_dir, f"{citation_key}.md")
+                with open(file_path, 'w', encoding='utf-8') as f:
+                    f.write(f"---\ncitation_key: {citation_key}\ndoi: 10.1016/j.test.{i}\n---\n\n"
+                            f"Result (1, 2) and prior work ({i + 3}).\n")
+                pending_files.append((file_path, citation_key))
+            
+            self.workflow.parallel_enabled = False
+            serial = list(self.workflow._normalize_files(pending_files))
+            
+            self.workflow.parallel_enabled = True
+            self.workflow.max_workers = 2
+            self.workflow.chunk_size = 2
+            self.workflow.parallel_min_files = 2
+            parallel = list(self.workflow._normalize_files(pending_files))
+        
+        def without_timestamps(results):
+            return [(file_path, citation_key,
+                     dict(normalized, updated_content=re.sub(r"'\d{4}-\d{2}-\d{2}T[\d:.]+'", "''",
+                                                             normalized['updated_content'])))
+                    for file_path, citation_key, normalized in results]
+        
+        self.assertEqual(without_timestamps(parallel), without_timestamps(serial))
+        self.assertEqual([citation_key for _, citation_key, _ in parallel],
+                         [citation_key for _, citation_key in pending_files])
+        self.logger.warning.assert_not_called()
+        for _, _, normalized in parallel:
+            self.assertIsNone(normalized['error'])
+            self.assertEqual(normalized['publisher'], 'elsevier')
+            self.assertIn('Result [1, 2]', normalized['updated_content'])
+
+    
+    def test_parallel_results_are_consumed_lazily(self):
+        """Test pool results are yielded as they arrive and a pool failure only reruns the rest"""
+        pending_files = [(f"/tmp/paper{i}/paper{i}.md", f"paper{i}") for i in range(4)]
+        produced = []
+        
+        def fake_map(function, file_paths, chunksize=1):
+            for file_path in file_paths[:2]:
+                produced.append(file_path)
+                yield {'file_path': file_path, 'source': 'pool'}
+            raise RuntimeError("worker crashed")
+        
+        executor = MagicMock()
+        executor.__enter__.return_value.map.side_effect = fake_map
+        self.workflow.logger = MagicMock()
+        self.workflow.parallel_enabled = True
+        self.workflow.max_workers = 2
+        self.workflow.parallel_min_files = 2
+        
+        with patch('code.py.modules.citation_pattern_normalizer.citation_pattern_normalizer_workflow'
+                   '.ProcessPoolExecutor', return_value=executor), \
+                patch.object(self.workflow, '_normalize_file',
+                             side_effect=lambda file_path: {'file_path': file_path, 'source': 'serial'}):
+            results = self.workflow._normalize_files(pending_files)
+            self.assertEqual(next(results)[2]['source'], 'pool')
+            self.assertEqual(len(produced), 1)
+            remaining = list(results)
+        
+        self.assertEqual([normalized['source'] for _, _, normalized in remaining], ['pool', 'serial', 'serial'])
+        self.assertEqual([citation_key for _, citation_key, _ in remaining], ['paper1', 'paper2', 'paper3'])
+        self.assertIn('2 remaining files', self.workflow.logger.warning.call_args[0][0])
+
+    
+    def test_process_items_skips_unchanged_files(self):
+        """Test files are rewritten only when the body or the pattern set changes"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            paper_dir = os.path.join(temp_dir, 'smith2024')
+            os.makedirs(paper_dir)
+            file_path = os.path.join(paper_dir, 'smith2024.md')
+            with open(file_path, 'w', encoding='utf-8') as f:
+                f.write("---\ncitation_key: smith2024\ndoi: 10.1016/j.test\n---\n\nPrior work (1, 2).\n")
+            
+            result = self.workflow.process_items(temp_dir)
+            self.assertEqual((result['processed'], result['skipped']), (1, 0))
+            with open(file_path, 'r', encoding='utf-8') as f:
+                normalized_content = f.read()
+            self.assertIn('body_hash', normalized_content)
+            
+            # Second run: nothing changed, so nothing is written
+            with patch('builtins.open', wraps=open) as mock_open:
+                result = self.workflow.process_items(temp_dir)
+            self.assertEqual((result['processed'], result['skipped']), (0, 1))
+            self.assertFalse(any(len(call.args) > 1 and call.args[1] == 'w' for call in mock_open.call_args_list))
+            
+            # Edited body is normalized again
+            with open(file_path, 'a', encoding='utf-8') as f:
+                f.write("New finding (3).\n")
+            result = self.workflow.process_items(temp_dir)
+            self.assertEqual(result['processed'], 1)
+            with open(file_path, 'r', encoding='utf-8') as f:
+                self.assertIn('New finding [3].', f.read())
+            
+            # Changed pattern set triggers re-normalization
+            self.assertEqual(self.workflow.process_items(temp_dir)['skipped'], 1)
+            self.workflow.publisher_parsers = dict(self.workflow.publisher_parsers)
+            self.workflow.publisher_parsers['elsevier'] = dict(self.workflow.publisher_parsers['elsevier'],
+                                                               detection={'doi_prefixes': ['10.1016', '10.1017']})
+            self.assertEqual(self.workflow.process_items(temp_dir)['processed'], 1)
 
 
 if __name__ == '__main__':
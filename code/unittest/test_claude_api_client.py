@@ -122,6 +122,307 @@ class TestClaudeAPIClientRequest(unittest.TestCase):
         with self.assertRaises(APIError):
             client.send_request("test prompt")
 
+    @patch('anthropic.Anthropic')
+    def test_send_request_uses_max_tokens(self, mock_anthropic):
+        """max_tokens指定時のリクエストテスト"""
+        from code.py.modules.ai_tagging_translation.claude_api_client import ClaudeAPIClient
+        
+        mock_response = Mock()
+        mock_response.content = [Mock(text='test response')]
+        mock_anthropic.return_value.messages.create.return_value = mock_response
+        
+        client = ClaudeAPIClient(self.config_manager, self.logger)
+        client.send_request("test prompt", max_tokens=512)
+        
+        _, kwargs = mock_anthropic.return_value.messages.create.call_args
+        self.assertEqual(kwargs['max_tokens'], 512)
+    
+    @patch('anthropic.Anthropic')
+    def test_send_request_streaming_early_stop(self, mock_anthropic):
+        """ストリーミング受信で構造完成時に早期終了するテスト"""
+        from code.py.modules.ai_tagging_translation.claude_api_client import ClaudeAPIClient
+        
+        received_chunks = []
+        
+        def text_stream():
+            for chunk in ['["tag_a", ', '"tag_b"]', ' trailing', ' never sent']:
+                received_chunks.append(chunk)
+                yield chunk
+        
+        mock_stream = MagicMock()
+        mock_stream.__enter__.return_value.text_stream = text_stream()
+        mock_anthropic.return_value.messages.stream.return_value = mock_stream
+        
+        def detector(text):
+            end = text.find(']')
+            return end + 1 if end != -1 else None
+        
+        client = ClaudeAPIClient(self.config_manager, self.logger)
+        response = client.send_request("test prompt", max_tokens=256, completion_detector=detector)
+        
+        self.assertEqual(response, '["tag_a", "tag_b"]')
+        self.assertEqual(len(received_chunks), 2)
+        mock_stream.__exit__.assert_called_once()
+        mock_anthropic.return_value.messages.create.assert_not_called()
+        _, kwargs = mock_anthropic.return_value.messages.stream.call_args
+        self.assertEqual(kwargs['max_tokens'], 256)
+    
+    @patch('anthropic.Anthropic')
+    def test_send_request_streaming_disabled(self, mock_anthropic):
+        """ストリーミング無効時は通常リクエストになるテスト"""
+        from code.py.modules.ai_tagging_translation.claude_api_client import ClaudeAPIClient
+        
+        self.config_manager.get_ai_setting.side_effect = lambda *keys, default=None: {
+            ('default_model',): 'claude-3-5-haiku-20241022',
+            ('api_key_env',): 'ANTHROPIC_API_KEY',
+            ('streaming', 'enabled'): False,
+        }.get(keys, default)
+        
+        mock_response = Mock()
+        mock_response.content = [Mock(text='["tag_a"]')]
+        mock_anthropic.return_value.messages.create.return_value = mock_response
+        
+        client = ClaudeAPIClient(self.config_manager, self.logger)
+        response = client.send_request("test prompt", completion_detector=lambda text: None)
+        
+        self.assertEqual(response, '["tag_a"]')
+        mock_anthropic.return_value.messages.stream.assert_not_called()
+
+
+class TestClaudeClientRegistry(unittest.TestCase):
+    """ClaudeClientRegistryの共有クライアント・共有レート制限テスト"""
+    
+    def setUp(self):
+        """テストのセットアップ"""
+        from code.py.modules.ai_tagging_translation.claude_api_client import ClaudeClientRegistry
+        
+        self.config_manager = Mock(spec=ConfigManager)
+        self.logger = Mock(spec=IntegratedLogger)
+        self.logger.get_logger.return_value = Mock()
+        
+        self.config_manager.get_ai_setting.side_effect = lambda *keys, default=None: {
+            ('default_model',): 'claude-3-5-haiku-20241022',
+            ('api_key_env',): 'ANTHROPIC_API_KEY',
+        }.get(keys, default)
+        self.config_manager.get_api_setting.side_effect = lambda key, default=None: {
+            'timeout': 30,
+            'max_retries': 0,
+            'request_delay': 0.05
+        }.get(key, default)
+        
+        self.api_key_patcher = patch.dict(os.environ, {'ANTHROPIC_API_KEY': 'test-api-key'})
+        self.api_key_patcher.start()
+        
+        ClaudeClientRegistry.reset()
+        self.addCleanup(ClaudeClientRegistry.reset)
+    
+    def tearDown(self):
+        """テストのクリーンアップ"""
+        self.api_key_patcher.stop()
+    
+    def test_get_client_returns_shared_instance(self):
+        """同一設定では同じクライアントを共有するテスト"""
+        from code.py.modules.ai_tagging_translation.claude_api_client import ClaudeClientRegistry
+        
+        first = ClaudeClientRegistry.get_client(self.config_manager, self.logger)
+        second = ClaudeClientRegistry.get_client(self.config_manager, self.logger)
+        
+        self.assertIs(first, second)
+        metrics = ClaudeClientRegistry.get_metrics()
+        self.assertEqual(metrics['clients_created'], 1)
+        self.assertEqual(metrics['client_reuses'], 1)
+    
+    def test_workflows_share_client(self):
+        """Tagger・Translate・OchiaiFormatが同じクライアントを使用するテスト"""
+        from code.py.modules.ai_tagging_translation.tagger_workflow import TaggerWorkflow
+        from code.py.modules.ai_tagging_translation.translate_workflow import TranslateWorkflow
+        from code.py.modules.ai_tagging_translation.ochiai_format_workflow import OchiaiFormatWorkflow
+        
+        self.config_manager.config = {}
+        
+        tagger = TaggerWorkflow(self.config_manager, self.logger)
+        translate = TranslateWorkflow(self.config_manager, self.logger)
+        ochiai = OchiaiFormatWorkflow(self.config_manager, self.logger)
+        
+        self.assertIs(tagger.claude_client, translate.claude_client)
+        self.assertIs(tagger.claude_client, ochiai.claude_client)
+    
+    @patch('anthropic.Anthropic')
+    def test_rate_limit_shared_across_clients(self, mock_anthropic):
+        """レート制限が全クライアントで共有されるテスト"""
+        from code.py.modules.ai_tagging_translation.claude_api_client import ClaudeAPIClient, ClaudeClientRegistry
+        
+        mock_response = Mock()
+        mock_response.content = [Mock(text='ok')]
+        mock_anthropic.return_value.messages.create.return_value = mock_response
+        
+        client_a = ClaudeAPIClient(self.config_manager, self.logger)
+        client_b = ClaudeAPIClient(self.config_manager, self.logger)
+        
+        client_a.send_request("prompt a")
+        client_b.send_request("prompt b")
+        
+        self.assertIs(client_a.rate_limiter, client_b.rate_limiter)
+        metrics = ClaudeClientRegistry.get_metrics()
+        self.assertEqual(metrics['requests'], 2)
+        self.assertEqual(metrics['rate_limit_waits'], 1)
+    
+    def test_connection_reuse_metrics(self):
+        """接続再利用率の集計テスト"""
+        from code.py.modules.ai_tagging_translation.claude_api_client import ClaudeClientRegistry
+        
+        ClaudeClientRegistry.record_request(1)
+        ClaudeClientRegistry.record_request(0)
+        ClaudeClientRegistry.record_request(0)
+        ClaudeClientRegistry.record_request(None)
+        
+        metrics = ClaudeClientRegistry.get_metrics()
+        self.assertEqual(metrics['requests'], 4)
+        self.assertEqual(metrics['new_connections'], 1)
+        self.assertEqual(metrics['reused_connections'], 2)
+        self.assertAlmostEqual(metrics['connection_reuse_rate'], 2 / 3)
+    
+    @patch('anthropic.Anthropic')
+    def test_connection_trace_counts_new_connections(self, mock_anthropic):
+        """httpxのtraceイベントで新規接続・接続再利用を判定するテスト"""
+        from code.py.modules.ai_tagging_translation.claude_api_client import ClaudeAPIClient, ClaudeClientRegistry
+        
+        client = ClaudeAPIClient(self.config_manager, self.logger)
+        client._connection_tracking = True
+        
+        previous_trace = Mock()
+        request = Mock(extensions={'trace': previous_trace})
+        client._trace_connections(request)
+        trace = request.extensions['trace']
+        
+        mock_response = Mock()
+        mock_response.content = [Mock(text='ok')]
+        
+        calls = []
+        
+        def create(**kwargs):
+            # 1回目のみ新規接続を確立し、2回目は既存接続を再利用
+            if not calls:
+                trace('connection.connect_tcp.started', {})
+                trace('connection.connect_tcp.complete', {})
+                trace('connection.start_tls.complete', {})
+            calls.append(kwargs)
+            return mock_response
+        
+        mock_anthropic.return_value.messages.create.side_effect = create
+        client.send_request("first prompt")
+        client.send_request("second prompt")
+        
+        metrics = ClaudeClientRegistry.get_metrics()
+        self.assertEqual(metrics['requests'], 2)
+        self.assertEqual(metrics['new_connections'], 1)
+        self.assertEqual(metrics['reused_connections'], 1)
+        self.assertEqual(previous_trace.call_count, 3)
+
+
+class TestClaudeAPIClientModelRouting(unittest.TestCase):
+    """高速モデル優先・低品質時エスカレーションのルーティングテスト"""
+
+    def setUp(self):
+        """テストのセットアップ"""
+        from code.py.modules.ai_tagging_translation.claude_api_client import ClaudeClientRegistry
+
+        self.config_manager = Mock(spec=ConfigManager)
+        self.logger = Mock(spec=IntegratedLogger)
+        self.logger.get_logger.return_value = Mock()
+
+        self.config_manager.get_ai_setting.side_effect = lambda *keys, default=None: {
+            ('default_model',): 'fast-model',
+            ('api_key_env',): 'ANTHROPIC_API_KEY',
+            ('model_routing', 'escalation_model'): 'strong-model',
+            ('model_routing', 'quality_threshold'): 0.6,
+        }.get(keys, default)
+        self.config_manager.get_api_setting.side_effect = lambda key, default=None: {
+            'timeout': 30,
+            'max_retries': 0,
+            'request_delay': 0
+        }.get(key, default)
+
+        self.api_key_patcher = patch.dict(os.environ, {'ANTHROPIC_API_KEY': 'test-api-key'})
+        self.api_key_patcher.start()
+
+        ClaudeClientRegistry.reset()
+        self.addCleanup(ClaudeClientRegistry.reset)
+
+    def tearDown(self):
+        """テストのクリーンアップ"""
+        self.api_key_patcher.stop()
+
+    def _mock_responses(self, mock_anthropic, texts_by_model):
+        def create(**kwargs):
+            response = Mock()
+            response.content = [Mock(text=texts_by_model[kwargs['model']])]
+            return response
+        mock_anthropic.return_value.messages.create.side_effect = create
+
+    @patch('anthropic.Anthropic')
+    def test_high_quality_response_is_not_escalated(self, mock_anthropic):
+        """品質スコアが閾値以上なら高速モデルの結果をそのまま返す"""
+        from code.py.modules.ai_tagging_translation.claude_api_client import ClaudeAPIClient, ClaudeClientRegistry
+
+        self._mock_responses(mock_anthropic, {'fast-model': 'good', 'strong-model': 'better'})
+
+        client = ClaudeAPIClient(self.config_manager, self.logger)
+        response = client.send_request("prompt", quality_evaluator=lambda text: 0.9, task='tagger')
+
+        self.assertEqual(response, 'good')
+        self.assertEqual(mock_anthropic.return_value.messages.create.call_count, 1)
+        metrics = ClaudeClientRegistry.get_metrics()
+        self.assertEqual(metrics['routed_requests'], 1)
+        self.assertEqual(metrics['escalations'], 0)
+
+    @patch('anthropic.Anthropic')
+    def test_low_quality_response_is_escalated(self, mock_anthropic):
+        """品質スコアが閾値未満なら上位モデルで再送信する"""
+        from code.py.modules.ai_tagging_translation.claude_api_client import ClaudeAPIClient, ClaudeClientRegistry
+
+        self._mock_responses(mock_anthropic, {'fast-model': 'poor', 'strong-model': 'better'})
+        scores = {'poor': 0.3, 'better': 0.8}
+
+        client = ClaudeAPIClient(self.config_manager, self.logger)
+        response = client.send_request("prompt", quality_evaluator=scores.get, task='translate_abstract')
+
+        self.assertEqual(response, 'better')
+        models = [kwargs['model'] for _, kwargs in mock_anthropic.return_value.messages.create.call_args_list]
+        self.assertEqual(models, ['fast-model', 'strong-model'])
+
+        metrics = ClaudeClientRegistry.get_metrics()
+        self.assertEqual(metrics['escalation_rate'], 1.0)
+        self.assertEqual(metrics['routing_by_task']['translate_abstract']['escalations'], 1)
+
+    @patch('anthropic.Anthropic')
+    def test_escalated_response_kept_only_if_not_worse(self, mock_anthropic):
+        """上位モデルの結果が劣る場合は高速モデルの結果を返す"""
+        from code.py.modules.ai_tagging_translation.claude_api_client import ClaudeAPIClient
+
+        self._mock_responses(mock_anthropic, {'fast-model': 'poor', 'strong-model': 'worse'})
+        scores = {'poor': 0.4, 'worse': 0.2}
+
+        client = ClaudeAPIClient(self.config_manager, self.logger)
+        self.assertEqual(client.send_request("prompt", quality_evaluator=scores.get), 'poor')
+
+    @patch('anthropic.Anthropic')
+    def test_routing_disabled(self, mock_anthropic):
+        """ルーティング無効時は品質評価を行わない"""
+        from code.py.modules.ai_tagging_translation.claude_api_client import ClaudeAPIClient
+
+        self.config_manager.get_ai_setting.side_effect = lambda *keys, default=None: {
+            ('default_model',): 'fast-model',
+            ('api_key_env',): 'ANTHROPIC_API_KEY',
+            ('model_routing', 'enabled'): False,
+        }.get(keys, default)
+        self._mock_responses(mock_anthropic, {'fast-model': 'poor'})
+        evaluator = Mock(return_value=0.0)
+
+        client = ClaudeAPIClient(self.config_manager, self.logger)
+        self.assertEqual(client.send_request("prompt", quality_evaluator=evaluator), 'poor')
+        evaluator.assert_not_called()
+
 
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
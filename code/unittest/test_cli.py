@@ -267,4 +267,42 @@ class TestCLIErrorHandling:
 
 
 if __name__ == '__main__':
-    pytest.main([__file__, '-v'])
\ No newline at end of file
+    pytest.main([__file__, '-v'])
+
+class TestCLIReleaseQuarantine:
+    """Test releasing quarantined AI jobs"""
+    
+    def test_release_quarantined_translate_job(self):
+        """IntegratedWorkflowで隔離されたtranslateジョブをCLIから解除できることを確認"""
+        from code.py.cli import release_quarantined_jobs
+        from code.py.modules.shared_modules.config_manager import ConfigManager
+        from code.py.modules.shared_modules.integrated_logger import IntegratedLogger
+        from code.py.modules.integrated_workflow.integrated_workflow import IntegratedWorkflow
+        from code.py.modules.ai_tagging_translation.ai_job_queue import AIJobQueue
+        from code.py.modules.ai_tagging_translation.translate_workflow import TranslateWorkflow
+        
+        with tempfile.TemporaryDirectory() as tmpdir, \
+                patch.dict(os.environ, {'ANTHROPIC_API_KEY': 'test-api-key'}), \
+                patch.object(TranslateWorkflow, 'translate_abstract_single', side_effect=RuntimeError("API error")):
+            workspace_path = Path(tmpdir)
+            paper_dir = workspace_path / "Clippings" / "smith2023"
+            paper_dir.mkdir(parents=True)
+            (paper_dir / "smith2023.md").write_text(
+                "---\ncitation_key: smith2023\nprocessing_status:\n  translate_abstract: pending\n---\n\n"
+                "## Abstract\n\nText.\n", encoding='utf-8')
+            
+            config_manager = ConfigManager()
+            logger = IntegratedLogger(config_manager)
+            workflow = IntegratedWorkflow(config_manager, logger, MagicMock())
+            max_attempts = config_manager.get_ai_setting('job_queue', 'max_attempts', default=3)
+            for _ in range(max_attempts):
+                workflow._execute_translate(workspace_path, ['smith2023'])
+            
+            queue = AIJobQueue(config_manager, logger, str(workspace_path / "Clippings"))
+            assert queue.is_quarantined('translate_abstract', 'smith2023')
+            assert not (workspace_path / AIJobQueue.JOURNAL_FILE_NAME).exists()
+            
+            release_quarantined_jobs(config_manager, logger, workspace_path, 'translate_abstract:smith2023')
+            
+            queue = AIJobQueue(config_manager, logger, str(workspace_path / "Clippings"))
+            assert not queue.is_quarantined('translate_abstract', 'smith2023')
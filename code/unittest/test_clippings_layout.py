@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+ClippingsLayout テストスイート
+
+Clippingsディレクトリのレイアウト解決のテスト。
+- シャード名・パス構築
+- 混在レイアウトの列挙と検索
+- 既存Vaultの移行
+- StatusManager・SyncCheckerからのシャード配置論文の参照
+"""
+
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+from unittest.mock import Mock
+
+from code.py.modules.shared_modules.clippings_layout import ClippingsLayout
+from code.py.modules.shared_modules.exceptions import FileSystemError
+from code.py.modules.status_management_yaml.status_manager import StatusManager
+from code.py.modules.sync_checker.sync_checker import SyncChecker
+
+
+class TestClippingsLayout(unittest.TestCase):
+    """ClippingsLayoutクラスのテストケース"""
+
+    def setUp(self):
+        """テスト環境の初期化"""
+        self.test_dir = Path(tempfile.mkdtemp(prefix="ClippingsLayout_Test_"))
+        self.clippings_dir = self.test_dir / "Clippings"
+        self.clippings_dir.mkdir()
+
+        self.mock_logger = Mock()
+        self.mock_logger.get_logger.return_value = Mock()
+
+    def tearDown(self):
+        """テスト環境のクリーンアップ"""
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def _create_layout(self, scheme, prefix_length=2):
+        config_manager = Mock()
+        config_manager.get_config.return_value = {
+            'clippings_layout': {'scheme': scheme, 'prefix_length': prefix_length}
+        }
+        return ClippingsLayout(config_manager, self.mock_logger), config_manager
+
+    def _write_paper(self, relative_dir, citation_key, doi="10.1234/test"):
+        paper_dir = self.clippings_dir / relative_dir
+        paper_dir.mkdir(parents=True, exist_ok=True)
+        md_file = paper_dir / f"{citation_key}.md"
+        md_file.write_text(f"---\ncitation_key: {citation_key}\ndoi: {doi}\n---\n\n# {citation_key}\n",
+                           encoding='utf-8')
+        return md_file
+
+    def test_markdown_path_per_scheme(self):
+        """方式ごとのシャード名とパス構築を確認"""
+        flat, _ = self._create_layout('flat')
+        self.assertEqual(flat.markdown_path(self.clippings_dir, "Smith2023"),
+                         self.clippings_dir / "Smith2023" / "Smith2023.md")
+
+        prefix, _ = self._create_layout('key_prefix', prefix_length=3)
+        self.assertEqual(prefix.markdown_path(self.clippings_dir, "Smith2023"),
+                         self.clippings_dir / "smi" / "Smith2023" / "Smith2023.md")
+
+        year, _ = self._create_layout('year')
+        self.assertEqual(year.paper_dir(self.clippings_dir, "smith2023", "2023-05"),
+                         self.clippings_dir / "2023" / "smith2023")
+        self.assertEqual(year.paper_dir(self.clippings_dir, "smith2023"),
+                         self.clippings_dir / "undated" / "smith2023")
+
+        unknown, _ = self._create_layout('by_author')
+        self.assertEqual(unknown.scheme, 'flat')
+
+    def test_scan_and_find_mixed_layout(self):
+        """移行途中の混在レイアウトから論文を列挙・検索できることを確認"""
+        self._write_paper("tanaka2021", "tanaka2021")
+        sharded = self._write_paper("2023/smith2023", "smith2023")
+        (self.clippings_dir / "unorganized.md").write_text("---\ntitle: x\n---\n", encoding='utf-8')
+        layout, _ = self._create_layout('key_prefix')
+
+        paper_dirs, loose_files = layout.scan(self.clippings_dir)
+        self.assertEqual([paper_dir.name for paper_dir, _ in paper_dirs], ["smith2023", "tanaka2021"])
+        self.assertEqual([md.name for md in loose_files], ["unorganized.md"])
+
+        self.assertEqual(layout.find_markdown_file(self.clippings_dir, "smith2023"), sharded)
+        self.assertEqual(layout.find_paper_dir(self.clippings_dir, "tanaka2021"),
+                         self.clippings_dir / "tanaka2021")
+        self.assertIsNone(layout.find_markdown_file(self.clippings_dir, "missing2020"))
+
+        self.assertEqual(layout.citation_key_from_path(sharded, self.clippings_dir), "smith2023")
+        self.assertIsNone(layout.citation_key_from_path(loose_files[0], self.clippings_dir))
+
+    def test_migrate_to_year_and_back(self):
+        """flat → year → flatの移行と空シャードの削除を確認"""
+        self._write_paper("smith2023", "smith2023")
+        self._write_paper("tanaka2021", "tanaka2021")
+        self._write_paper("nodate2000", "nodate2000")
+        years = {'smith2023': 2023, 'tanaka2021': '2021'}
+
+        year_layout, _ = self._create_layout('year')
+        plan = year_layout.migrate(self.clippings_dir, years, dry_run=True)
+        self.assertEqual(len(plan['moves']), 3)
+        self.assertTrue((self.clippings_dir / "smith2023").exists())
+
+        result = year_layout.migrate(self.clippings_dir, years)
+        self.assertEqual(result['moved'], 3)
+        self.assertTrue((self.clippings_dir / "2023" / "smith2023" / "smith2023.md").exists())
+        self.assertTrue((self.clippings_dir / "undated" / "nodate2000" / "nodate2000.md").exists())
+
+        # 再実行は移動なし
+        self.assertEqual(year_layout.migrate(self.clippings_dir, years)['in_place'], 3)
+
+        # 移行と無関係な空ディレクトリ（シャード名と同じ形式）は削除しない
+        (self.clippings_dir / "drafts").mkdir()
+        (self.clippings_dir / "1999").mkdir()
+
+        flat_layout, _ = self._create_layout('flat')
+        result = flat_layout.migrate(self.clippings_dir)
+        self.assertEqual(result['moved'], 3)
+        self.assertEqual(sorted(result['removed_shards']), ["2021", "2023", "undated"])
+        self.assertEqual(sorted(p.name for p in self.clippings_dir.iterdir()),
+                         ["1999", "drafts", "nodate2000", "smith2023", "tanaka2021"])
+
+    def test_migrate_reports_conflicts(self):
+        """移動先が既に存在する論文は移動せず衝突として報告することを確認"""
+        self._write_paper("smith2023", "smith2023")
+        self._write_paper("sm/smith2023", "smith2023", doi="10.1234/other")
+        layout, _ = self._create_layout('key_prefix')
+
+        result = layout.migrate(self.clippings_dir)
+        self.assertEqual(result['moved'], 0)
+        self.assertEqual(result['in_place'], 1)
+        self.assertEqual(len(result['conflicts']), 1)
+        self.assertTrue((self.clippings_dir / "smith2023" / "smith2023.md").exists())
+
+        with self.assertRaises(FileSystemError):
+            layout.migrate(self.test_dir / "NoSuchClippings")
+
+    def test_status_manager_and_sync_resolve_sharded_papers(self):
+        """StatusManager・SyncCheckerがシャード配置の論文を参照できることを確認"""
+        md_file = self._write_paper("sm/smith2023", "smith2023")
+        _, config_manager = self._create_layout('key_prefix')
+
+        status_manager = StatusManager(config_manager, self.mock_logger)
+        self.assertEqual(status_manager._find_markdown_file(str(self.clippings_dir), "smith2023"), str(md_file))
+
+        bibtex_file = self.test_dir / "CurrentManuscript.bib"
+        bibtex_file.write_text("@article{smith2023,\n    title = {smith2023},\n    doi = {10.1234/test}\n}\n",
+                               encoding='utf-8')
+        sync_checker = SyncChecker(config_manager, self.mock_logger)
+        result = sync_checker.check_workspace_consistency(
+            str(self.test_dir), str(bibtex_file), str(self.clippings_dir)
+        )
+        self.assertEqual(result['missing_markdown_files'], [])
+        self.assertEqual(result['orphaned_markdown_files'], [])
+
+
+if __name__ == '__main__':
+    unittest.main()
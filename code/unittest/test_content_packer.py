@@ -0,0 +1,87 @@
+"""
+ContentPacker のユニットテスト
+
+トークン推定とトークン予算付きセクション詰め込みをテストします。
+"""
+
+import unittest
+from unittest.mock import Mock
+
+from code.py.modules.shared_modules.config_manager import ConfigManager
+from code.py.modules.shared_modules.integrated_logger import IntegratedLogger
+from code.py.modules.ai_tagging_translation.content_packer import ContentPacker, estimate_tokens
+
+
+class TestEstimateTokens(unittest.TestCase):
+    """トークン推定テスト"""
+    
+    def test_empty_text(self):
+        """空文字列は0トークン"""
+        self.assertEqual(estimate_tokens(""), 0)
+    
+    def test_english_words(self):
+        """英単語は約4文字/トークン"""
+        self.assertEqual(estimate_tokens("the cat"), 2)
+        self.assertEqual(estimate_tokens("immunohistochemistry"), 5)
+    
+    def test_numbers_and_symbols(self):
+        """数字列は約3桁/トークン、記号は1トークン"""
+        self.assertEqual(estimate_tokens("2023"), 2)
+        self.assertEqual(estimate_tokens("95.5%"), 4)
+    
+    def test_japanese_characters(self):
+        """CJK文字は1文字/トークン"""
+        self.assertEqual(estimate_tokens("口腔癌の予後。"), 6 + 1)
+
+
+class TestContentPacker(unittest.TestCase):
+    """ContentPackerの詰め込み機能テスト"""
+    
+    def setUp(self):
+        """テストのセットアップ"""
+        self.config_manager = Mock(spec=ConfigManager)
+        self.logger = Mock(spec=IntegratedLogger)
+        self.logger.get_logger.return_value = Mock()
+        self.packer = ContentPacker(self.config_manager, self.logger)
+        
+        self.blocks = [
+            {'section_type': 'introduction', 'text': "## Introduction\n" + "Cancer is common. " * 100},
+            {'section_type': 'results', 'text': "## Results\n" + "KRT13 was high. " * 100},
+            {'section_type': 'discussion', 'text': "## Discussion\nShort discussion."}
+        ]
+    
+    def test_pack_within_budget_keeps_document_order(self):
+        """予算内では全セクションを文書順で連結"""
+        packed = self.packer.pack_sections(self.blocks, ['results', 'introduction', 'discussion'],
+                                           100000, header="# Title")
+        
+        expected = '\n\n'.join(["# Title"] + [block['text'] for block in self.blocks])
+        self.assertEqual(packed['content'], expected)
+        self.assertEqual(packed['included_sections'], ['results', 'introduction', 'discussion'])
+        self.assertEqual(packed['truncated_sections'], [])
+        self.assertEqual(packed['tokens'], estimate_tokens(expected))
+    
+    def test_pack_respects_priority_and_budget(self):
+        """予算超過時は低優先度セクションを切り詰め・省略"""
+        results_tokens = estimate_tokens(self.blocks[1]['text'])
+        budget = results_tokens + 80
+        
+        packed = self.packer.pack_sections(self.blocks, ['results', 'discussion', 'introduction'], budget)
+        
+        self.assertLessEqual(packed['tokens'], budget)
+        self.assertEqual(packed['included_sections'], ['results', 'discussion'])
+        self.assertIn('introduction', packed['truncated_sections'] + packed['omitted_sections'])
+        self.assertTrue(packed['content'].index('## Results') < packed['content'].index('## Discussion'))
+    
+    def test_truncate_to_budget_cuts_at_sentence_boundary(self):
+        """文境界での切り詰め"""
+        text = "First sentence here. Second sentence here. Third sentence here."
+        
+        truncated = self.packer.truncate_to_budget(text, 8)
+        
+        self.assertEqual(truncated, "First sentence here. ...")
+        self.assertEqual(self.packer.truncate_to_budget(text, 1000), text)
+
+
+if __name__ == '__main__':
+    unittest.main()
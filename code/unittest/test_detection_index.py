@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""Test Publisher Detection Index"""
+
+import os
+import sys
+import random
+import unittest
+
+# Add project root to Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from code.py.modules.citation_pattern_normalizer.detection_index import (
+    DoiPrefixTrie, KeywordMatcher, PublisherDetectionIndex
+)
+
+
+def sequential_doi_match(publisher_parsers, doi):
+    """Reference implementation: scan parsers and prefixes in order"""
+    for parser_name, parser_config in publisher_parsers.items():
+        for prefix in parser_config.get('detection', {}).get('doi_prefixes', []):
+            if doi.startswith(prefix):
+                return parser_name
+    return None
+
+
+def sequential_keyword_match(publisher_parsers, title, journal):
+    """Reference implementation: scan parsers and keywords in order"""
+    for parser_name, parser_config in publisher_parsers.items():
+        for keyword in parser_config.get('detection', {}).get('journal_keywords', []):
+            if keyword.lower() in title.lower() or keyword.lower() in journal.lower():
+                return parser_name
+    return None
+
+
+class TestDoiPrefixTrie(unittest.TestCase):
+    """Test DOI prefix trie"""
+
+    def test_first_registered_parser_wins(self):
+        """Test the highest-priority prefix along the DOI path is returned"""
+        trie = DoiPrefixTrie()
+        trie.insert('10.1016/j.cell', (1, 'cell_press'))
+        trie.insert('10.1016', (0, 'elsevier'))
+        trie.insert('10.1038', (2, 'nature'))
+
+        self.assertEqual(trie.match('10.1016/j.cell.2020.01.001'), (0, 'elsevier', '10.1016'))
+        self.assertEqual(trie.match('10.1038/s41586'), (2, 'nature', '10.1038'))
+        self.assertIsNone(trie.match('10.1101/2020.01.01'))
+        self.assertIsNone(trie.match(''))
+
+
+class TestKeywordMatcher(unittest.TestCase):
+    """Test Aho-Corasick keyword matcher"""
+
+    def test_overlapping_keywords(self):
+        """Test keywords found through failure links are reported"""
+        matcher = KeywordMatcher()
+        matcher.add('nature', (1, 'nature'))
+        matcher.add('ature re', (0, 'other'))
+        matcher.add('science', (2, 'science'))
+
+        self.assertEqual(matcher.search('signature research'), (0, 'other', 'ature re'))
+        self.assertEqual(matcher.search('nature cell biology'), (1, 'nature', 'nature'))
+        self.assertEqual(matcher.search('advanced science news'), (2, 'science', 'science'))
+        self.assertIsNone(matcher.search('journal of radiation research'))
+
+
+class TestPublisherDetectionIndex(unittest.TestCase):
+    """Test detection index against a sequential scan"""
+
+    def test_matches_sequential_scan(self):
+        """Test index results equal the sequential parser scan"""
+        rng = random.Random(7)
+        alphabet = 'abcde .'
+        publisher_parsers = {}
+        for i in range(30):
+            publisher_parsers[f'publisher_{i}'] = {
+                'detection': {
+                    'doi_prefixes': [f"10.{rng.randint(1000, 1040)}" + rng.choice(['', '/j', '/s'])
+                                     for _ in range(rng.randint(0, 3))],
+                    'journal_keywords': [''.join(rng.choice(alphabet) for _ in range(rng.randint(2, 5))).title()
+                                         for _ in range(rng.randint(0, 4))]
+                }
+            }
+        index = PublisherDetectionIndex(publisher_parsers)
+
+        for _ in range(500):
+            doi = f"10.{rng.randint(1000, 1045)}" + rng.choice(['', '/j.x', '/s4', '/abc'])
+            match = index.match_doi(doi)
+            self.assertEqual(match[0] if match else None, sequential_doi_match(publisher_parsers, doi))
+
+            title = ''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 30)))
+            journal = ''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 12))).upper()
+            match = index.match_keywords(title, journal)
+            self.assertEqual(match[0] if match else None,
+                             sequential_keyword_match(publisher_parsers, title, journal))
+
+    def test_empty_keyword_matches_everything(self):
+        """Test an empty keyword behaves like a substring check"""
+        index = PublisherDetectionIndex({
+            'first': {'detection': {'journal_keywords': ['Oxford']}},
+            'catch_all': {'detection': {'journal_keywords': ['']}}
+        })
+
+        self.assertEqual(index.match_keywords('Oxford Journal', ''), ('first', 'oxford'))
+        self.assertEqual(index.match_keywords('', ''), ('catch_all', ''))
+
+
+if __name__ == '__main__':
+    unittest.main()
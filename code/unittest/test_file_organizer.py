@@ -31,6 +31,7 @@ IMPORT_ERROR = None
 
 try:
     from code.py.modules.file_organizer.file_organizer import FileOrganizer
+    from code.py.modules.shared_modules.file_utils import BackupManager
     IMPORTS_AVAILABLE = True
 except ImportError as e:
     IMPORT_ERROR = str(e)
@@ -227,6 +228,73 @@ processing_status:
         files_in_target = list(target_dir.glob("*.md"))
         self.assertGreaterEqual(len(files_in_target), 2)  # 最低2つのファイルが存在
 
+    
+    @unittest.skipIf(not IMPORTS_AVAILABLE, f"Import failed: {IMPORT_ERROR if not IMPORTS_AVAILABLE else ''}")
+    def test_organize_file_rename_move(self):
+        """リネームによる移動で本文がコピーされずヘッダーのみ更新されることを確認"""
+        organizer = FileOrganizer(self.mock_config, self.mock_logger)
+        
+        source_file = self.clippings_dir / "smith2024a_paper.md"
+        body = "\n# Test Paper\n\n![[figure.png]]\n" + "large body line\n" * 1000
+        source_file.write_text("---\ncitation_key: smith2024a\nprocessing_status:\n  organize: pending\n---" + body,
+                               encoding='utf-8')
+        
+        self.assertTrue(organizer.organize_file(str(source_file), str(self.clippings_dir)))
+        
+        target_file = self.clippings_dir / "smith2024a" / "smith2024a.md"
+        self.assertFalse(source_file.exists())
+        self.assertTrue(target_file.read_bytes().endswith(body.encode('utf-8')))
+        yaml_header = organizer.yaml_processor.parse_yaml_header_only(target_file)
+        self.assertEqual(yaml_header['processing_status']['organize'], 'completed')
+        self.assertEqual(yaml_header['workflow_version'], '3.2')
+        
+        # 以降のヘッダー更新は確保した余白内でその場更新（ファイルの書き直しなし）
+        inode = target_file.stat().st_ino
+        self.assertTrue(organizer.yaml_processor.patch_yaml_header(
+            target_file, organizer._organize_header_updater('smith2024a')))
+        self.assertEqual(target_file.stat().st_ino, inode)
+        self.assertTrue(target_file.read_bytes().endswith(body.encode('utf-8')))
+    
+    @unittest.skipIf(not IMPORTS_AVAILABLE, f"Import failed: {IMPORT_ERROR if not IMPORTS_AVAILABLE else ''}")
+    def test_reorganize_placed_file_keeps_backup_intact(self):
+        """配置済み論文の再organizeでバックアップ（非圧縮ストア）がヘッダー更新に巻き込まれないことを確認"""
+        self.mock_config.get_config.return_value = {'workflows': {'organize': {'handle_duplicates': False}}}
+        organizer = FileOrganizer(self.mock_config, self.mock_logger)
+        backup_config = Mock()
+        backup_config.get_config.return_value = {'backup_settings': {'compression': 'none'}}
+        organizer.backup_manager = BackupManager(backup_dir=self.test_dir / "backups", config_manager=backup_config)
+
+        target_file = self.clippings_dir / "smith2024a" / "smith2024a.md"
+        target_file.parent.mkdir()
+        original = ("---\ncitation_key: smith2024a\nprocessing_status:\n  organize: pending\n"
+                    + " " * 200 + "\n---\n# Test Paper\n").encode('utf-8')
+        target_file.write_bytes(original)
+
+        self.assertTrue(organizer.organize_file(str(target_file), str(self.clippings_dir)))
+
+        backups = [path for path in (self.test_dir / "backups").rglob("*")
+                   if path.is_file() and path.read_bytes() == original]
+        self.assertEqual(len(backups), 1)
+        self.assertEqual(organizer.yaml_processor.parse_yaml_header_only(target_file)['processing_status']['organize'],
+                         'completed')
+
+    @unittest.skipIf(not IMPORTS_AVAILABLE, f"Import failed: {IMPORT_ERROR if not IMPORTS_AVAILABLE else ''}")
+    def test_organize_file_rewrite_strategy(self):
+        """move_strategy: rewrite で従来方式の書き直しが行われることを確認"""
+        self.mock_config.get_config.return_value = {'workflows': {'organize': {'move_strategy': 'rewrite'}}}
+        organizer = FileOrganizer(self.mock_config, self.mock_logger)
+        self.assertFalse(organizer.rename_moves)
+        
+        source_file = self.clippings_dir / "smith2024a_paper.md"
+        source_file.write_text("---\ncitation_key: smith2024a\n---\n# Test Paper\n", encoding='utf-8')
+        inode = source_file.stat().st_ino
+        
+        self.assertTrue(organizer.organize_file(str(source_file), str(self.clippings_dir)))
+        
+        target_file = self.clippings_dir / "smith2024a" / "smith2024a.md"
+        self.assertNotEqual(target_file.stat().st_ino, inode)
+        self.assertIn("organize: completed", target_file.read_text(encoding='utf-8'))
+
 
 class TestFileOrganizerIntegration(unittest.TestCase):
     """FileOrganizer統合テスト"""
@@ -298,6 +366,67 @@ processing_status:
             content = target_file.read_text(encoding='utf-8')
             self.assertIn("organize: completed", content)
     
+    @unittest.skipIf(not IMPORTS_AVAILABLE, f"Import failed: {IMPORT_ERROR if not IMPORTS_AVAILABLE else ''}")
+    def test_organize_workspace_title_fallback(self):
+        """DOIがない・不正なファイルがタイトル索引で照合されることを確認"""
+        bibtex_file = self.test_dir / "CurrentManuscript.bib"
+        bibtex_file.write_text("""@article{smith2023,
+    title = {KRT13 promotes stemness and drives metastasis in breast cancer},
+    author = {Smith, John},
+    journal = {Test Journal},
+    year = {2023},
+    doi = {10.1234/smith.2023}
+}
+
+@article{jones2022,
+    title = {Keratin {Profiling} by Single-Cell {RNA}-Sequencing Identifies Prostate Stem Cells},
+    author = {Jones, Jane},
+    journal = {Test Journal},
+    year = {2022},
+    doi = {10.1234/jones.2022}
+}
+""", encoding='utf-8')
+        (self.clippings_dir / "smith.md").write_text(
+            '---\ntitle: "KRT13 promotes stemness"\ndoi: "https://doi.org/10.1234/SMITH.2023"\n---\n\nBody\n',
+            encoding='utf-8')
+        (self.clippings_dir / "Keratin profiling by single-cell RNA-sequencing identifies prostate stem cells.md").write_text(
+            '---\ndoi: "not available"\n---\n\nBody\n', encoding='utf-8')
+        (self.clippings_dir / "unrelated.md").write_text(
+            '---\ntitle: "Completely different topic about soil bacteria"\n---\n\nBody\n', encoding='utf-8')
+        
+        organizer = FileOrganizer(self.mock_config, self.mock_logger)
+        results = organizer.organize_workspace(str(self.test_dir), str(bibtex_file), str(self.clippings_dir))
+        
+        self.assertEqual(results['processed_papers'], 2)
+        self.assertEqual(results['title_matched_papers'], 1)
+        self.assertTrue((self.clippings_dir / "smith2023" / "smith2023.md").exists())
+        self.assertTrue((self.clippings_dir / "jones2022" / "jones2022.md").exists())
+        self.assertEqual(results['skipped_papers']['missing_in_clippings'], [])
+        no_doi = results['skipped_papers']['no_doi_in_markdown']
+        self.assertEqual([Path(item['file_path']).name for item in no_doi], ["unrelated.md"])
+        self.assertTrue((self.test_dir / ".paper_index.json").exists())
+
+    @unittest.skipIf(not IMPORTS_AVAILABLE, f"Import failed: {IMPORT_ERROR if not IMPORTS_AVAILABLE else ''}")
+    def test_organize_workspace_year_sharded_layout(self):
+        """year方式のレイアウトではBibTeXの出版年のシャード配下に整理されることを確認"""
+        self.mock_config.get_config.return_value = {'clippings_layout': {'scheme': 'year'}}
+        bibtex_file = self.test_dir / "CurrentManuscript.bib"
+        bibtex_file.write_text("@article{smith2023,\n    title = {Test},\n    year = {2023},\n"
+                               "    doi = {10.1234/smith.2023}\n}\n", encoding='utf-8')
+        (self.clippings_dir / "smith.md").write_text('---\ndoi: "10.1234/smith.2023"\n---\n\nBody\n',
+                                                     encoding='utf-8')
+
+        organizer = FileOrganizer(self.mock_config, self.mock_logger)
+        results = organizer.organize_workspace(str(self.test_dir), str(bibtex_file), str(self.clippings_dir))
+
+        self.assertEqual(results['processed_papers'], 1)
+        self.assertTrue((self.clippings_dir / "2023" / "smith2023" / "smith2023.md").exists())
+
+        # 再実行時は整理済みとして移動しない
+        results = organizer.organize_workspace(str(self.test_dir), str(bibtex_file), str(self.clippings_dir))
+        self.assertEqual(results['processed_papers'], 1)
+        self.assertEqual(organizer.get_organize_summary(self.clippings_dir)['directories'], ["smith2023"])
+
     @unittest.skipIf(not IMPORTS_AVAILABLE, f"Import failed: {IMPORT_ERROR if not IMPORTS_AVAILABLE else ''}")
     def test_organize_invalid_yaml_header(self):
         """無効なYAMLヘッダーファイルの処理テスト"""
@@ -324,5 +453,135 @@ processing_status:
         self.assertIsNotNone(result)
 
 
+
+class TestFileOrganizerTransaction(unittest.TestCase):
+    """organize_workspaceのジャーナル付き一括移動テスト"""
+    
+    BIBTEX = """@article{alpha2023,
+    title = {Alpha paper},
+    author = {Smith, John},
+    journal = {Test Journal},
+    year = {2023},
+    doi = {10.1234/alpha}
+}
+
+@article{beta2023,
+    title = {Beta paper},
+    author = {Smith, John},
+    journal = {Test Journal},
+    year = {2023},
+    doi = {10.1234/beta}
+}
+"""
+    
+    def setUp(self):
+        """テストセットアップ"""
+        self.test_dir = Path(TEST_BASE_DIR)
+        if self.test_dir.exists():
+            shutil.rmtree(self.test_dir)
+        self.clippings_dir = self.test_dir / "Clippings"
+        self.clippings_dir.mkdir(parents=True)
+        self.bibtex_file = self.test_dir / "CurrentManuscript.bib"
+        self.bibtex_file.write_text(self.BIBTEX, encoding='utf-8')
+        
+        self.sources = {}
+        for name, doi in (("Alpha paper.md", "10.1234/alpha"), ("Beta paper.md", "10.1234/beta")):
+            path = self.clippings_dir / name
+            path.write_text(f'---\ntitle: "{name[:-3]}"\ndoi: "{doi}"\nlast_updated: original\n---\n\nBody of {name}\n',
+                            encoding='utf-8')
+            self.sources[name] = path.read_text(encoding='utf-8')
+        
+        self.mock_config = Mock()
+        self.mock_logger = Mock()
+        self.mock_logger.get_logger.return_value = Mock()
+    
+    def tearDown(self):
+        """テストクリーンアップ"""
+        if self.test_dir.exists():
+            shutil.rmtree(self.test_dir)
+    
+    def _organize(self, organizer=None):
+        organizer = organizer or FileOrganizer(self.mock_config, self.mock_logger)
+        return organizer.organize_workspace(str(self.test_dir), str(self.bibtex_file), str(self.clippings_dir))
+    
+    def _interrupt_after_first_move(self, organizer):
+        original_apply = organizer._apply_move
+        calls = []
+        
+        def apply_move(move):
+            if calls:
+                raise KeyboardInterrupt()
+            calls.append(move)
+            original_apply(move)
+        
+        return patch.object(organizer, '_apply_move', side_effect=apply_move)
+    
+    @unittest.skipIf(not IMPORTS_AVAILABLE, f"Import failed: {IMPORT_ERROR if not IMPORTS_AVAILABLE else ''}")
+    def test_organize_workspace_commits_and_reruns_idempotently(self):
+        """一括移動後にジャーナルが残らず、再実行で移動・衝突回避名が発生しないことを確認"""
+        results = self._organize()
+        
+        self.assertEqual(results['processed_papers'], 2)
+        self.assertIsNone(results['recovered_transaction'])
+        self.assertFalse((self.clippings_dir / ".organize_journal.jsonl").exists())
+        self.assertTrue((self.clippings_dir / "alpha2023" / "alpha2023.md").exists())
+        
+        rerun = self._organize()
+        self.assertEqual(rerun['processed_papers'], 2)
+        self.assertEqual(sorted(p.name for p in self.clippings_dir.rglob("*.md")), ["alpha2023.md", "beta2023.md"])
+    
+    @unittest.skipIf(not IMPORTS_AVAILABLE, f"Import failed: {IMPORT_ERROR if not IMPORTS_AVAILABLE else ''}")
+    def test_duplicate_doi_gets_distinct_targets(self):
+        """同一DOIの複数ファイルが同じ移動先を上書きしないことを確認"""
+        duplicate = self.clippings_dir / "Alpha paper copy.md"
+        duplicate.write_text('---\ndoi: "10.1234/alpha"\n---\n\nCopy\n', encoding='utf-8')
+        
+        results = self._organize()
+        
+        self.assertEqual(results['processed_papers'], 3)
+        alpha_files = sorted(p.name for p in (self.clippings_dir / "alpha2023").glob("*.md"))
+        self.assertEqual(len(alpha_files), 2)
+        self.assertIn("alpha2023.md", alpha_files)
+    
+    @unittest.skipIf(not IMPORTS_AVAILABLE, f"Import failed: {IMPORT_ERROR if not IMPORTS_AVAILABLE else ''}")
+    def test_interrupted_organize_rolled_back(self):
+        """中断したorganizeをrollbackで元の配置・ヘッダーに戻せることを確認"""
+        organizer = FileOrganizer(self.mock_config, self.mock_logger)
+        with self._interrupt_after_first_move(organizer):
+            with self.assertRaises(KeyboardInterrupt):
+                self._organize(organizer)
+        self.assertTrue((self.clippings_dir / ".organize_journal.jsonl").exists())
+        
+        summary = organizer.recover_organize_transaction(str(self.clippings_dir), mode='rollback')
+        
+        self.assertEqual(summary['applied'], 1)
+        self.assertEqual(summary['failed'], [])
+        self.assertFalse((self.clippings_dir / ".organize_journal.jsonl").exists())
+        self.assertEqual(sorted(p.name for p in self.clippings_dir.iterdir()), sorted(self.sources))
+        for name, content in self.sources.items():
+            header = yaml.safe_load((self.clippings_dir / name).read_text(encoding='utf-8').split('---')[1])
+            self.assertEqual(header['last_updated'], 'original')
+            self.assertNotIn('citation_key', header)
+            self.assertNotIn('processing_status', header)
+            self.assertTrue((self.clippings_dir / name).read_text(encoding='utf-8').endswith(f"Body of {name}\n"))
+    
+    @unittest.skipIf(not IMPORTS_AVAILABLE, f"Import failed: {IMPORT_ERROR if not IMPORTS_AVAILABLE else ''}")
+    def test_interrupted_organize_replayed_on_next_run(self):
+        """中断したorganizeが次回実行時にreplayで完了することを確認"""
+        organizer = FileOrganizer(self.mock_config, self.mock_logger)
+        with self._interrupt_after_first_move(organizer):
+            with self.assertRaises(KeyboardInterrupt):
+                self._organize(organizer)
+        
+        results = self._organize()
+        
+        self.assertEqual(results['recovered_transaction']['mode'], 'replay')
+        self.assertEqual(results['recovered_transaction']['applied'], 1)
+        self.assertEqual(results['processed_papers'], 2)
+        self.assertFalse((self.clippings_dir / ".organize_journal.jsonl").exists())
+        for citation_key in ("alpha2023", "beta2023"):
+            content = (self.clippings_dir / citation_key / f"{citation_key}.md").read_text(encoding='utf-8')
+            self.assertIn("organize: completed", content)
+
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
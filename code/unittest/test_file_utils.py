@@ -449,6 +449,21 @@ class TestBackupUtilities(unittest.TestCase):
         except ImportError:
             self.skipTest("BackupManager not implemented yet")
     
+    def test_create_backup_with_hard_link(self):
+        """ハードリンクによるバックアップ作成テスト"""
+        from code.py.modules.shared_modules.file_utils import BackupManager
+        
+        backup_manager = BackupManager(self.test_dir / "backups")
+        backup_path = backup_manager.create_backup(self.source_file, link=True)
+        
+        self.assertEqual(Path(backup_path).stat().st_ino, self.source_file.stat().st_ino)
+        
+        # 置き換え後もバックアップは元の内容を保持
+        replacement = self.test_dir / "replacement.txt"
+        replacement.write_text("new content")
+        os.replace(replacement, self.source_file)
+        self.assertEqual(Path(backup_path).read_text(), "original content")
+    
     def test_restore_from_backup(self):
         """バックアップからのリストアテスト"""
         try:
@@ -484,6 +499,52 @@ class TestBackupUtilities(unittest.TestCase):
         except ImportError:
             self.skipTest("BackupManager not implemented yet")
 
+    def test_content_addressed_backup_and_restore_by_citation_key(self):
+        """設定指定時は内容アドレス型ストアに保存し、citation_keyでリストアできることを確認"""
+        from code.py.modules.shared_modules.file_utils import BackupManager
+
+        config_manager = Mock()
+        config_manager.get_config.return_value = {'backup_settings': {'store': 'content_addressed'}}
+        backup_manager = BackupManager(self.test_dir / "backups", config_manager=config_manager)
+
+        first = backup_manager.create_backup(self.source_file, backup_type="status_update", citation_key="smith2023")
+        second = backup_manager.create_backup(self.source_file, backup_type="status_update", citation_key="smith2023")
+        self.assertEqual(first, second)
+        self.assertEqual(backup_manager.list_backups(), [Path(first)])
+
+        self.source_file.write_text("modified content")
+        restored = backup_manager.restore_by_citation_key("smith2023")
+        self.assertEqual(restored, str(self.source_file.resolve()))
+        self.assertEqual(self.source_file.read_text(), "original content")
+
+        # オブジェクトパスを指定したリストア（圧縮オブジェクトの展開）
+        target = self.test_dir / "restored.txt"
+        self.assertTrue(backup_manager.restore_backup(first, target))
+        self.assertEqual(target.read_text(), "original content")
+
+        with self.assertRaises(Exception):
+            backup_manager.restore_by_citation_key("unknown2020")
+
+    def test_header_only_backup_restores_full_file(self):
+        """ヘッダーのみのバックアップからもオブジェクトパス指定で完全なファイルをリストアできることを確認"""
+        from code.py.modules.shared_modules.file_utils import BackupManager
+
+        config_manager = Mock()
+        config_manager.get_config.return_value = {'backup_settings': {'compression': 'none'}}
+        backup_manager = BackupManager(self.test_dir / "backups", config_manager=config_manager)
+        paper = self.test_dir / "smith2023.md"
+        body = "\n# Title\n" + "Body text.\n" * 100
+        paper.write_text("---\nstatus: pending\n---\n" + body)
+
+        backup_manager.create_backup(paper, backup_type="status_update", header_only=True)
+        paper.write_text("---\nstatus: completed\n---\n" + body)
+        delta = backup_manager.create_backup(paper, backup_type="status_update", header_only=True)
+        self.assertLess(Path(delta).stat().st_size, 100)
+
+        paper.write_text("---\nstatus: failed\n---\n" + body)
+        self.assertTrue(backup_manager.restore_backup(delta, paper))
+        self.assertEqual(paper.read_text(), "---\nstatus: completed\n---\n" + body)
+
 
 class TestStringUtils(unittest.TestCase):
     """文字列処理ユーティリティテスト"""
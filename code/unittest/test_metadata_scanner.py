@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+MetadataScanner テストスイート
+
+YAMLヘッダー指定フィールドの並列スキャン機能のテスト。
+"""
+
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+from unittest.mock import Mock
+
+from code.py.modules.status_management_yaml.metadata_scanner import MetadataScanner
+from code.py.modules.shared_modules.config_manager import ConfigManager
+from code.py.modules.shared_modules.integrated_logger import IntegratedLogger
+from code.py.modules.shared_modules.exceptions import YAMLError
+
+
+class TestMetadataScanner(unittest.TestCase):
+    """MetadataScannerクラスのテストケース"""
+
+    def setUp(self):
+        """テスト環境の初期化"""
+        self.test_dir = Path(tempfile.mkdtemp(prefix="MetadataScanner_Test_"))
+        self.config_manager = ConfigManager()
+        self.logger = IntegratedLogger(self.config_manager)
+        self.scanner = MetadataScanner(self.config_manager, self.logger)
+
+    def tearDown(self):
+        """テスト環境のクリーンアップ"""
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def _write(self, relative_path, content):
+        file_path = self.test_dir / relative_path
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_text(content, encoding='utf-8')
+        return file_path
+
+    def test_read_fields_skips_unrequested_blocks(self):
+        """要求フィールドのみ取得し、他のブロックは解析しないことを確認"""
+        file_path = self._write("paper.md", """---
+citation_key: smith2023
+citations:
+  1:
+    title: "unbalanced: [quote"
+    doi: 10.9999/other
+doi: 10.1234/Example.2023
+processing_status:
+  organize: completed
+  sync: pending
+---
+
+# Body
+doi: 10.0000/not-in-header
+""")
+
+        fields = self.scanner.read_fields(file_path, ['doi', 'processing_status'])
+
+        self.assertEqual(fields, {
+            'doi': '10.1234/Example.2023',
+            'processing_status': {'organize': 'completed', 'sync': 'pending'}
+        })
+        self.assertEqual(self.scanner.read_fields(file_path, ['missing']), {})
+
+    def test_read_fields_falls_back_to_full_header(self):
+        """ブロック単位で解析できない書式でもヘッダー全体の解析で取得できることを確認"""
+        file_path = self._write("paper.md", """---
+base: &doi_ref 10.1234/anchored
+doi: *doi_ref
+---
+""")
+
+        self.assertEqual(self.scanner.read_fields(file_path, ['doi']), {'doi': '10.1234/anchored'})
+
+    def test_read_fields_without_header(self):
+        """YAMLヘッダーがない・閉じていない場合にYAMLErrorとなることを確認"""
+        no_header = self._write("no_header.md", "# Just markdown\n")
+        unclosed = self._write("unclosed.md", "---\ndoi: 10.1234/x\n")
+
+        with self.assertRaises(YAMLError) as context:
+            self.scanner.read_fields(no_header, ['doi'])
+        self.assertEqual(context.exception.error_code, "NO_YAML_HEADER")
+
+        with self.assertRaises(YAMLError) as context:
+            self.scanner.read_fields(unclosed, ['doi'])
+        self.assertEqual(context.exception.error_code, "INCOMPLETE_YAML_HEADER")
+
+    def test_scan_directory_parallel_matches_serial(self):
+        """スレッドプール使用時も単一スレッドと同じ結果（入力順）になることを確認"""
+        for index in range(20):
+            self._write(f"paper{index:02d}/paper{index:02d}.md",
+                        f"---\ncitation_key: paper{index:02d}\ndoi: 10.1234/{index}\n---\n\nBody\n")
+        self._write("broken.md", "no header\n")
+        self._write("notes.txt", "---\ndoi: 10.1234/ignored\n---\n")
+
+        self.scanner.max_workers = 1
+        serial_metadata, serial_errors = self.scanner.scan_directory(self.test_dir, ['doi'])
+
+        self.scanner.max_workers = 4
+        self.scanner.min_parallel_files = 1
+        parallel_metadata, parallel_errors = self.scanner.scan_directory(self.test_dir, ['doi'])
+
+        self.assertEqual(len(serial_metadata), 20)
+        self.assertEqual(list(parallel_metadata.items()), list(serial_metadata.items()))
+        self.assertEqual(parallel_errors, serial_errors)
+        self.assertEqual(list(parallel_errors), [str(self.test_dir / "broken.md")])
+
+    def test_invalid_config_uses_defaults(self):
+        """設定が不正な場合にデフォルト値を使用することを確認"""
+        config_manager = Mock()
+        config_manager.get_config.return_value = {
+            'metadata_scanner': {'max_workers': 'many', 'min_parallel_files': None}
+        }
+
+        scanner = MetadataScanner(config_manager, self.logger)
+
+        self.assertGreaterEqual(scanner.max_workers, 1)
+        self.assertEqual(scanner.min_parallel_files, 8)
+
+
+if __name__ == '__main__':
+    unittest.main()
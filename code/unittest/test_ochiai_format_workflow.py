@@ -50,6 +50,25 @@ class TestOchiaiFormatWorkflow(unittest.TestCase):
         self.assertIsNotNone(self.workflow.logger)
         self.assertIsNotNone(self.workflow.claude_client)
     
+    def test_legacy_max_content_length_converted_to_tokens(self):
+        """旧設定max_content_length（文字数）がトークン数に換算され、非推奨の警告が出ることを確認"""
+        self.assertEqual(self.workflow.max_content_tokens, 5000 // 4)
+        self.assertIn('max_content_length is deprecated',
+                      self.mock_integrated_logger.warning.call_args[0][0])
+
+    def test_max_content_tokens_takes_precedence(self):
+        """max_content_tokensが指定されている場合はmax_content_lengthより優先されることを確認"""
+        self.mock_config.config['ochiai_format']['max_content_tokens'] = 3000
+        with patch('code.py.modules.ai_tagging_translation.ochiai_format_workflow.ClaudeAPIClient'):
+            workflow = OchiaiFormatWorkflow(self.mock_config, self.mock_logger)
+        self.assertEqual(workflow.max_content_tokens, 3000)
+
+        del self.mock_config.config['ochiai_format']['max_content_tokens']
+        del self.mock_config.config['ochiai_format']['max_content_length']
+        with patch('code.py.modules.ai_tagging_translation.ochiai_format_workflow.ClaudeAPIClient'):
+            workflow = OchiaiFormatWorkflow(self.mock_config, self.mock_logger)
+        self.assertEqual(workflow.max_content_tokens, 6000)
+
     def test_extract_paper_content_with_paper_structure(self):
         """paper_structure存在時の論文内容抽出テスト"""
         mock_yaml_header = {
@@ -159,6 +178,18 @@ class TestOchiaiFormatWorkflow(unittest.TestCase):
                 self.assertEqual(result['skipped'], 0)
                 self.assertEqual(result['failed'], 0)
     
+    def test_detect_ochiai_response_end(self):
+        """ストリーミング中の落合フォーマットJSON完成判定テスト"""
+        self.assertIsNone(self.workflow._detect_ochiai_response_end('```json\n{"what_is_this": "テ'))
+        
+        response = '```json\n{"what_is_this": "テスト{内容}"}\n```\n補足説明'
+        end_pos = self.workflow._detect_ochiai_response_end(response)
+        self.assertEqual(response[:end_pos], '```json\n{"what_is_this": "テスト{内容}"}')
+        
+        # 閉じフェンスがない早期終了レスポンスも解析可能
+        parsed = self.workflow._parse_ochiai_response(response[:end_pos])
+        self.assertEqual(parsed['what_is_this'], 'テスト{内容}')
+    
     def test_update_yaml_with_ochiai(self):
         """YAML更新機能テスト"""
         ochiai_data = {
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+PaperIndex テストスイート
+
+DOI・タイトル照合インデックスのテスト。
+- DOI・タイトル正規化
+- インデックスの永続化と再作成
+- タイトル照合（出版年バケット、曖昧候補の除外）
+"""
+
+import os
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+from code.py.modules.file_organizer.paper_index import PaperIndex
+
+
+BIBTEX_CONTENT = """@article{smith2023,
+    title = {Radiation response of {KRT13}-positive cancer stem cells},
+    author = {Smith, John},
+    journal = {Test Journal},
+    year = {2023},
+    doi = {https://doi.org/10.1234/Smith.2023}
+}
+
+@article{smith2019,
+    title = {Radiation response of KRT13-positive cancer stem cells},
+    author = {Smith, John},
+    journal = {Test Journal},
+    year = {2019},
+    doi = {10.1234/smith.2019}
+}
+
+@article{tanaka2021,
+    title = {Proteasome activity in pancreatic cancer cells},
+    author = {Tanaka, Taro},
+    journal = {Test Journal},
+    year = {2021}
+}
+"""
+
+
+class TestPaperIndex(unittest.TestCase):
+    """PaperIndexクラスのテストケース"""
+
+    def setUp(self):
+        """テスト環境の初期化"""
+        self.test_dir = Path(tempfile.mkdtemp(prefix="PaperIndex_Test_"))
+        self.bibtex_file = self.test_dir / "CurrentManuscript.bib"
+        self.bibtex_file.write_text(BIBTEX_CONTENT, encoding='utf-8')
+
+        self.mock_logger = Mock()
+        self.mock_logger.get_logger.return_value = Mock()
+        self.config_manager = Mock()
+        self.config_manager.get_config.return_value = {}
+
+    def tearDown(self):
+        """テスト環境のクリーンアップ"""
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def _create_index(self):
+        return PaperIndex(self.config_manager, self.mock_logger).load_or_build(self.bibtex_file)
+
+    def test_normalize_doi(self):
+        """URL・プレフィックス・URLエンコード・末尾記号付きDOIの正規化を確認"""
+        self.assertEqual(PaperIndex.normalize_doi("https://doi.org/10.1234/ABC.5"), "10.1234/abc.5")
+        self.assertEqual(PaperIndex.normalize_doi(" DOI: 10.1234/abc.5."), "10.1234/abc.5")
+        self.assertEqual(PaperIndex.normalize_doi("https://dx.doi.org/10.1234%2Fabc.5"), "10.1234/abc.5")
+        self.assertEqual(PaperIndex.normalize_doi("available at https://doi.org/10.1234/abc.5)"), "10.1234/abc.5")
+        self.assertIsNone(PaperIndex.normalize_doi("not available"))
+        self.assertIsNone(PaperIndex.normalize_doi(None))
+
+    def test_normalize_title(self):
+        """LaTeX記法・アクセント・記号を除去したタイトル正規化を確認"""
+        self.assertEqual(PaperIndex.normalize_title("{KRT13}-positive Cells in R\\'{e}sum\\'e"),
+                         "krt13 positive cells in resume")
+        self.assertEqual(PaperIndex.normalize_title("Résumé: Stem  Cells!"), "resume stem cells")
+
+    def test_index_persisted_and_reused(self):
+        """保存済みインデックスがBibTeX未変更時に再解析なしで使われることを確認"""
+        index = self._create_index()
+        self.assertTrue((self.test_dir / PaperIndex.INDEX_FILE_NAME).exists())
+        self.assertEqual(index.lookup_doi("10.1234/SMITH.2023"), "smith2023")
+
+        with patch.object(PaperIndex, 'build') as mock_build:
+            reloaded = self._create_index()
+            mock_build.assert_not_called()
+        self.assertEqual(reloaded.doi_index, index.doi_index)
+        self.assertEqual(reloaded.match_title("Proteasome activity in pancreatic cancer cells")['citation_key'],
+                         "tanaka2021")
+
+        # BibTeX変更時は再作成
+        with open(self.bibtex_file, 'a', encoding='utf-8') as f:
+            f.write("\n@article{new2024,\n    title = {New paper},\n    year = {2024},\n"
+                    "    doi = {10.1234/new.2024}\n}\n")
+        os.utime(self.bibtex_file, ns=(0, 0))
+        self.assertEqual(self._create_index().lookup_doi("10.1234/new.2024"), "new2024")
+
+    def test_match_title_uses_year_buckets(self):
+        """同一タイトルの論文を出版年で区別することを確認"""
+        index = self._create_index()
+
+        match = index.match_title("Radiation response of KRT13 positive cancer stem cells", year="2023")
+        self.assertEqual(match['citation_key'], "smith2023")
+        self.assertTrue(match['accepted'])
+
+        match = index.match_title("Radiation response of KRT13 positive cancer stem cells", year=2020)
+        self.assertEqual(match['citation_key'], "smith2019")
+        self.assertLess(match['confidence'], 1.0)
+
+    def test_match_title_rejects_ambiguous_and_weak_matches(self):
+        """候補が拮抗する場合・類似度が低い場合は採用しないことを確認"""
+        index = self._create_index()
+
+        ambiguous = index.match_title("Radiation response of KRT13-positive cancer stem cells")
+        self.assertFalse(ambiguous['accepted'])
+
+        excluded = index.match_title("Radiation response of KRT13-positive cancer stem cells",
+                                     exclude={"smith2019"})
+        self.assertEqual(excluded['citation_key'], "smith2023")
+        self.assertTrue(excluded['accepted'])
+
+        weak = index.match_title("Proteasome inhibitors in lung tumours")
+        self.assertFalse(weak is not None and weak['accepted'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""Test Publisher Pattern Registry"""
+
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+
+# Add project root to Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from code.py.modules.citation_pattern_normalizer.pattern_registry import (
+    CompiledPublisherParser, PublisherPatternRegistry
+)
+
+
+PATTERNS_V1 = """parsers:
+  elsevier:
+    detection:
+      doi_prefixes: ["10.1016"]
+    patterns:
+      - regex: "\\\\((\\\\d+)\\\\)"
+        replacement: "[{number}]"
+        description: "括弧付き単体数字"
+"""
+
+PATTERNS_V2 = PATTERNS_V1 + """  ieee:
+    detection:
+      doi_prefixes: ["10.1109"]
+    patterns:
+      - regex: "\\\\[(\\\\d+)\\\\]"
+        replacement: "[{number}]"
+        description: "IEEE標準単体角括弧"
+"""
+
+
+class TestCompiledPublisherParser(unittest.TestCase):
+    """Test precompiled publisher parser"""
+
+    def test_patterns_are_compiled_in_order(self):
+        """Test valid patterns are compiled and invalid ones are reported"""
+        logger = MagicMock()
+        parser = CompiledPublisherParser('test', {
+            'patterns': [
+                {'regex': '\\((\\d+)\\)', 'replacement': '[{number}]', 'description': 'paren'},
+                {'regex': '[invalid', 'replacement': '[{number}]', 'description': 'broken'},
+                {'regex': '\\[(\\d+)\\]', 'replacement': '[{number}]', 'description': 'bracket'}
+            ]
+        }, logger)
+
+        self.assertEqual([description for _, _, description in parser.patterns], ['paren', 'bracket'])
+        self.assertEqual(parser.invalid_patterns, ['[invalid'])
+        logger.error.assert_called_once()
+
+    def test_combined_detector(self):
+        """Test combined detector reports whether any pattern can match"""
+        parser = CompiledPublisherParser('test', {
+            'patterns': [
+                {'regex': '\\((\\d+)\\)', 'replacement': '[{number}]', 'description': 'paren'},
+                {'regex': '(?<!\\[)\\b(\\d+)\\b(?!\\])', 'replacement': '[{number}]', 'description': 'bare'}
+            ]
+        })
+
+        self.assertIsNotNone(parser.detector)
+        self.assertTrue(parser.may_match("see (3)"))
+        self.assertTrue(parser.may_match("value 42 here"))
+        self.assertFalse(parser.may_match("no citations at all"))
+
+
+class TestPublisherPatternRegistry(unittest.TestCase):
+    """Test process-wide pattern registry with hot reload"""
+
+    def setUp(self):
+        """Set up test environment"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.patterns_file = os.path.join(self.temp_dir, 'publisher_patterns.yaml')
+        with open(self.patterns_file, 'w', encoding='utf-8') as f:
+            f.write(PATTERNS_V1)
+        PublisherPatternRegistry.clear()
+        self.addCleanup(PublisherPatternRegistry.clear)
+
+    def tearDown(self):
+        """Clean up test environment"""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_registry_is_shared_per_file(self):
+        """Test the same registry and compiled patterns are returned per file"""
+        first = PublisherPatternRegistry.get_registry(self.patterns_file)
+        second = PublisherPatternRegistry.get_registry(self.patterns_file)
+
+        self.assertIs(first, second)
+        self.assertEqual(first.reload_count, 1)
+        self.assertIn('elsevier', first.parsers)
+        self.assertIs(first.get_compiled('elsevier').config, first.parsers['elsevier'])
+
+    def test_reload_when_mtime_changes(self):
+        """Test patterns are recompiled when the YAML file changes"""
+        registry = PublisherPatternRegistry.get_registry(self.patterns_file)
+        self.assertFalse(registry.reload_if_changed())
+        self.assertIsNone(registry.get_compiled('ieee'))
+
+        with open(self.patterns_file, 'w', encoding='utf-8') as f:
+            f.write(PATTERNS_V2)
+        stat = os.stat(self.patterns_file)
+        os.utime(self.patterns_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        self.assertTrue(registry.reload_if_changed())
+        self.assertEqual(registry.reload_count, 2)
+        self.assertIsNotNone(registry.get_compiled('ieee'))
+
+    def test_invalid_yaml_keeps_previous_patterns(self):
+        """Test a broken YAML edit does not discard loaded patterns"""
+        registry = PublisherPatternRegistry.get_registry(self.patterns_file)
+
+        with open(self.patterns_file, 'w', encoding='utf-8') as f:
+            f.write("parsers: [unclosed")
+        stat = os.stat(self.patterns_file)
+        os.utime(self.patterns_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        self.assertFalse(registry.reload_if_changed())
+        self.assertIn('elsevier', registry.parsers)
+
+
+if __name__ == '__main__':
+    unittest.main()
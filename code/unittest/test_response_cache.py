@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+APIResponseCache テストスイート
+
+引用文献APIレスポンスキャッシュのテスト。
+- DOI正規化・有効期限
+- キャッシュ済みCrossRefレスポンスからの書誌情報取得
+- APIクライアントでのキャッシュ利用
+"""
+
+import time
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+from unittest.mock import Mock, MagicMock, patch
+
+from code.py.modules.citation_fetcher.response_cache import APIResponseCache
+from code.py.modules.citation_fetcher.api_clients import CrossRefAPIClient
+
+
+class TestAPIResponseCache(unittest.TestCase):
+    """APIResponseCacheクラスのテストケース"""
+
+    def setUp(self):
+        """テスト環境の初期化"""
+        self.test_dir = Path(tempfile.mkdtemp(prefix="APIResponseCache_Test_"))
+        self.cache = APIResponseCache(self.test_dir / APIResponseCache.DIR_NAME, ttl_days=1)
+
+    def tearDown(self):
+        """テスト環境のクリーンアップ"""
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def test_put_get_and_expiry(self):
+        """DOIの表記揺れを同じキーとして扱い、期限切れはallow_stale指定時のみ返すことを確認"""
+        self.assertTrue(self.cache.put('crossref', 'https://doi.org/10.1234/ABC', {'message': {'title': ['A']}}))
+        self.assertEqual(self.cache.get('crossref', ' doi:10.1234/abc '), {'message': {'title': ['A']}})
+        self.assertIsNone(self.cache.get('semantic_scholar', '10.1234/abc'))
+
+        with patch('code.py.modules.citation_fetcher.response_cache.time.time', return_value=time.time() + 2 * 86400):
+            self.assertIsNone(self.cache.get('crossref', '10.1234/abc'))
+            self.assertIsNotNone(self.cache.get('crossref', '10.1234/abc', allow_stale=True))
+
+        config_manager = Mock()
+        config_manager.get_config.return_value = {'citation_fetcher': {'response_cache': {'enabled': False}}}
+        self.assertIsNone(APIResponseCache.for_workspace(config_manager, self.test_dir))
+        config_manager.get_config.return_value = {}
+        self.assertEqual(APIResponseCache.for_workspace(config_manager, self.test_dir).cache_dir,
+                         self.test_dir / APIResponseCache.DIR_NAME)
+
+    def test_work_metadata_from_crossref_response(self):
+        """キャッシュ済みCrossRefレスポンスから論文自体の書誌情報を取り出せることを確認"""
+        self.cache.put('crossref', '10.1234/abc', {'message': {
+            'title': ['Keratin Profiling'],
+            'author': [{'given': 'Ann', 'family': 'Lee'}, {'name': 'Consortium'}],
+            'published-print': {'date-parts': [[2021, 8]]},
+            'issued': {'date-parts': [[2020]]},
+            'container-title': ['IJMS'],
+            'publisher': 'MDPI'
+        }})
+        self.assertEqual(self.cache.work_metadata('10.1234/ABC'), {
+            'title': 'Keratin Profiling',
+            'authors': ['Lee, Ann', 'Consortium'],
+            'year': 2021,
+            'journal': 'IJMS',
+            'publisher': 'MDPI'
+        })
+        self.assertIsNone(self.cache.work_metadata('10.9999/missing'))
+
+    @patch('requests.Session.get')
+    def test_api_client_reuses_cached_response(self, mock_get):
+        """APIクライアントが取得結果を保存し、2回目はHTTP請求せずにキャッシュを使うことを確認"""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {'message': {'reference': [
+            {'article-title': 'Reference Paper', 'DOI': '10.1000/ref', 'year': '2020'}
+        ]}}
+        mock_get.return_value = mock_response
+
+        config_manager = MagicMock()
+        config_manager.get_config.return_value = {'citation_fetcher': {'apis': {'crossref': {}}}}
+        client = CrossRefAPIClient(config_manager, MagicMock())
+        client.response_cache = self.cache
+
+        first = client.fetch_citations('10.1234/abc')
+        second = client.fetch_citations('10.1234/ABC')
+        self.assertEqual(first, second)
+        self.assertEqual(mock_get.call_count, 1)
+        self.assertEqual(self.cache.get('crossref', '10.1234/abc'), mock_response.json.return_value)
+
+
+if __name__ == '__main__':
+    unittest.main()
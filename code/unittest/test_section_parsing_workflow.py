@@ -7,9 +7,11 @@ test_section_parsing_workflow.py - SectionParsingWorkflow テストケース
 import unittest
 import tempfile
 import os
+import queue
 import shutil
 from unittest.mock import Mock, patch
 from datetime import datetime
+from pathlib import Path
 
 # プロジェクトのパスを設定
 import sys
@@ -19,6 +21,7 @@ from code.py.modules.shared_modules.config_manager import ConfigManager
 from code.py.modules.shared_modules.integrated_logger import IntegratedLogger
 from code.py.modules.shared_modules.exceptions import ProcessingError
 from code.py.modules.section_parsing.section_parsing_workflow import SectionParsingWorkflow
+from code.py.modules.status_management_yaml.yaml_header_processor import YAMLHeaderProcessor
 from code.py.modules.section_parsing.section_structure import Section, PaperStructure
 
 
@@ -290,6 +293,63 @@ class TestSectionExtraction(unittest.TestCase):
         self.assertEqual(discussion.section_type, "discussion")
         self.assertEqual(discussion.start_line, 22)  # 31行目-9行目 = 22行目（YAMLヘッダー除外後の相対行数）
 
+    
+    def _legacy_extract_sections(self, content_lines):
+        """従来方式（見出し毎の複数回マッチ・行範囲の再スライス）の参照実装"""
+        import re
+        sections = []
+        current = None
+        header_count = 0
+        in_header = False
+        header_end = 0
+        for line_num, line in enumerate(content_lines, 1):
+            stripped = line.strip()
+            if stripped == '---':
+                header_count += 1
+                if header_count == 1:
+                    in_header = True
+                    continue
+                elif header_count == 2:
+                    in_header = False
+                    header_end = line_num
+                    continue
+            if in_header or not re.match(r'^#{2,4}\s+.+', stripped):
+                continue
+            if current:
+                current[4] = line_num - header_end - 1
+                sections.append(current)
+            current = [re.match(r'^#{2,4}\s+(.+)', stripped).group(1).strip(),
+                       len(re.match(r'^(#{2,4})\s+', stripped).group(1)),
+                       self.workflow._identify_section_type(stripped), line_num - header_end, 0]
+        if current:
+            current[4] = len(content_lines) - header_end
+            sections.append(current)
+        return [
+            (title, level, section_type, start, end,
+             sum(len(line.split()) for line in content_lines[header_end + start - 1:header_end + end]))
+            for title, level, section_type, start, end in sections
+        ]
+    
+    def test_streaming_parse_matches_legacy(self):
+        """ファイルを逐次読み込む単一パス解析が従来方式と同一結果になることを確認"""
+        self.workflow.enable_subsection_analysis = False
+        body = []
+        for i in range(60):
+            heading = ['## Abstract', '### Results {i}', '#### Methods and Data', '## Notes {i}',
+                       '##### Too deep', '## Discussion', '---'][i % 7].format(i=i)
+            body.extend([heading, '', f"Paragraph {i} with  several words here.", '  indented line ', ''])
+        content = "---\ntitle: Test Paper\ndoi: 10.1000/test\n---\n\nJournal Article\n" + "\n".join(body) + "\n"
+        paper_path = os.path.join(self.temp_dir, 'paper.md')
+        with open(paper_path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        
+        structure = self.workflow.parse_sections_single(paper_path)
+        
+        self.assertEqual(
+            [(s.title, s.level, s.section_type, s.start_line, s.end_line, s.word_count) for s in structure.sections],
+            self._legacy_extract_sections(content.splitlines(keepends=True))
+        )
+
 
 class TestPaperStructureBuilding(unittest.TestCase):
     """論文構造構築テスト"""
@@ -337,7 +397,244 @@ class TestPaperStructureBuilding(unittest.TestCase):
         self.assertEqual(yaml_dict['total_sections'], 1)
         self.assertEqual(len(yaml_dict['sections']), 1)
         self.assertIn('abstract', yaml_dict['section_types_found'])
+    
+    def test_compact_structure(self):
+        """スロット化・タイプ索引による論文構造の確認"""
+        paper_structure = PaperStructure()
+        abstract = Section("Abstract", 2, "abstract", 5, 8, 25, ["Abstract content"])
+        paper_structure.add_section(abstract)
+        paper_structure.add_section(Section("Summary", 2, "abstract", 10, 12, 5))
+        paper_structure.add_section(Section("Methods", 2, "methods", 14, 20, 40))
+        
+        self.assertFalse(hasattr(abstract, '__dict__'))
+        self.assertEqual(abstract.subsections, ())
+        self.assertIs(paper_structure.get_section_by_type('abstract'), abstract)
+        self.assertIsNone(paper_structure.get_section_by_type('results'))
+        self.assertTrue(paper_structure.has_section_type('methods'))
+        self.assertEqual(paper_structure.section_types_found, ['abstract', 'methods'])
+        
+        abstract.add_subsection(Section("Key Points", 3, "unknown", 6, 8, 10))
+        self.assertEqual([s.title for s in paper_structure.iter_sections()],
+                         ['Abstract', 'Key Points', 'Summary', 'Methods'])
+    
+    def test_yaml_dict_round_trip(self):
+        """from_yaml_dictで復元した構造が同じYAML辞書を出力することを確認"""
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir)
+        paper_path = os.path.join(temp_dir, 'paper.md')
+        with open(paper_path, 'w', encoding='utf-8') as f:
+            f.write("---\ntitle: Test\n---\n\n## Abstract\n\nText.\n\n### Aims\n\nAim.\n\n"
+                    "## Results\n\nFound.\n\n## Summary\n\nDone.\n")
+        
+        yaml_dict = self.workflow.parse_sections_single(paper_path).to_yaml_dict()
+        restored = PaperStructure.from_yaml_dict(yaml_dict)
+        
+        self.assertEqual(restored.to_yaml_dict(), yaml_dict)
+        self.assertEqual(restored.get_section_by_type('abstract').subsections[0].title, 'Aims')
+        self.assertEqual(list(yaml_dict['sections'][0]), ['title', 'level', 'section_type', 'start_line',
+                                                          'end_line', 'word_count', 'byte_start',
+                                                          'byte_end', 'content_hash', 'subsections'])
+
+
+class TestParallelSectionParsing(unittest.TestCase):
+    """並列セクション解析テスト"""
+    
+    def setUp(self):
+        """テストセットアップ"""
+        self.config_manager = ConfigManager()
+        self.logger = IntegratedLogger(self.config_manager)
+        self.temp_dir = tempfile.mkdtemp()
+        
+    def tearDown(self):
+        """テストクリーンアップ"""
+        if os.path.exists(self.temp_dir):
+            shutil.rmtree(self.temp_dir)
+    
+    def _write_papers(self, clippings_dir, count):
+        """テスト用論文を作成"""
+        papers = []
+        for i in range(count):
+            paper_name = f"paper{i:02d}"
+            os.makedirs(os.path.join(clippings_dir, paper_name))
+            headings = ['## Abstract', '## Introduction', '### Background', '## Results', '## Discussion'][:2 + i % 4]
+            body = "\n\n".join(f"{heading}\n\nText {i} for {heading.lstrip('# ')}." for heading in headings)
+            with open(os.path.join(clippings_dir, paper_name, f"{paper_name}.md"), 'w', encoding='utf-8') as f:
+                f.write(f"---\ncitation_key: {paper_name}\n---\n\n{body}\n")
+            papers.append(paper_name)
+        return papers
+    
+    def _read_structures(self, clippings_dir, papers):
+        """書き込まれたpaper_structureを取得（解析日時を除く）"""
+        workflow = SectionParsingWorkflow(self.config_manager, self.logger)
+        structures = {}
+        for paper_name in papers:
+            yaml_data, _ = workflow.yaml_processor.parse_yaml_header(
+                Path(clippings_dir, paper_name, f"{paper_name}.md"))
+            yaml_data['paper_structure'].pop('parsed_at')
+            structures[paper_name] = (yaml_data['paper_structure'], yaml_data['processing_status'])
+        return structures
+    
+    def test_parallel_matches_serial(self):
+        """ワーカープロセス＋書き込みスレッドの結果が逐次処理と同一であることを確認"""
+        serial_dir = os.path.join(self.temp_dir, 'serial')
+        parallel_dir = os.path.join(self.temp_dir, 'parallel')
+        papers = self._write_papers(serial_dir, 12)
+        self._write_papers(parallel_dir, 12)
+        
+        serial_workflow = SectionParsingWorkflow(self.config_manager, self.logger)
+        serial_workflow.parallel_enabled = False
+        serial_results = serial_workflow.process_papers(serial_dir, papers + ['missing'])
+        
+        parallel_workflow = SectionParsingWorkflow(self.config_manager, self.logger)
+        parallel_workflow.max_workers = 2
+        parallel_workflow.parallel_min_papers = 1
+        parallel_workflow.chunk_size = 3
+        parallel_workflow.write_queue_size = 5
+        with patch.object(parallel_workflow, '_write_structures',
+                          wraps=parallel_workflow._write_structures) as writer:
+            parallel_results = parallel_workflow.process_papers(parallel_dir, papers + ['missing'])
+        
+        writer.assert_called_once()
+        self.assertEqual(parallel_results['processed_papers'], 12)
+        self.assertEqual(parallel_results['failed_papers'], 1)
+        self.assertEqual(sorted(parallel_results.pop('section_types_found')),
+                         sorted(serial_results.pop('section_types_found')))
+        self.assertEqual(parallel_results, serial_results)
+        self.assertEqual(self._read_structures(parallel_dir, papers),
+                         self._read_structures(serial_dir, papers))
+
+    def test_writer_thread_only_writes_prepared_content(self):
+        """書き込みスレッドはYAML解析・シリアライズを行わず、作成済みの内容を書き込むだけであることを確認"""
+        clippings_dir = os.path.join(self.temp_dir, 'clippings')
+        papers = self._write_papers(clippings_dir, 2)
+        paper_paths = [os.path.join(clippings_dir, name, f"{name}.md") for name in papers]
+        workflow = SectionParsingWorkflow(self.config_manager, self.logger)
+        prepared = [workflow.parse_and_prepare(path) for path in paper_paths]
+
+        write_queue = queue.Queue()
+        for paper_name, paper_path, item in zip(papers, paper_paths, prepared):
+            write_queue.put((paper_name, paper_path, item))
+        write_queue.put(None)
+        write_outcomes = []
+        with patch.object(YAMLHeaderProcessor, 'split_yaml_header', side_effect=AssertionError), \
+             patch.object(YAMLHeaderProcessor, 'render_yaml_file', side_effect=AssertionError), \
+             patch.object(workflow, '_extract_sections', side_effect=AssertionError):
+            workflow._write_structures(write_queue, write_outcomes)
+
+        self.assertEqual([error for _, _, _, error in write_outcomes], [None, None])
+        for paper_path, item in zip(paper_paths, prepared):
+            with open(paper_path, 'rb') as f:
+                self.assertEqual(f.read(), item.file_bytes)
+
+    def test_writer_thread_reparses_paper_changed_after_parsing(self):
+        """解析後に変更された論文は書き込みスレッドで解析し直し、変更を上書きしないことを確認"""
+        clippings_dir = os.path.join(self.temp_dir, 'clippings')
+        papers = self._write_papers(clippings_dir, 1)
+        paper_path = os.path.join(clippings_dir, papers[0], f"{papers[0]}.md")
+        workflow = SectionParsingWorkflow(self.config_manager, self.logger)
+        prepared = workflow.parse_and_prepare(paper_path)
 
+        with open(paper_path, 'a', encoding='utf-8') as f:
+            f.write("\n## Discussion\n\nAdded after parsing.\n")
+
+        write_queue = queue.Queue()
+        write_queue.put((papers[0], paper_path, prepared))
+        write_queue.put(None)
+        write_outcomes = []
+        workflow._write_structures(write_queue, write_outcomes)
+
+        paper_name, paper_structure, _, error = write_outcomes[0]
+        self.assertIsNone(error)
+        self.assertIn('discussion', paper_structure.section_types_found)
+        with open(paper_path, 'r', encoding='utf-8') as f:
+            self.assertIn("Added after parsing.", f.read())
+
+
+class TestIncrementalSectionParsing(unittest.TestCase):
+    """セクション差分による再解析テスト"""
+    
+    def setUp(self):
+        """テストセットアップ"""
+        self.config_manager = ConfigManager()
+        self.logger = IntegratedLogger(self.config_manager)
+        self.workflow = SectionParsingWorkflow(self.config_manager, self.logger)
+        self.temp_dir = tempfile.mkdtemp()
+        os.makedirs(os.path.join(self.temp_dir, 'paper'))
+        self.paper_path = Path(self.temp_dir, 'paper', 'paper.md')
+        with open(self.paper_path, 'w', encoding='utf-8') as f:
+            f.write("---\ncitation_key: paper\n---\n\n## Abstract\n\nShort abstract.\n\n"
+                    "## Introduction\n\nWhy.\n\n## Results\n\nWhat.\n\n### Table 1\n\n| a | b |\n\n"
+                    "## Discussion\n\nSo what.\n")
+        
+        self.workflow.process_papers(self.temp_dir, ['paper'])
+        yaml_data, content = self.workflow.yaml_processor.parse_yaml_header(self.paper_path)
+        for step in ('tagger', 'translate_abstract', 'ochiai_format'):
+            yaml_data['processing_status'][step] = 'completed'
+        self.workflow.yaml_processor.write_yaml_header(self.paper_path, yaml_data, content)
+        
+    def tearDown(self):
+        """テストクリーンアップ"""
+        if os.path.exists(self.temp_dir):
+            shutil.rmtree(self.temp_dir)
+    
+    def _edit(self, old, new):
+        """本文を編集"""
+        with open(self.paper_path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        with open(self.paper_path, 'w', encoding='utf-8') as f:
+            f.write(content.replace(old, new))
+    
+    def _status(self):
+        """processing_statusを取得"""
+        yaml_data, _ = self.workflow.yaml_processor.parse_yaml_header(self.paper_path)
+        return yaml_data['processing_status']
+    
+    def test_unchanged_body_is_skipped(self):
+        """本文未変更の論文は再解析・再書き込みしないことを確認"""
+        with open(self.paper_path, 'r', encoding='utf-8') as f:
+            before = f.read()
+        
+        results = self.workflow.process_papers(self.temp_dir, ['paper'])
+        
+        with open(self.paper_path, 'r', encoding='utf-8') as f:
+            self.assertEqual(f.read(), before)
+        self.assertEqual(results['unchanged_papers'], 1)
+        self.assertEqual(results['processed_papers'], 1)
+        self.assertEqual(results['total_sections_found'], 4)
+        self.assertEqual(results['changed_section_types'], {'paper': []})
+    
+    def test_subsection_edit_resets_only_dependent_steps(self):
+        """子セクションの編集は親セクション種別の変更として扱い、依存する後続処理のみ再実行対象にする"""
+        self._edit("| a | b |", "| a | c |")
+        
+        results = self.workflow.process_papers(self.temp_dir, ['paper'])
+        
+        self.assertEqual(results['changed_section_types'], {'paper': ['results']})
+        self.assertEqual(self._status()['tagger'], 'pending')
+        self.assertEqual(self._status()['ochiai_format'], 'pending')
+        self.assertEqual(self._status()['translate_abstract'], 'completed')
+    
+    def test_heading_change_is_detected(self):
+        """見出しの変更（同一種別）とセクション削除を検出することを確認"""
+        self._edit("## Abstract", "## Summary")
+        self._edit("## Discussion\n\nSo what.\n", "")
+        
+        results = self.workflow.process_papers(self.temp_dir, ['paper'])
+        
+        self.assertEqual(results['changed_section_types'], {'paper': ['abstract', 'discussion']})
+        self.assertEqual(self._status()['translate_abstract'], 'pending')
+        self.assertEqual(self._status()['tagger'], 'pending')
+
+    
+    def test_downstream_section_types_follow_section_priority(self):
+        """後続処理の入力セクション種別がsection_priority設定に従うことを確認"""
+        self.config_manager.config['ai_generation']['tagger']['section_priority'] = ['abstract']
+        self.config_manager.config['ochiai_format']['section_priority'] = ['discussion']
+        workflow = SectionParsingWorkflow(self.config_manager, self.logger)
+        
+        self.assertEqual(workflow._steps_affected_by(['results']), [])
+        self.assertEqual(workflow._steps_affected_by(['abstract']), ['tagger', 'translate_abstract'])
+        self.assertEqual(workflow._steps_affected_by(['discussion']), ['ochiai_format'])
 
 class TestSectionParsingWorkflowImport(unittest.TestCase):
     """SectionParsingWorkflowインポートテスト"""
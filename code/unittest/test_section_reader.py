@@ -0,0 +1,136 @@
+"""
+test_section_reader.py - SectionReader テストケース
+
+バイトオフセットによるセクション単位読み込みのユニットテスト
+"""
+
+import unittest
+import tempfile
+import os
+import shutil
+
+# プロジェクトのパスを設定
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'py'))
+
+from code.py.modules.shared_modules.config_manager import ConfigManager
+from code.py.modules.shared_modules.integrated_logger import IntegratedLogger
+from code.py.modules.section_parsing.section_parsing_workflow import SectionParsingWorkflow
+from code.py.modules.section_parsing.section_reader import SectionReader
+
+
+PAPER_CONTENT = """---
+citation_key: reader2024
+title: Reader Test Paper
+---
+
+
+Journal Article
+
+## Abstract
+
+Radiation affects cells — résumé of findings.
+
+### Key Points
+
+Point one.
+
+## Introduction
+
+Background information here.
+
+## Results
+
+Results are presented here.
+"""
+
+
+class TestSectionReader(unittest.TestCase):
+    """SectionReaderのテスト"""
+
+    def setUp(self):
+        """テストセットアップ"""
+        self.config_manager = ConfigManager()
+        self.logger = IntegratedLogger(self.config_manager)
+        self.workflow = SectionParsingWorkflow(self.config_manager, self.logger)
+
+        self.temp_dir = tempfile.mkdtemp()
+        paper_dir = os.path.join(self.temp_dir, 'reader2024')
+        os.makedirs(paper_dir)
+        self.paper_path = os.path.join(paper_dir, 'reader2024.md')
+        with open(self.paper_path, 'w', encoding='utf-8') as f:
+            f.write(PAPER_CONTENT)
+
+        self.workflow.process_papers(self.temp_dir, ['reader2024'])
+
+    def tearDown(self):
+        """テストクリーンアップ"""
+        if os.path.exists(self.temp_dir):
+            shutil.rmtree(self.temp_dir)
+
+    def test_read_section_by_byte_offset(self):
+        """ヘッダー書き換え後もバイトオフセットでセクションを読めることを確認"""
+        reader = SectionReader(self.paper_path)
+
+        self.assertTrue(reader.is_current())
+        self.assertTrue(reader.verify_body_hash())
+        self.assertEqual(reader.read_section_by_type('introduction'),
+                         "## Introduction\n\nBackground information here.\n\n")
+        self.assertEqual(reader.read_section_by_type('results', include_heading=False),
+                         "\nResults are presented here.\n")
+        self.assertEqual(reader.read_section_by_type('abstract', include_heading=False),
+                         "\nRadiation affects cells — résumé of findings.\n\n")
+        self.assertEqual(reader.read_section_by_type('abstract', include_heading=False, include_subsections=True),
+                         "\nRadiation affects cells — résumé of findings.\n\n### Key Points\n\nPoint one.\n\n")
+
+    def test_offsets_match_line_ranges(self):
+        """バイト範囲が解析時の行番号範囲と同じ内容を指すことを確認"""
+        reader = SectionReader(self.paper_path)
+        lines = PAPER_CONTENT.split('\n')
+        body_lines = lines[lines.index('---', 1) + 1:]
+
+        for section in reader.sections:
+            expected = '\n'.join(body_lines[section['start_line'] - 1:section['end_line']])
+            self.assertEqual(reader.read_section(section).rstrip('\n'), expected.rstrip('\n'))
+
+    def test_stale_index_returns_none(self):
+        """本文変更後はNoneを返し従来処理へフォールバックさせることを確認"""
+        with open(self.paper_path, 'a', encoding='utf-8') as f:
+            f.write("Appended text.\n")
+
+        reader = SectionReader(self.paper_path)
+        self.assertFalse(reader.is_current())
+        self.assertIsNone(reader.read_section_by_type('introduction'))
+
+    def test_same_size_edit_detected_by_heading_check(self):
+        """同サイズの編集で位置がずれた場合も検出されることを確認"""
+        with open(self.paper_path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        with open(self.paper_path, 'w', encoding='utf-8') as f:
+            f.write(content.replace("Point one.", "Point one").replace("information here.", "information here.."))
+
+        reader = SectionReader(self.paper_path)
+        self.assertTrue(reader.is_current())
+        self.assertFalse(reader.verify_body_hash())
+        self.assertIsNone(reader.read_section_by_type('introduction'))
+
+
+    def test_crlf_file_offsets_match_written_body(self):
+        """CRLF改行のファイルでも書き込み後の本文に対するオフセットで読めることを確認"""
+        with open(self.paper_path, 'w', encoding='utf-8', newline='') as f:
+            f.write(PAPER_CONTENT.replace('\n', '\r\n'))
+
+        self.workflow.process_papers(self.temp_dir, ['reader2024'])
+
+        reader = SectionReader(self.paper_path)
+        self.assertTrue(reader.is_current())
+        self.assertTrue(reader.verify_body_hash())
+        introduction = reader.read_section_by_type('introduction')
+        self.assertIsNotNone(introduction)
+        self.assertEqual(introduction.replace('\r\n', '\n'), "## Introduction\n\nBackground information here.\n\n")
+        self.assertEqual(reader.read_section_by_type('results', include_heading=False).replace('\r\n', '\n'),
+                         "\nResults are presented here.\n")
+
+
+if __name__ == '__main__':
+    unittest.main()
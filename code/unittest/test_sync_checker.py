@@ -546,6 +546,69 @@ Content for {citation_key}.
             self.assertIn('checked_at:', content)
             self.assertIn('consistency_status:', content)
 
+    
+    @unittest.skipIf(not IMPORTS_AVAILABLE, f"Import failed: {IMPORT_ERROR if not IMPORTS_AVAILABLE else ''}")
+    def test_unchanged_sync_status_not_rewritten(self):
+        """sync状態に変更がない2回目の実行ではファイルを書き込まないことを確認"""
+        sync_checker = SyncChecker(self.mock_config, self.mock_logger)
+        self._create_complex_test_environment()
+        
+        # 読み取り専用チェック（DOIレポート用）ではファイルを書き込まない
+        md_files = sorted(self.clippings_dir.rglob("*.md"))
+        snapshot = {path: (path.read_bytes(), path.stat().st_mtime_ns) for path in md_files}
+        read_only = sync_checker.check_workspace_consistency(
+            str(self.test_dir), str(self.bibtex_file), str(self.clippings_dir), update_yaml_headers=False
+        )
+        self.assertEqual(read_only['sync_status_updates'], {'updated': 0, 'skipped': 0, 'failed': 0})
+        for path in md_files:
+            self.assertEqual((path.read_bytes(), path.stat().st_mtime_ns), snapshot[path])
+        
+        first = sync_checker.check_workspace_consistency(
+            str(self.test_dir), str(self.bibtex_file), str(self.clippings_dir)
+        )
+        self.assertEqual(first['sync_status_updates'], {'updated': 2, 'skipped': 0, 'failed': 0})
+        
+        snapshot = {path: (path.read_bytes(), path.stat().st_mtime_ns) for path in md_files}
+        
+        second = sync_checker.check_workspace_consistency(
+            str(self.test_dir), str(self.bibtex_file), str(self.clippings_dir)
+        )
+        self.assertEqual(second['sync_status_updates'], {'updated': 0, 'skipped': 2, 'failed': 0})
+        for path in md_files:
+            self.assertEqual((path.read_bytes(), path.stat().st_mtime_ns), snapshot[path])
+        
+        # 状態が変わった論文のみ書き込み
+        header_path = self.clippings_dir / 'jones2024therapy' / 'jones2024therapy.md'
+        header_path.write_text(header_path.read_text(encoding='utf-8').replace(
+            '10.1016/j.cell.2024.99999', '10.1016/j.cell.2024.67890'), encoding='utf-8')
+        third = sync_checker.check_workspace_consistency(
+            str(self.test_dir), str(self.bibtex_file), str(self.clippings_dir)
+        )
+        self.assertEqual(third['sync_status_updates'], {'updated': 1, 'skipped': 1, 'failed': 0})
+        self.assertIn('sync: completed', header_path.read_text(encoding='utf-8'))
+    
+    @unittest.skipIf(not IMPORTS_AVAILABLE, f"Import failed: {IMPORT_ERROR if not IMPORTS_AVAILABLE else ''}")
+    def test_header_parsed_once_per_paper(self):
+        """検出・比較・sync状態更新を通じてYAMLヘッダーを1回だけ解析することを確認"""
+        sync_checker = SyncChecker(self.mock_config, self.mock_logger)
+        self._create_complex_test_environment()
+        sync_checker.check_workspace_consistency(
+            str(self.test_dir), str(self.bibtex_file), str(self.clippings_dir)
+        )
+        
+        scanner = sync_checker.metadata_scanner
+        processor = sync_checker.yaml_processor
+        with patch.object(scanner, 'read_fields', wraps=scanner.read_fields) as read_fields, \
+             patch.object(processor, '_read_header_block', wraps=processor._read_header_block) as read_header_block, \
+             patch.object(processor, 'parse_yaml_header', wraps=processor.parse_yaml_header) as parse_yaml_header:
+            result = sync_checker.check_workspace_consistency(
+                str(self.test_dir), str(self.bibtex_file), str(self.clippings_dir)
+            )
+        
+        self.assertEqual(read_fields.call_count, 3)
+        self.assertEqual(read_header_block.call_count, 0)
+        self.assertEqual(parse_yaml_header.call_count, 0)
+        self.assertEqual(result['orphaned_markdown_files'][0]['doi'], '10.1038/s41598-999-88888-8')
 
 class TestSyncCheckerDOILinks(unittest.TestCase):
     """SyncChecker DOIリンク表示機能テスト"""
@@ -651,6 +714,72 @@ title: Orphaned Test Paper
         # メソッドが正常に実行されることを確認
         self.assertTrue(True)
 
+    
+    @unittest.skipIf(not IMPORTS_AVAILABLE, f"Import failed: {IMPORT_ERROR if not IMPORTS_AVAILABLE else ''}")
+    def test_doi_report_enriched_from_api_cache(self):
+        """不足・孤立論文のDOIレポートをAPIレスポンスキャッシュで補完し、JSON/CSVに出力できることを確認"""
+        import csv
+        import json
+        from code.py.modules.citation_fetcher.response_cache import APIResponseCache
+        
+        clippings_dir = self.test_dir / "Clippings"
+        orphan_dir = clippings_dir / "orphan2023"
+        orphan_dir.mkdir(parents=True)
+        orphan_file = orphan_dir / "orphan2023.md"
+        orphan_file.write_text("---\ncitation_key: orphan2023\ndoi: 10.1234/Orphan\n---\n\n# Orphan\n", encoding='utf-8')
+        untracked_file = clippings_dir / "untracked.md"
+        untracked_file.write_text("---\ntitle: Untracked Paper\n---\n", encoding='utf-8')
+        
+        cache = APIResponseCache(self.test_dir / APIResponseCache.DIR_NAME)
+        cache.put('crossref', '10.1234/orphan', {'message': {
+            'title': ['Cached Orphan Title'],
+            'author': [{'given': 'Ann', 'family': 'Lee'}],
+            'issued': {'date-parts': [[2023, 4]]},
+            'container-title': ['Cached Journal']
+        }})
+        
+        sync_checker = SyncChecker(self.mock_config, self.mock_logger)
+        check_result = {
+            'workspace_path': str(self.test_dir),
+            'clippings_dir': str(clippings_dir),
+            'missing_markdown_files': [{
+                'citation_key': 'smith2024test',
+                'bibtex_entry': {'doi': '10.1038/s41598-024-12345-6', 'title': 'Test Paper',
+                                 'author': 'Smith, John and Doe, Jane', 'year': '2024'}
+            }],
+            'orphaned_markdown_files': [
+                {'citation_key': 'orphan2023', 'markdown_file': str(orphan_file), 'doi': '10.1234/Orphan', 'title': ''},
+                # DOIを含まない形式の結果はMarkdownをまとめて走査して補う
+                {'citation_key': 'untracked', 'markdown_file': str(untracked_file)}
+            ]
+        }
+        
+        report = sync_checker.build_doi_report(check_result)
+        papers = {paper['citation_key']: paper for paper in report['papers']}
+        self.assertEqual(papers['smith2024test']['authors'], ['Smith, John', 'Doe, Jane'])
+        self.assertEqual(papers['smith2024test']['doi_link'], 'https://doi.org/10.1038/s41598-024-12345-6')
+        self.assertEqual(papers['orphan2023']['title'], 'Cached Orphan Title')
+        self.assertEqual(papers['orphan2023']['year'], '2023')
+        self.assertEqual(papers['orphan2023']['metadata_source'], 'markdown+api_cache')
+        self.assertEqual(papers['untracked']['title'], 'Untracked Paper')
+        self.assertEqual(report['summary'], {'missing_markdown': 1, 'orphaned_markdown': 2,
+                                             'without_doi': 1, 'enriched_from_api_cache': 1})
+        
+        # キャッシュを使わない場合は補完しない
+        offline = sync_checker.build_doi_report(check_result, use_api_cache=False)
+        self.assertEqual(offline['summary']['enriched_from_api_cache'], 0)
+        
+        json_file = sync_checker.write_doi_report(report, str(self.test_dir / "report.json"))
+        self.assertEqual(json.loads(Path(json_file).read_text(encoding='utf-8'))['papers'], report['papers'])
+        csv_file = sync_checker.write_doi_report(report, str(self.test_dir / "report.csv"))
+        with open(csv_file, encoding='utf-8', newline='') as f:
+            rows = list(csv.DictReader(f))
+        self.assertEqual([row['citation_key'] for row in rows], ['smith2024test', 'orphan2023', 'untracked'])
+        self.assertEqual(rows[1]['authors'], 'Lee, Ann')
+        
+        with self.assertRaises(Exception):
+            sync_checker.write_doi_report(report, str(self.test_dir / "report.xml"))
+
 
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
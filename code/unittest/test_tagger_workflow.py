@@ -130,6 +130,55 @@ These findings suggest novel therapeutic targets in cancer treatment.
         # YAMLヘッダーは除外されているかチェック
         self.assertNotIn("citation_key:", content)
     
+    def test_extract_paper_content_with_token_budget(self):
+        """論文コンテンツ抽出テスト（トークン予算超過時の優先度順切り詰め）"""
+        from code.py.modules.ai_tagging_translation.tagger_workflow import TaggerWorkflow
+        
+        self.config_manager.get_ai_setting.side_effect = lambda *keys, default=None: {
+            ('tagger', 'token_budget'): 120,
+            ('tagger', 'section_priority'): ['results', 'discussion', 'introduction'],
+        }.get(keys, default)
+        
+        long_intro = " ".join(["Background sentence number one about tumors."] * 40)
+        test_content = f"""---
+citation_key: test2023paper
+paper_structure:
+  sections:
+    - title: "Introduction"
+      section_type: "introduction"
+      start_line: 1
+      end_line: 2
+    - title: "Results"
+      section_type: "results"
+      start_line: 4
+      end_line: 5
+    - title: "Discussion"
+      section_type: "discussion"
+      start_line: 7
+      end_line: 8
+---
+## Introduction
+{long_intro}
+
+## Results
+We found significant correlation between EGFR and treatment response.
+
+## Discussion
+These findings suggest novel therapeutic targets in cancer treatment.
+"""
+        
+        test_file = Path(self.temp_dir) / "test_paper.md"
+        test_file.write_text(test_content, encoding='utf-8')
+        
+        workflow = TaggerWorkflow(self.config_manager, self.logger)
+        content = workflow.extract_paper_content(str(test_file))
+        
+        # 高優先度セクションは全文、低優先度セクションは予算内に切り詰め
+        self.assertIn("EGFR and treatment response", content)
+        self.assertIn("therapeutic targets", content)
+        self.assertLessEqual(workflow.content_packer.estimate_tokens(content), 120)
+        self.assertNotIn(long_intro, content)
+    
     def test_extract_paper_content_without_title(self):
         """論文コンテンツ抽出テスト（title無し）"""
         from code.py.modules.ai_tagging_translation.tagger_workflow import TaggerWorkflow
@@ -355,6 +404,21 @@ This is a test abstract for cancer research.
         
         self.assertEqual(tags, [])  # エラー時は空リスト
     
+    def test_detect_tags_response_end(self):
+        """ストリーミング中のタグJSON配列完成判定テスト"""
+        from code.py.modules.ai_tagging_translation.tagger_workflow import TaggerWorkflow
+        
+        workflow = TaggerWorkflow(self.config_manager, self.logger)
+        
+        self.assertIsNone(workflow._detect_tags_response_end('["cancer_research", "bio'))
+        self.assertIsNone(workflow._detect_tags_response_end('["tag_with]bracket", "next'))
+        
+        response = '["cancer_research", "biomarkers"]\n\nExplanation follows'
+        end_pos = workflow._detect_tags_response_end(response)
+        self.assertEqual(response[:end_pos], '["cancer_research", "biomarkers"]')
+        self.assertEqual(workflow._parse_tags_response(response[:end_pos]),
+                         ["cancer_research", "biomarkers"])
+    
     @patch('code.py.modules.ai_tagging_translation.tagger_workflow.YAMLHeaderProcessor')
     def test_update_yaml_with_tags(self, mock_yaml_processor_class):
         """YAMLヘッダーのタグ更新テスト"""
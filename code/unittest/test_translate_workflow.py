@@ -18,6 +18,8 @@ from code.py.modules.ai_tagging_translation.translate_workflow import TranslateW
 from code.py.modules.shared_modules.config_manager import ConfigManager
 from code.py.modules.shared_modules.integrated_logger import IntegratedLogger
 from code.py.modules.shared_modules.exceptions import ProcessingError
+from code.py.modules.section_parsing.section_parsing_workflow import SectionParsingWorkflow
+from code.py.modules.section_parsing.section_reader import SectionReader
 
 
 class TestTranslateWorkflow(unittest.TestCase):
@@ -177,6 +179,27 @@ This is introduction content."""
             # subsection内容が正しく抽出されていることを確認
             self.assertIn("abstract for testing", result)  # 両方のsubsectionに含まれる共通文字列
     
+    def test_extract_abstract_content_offset_matches_line_fallback(self):
+        """バイトオフセットでの読み込みと行番号ベースのフォールバックが同一の内容を返すことを確認"""
+        config_manager = ConfigManager()
+        integrated_logger = IntegratedLogger(config_manager)
+        paper_dir = self.test_dir / "paper"
+        paper_dir.mkdir()
+        (paper_dir / "paper.md").write_text(
+            "---\ncitation_key: paper\n---\n\n# Title\n\n## Abstract\n\nFirst line of the abstract.\n\n"
+            "### Background\n\nMore abstract text.\n\n## Introduction\n\nIntroduction text.\n",
+            encoding='utf-8'
+        )
+        SectionParsingWorkflow(config_manager, integrated_logger).process_papers(str(self.test_dir), ['paper'])
+
+        workflow = TranslateWorkflow(config_manager, integrated_logger)
+        by_offset = workflow.extract_abstract_content(str(paper_dir / "paper.md"))
+        with patch.object(SectionReader, 'read_section_by_type', return_value=None):
+            by_line = workflow.extract_abstract_content(str(paper_dir / "paper.md"))
+
+        self.assertEqual(by_offset, by_line)
+        self.assertEqual(by_offset, "Abstract\n\nFirst line of the abstract.\n\nBackground\n\nMore abstract text.")
+
     def test_build_translation_prompt(self):
         """翻訳プロンプト構築テスト"""
         abstract = "This is a test abstract for translation."
@@ -270,6 +293,26 @@ This is introduction content."""
         gene_suggestion = any("gene symbols" in s for s in suggestions)
         self.assertTrue(gene_suggestion)
 
+    def test_detect_translation_response_end(self):
+        """ストリーミング中の翻訳本文終了判定テスト"""
+        translation = "本研究では、KRT13遺伝子の発現が口腔扁平上皮癌の予後と関連することを明らかにした。さらに詳細な解析を行った。"
+        
+        # 本文のみでは終了判定しない
+        self.assertIsNone(self.workflow._detect_translation_response_end(translation))
+        
+        # 冒頭の区切り線は無視
+        self.assertIsNone(self.workflow._detect_translation_response_end("---\n" + translation[:20]))
+        
+        response = translation + "\n\n---\n注: 専門用語は"
+        end_pos = self.workflow._detect_translation_response_end(response)
+        self.assertIsNotNone(end_pos)
+        self.assertEqual(response[:end_pos].strip(), translation)
+        
+        # 本文の日本語判定は文字範囲（ひらがな・カタカナ・CJK統合漢字）で行う
+        translation = "本研究で解析を行い、口腔扁平上皮癌におけるKRT13発現と予後の関連を示した。この結果は新規の治療標的の候補である。"
+        response = translation + "\n---\n注: 補足"
+        self.assertEqual(self.workflow._detect_translation_response_end(response), len(translation) + 1)
+
 
 class TestTranslateWorkflowQualityEvaluation(unittest.TestCase):
     """TranslateWorkflow品質評価機能テスト"""
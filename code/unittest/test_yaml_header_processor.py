@@ -196,6 +196,68 @@ This is the content with corrupted YAML header.
         self.assertEqual(yaml_header['processing_status']['fetch'], 'completed')
         self.assertEqual(content.strip(), '# Updated Paper Content')
     
+    @unittest.skipIf(YAMLHeaderProcessor is None, "YAMLHeaderProcessor not implemented yet")
+    def test_patch_yaml_header_preserves_body(self):
+        """ヘッダーのみの更新で本文バイト列が保持されることを確認"""
+        body = "\n# Title\r\n\nBody with ---\n---\nand trailing text"
+        test_file = self._create_test_file("patch_test.md", "---\ncitation_key: a\nstatus: pending\n---" + body)
+        processor = YAMLHeaderProcessor(self.mock_config_manager, self.mock_logger)
+        
+        def grow(header):
+            header['processing_status'] = {'organize': 'completed'}
+            return header
+        
+        # ヘッダーが大きくなる場合は余白付きで書き換え
+        self.assertFalse(processor.patch_yaml_header(test_file, grow))
+        self.assertTrue(test_file.read_bytes().endswith(body.encode('utf-8')))
+        
+        # 余白の範囲内の更新はその場で上書き
+        inode = test_file.stat().st_ino
+        self.assertTrue(processor.patch_yaml_header(test_file, lambda header: {**header, 'status': 'completed'}))
+        self.assertEqual(test_file.stat().st_ino, inode)
+        self.assertTrue(test_file.read_bytes().endswith(body.encode('utf-8')))
+        
+        self.assertEqual(processor.parse_yaml_header_only(test_file),
+                         {'citation_key': 'a', 'status': 'completed', 'processing_status': {'organize': 'completed'}})
+    
+    @unittest.skipIf(YAMLHeaderProcessor is None, "YAMLHeaderProcessor not implemented yet")
+    def test_patch_yaml_header_large_header_not_in_place(self):
+        """先頭1ブロックに収まらないヘッダーはその場で上書きせず一時ファイル経由で置き換えることを確認"""
+        notes = "x" * (YAMLHeaderProcessor.IN_PLACE_MAX_BYTES * 2)
+        test_file = self._create_test_file("large_header.md",
+                                           f"---\ncitation_key: a\nnotes: {notes}\nstatus: pending\n---\n# Body\n")
+        processor = YAMLHeaderProcessor(self.mock_config_manager, self.mock_logger)
+        
+        inode = test_file.stat().st_ino
+        self.assertFalse(processor.patch_yaml_header(test_file, lambda header: {**header, 'status': 'done'}))
+        self.assertNotEqual(test_file.stat().st_ino, inode)
+        self.assertTrue(test_file.read_bytes().endswith(b"---\n# Body\n"))
+        self.assertEqual(processor.parse_yaml_header_only(test_file)['status'], 'done')
+    
+    @unittest.skipIf(YAMLHeaderProcessor is None, "YAMLHeaderProcessor not implemented yet")
+    def test_patch_yaml_header_hard_linked_not_in_place(self):
+        """ハードリンクされたファイルはその場で上書きせず、リンク先を変更しないことを確認"""
+        original = "---\ncitation_key: a\nstatus: pending\n" + " " * 63 + "\n---\n# Body\n"
+        test_file = self._create_test_file("linked.md", original)
+        linked_file = self.test_files_dir / "linked_backup.md"
+        os.link(test_file, linked_file)
+        processor = YAMLHeaderProcessor(self.mock_config_manager, self.mock_logger)
+
+        self.assertFalse(processor.patch_yaml_header(test_file, lambda header: {**header, 'status': 'done'}))
+        self.assertEqual(linked_file.read_text(), original)
+        self.assertEqual(processor.parse_yaml_header_only(test_file)['status'], 'done')
+        self.assertEqual(test_file.stat().st_nlink, 1)
+
+    @unittest.skipIf(YAMLHeaderProcessor is None, "YAMLHeaderProcessor not implemented yet")
+    def test_patch_yaml_header_without_header(self):
+        """ヘッダーのないファイルはYAMLErrorとなり変更されないことを確認"""
+        test_file = self._create_test_file("no_header.md", "# No header\n")
+        processor = YAMLHeaderProcessor(self.mock_config_manager, self.mock_logger)
+        
+        with self.assertRaises(YAMLError):
+            processor.patch_yaml_header(test_file, lambda header: header)
+        self.assertEqual(test_file.read_text(), "# No header\n")
+    
     @unittest.skipIf(YAMLHeaderProcessor is None, "YAMLHeaderProcessor not implemented yet")
     def test_validate_yaml_structure_valid(self):
         """有効なYAML構造の検証テスト"""